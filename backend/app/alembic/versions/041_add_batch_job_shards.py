@@ -0,0 +1,54 @@
+"""add batch job shards
+
+Revision ID: 041
+Revises: 040
+Create Date: 2025-12-01 10:12:41.503218
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "041"
+down_revision = "040"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "batch_job",
+        sa.Column(
+            "parent_id",
+            sa.Integer(),
+            nullable=True,
+            comment="Reference to the logical batch job this shard belongs to",
+        ),
+    )
+    op.add_column(
+        "batch_job",
+        sa.Column(
+            "shard_index",
+            sa.Integer(),
+            nullable=True,
+            comment="Position of this shard within its parent batch job",
+        ),
+    )
+    op.create_foreign_key(
+        "batch_job_parent_id_fkey",
+        "batch_job",
+        "batch_job",
+        ["parent_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    op.create_index(
+        op.f("ix_batch_job_parent_id"), "batch_job", ["parent_id"], unique=False
+    )
+
+
+def downgrade():
+    op.drop_index(op.f("ix_batch_job_parent_id"), table_name="batch_job")
+    op.drop_constraint("batch_job_parent_id_fkey", "batch_job", type_="foreignkey")
+    op.drop_column("batch_job", "shard_index")
+    op.drop_column("batch_job", "parent_id")
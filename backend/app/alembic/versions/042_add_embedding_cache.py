@@ -0,0 +1,78 @@
+"""add embedding cache
+
+Revision ID: 042
+Revises: 041
+Create Date: 2025-12-03 14:31:07.118402
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = "042"
+down_revision = "041"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "embedding_cache",
+        sa.Column(
+            "id",
+            sa.Integer(),
+            nullable=False,
+            comment="Unique identifier for the cache entry",
+        ),
+        sa.Column(
+            "model",
+            sqlmodel.sql.sqltypes.AutoString(),
+            nullable=False,
+            comment="Embedding model used (e.g., text-embedding-3-large)",
+        ),
+        sa.Column(
+            "dimensions",
+            sa.Integer(),
+            nullable=False,
+            comment="Number of dimensions of the embedding",
+        ),
+        sa.Column(
+            "text_hash",
+            sqlmodel.sql.sqltypes.AutoString(length=64),
+            nullable=False,
+            comment="Hex sha256 of the embedded text",
+        ),
+        sa.Column(
+            "embedding",
+            sa.LargeBinary(),
+            nullable=False,
+            comment="Embedding vector as little-endian float32 bytes",
+        ),
+        sa.Column(
+            "project_id",
+            sa.Integer(),
+            nullable=False,
+            comment="Reference to the project",
+        ),
+        sa.Column(
+            "inserted_at",
+            sa.DateTime(),
+            nullable=False,
+            comment="Timestamp when the embedding was cached",
+        ),
+        sa.ForeignKeyConstraint(["project_id"], ["project.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "project_id",
+            "model",
+            "dimensions",
+            "text_hash",
+            name="uq_embedding_cache_project_model_dimensions_hash",
+        ),
+    )
+
+
+def downgrade():
+    op.drop_table("embedding_cache")
@@ -0,0 +1,105 @@
+"""add evaluation result
+
+Revision ID: 043
+Revises: 042
+Create Date: 2025-12-05 11:08:42.627190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = "043"
+down_revision = "042"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "evaluation_result",
+        sa.Column(
+            "id",
+            sa.Integer(),
+            nullable=False,
+            comment="Unique identifier for the evaluation result",
+        ),
+        sa.Column(
+            "evaluation_run_id",
+            sa.Integer(),
+            nullable=False,
+            comment="Reference to the evaluation run",
+        ),
+        sa.Column(
+            "item_id",
+            sqlmodel.sql.sqltypes.AutoString(),
+            nullable=False,
+            comment="Langfuse dataset item ID",
+        ),
+        sa.Column(
+            "trace_id",
+            sqlmodel.sql.sqltypes.AutoString(),
+            nullable=True,
+            comment="Langfuse trace ID of the item",
+        ),
+        sa.Column(
+            "question", sa.Text(), nullable=False, comment="Question sent to the model"
+        ),
+        sa.Column(
+            "generated_output",
+            sa.Text(),
+            nullable=False,
+            comment="Output generated by the model",
+        ),
+        sa.Column("ground_truth", sa.Text(), nullable=False, comment="Expected answer"),
+        sa.Column(
+            "cosine_similarity",
+            sa.Float(),
+            nullable=True,
+            comment="Cosine similarity between output and ground truth embeddings",
+        ),
+        sa.Column(
+            "input_tokens",
+            sa.Integer(),
+            nullable=True,
+            comment="Input tokens used for the response",
+        ),
+        sa.Column(
+            "output_tokens",
+            sa.Integer(),
+            nullable=True,
+            comment="Output tokens used for the response",
+        ),
+        sa.Column(
+            "total_tokens",
+            sa.Integer(),
+            nullable=True,
+            comment="Total tokens used for the response",
+        ),
+        sa.Column(
+            "inserted_at",
+            sa.DateTime(),
+            nullable=False,
+            comment="Timestamp when the result was stored",
+        ),
+        sa.ForeignKeyConstraint(
+            ["evaluation_run_id"], ["evaluation_run.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "evaluation_run_id", "item_id", name="uq_evaluation_result_run_item"
+        ),
+    )
+    op.create_index(
+        "idx_evaluation_result_run_trace",
+        "evaluation_result",
+        ["evaluation_run_id", "trace_id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("idx_evaluation_result_run_trace", table_name="evaluation_result")
+    op.drop_table("evaluation_result")
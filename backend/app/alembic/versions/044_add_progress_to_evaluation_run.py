@@ -0,0 +1,33 @@
+"""add progress to evaluation run
+
+Revision ID: 044
+Revises: 043
+Create Date: 2025-12-08 10:21:37.482915
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "044"
+down_revision = "043"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "evaluation_run",
+        sa.Column(
+            "progress",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="Progress of run creation (stage, task_id, total_items)",
+        ),
+    )
+
+
+def downgrade():
+    op.drop_column("evaluation_run", "progress")
@@ -0,0 +1,33 @@
+"""add progress to evaluation dataset
+
+Revision ID: 045
+Revises: 044
+Create Date: 2025-12-10 14:05:12.318604
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "045"
+down_revision = "044"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "evaluation_dataset",
+        sa.Column(
+            "progress",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="Progress of dataset ingestion (stage, task_id, items_processed)",
+        ),
+    )
+
+
+def downgrade():
+    op.drop_column("evaluation_dataset", "progress")
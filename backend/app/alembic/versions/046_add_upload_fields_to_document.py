@@ -0,0 +1,54 @@
+"""add upload fields to document
+
+Revision ID: 046
+Revises: 045
+Create Date: 2025-12-12 10:21:47.512093
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = "046"
+down_revision = "045"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "document",
+        sa.Column(
+            "is_pending",
+            sa.Boolean(),
+            server_default="false",
+            nullable=False,
+            comment="Whether a direct upload is still awaiting finalization",
+        ),
+    )
+    op.add_column(
+        "document",
+        sa.Column(
+            "file_size_bytes",
+            sa.BigInteger(),
+            nullable=True,
+            comment="Size of the stored file in bytes",
+        ),
+    )
+    op.add_column(
+        "document",
+        sa.Column(
+            "sha256",
+            sqlmodel.sql.sqltypes.AutoString(length=64),
+            nullable=True,
+            comment="SHA-256 (hex) of the stored file",
+        ),
+    )
+
+
+def downgrade():
+    op.drop_column("document", "sha256")
+    op.drop_column("document", "file_size_bytes")
+    op.drop_column("document", "is_pending")
@@ -0,0 +1,28 @@
+"""add sha256 index to document
+
+Revision ID: 047
+Revises: 046
+Create Date: 2025-12-12 16:48:03.207415
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "047"
+down_revision = "046"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "idx_document_project_sha256",
+        "document",
+        ["project_id", "sha256"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("idx_document_project_sha256", table_name="document")
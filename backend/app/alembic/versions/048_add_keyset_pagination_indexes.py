@@ -0,0 +1,70 @@
+"""add keyset pagination indexes
+
+Revision ID: 048
+Revises: 047
+Create Date: 2025-12-15 11:20:41.508316
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "048"
+down_revision = "047"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "idx_document_project_inserted_at_id",
+        "document",
+        ["project_id", "inserted_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_collection_project_inserted_at_id",
+        "collection",
+        ["project_id", "inserted_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_openai_conversation_project_inserted_at_id",
+        "openai_conversation",
+        ["project_id", "inserted_at", "id"],
+        unique=False,
+    )
+    op.drop_index(
+        "idx_config_project_id_updated_at_active",
+        table_name="config",
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.create_index(
+        "idx_config_project_id_updated_at_id_active",
+        "config",
+        ["project_id", "updated_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "idx_config_project_id_updated_at_id_active",
+        table_name="config",
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.create_index(
+        "idx_config_project_id_updated_at_active",
+        "config",
+        ["project_id", "updated_at"],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.drop_index(
+        "idx_openai_conversation_project_inserted_at_id",
+        table_name="openai_conversation",
+    )
+    op.drop_index("idx_collection_project_inserted_at_id", table_name="collection")
+    op.drop_index("idx_document_project_inserted_at_id", table_name="document")
@@ -0,0 +1,33 @@
+"""add dataset snapshot to evaluation run
+
+Revision ID: 049
+Revises: 048
+Create Date: 2025-12-16 09:42:18.271604
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "049"
+down_revision = "048"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "evaluation_run",
+        sa.Column(
+            "dataset_snapshot",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="Dataset item snapshot the run was submitted with (url, fingerprint)",
+        ),
+    )
+
+
+def downgrade():
+    op.drop_column("evaluation_run", "dataset_snapshot")
@@ -14,6 +14,7 @@ from app.api.routes import (
     project,
     responses,
     private,
+    storage,
     threads,
     users,
     utils,
@@ -45,6 +46,7 @@ api_router.include_router(openai_conversation.router)
 api_router.include_router(organization.router)
 api_router.include_router(project.router)
 api_router.include_router(responses.router)
+api_router.include_router(storage.router)
 api_router.include_router(threads.router)
 api_router.include_router(users.router)
 api_router.include_router(utils.router)
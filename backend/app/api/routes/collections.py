@@ -10,6 +10,7 @@ from app.api.permissions import Permission, require_permission
 from app.crud import (
     CollectionCrud,
     CollectionJobCrud,
+    CountMode,
     DocumentCollectionCrud,
 )
 from app.models import (
@@ -65,11 +66,17 @@ def collection_callback_notification(body: APIResponse[CollectionJobPublic]):
 def list_collections(
     session: SessionDep,
     current_user: AuthContextDep,
+    limit: int = Query(100, gt=0, le=100),
+    cursor: str
+    | None = Query(None, description="Cursor from the previous page's next_cursor"),
+    count: CountMode = Query(
+        CountMode.NONE, description="Report no, an exact or an estimated total"
+    ),
 ):
     collection_crud = CollectionCrud(session, current_user.project_.id)
-    rows = collection_crud.read_all()
+    page = collection_crud.read_page(limit, cursor=cursor, count=count)
 
-    return APIResponse.success_response(rows)
+    return APIResponse.success_response(page.items, metadata=page.metadata)
 
 
 @router.post(
@@ -2,6 +2,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Query, HTTPException
 
 from app.api.deps import SessionDep, AuthContextDep
+from app.crud import CountMode
 from app.crud.config import ConfigCrud
 from app.models import (
     Config,
@@ -55,15 +56,21 @@ def list_configs(
     session: SessionDep,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum records to return"),
+    cursor: str
+    | None = Query(None, description="Cursor from the previous page's next_cursor"),
+    count: CountMode = Query(
+        CountMode.NONE, description="Report no, an exact or an estimated total"
+    ),
 ):
     """
     List all configurations for the current project.
     Ordered by updated_at in descending order.
     """
     config_crud = ConfigCrud(session=session, project_id=current_user.project_.id)
-    configs = config_crud.read_all(skip=skip, limit=limit)
+    page = config_crud.read_page(limit, cursor=cursor, skip=skip, count=count)
     return APIResponse.success_response(
-        data=configs,
+        data=page.items,
+        metadata=page.metadata,
     )
 
 
@@ -6,6 +6,7 @@ from sqlmodel import Session
 
 from app.api.deps import SessionDep, AuthContextDep
 from app.crud.evaluations import process_all_pending_evaluations_sync
+from app.services.documents.cleanup import delete_expired_pending_uploads
 from app.models import User
 
 logger = logging.getLogger(__name__)
@@ -62,3 +63,28 @@ def evaluation_cron_job(
             "total_failed": 0,
             "total_still_processing": 0,
         }
+
+
+@router.get(
+    "/cron/pending-uploads",
+    include_in_schema=False,
+    dependencies=[Depends(require_permission(Permission.SUPERUSER))],
+)
+def pending_uploads_cron_job(
+    session: SessionDep,
+) -> dict:
+    """
+    Cron job endpoint that removes abandoned direct document uploads.
+
+    Pending documents whose upload URL expired (plus a grace period for
+    finalizing) are deleted together with any object uploaded for them.
+
+    Hidden from Swagger documentation.
+    Requires authentication via FIRST_SUPERUSER credentials.
+    """
+    logger.info("[pending_uploads_cron_job] Cron job invoked")
+
+    deleted = delete_expired_pending_uploads(session=session)
+
+    logger.info(f"[pending_uploads_cron_job] Completed: deleted={deleted}")
+    return {"status": "success", "deleted": deleted}
@@ -72,10 +72,9 @@ def get_multiple_transformation_jobs(
     ),
 ):
     job_crud = DocTransformationJobCrud(session, project_id=current_user.project_.id)
-    doc_crud = DocumentCrud(session, project_id=current_user.project_.id)
 
-    jobs = job_crud.read_each(set(job_ids))
-    jobs_found_ids = {job.id for job in jobs}
+    jobs = job_crud.read_each_with_outputs(set(job_ids))
+    jobs_found_ids = {job.id for job, _ in jobs}
     jobs_not_found = set(job_ids) - jobs_found_ids
 
     storage = (
@@ -86,7 +85,6 @@ def get_multiple_transformation_jobs(
 
     job_schemas = build_job_schemas(
         jobs=jobs,
-        doc_crud=doc_crud,
         include_url=include_url,
         storage=storage,
     )
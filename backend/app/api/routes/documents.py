@@ -16,21 +16,34 @@ from fastapi import Path as FastPath
 
 from app.api.deps import AuthContextDep, SessionDep
 from app.api.permissions import Permission, require_permission
-from app.core.cloud import get_cloud_storage
-from app.crud import CollectionCrud, DocumentCrud
+from app.core.cloud import (
+    CloudStorage,
+    CloudStorageError,
+    get_cloud_storage,
+    run_storage_io,
+)
+from app.core.cloud.storage import describe_file
+from app.core.exception_handlers import HTTPException
+from app.core.util import now
+from app.crud import CollectionCrud, CountMode, DocumentCrud
 from app.crud.rag import OpenAIAssistantCrud, OpenAIVectorStoreCrud
 from app.models import (
     Document,
     DocumentPublic,
     TransformedDocumentPublic,
+    DocumentFinalizeRequest,
     DocumentUploadResponse,
+    DocumentUploadURLRequest,
+    DocumentUploadURLResponse,
     Message,
     TransformationJobInfo,
     DocTransformationJobPublic,
 )
 from app.services.collections.helpers import pick_service_for_documennt
+from app.services.documents.cleanup import UPLOAD_URL_EXPIRES_IN
 from app.services.documents.helpers import (
     schedule_transformation,
+    reuse_or_schedule_transformation,
     pre_transform_validation,
     build_document_schema,
     build_document_schemas,
@@ -45,6 +58,7 @@ from app.utils import (
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/documents", tags=["Documents"])
+
 doctransformation_callback_router = APIRouter()
 
 
@@ -77,12 +91,18 @@ def list_docs(
     current_user: AuthContextDep,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, gt=0, le=100),
+    cursor: str
+    | None = Query(None, description="Cursor from the previous page's next_cursor"),
+    count: CountMode = Query(
+        CountMode.NONE, description="Report no, an exact or an estimated total"
+    ),
     include_url: bool = Query(
         False, description="Include a signed URL to access each document"
     ),
 ):
     crud = DocumentCrud(session, current_user.project_.id)
-    documents = crud.read_many(skip, limit)
+    page = crud.read_page(limit, cursor=cursor, skip=skip, count=count)
+    documents = page.items
 
     storage = (
         get_cloud_storage(session=session, project_id=current_user.project_.id)
@@ -95,7 +115,7 @@ def list_docs(
         include_url=include_url,
         storage=storage,
     )
-    return APIResponse.success_response(results)
+    return APIResponse.success_response(results, metadata=page.metadata)
 
 
 @router.post(
@@ -131,14 +151,40 @@ async def upload_doc(
     )
 
     storage = get_cloud_storage(session=session, project_id=current_user.project_.id)
+    crud = DocumentCrud(session, current_user.project_.id)
+    # Hashing and uploading run on the storage threadpool; a large upload
+    # would otherwise hold up every other request served by this worker
+    stored = await run_storage_io(describe_file, src.file)
+
+    # Content already stored in the project is not uploaded again; the
+    # existing document (and any matching transformation) is returned
+    existing = crud.read_by_sha256(stored.sha256) if stored else None
+    if existing:
+        logger.info(
+            f"[upload_doc] Duplicate upload, returning existing document | {{'doc_id': '{existing.id}', 'project_id': {current_user.project_.id}}}"
+        )
+        job_info = reuse_or_schedule_transformation(
+            session=session,
+            project_id=current_user.project_.id,
+            source_format=source_format,
+            target_format=target_format,
+            actual_transformer=actual_transformer,
+            source_document_id=existing.id,
+            callback_url=callback_url,
+        )
+        return _upload_response(storage, existing, job_info, is_duplicate=True)
+
     document_id = uuid4()
-    object_store_url = storage.put(src, Path(str(document_id)))
+    object_store_url = await storage.aput(
+        src, Path(str(document_id)), sha256=stored.sha256 if stored else None
+    )
 
-    crud = DocumentCrud(session, current_user.project_.id)
     document = Document(
         id=document_id,
         fname=src.filename,
         object_store_url=str(object_store_url),
+        file_size_bytes=stored.size_bytes if stored else None,
+        sha256=stored.sha256 if stored else None,
     )
     source_document = crud.update(document)
 
@@ -151,16 +197,144 @@ async def upload_doc(
         source_document_id=source_document.id,
         callback_url=callback_url,
     )
+    return _upload_response(storage, source_document, job_info)
 
-    document_schema = DocumentPublic.model_validate(
-        source_document, from_attributes=True
+
+@router.post(
+    "/upload-url",
+    description=load_description("documents/upload_url.md"),
+    response_model=APIResponse[DocumentUploadURLResponse],
+    dependencies=[Depends(require_permission(Permission.REQUIRE_PROJECT))],
+)
+def create_upload_url(
+    session: SessionDep,
+    current_user: AuthContextDep,
+    request: DocumentUploadURLRequest,
+):
+    storage = get_cloud_storage(session=session, project_id=current_user.project_.id)
+    document_id = uuid4()
+    signed_upload = storage.get_signed_upload(
+        Path(str(document_id)),
+        sha256=request.sha256,
+        content_type=request.content_type,
+        expires_in=UPLOAD_URL_EXPIRES_IN,
     )
-    document_schema.signed_url = storage.get_signed_url(
-        source_document.object_store_url
+
+    crud = DocumentCrud(session, current_user.project_.id)
+    document = Document(
+        id=document_id,
+        fname=request.fname,
+        object_store_url=str(signed_upload.destination),
+        sha256=request.sha256,
+        is_pending=True,
     )
+    crud.update(document)
+
+    response = DocumentUploadURLResponse(
+        id=document_id,
+        upload_url=signed_upload.url,
+        upload_headers=signed_upload.headers,
+        expires_in=UPLOAD_URL_EXPIRES_IN,
+    )
+    return APIResponse.success_response(response)
+
+
+@router.post(
+    "/{doc_id}/finalize",
+    description=load_description("documents/finalize.md"),
+    response_model=APIResponse[DocumentUploadResponse],
+    callbacks=doctransformation_callback_router.routes,
+    dependencies=[Depends(require_permission(Permission.REQUIRE_PROJECT))],
+)
+def finalize_upload(
+    session: SessionDep,
+    current_user: AuthContextDep,
+    request: DocumentFinalizeRequest,
+    doc_id: UUID = FastPath(description="Pending document to finalize"),
+):
+    if request.callback_url:
+        validate_callback_url(request.callback_url)
+
+    crud = DocumentCrud(session, current_user.project_.id)
+    document = crud.read_pending(doc_id)
+
+    source_format, actual_transformer = pre_transform_validation(
+        src_filename=document.fname,
+        target_format=request.target_format,
+        transformer=request.transformer,
+    )
+
+    storage = get_cloud_storage(session=session, project_id=current_user.project_.id)
+    try:
+        stored = storage.get_object_info(document.object_store_url)
+    except CloudStorageError as err:
+        logger.warning(
+            f"[finalize_upload] Uploaded file not available | {{'doc_id': '{doc_id}', 'error': '{str(err)}'}}"
+        )
+        raise HTTPException(
+            status_code=400, detail="Uploaded file not found or failed verification"
+        )
+
+    if stored.sha256 != document.sha256:
+        logger.warning(
+            f"[finalize_upload] Uploaded file checksum mismatch | {{'doc_id': '{doc_id}'}}"
+        )
+        raise HTTPException(
+            status_code=400,
+            detail="Uploaded file does not match the checksum of the upload request",
+        )
+
+    # The same content was stored by another upload in the meantime: drop
+    # this copy and return the existing document
+    existing = crud.read_by_sha256(document.sha256)
+    if existing:
+        logger.info(
+            f"[finalize_upload] Duplicate upload, returning existing document | {{'doc_id': '{doc_id}', 'existing_doc_id': '{existing.id}'}}"
+        )
+        storage.delete(document.object_store_url)
+        document.is_deleted = True
+        document.deleted_at = now()
+        crud.update(document)
+
+        job_info = reuse_or_schedule_transformation(
+            session=session,
+            project_id=current_user.project_.id,
+            source_format=source_format,
+            target_format=request.target_format,
+            actual_transformer=actual_transformer,
+            source_document_id=existing.id,
+            callback_url=request.callback_url,
+        )
+        return _upload_response(storage, existing, job_info, is_duplicate=True)
+
+    document.file_size_bytes = stored.size_bytes
+    document.is_pending = False
+    source_document = crud.update(document)
+
+    job_info: TransformationJobInfo | None = schedule_transformation(
+        session=session,
+        project_id=current_user.project_.id,
+        source_format=source_format,
+        target_format=request.target_format,
+        actual_transformer=actual_transformer,
+        source_document_id=source_document.id,
+        callback_url=request.callback_url,
+    )
+    return _upload_response(storage, source_document, job_info)
+
+
+def _upload_response(
+    storage: CloudStorage,
+    document: Document,
+    job_info: TransformationJobInfo | None,
+    is_duplicate: bool = False,
+):
+    document_schema = DocumentPublic.model_validate(document, from_attributes=True)
+    document_schema.signed_url = storage.get_signed_url(document.object_store_url)
 
     response = DocumentUploadResponse(
         **document_schema.model_dump(),
+        is_duplicate=is_duplicate,
         transformation_job=job_info,
     )
     return APIResponse.success_response(response)
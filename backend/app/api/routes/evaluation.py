@@ -1,5 +1,4 @@
 import csv
-import io
 import logging
 import re
 from pathlib import Path
@@ -14,10 +13,11 @@ from fastapi import (
     UploadFile,
     Depends,
 )
+from fastapi.concurrency import run_in_threadpool
 
 from app.api.deps import AuthContextDep, SessionDep
 from app.api.permissions import Permission, require_permission
-from app.core.cloud import get_cloud_storage
+from app.core.cloud import get_cloud_storage, run_storage_io
 from app.crud.assistants import get_assistant_by_id
 from app.crud.evaluations import (
     create_evaluation_dataset,
@@ -25,18 +25,27 @@ from app.crud.evaluations import (
     get_dataset_by_id,
     get_evaluation_run_by_id,
     list_datasets,
-    start_evaluation_batch,
     upload_csv_to_object_store,
-    upload_dataset_to_langfuse,
 )
 from app.crud.evaluations import list_evaluation_runs as list_evaluation_runs_crud
 from app.crud.evaluations.core import save_score
 from app.crud.evaluations.dataset import delete_dataset as delete_dataset_crud
+from app.crud.evaluations.dataset import get_dataset_by_name, read_csv_columns
+from app.crud.evaluations.embeddings import resolve_embedding_config
 from app.crud.evaluations.langfuse import fetch_trace_scores_from_langfuse
+from app.crud.evaluations.results import (
+    get_evaluation_result_summary,
+    list_evaluation_results,
+)
 from app.models.evaluation import (
     DatasetUploadResponse,
+    EvaluationResultPublic,
+    EvaluationResultSummary,
+    EvaluationRun,
     EvaluationRunPublic,
 )
+from app.services.evaluations.ingestion import start_job as start_ingestion_job
+from app.services.evaluations.jobs import start_job as start_evaluation_job
 from app.utils import (
     APIResponse,
     get_langfuse_client,
@@ -47,7 +56,9 @@ from app.utils import (
 logger = logging.getLogger(__name__)
 
 # File upload security constants
-MAX_FILE_SIZE = 1024 * 1024  # 1 MB
+# CSVs are streamed to the object store and parsed by a background job, so the
+# limit only bounds storage, not API memory
+MAX_FILE_SIZE = 512 * 1024 * 1024  # 512 MB
 ALLOWED_EXTENSIONS = {".csv"}
 ALLOWED_MIME_TYPES = {
     "text/csv",
@@ -68,6 +79,7 @@ def _dataset_to_response(dataset) -> DatasetUploadResponse:
         duplication_factor=dataset.dataset_metadata.get("duplication_factor", 1),
         langfuse_dataset_id=dataset.langfuse_dataset_id,
         object_store_url=dataset.object_store_url,
+        progress=dataset.progress,
     )
 
 
@@ -188,150 +200,87 @@ async def upload_dataset(
     if file_size == 0:
         raise HTTPException(status_code=422, detail="Empty file uploaded")
 
-    # Read CSV content
-    csv_content = await file.read()
-
-    # Step 1: Parse and validate CSV
+    # Step 1: Validate the CSV header; rows are parsed by the ingestion job
     try:
-        csv_text = csv_content.decode("utf-8")
-        csv_reader = csv.DictReader(io.StringIO(csv_text))
-
-        if not csv_reader.fieldnames:
-            raise HTTPException(status_code=422, detail="CSV file has no headers")
-
-        # Normalize headers for case-insensitive matching
-        clean_headers = {
-            field.strip().lower(): field for field in csv_reader.fieldnames
-        }
-
-        # Validate required headers (case-insensitive)
-        if "question" not in clean_headers or "answer" not in clean_headers:
-            raise HTTPException(
-                status_code=422,
-                detail=f"CSV must contain 'question' and 'answer' columns "
-                f"Found columns: {csv_reader.fieldnames}",
-            )
-
-        # Get the actual column names from the CSV
-        question_col = clean_headers["question"]
-        answer_col = clean_headers["answer"]
-
-        # Count original items
-        original_items = []
-        for row in csv_reader:
-            question = row.get(question_col, "").strip()
-            answer = row.get(answer_col, "").strip()
-            if question and answer:
-                original_items.append({"question": question, "answer": answer})
-
-        if not original_items:
-            raise HTTPException(
-                status_code=422, detail="No valid items found in CSV file"
-            )
-
-        original_items_count = len(original_items)
-        total_items_count = original_items_count * duplication_factor
+        await run_in_threadpool(read_csv_columns, file.file)
+    except (ValueError, csv.Error) as e:
+        logger.error(f"[upload_dataset] Invalid CSV header | {e}")
+        raise HTTPException(status_code=422, detail=f"Invalid CSV file: {e}")
 
-        logger.info(
-            f"[upload_dataset] Parsed items from CSV | original={original_items_count} | "
-            f"total_with_duplication={total_items_count}"
+    if get_dataset_by_name(
+        session=_session,
+        name=dataset_name,
+        organization_id=auth_context.organization_.id,
+        project_id=auth_context.project_.id,
+    ):
+        raise HTTPException(
+            status_code=409,
+            detail=f"Dataset with name '{dataset_name}' already exists in this "
+            "organization and project. Please choose a different name.",
         )
 
-    except Exception as e:
-        logger.error(f"[upload_dataset] Failed to parse CSV | {e}", exc_info=True)
-        raise HTTPException(status_code=422, detail=f"Invalid CSV file: {e}")
+    # Fail fast if Langfuse credentials are missing; the ingestion job builds
+    # its own client
+    get_langfuse_client(
+        session=_session,
+        org_id=auth_context.organization_.id,
+        project_id=auth_context.project_.id,
+    )
 
-    # Step 2: Upload to object store (if credentials configured)
-    object_store_url = None
+    # Step 2: Stream the upload to the object store, where the ingestion job
+    # reads it from
     try:
         storage = get_cloud_storage(
             session=_session, project_id=auth_context.project_.id
         )
-        object_store_url = upload_csv_to_object_store(
-            storage=storage, csv_content=csv_content, dataset_name=dataset_name
-        )
-        if object_store_url:
-            logger.info(
-                f"[upload_dataset] Successfully uploaded CSV to object store | {object_store_url}"
-            )
-        else:
-            logger.info(
-                "[upload_dataset] Object store upload returned None | continuing without object store storage"
-            )
     except Exception as e:
-        logger.warning(
-            f"[upload_dataset] Failed to upload CSV to object store (continuing without object store) | {e}",
-            exc_info=True,
-        )
-        object_store_url = None
-
-    # Step 3: Upload to Langfuse
-    langfuse_dataset_id = None
-    try:
-        # Get Langfuse client
-        langfuse = get_langfuse_client(
-            session=_session,
-            org_id=auth_context.organization_.id,
-            project_id=auth_context.project_.id,
-        )
-
-        # Upload to Langfuse
-        langfuse_dataset_id, _ = upload_dataset_to_langfuse(
-            langfuse=langfuse,
-            items=original_items,
-            dataset_name=dataset_name,
-            duplication_factor=duplication_factor,
+        logger.error(
+            f"[upload_dataset] Failed to initialize object store | {e}", exc_info=True
         )
-
-        logger.info(
-            f"[upload_dataset] Successfully uploaded dataset to Langfuse | "
-            f"dataset={dataset_name} | id={langfuse_dataset_id}"
+        raise HTTPException(
+            status_code=503, detail="Object store is not available for this project"
         )
 
-    except Exception as e:
-        logger.error(
-            f"[upload_dataset] Failed to upload dataset to Langfuse | {e}",
-            exc_info=True,
-        )
+    object_store_url = await run_storage_io(
+        upload_csv_to_object_store,
+        storage=storage,
+        csv_content=file.file,
+        dataset_name=dataset_name,
+    )
+    if not object_store_url:
         raise HTTPException(
-            status_code=500, detail=f"Failed to upload dataset to Langfuse: {e}"
+            status_code=503, detail="Failed to upload dataset file to object store"
         )
 
-    # Step 4: Store metadata in database
-    metadata = {
-        "original_items_count": original_items_count,
-        "total_items_count": total_items_count,
-        "duplication_factor": duplication_factor,
-    }
+    logger.info(
+        f"[upload_dataset] Uploaded CSV to object store | size={file_size} | "
+        f"{object_store_url}"
+    )
 
+    # Step 3: Store the dataset and queue ingestion; counts and the Langfuse
+    # dataset ID are filled in by the job
     dataset = create_evaluation_dataset(
         session=_session,
         name=dataset_name,
         description=description,
-        dataset_metadata=metadata,
+        dataset_metadata={
+            "original_items_count": 0,
+            "total_items_count": 0,
+            "duplication_factor": duplication_factor,
+        },
         object_store_url=object_store_url,
-        langfuse_dataset_id=langfuse_dataset_id,
         organization_id=auth_context.organization_.id,
         project_id=auth_context.project_.id,
+        progress={"stage": "queued"},
     )
+    dataset = start_ingestion_job(db=_session, dataset=dataset)
 
     logger.info(
-        f"[upload_dataset] Successfully created dataset record in database | "
+        f"[upload_dataset] Dataset created, ingestion queued | "
         f"id={dataset.id} | name={dataset_name}"
     )
 
-    # Return response
-    return APIResponse.success_response(
-        data=DatasetUploadResponse(
-            dataset_id=dataset.id,
-            dataset_name=dataset_name,
-            total_items=total_items_count,
-            original_items=original_items_count,
-            duplication_factor=duplication_factor,
-            langfuse_dataset_id=langfuse_dataset_id,
-            object_store_url=object_store_url,
-        )
-    )
+    return APIResponse.success_response(data=_dataset_to_response(dataset))
 
 
 @router.get(
@@ -459,6 +408,13 @@ def evaluate(
         f"config_keys={list(config.keys())}"
     )
 
+    # Similarity scoring settings are validated up front and recorded in the
+    # run config with their resolved values
+    try:
+        embedding_config = resolve_embedding_config(config)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     # Step 1: Fetch dataset from database
     dataset = get_dataset_by_id(
         session=_session,
@@ -482,13 +438,22 @@ def evaluate(
 
     dataset_name = dataset.name
 
-    # Get API clients
-    openai_client = get_openai_client(
+    ingestion_stage = (dataset.progress or {}).get("stage")
+    if ingestion_stage not in (None, "completed"):
+        raise HTTPException(
+            status_code=409,
+            detail=f"Dataset {dataset_id} is not ready for evaluation "
+            f"(ingestion stage: {ingestion_stage})",
+        )
+
+    # Fail fast if credentials are missing; the background job builds its own
+    # clients
+    get_openai_client(
         session=_session,
         org_id=auth_context.organization_.id,
         project_id=auth_context.project_.id,
     )
-    langfuse = get_langfuse_client(
+    get_langfuse_client(
         session=_session,
         org_id=auth_context.organization_.id,
         project_id=auth_context.project_.id,
@@ -552,6 +517,8 @@ def evaluate(
                 detail="Config must include 'model' when assistant_id is not provided",
             )
 
+    config = {**config, **embedding_config}
+
     # Create EvaluationRun record
     eval_run = create_evaluation_run(
         session=_session,
@@ -561,33 +528,18 @@ def evaluate(
         config=config,
         organization_id=auth_context.organization_.id,
         project_id=auth_context.project_.id,
+        progress={"stage": "queued"},
     )
 
-    # Start the batch evaluation
-    try:
-        eval_run = start_evaluation_batch(
-            langfuse=langfuse,
-            openai_client=openai_client,
-            session=_session,
-            eval_run=eval_run,
-            config=config,
-        )
-
-        logger.info(
-            f"[evaluate] Evaluation started successfully | "
-            f"batch_job_id={eval_run.batch_job_id} | total_items={eval_run.total_items}"
-        )
+    # Fetching the dataset and submitting the batch run in a Celery task; the
+    # run is returned as pending and its progress is updated by the task
+    eval_run = start_evaluation_job(db=_session, eval_run=eval_run)
 
-        return APIResponse.success_response(data=eval_run)
+    logger.info(
+        f"[evaluate] Evaluation queued | run_id={eval_run.id} | status={eval_run.status}"
+    )
 
-    except Exception as e:
-        logger.error(
-            f"[evaluate] Failed to start evaluation | run_id={eval_run.id} | {e}",
-            exc_info=True,
-        )
-        # Error is already handled in start_evaluation_batch
-        _session.refresh(eval_run)
-        return APIResponse.success_response(data=eval_run)
+    return APIResponse.success_response(data=eval_run)
 
 
 @router.get(
@@ -686,10 +638,17 @@ def get_evaluation_run_status(
                 data=eval_run,
             )
 
-        # Check if we already have cached scores (before any slow operations)
+        # Check if we already have cached scores (before any slow operations).
+        # A partial result (some traces failed to fetch) is resumed instead.
         has_cached_score = eval_run.score is not None and "traces" in eval_run.score
-        if not resync_score and has_cached_score:
+        is_partial_score = has_cached_score and bool(
+            eval_run.score.get("failed_trace_ids")
+        )
+        if not resync_score and has_cached_score and not is_partial_score:
             return APIResponse.success_response(data=eval_run)
+        cached_traces = (
+            eval_run.score["traces"] if is_partial_score and not resync_score else None
+        )
 
         # Get Langfuse client (needs session for credentials lookup)
         langfuse = get_langfuse_client(
@@ -712,6 +671,7 @@ def get_evaluation_run_status(
                 langfuse=langfuse,
                 dataset_name=dataset_name,
                 run_name=run_name,
+                cached_traces=cached_traces,
             )
         except ValueError as e:
             # Run not found in Langfuse - return eval_run with error
@@ -746,3 +706,79 @@ def get_evaluation_run_status(
             )
 
     return APIResponse.success_response(data=eval_run)
+
+
+def _get_evaluation_run_or_404(
+    session: SessionDep, auth_context: AuthContextDep, evaluation_id: int
+) -> EvaluationRun:
+    eval_run = get_evaluation_run_by_id(
+        session=session,
+        evaluation_id=evaluation_id,
+        organization_id=auth_context.organization_.id,
+        project_id=auth_context.project_.id,
+    )
+    if not eval_run:
+        raise HTTPException(
+            status_code=404,
+            detail=(
+                f"Evaluation run {evaluation_id} not found or not accessible "
+                "to this organization"
+            ),
+        )
+    return eval_run
+
+
+@router.get(
+    "/evaluations/{evaluation_id}/results",
+    description=load_description("evaluation/list_evaluation_results.md"),
+    response_model=APIResponse[list[EvaluationResultPublic]],
+    dependencies=[Depends(require_permission(Permission.REQUIRE_PROJECT))],
+)
+def list_evaluation_results_endpoint(
+    evaluation_id: int,
+    _session: SessionDep,
+    auth_context: AuthContextDep,
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    cursor: str
+    | None = Query(None, description="Cursor from the previous page's next_cursor"),
+) -> APIResponse[list[EvaluationResultPublic]]:
+    logger.info(
+        f"[list_evaluation_results] Listing evaluation results | "
+        f"evaluation_id={evaluation_id} | "
+        f"project_id={auth_context.project_.id} | limit={limit} | offset={offset}"
+    )
+
+    eval_run = _get_evaluation_run_or_404(_session, auth_context, evaluation_id)
+
+    page = list_evaluation_results(
+        session=_session,
+        eval_run_id=eval_run.id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+    )
+    return APIResponse.success_response(data=page.items, metadata=page.metadata)
+
+
+@router.get(
+    "/evaluations/{evaluation_id}/summary",
+    description=load_description("evaluation/get_evaluation_summary.md"),
+    response_model=APIResponse[EvaluationResultSummary],
+    dependencies=[Depends(require_permission(Permission.REQUIRE_PROJECT))],
+)
+def get_evaluation_summary(
+    evaluation_id: int,
+    _session: SessionDep,
+    auth_context: AuthContextDep,
+) -> APIResponse[EvaluationResultSummary]:
+    logger.info(
+        f"[get_evaluation_summary] Summarizing evaluation results | "
+        f"evaluation_id={evaluation_id} | project_id={auth_context.project_.id}"
+    )
+
+    eval_run = _get_evaluation_run_or_404(_session, auth_context, evaluation_id)
+
+    return APIResponse.success_response(
+        data=get_evaluation_result_summary(session=_session, eval_run_id=eval_run.id)
+    )
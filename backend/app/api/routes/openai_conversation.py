@@ -8,9 +8,9 @@ from app.crud import (
     get_conversation_by_id,
     get_conversation_by_response_id,
     get_conversation_by_ancestor_id,
-    get_conversations_by_project,
-    get_conversations_count_by_project,
+    get_conversations_page_by_project,
     delete_conversation,
+    CountMode,
 )
 from app.models import (
     OpenAIConversationPublic,
@@ -111,25 +111,26 @@ def list_conversations_route(
     current_user: AuthContextDep,
     skip: int = Query(0, ge=0, description="How many items to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum items to return"),
+    cursor: str
+    | None = Query(None, description="Cursor from the previous page's next_cursor"),
+    count: CountMode = Query(
+        CountMode.EXACT, description="Report no, an exact or an estimated total"
+    ),
 ):
     """
     List all conversations in the current project.
     """
-    conversations = get_conversations_by_project(
-        session=session,
-        project_id=current_user.project_.id,
-        skip=skip,  # ← Pagination offset
-        limit=limit,  # ← Page size
-    )
-
-    # Get total count for pagination metadata
-    total = get_conversations_count_by_project(
+    page = get_conversations_page_by_project(
         session=session,
         project_id=current_user.project_.id,
+        limit=limit,
+        cursor=cursor,
+        skip=skip,
+        count=count,
     )
 
     return APIResponse.success_response(
-        data=conversations, metadata={"skip": skip, "limit": limit, "total": total}
+        data=page.items, metadata={"skip": skip, "limit": limit, **page.metadata}
     )
 
 
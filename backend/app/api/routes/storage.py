@@ -0,0 +1,172 @@
+import asyncio
+import logging
+
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import FileResponse
+
+from app.core.cloud import CloudStorageError, run_storage_io
+from app.core.cloud.storage import (
+    CHECKSUM_METADATA_KEY,
+    LOCAL_CHECKSUM_HEADER,
+    SimpleStorageName,
+    get_local_object_path,
+    read_local_metadata,
+    verify_local_url,
+    write_local_object,
+)
+from app.core.config import settings
+from app.utils import APIResponse
+
+logger = logging.getLogger(__name__)
+
+# Signed URLs of the local storage backend point here; the signature in the
+# query string is the only credential, as with S3 presigned URLs
+router = APIRouter(prefix="/storage", tags=["Storage"], include_in_schema=False)
+
+
+def _verify_or_raise(
+    method: str,
+    name: SimpleStorageName,
+    expires: int,
+    signature: str,
+    sha256: str | None = None,
+) -> None:
+    if settings.STORAGE_BACKEND != "local":
+        raise HTTPException(status_code=404, detail="Not found")
+    if not verify_local_url(method, name, expires, signature, sha256):
+        logger.warning(
+            f"[storage] Invalid or expired signature | "
+            f"{{'method': '{method}', 'bucket': '{name.Bucket}'}}"
+        )
+        raise HTTPException(status_code=403, detail="Invalid or expired signature")
+
+
+class _BodyTooLarge(Exception):
+    pass
+
+
+class _RequestBodyReader:
+    """
+    Blocking file-like view of a request body for a storage thread.
+
+    Each read pulls the next chunks from the request stream on the event loop,
+    so the body goes straight into the object's temporary file without being
+    buffered or spooled to disk first.
+    """
+
+    def __init__(
+        self, request: Request, loop: asyncio.AbstractEventLoop, max_bytes: int
+    ):
+        self._chunks = request.stream()
+        self._loop = loop
+        self._max_bytes = max_bytes
+        self._buffer = bytearray()
+        self._received = 0
+        self._finished = False
+
+    async def _next_chunk(self) -> bytes:
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._finished and (size < 0 or len(self._buffer) < size):
+            chunk = asyncio.run_coroutine_threadsafe(
+                self._next_chunk(), self._loop
+            ).result()
+            if not chunk:
+                self._finished = True
+                break
+            self._received += len(chunk)
+            if self._received > self._max_bytes:
+                raise _BodyTooLarge()
+            self._buffer.extend(chunk)
+
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+
+def _too_large() -> HTTPException:
+    max_mb = settings.LOCAL_STORAGE_MAX_UPLOAD_BYTES / (1024 * 1024)
+    return HTTPException(
+        status_code=413, detail=f"File too large. Maximum size: {max_mb:.0f}MB"
+    )
+
+
+@router.get("/{bucket}/{key:path}")
+def download_object(
+    bucket: str,
+    key: str,
+    expires: int = Query(...),
+    signature: str = Query(...),
+):
+    name = SimpleStorageName(Key=key, Bucket=bucket)
+    _verify_or_raise("GET", name, expires, signature)
+
+    try:
+        path = get_local_object_path(name)
+    except CloudStorageError:
+        raise HTTPException(status_code=404, detail="Not found")
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail="Not found")
+
+    metadata = read_local_metadata(name)
+    return FileResponse(
+        path,
+        media_type=metadata.get("content_type") or "application/octet-stream",
+        headers={"Cache-Control": "private, max-age=300"},
+    )
+
+
+@router.put("/{bucket}/{key:path}")
+async def upload_object(
+    bucket: str,
+    key: str,
+    request: Request,
+    expires: int = Query(...),
+    signature: str = Query(...),
+    sha256: str = Header(..., alias=LOCAL_CHECKSUM_HEADER),
+    content_type: str | None = Header(None),
+):
+    name = SimpleStorageName(Key=key, Bucket=bucket)
+    _verify_or_raise("PUT", name, expires, signature, sha256)
+
+    content_length = request.headers.get("content-length")
+    if (
+        content_length
+        and content_length.isdigit()
+        and int(content_length) > settings.LOCAL_STORAGE_MAX_UPLOAD_BYTES
+    ):
+        raise _too_large()
+
+    # The body is read and written on the storage threadpool, so disk writes
+    # never block the event loop
+    body = _RequestBodyReader(
+        request,
+        asyncio.get_running_loop(),
+        max_bytes=settings.LOCAL_STORAGE_MAX_UPLOAD_BYTES,
+    )
+    try:
+        stored = await run_storage_io(
+            write_local_object,
+            name,
+            body,
+            sha256=sha256,
+            content_type=content_type,
+        )
+    except _BodyTooLarge:
+        logger.warning(
+            f"[upload_object] Upload too large | {{'bucket': '{name.Bucket}'}}"
+        )
+        raise _too_large()
+    except CloudStorageError as err:
+        logger.warning(f"[upload_object] Upload rejected | {err}")
+        raise HTTPException(status_code=400, detail=str(err))
+
+    return APIResponse.success_response(
+        {"size_bytes": stored.size_bytes, CHECKSUM_METADATA_KEY: stored.sha256}
+    )
@@ -0,0 +1,490 @@
+"""Micro-benchmarks for evaluation scoring and processing code paths."""
+
+import ast
+import gc
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import typer
+
+from app.core.batch.jsonl import JSON_DECODER, decode_json
+from app.crud.evaluations.embeddings import (
+    calculate_average_similarity,
+    calculate_cosine_similarities,
+    calculate_cosine_similarity,
+    parse_embedding_results,
+    truncate_embedding,
+)
+from app.crud.evaluations.processing import (
+    extract_generated_output,
+    extract_output_text,
+    parse_evaluation_output,
+)
+
+cli = typer.Typer(help=__doc__)
+
+
+def build_embedding_pairs(pairs: int, dims: int, seed: int = 0) -> list[dict]:
+    """Build random embedding pairs shaped like parse_embedding_results() output."""
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            "trace_id": f"trace_{i}",
+            "output_embedding": rng.normal(size=dims).tolist(),
+            "ground_truth_embedding": rng.normal(size=dims).tolist(),
+        }
+        for i in range(pairs)
+    ]
+
+
+def build_matryoshka_pairs(pairs: int, dims: int, seed: int = 0) -> list[dict]:
+    """
+    Build unit-norm embedding pairs whose variance decays with the dimension index.
+
+    text-embedding-3 vectors concentrate their information in the leading
+    dimensions; a 1/sqrt(i) spectrum mimics that, and ground truths are mixed
+    with their outputs at random strengths to spread similarities over (0, 1).
+    """
+    rng = np.random.default_rng(seed)
+    spectrum = 1.0 / np.sqrt(np.arange(1, dims + 1))
+    outputs = rng.normal(size=(pairs, dims)) * spectrum
+    noise = rng.normal(size=(pairs, dims)) * spectrum
+    mix = rng.uniform(0.2, 1.0, size=(pairs, 1))
+    ground_truths = mix * outputs + np.sqrt(1 - mix**2) * noise
+
+    outputs /= np.linalg.norm(outputs, axis=1, keepdims=True)
+    ground_truths /= np.linalg.norm(ground_truths, axis=1, keepdims=True)
+    return [
+        {
+            "trace_id": f"trace_{i}",
+            "output_embedding": outputs[i].astype(np.float32),
+            "ground_truth_embedding": ground_truths[i].astype(np.float32),
+        }
+        for i in range(pairs)
+    ]
+
+
+def load_embedding_fixture(path: Path) -> list[dict]:
+    """Load embedding pairs from a downloaded embedding batch output JSONL file."""
+    with path.open() as f:
+        raw_results = [json.loads(line) for line in f if line.strip()]
+    return parse_embedding_results(raw_results)
+
+
+def loop_average_similarity(embedding_pairs: list[dict]) -> float:
+    """Per-pair Python loop that calculate_average_similarity used to run."""
+    similarities = [
+        calculate_cosine_similarity(
+            pair["output_embedding"], pair["ground_truth_embedding"]
+        )
+        for pair in embedding_pairs
+    ]
+    return float(np.mean(similarities))
+
+
+def time_best_of(func: Callable[[], Any], repeat: int) -> float:
+    """Return the fastest wall-clock time of `repeat` calls, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def print_timings(timings: dict[str, float]):
+    """Print timings in milliseconds with the speedup over the first entry."""
+    baseline = next(iter(timings.values()))
+    for name, value in timings.items():
+        typer.echo(f"{name:>12}: {value * 1000:10.2f} ms  ({baseline / value:.1f}x)")
+
+
+@cli.command()
+def cosine(
+    pairs: int = typer.Option(2000, help="Number of embedding pairs."),
+    dims: int = typer.Option(3072, help="Embedding dimensions."),
+    repeat: int = typer.Option(3, help="Runs per implementation; best is reported."),
+):
+    """
+    Compare the per-pair cosine loop with the vectorized similarity engine.
+
+    How to run the benchmark: in backend/ run `uv run ai-cli bench evaluation cosine --pairs 2000 --dims 3072`
+    """
+    embedding_pairs = build_embedding_pairs(pairs, dims)
+    typer.echo(f"Scoring {pairs} pairs of {dims}-dim embeddings")
+
+    loop_avg = loop_average_similarity(embedding_pairs)
+    vectorized_avg = calculate_average_similarity(embedding_pairs)[
+        "cosine_similarity_avg"
+    ]
+    if abs(loop_avg - vectorized_avg) > 1e-5:
+        typer.echo(f"Results differ: loop={loop_avg} vectorized={vectorized_avg}")
+        raise typer.Exit(code=1)
+
+    # Pairs as parse_embedding_results() returns them for base64 responses
+    decoded_pairs = [
+        {
+            "trace_id": pair["trace_id"],
+            "output_embedding": np.asarray(pair["output_embedding"], dtype="<f4"),
+            "ground_truth_embedding": np.asarray(
+                pair["ground_truth_embedding"], dtype="<f4"
+            ),
+        }
+        for pair in embedding_pairs
+    ]
+    outputs = np.stack([pair["output_embedding"] for pair in decoded_pairs])
+    ground_truths = np.stack([pair["ground_truth_embedding"] for pair in decoded_pairs])
+
+    # "vectorized" scores float lists, which spends most of its time converting
+    # Python floats; "base64" scores the float32 arrays decoded from base64
+    # responses; "kernel" is the similarity math alone
+    print_timings(
+        {
+            "loop": time_best_of(
+                lambda: loop_average_similarity(embedding_pairs), repeat
+            ),
+            "vectorized": time_best_of(
+                lambda: calculate_average_similarity(embedding_pairs), repeat
+            ),
+            "base64": time_best_of(
+                lambda: calculate_average_similarity(decoded_pairs), repeat
+            ),
+            "kernel": time_best_of(
+                lambda: calculate_cosine_similarities(outputs, ground_truths), repeat
+            ),
+        }
+    )
+
+
+@cli.command()
+def dimensions(
+    pairs: int = typer.Option(2000, help="Number of synthetic embedding pairs."),
+    dims: int = typer.Option(3072, help="Full embedding size of synthetic pairs."),
+    sizes: str = typer.Option(
+        "256,512,1024,1536", help="Comma-separated reduced sizes to compare."
+    ),
+    fixture: Path
+    | None = typer.Option(
+        None,
+        help="Embedding batch output JSONL (full size) to use instead of "
+        "synthetic pairs.",
+    ),
+    repeat: int = typer.Option(3, help="Runs per size; best is reported."),
+):
+    """
+    Compare similarity scores at reduced embedding sizes with the full size.
+
+    Reduced embeddings are derived by truncation and renormalization, which is
+    how text-embedding-3 shortens them. Reports the score drift against the full
+    size, scoring time and the size of the decoded vectors.
+
+    How to run the benchmark: in backend/ run `uv run ai-cli bench evaluation dimensions --fixture output.jsonl`
+    """
+    if fixture:
+        embedding_pairs = load_embedding_fixture(fixture)
+        if not embedding_pairs:
+            typer.echo(f"No embedding pairs found in {fixture}")
+            raise typer.Exit(code=1)
+        dims = len(embedding_pairs[0]["output_embedding"])
+    else:
+        embedding_pairs = build_matryoshka_pairs(pairs, dims)
+
+    typer.echo(f"Scoring {len(embedding_pairs)} pairs of {dims}-dim embeddings")
+    full_stats = calculate_average_similarity(embedding_pairs)
+    full_scores = np.array(
+        [item["cosine_similarity"] for item in full_stats["per_item_scores"]]
+    )
+
+    typer.echo(
+        f"{'dims':>6} {'avg':>8} {'avg drift':>10} {'mean |drift|':>13} "
+        f"{'max |drift|':>12} {'time ms':>9} {'vectors MB':>11}"
+    )
+    for size in [int(size) for size in sizes.split(",")] + [dims]:
+        if size > dims:
+            continue
+        reduced_pairs = [
+            {
+                "trace_id": pair["trace_id"],
+                "output_embedding": truncate_embedding(pair["output_embedding"], size),
+                "ground_truth_embedding": truncate_embedding(
+                    pair["ground_truth_embedding"], size
+                ),
+            }
+            for pair in embedding_pairs
+        ]
+        stats = calculate_average_similarity(reduced_pairs)
+        scores = np.array(
+            [item["cosine_similarity"] for item in stats["per_item_scores"]]
+        )
+        drift = np.abs(scores - full_scores)
+        elapsed = time_best_of(
+            lambda: calculate_average_similarity(reduced_pairs), repeat
+        )
+        # Two float32 vectors per pair once decoded
+        vectors_mb = len(reduced_pairs) * size * 4 * 2 / 1024**2
+
+        typer.echo(
+            f"{size:>6} {stats['cosine_similarity_avg']:>8.4f} "
+            f"{stats['cosine_similarity_avg'] - full_stats['cosine_similarity_avg']:>+10.4f} "
+            f"{drift.mean():>13.4f} {drift.max():>12.4f} "
+            f"{elapsed * 1000:>9.2f} {vectors_mb:>11.1f}"
+        )
+
+
+def build_response_batch(items: int) -> tuple[list[dict], list[dict]]:
+    """Build synthetic Responses batch output and the matching dataset items."""
+    dataset_items = [
+        {
+            "id": f"item_{i}",
+            "input": {"question": f"Question {i}: " + "context " * 20},
+            "expected_output": {"answer": f"Answer {i}: " + "fact " * 30},
+        }
+        for i in range(items)
+    ]
+    raw_results = [
+        {
+            "custom_id": f"item_{i}",
+            "response": {
+                "body": {
+                    "id": f"resp_{i:032x}",
+                    "output": [
+                        {
+                            "type": "message",
+                            "content": [
+                                {
+                                    "type": "output_text",
+                                    "text": f"Generated {i}: " + "word " * 40,
+                                }
+                            ],
+                        }
+                    ],
+                    "usage": {
+                        "input_tokens": 69,
+                        "output_tokens": 258,
+                        "total_tokens": 327,
+                    },
+                }
+            },
+        }
+        for i in range(items)
+    ]
+    return raw_results, dataset_items
+
+
+def retained_bytes(build: Callable[[], Any]) -> tuple[Any, int]:
+    """Return the object built by `build` and the bytes it keeps allocated."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        value = build()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return value, retained
+
+
+def count_gc_tracked(root: Any) -> int:
+    """Count the objects reachable from root that the cyclic GC tracks."""
+    seen = {id(root)}
+    pending = [root]
+    while pending:
+        for referent in gc.get_referents(pending.pop()):
+            if (
+                gc.is_tracked(referent)
+                and not isinstance(referent, type)
+                and id(referent) not in seen
+            ):
+                seen.add(id(referent))
+                pending.append(referent)
+    return len(seen)
+
+
+@cli.command()
+def results(
+    items: int = typer.Option(50000, help="Number of synthetic batch output items."),
+):
+    """
+    Compare the memory held by parsed results as a frame and as per-item dicts.
+
+    Both forms share the strings of the parsed batch output, so the numbers
+    are the container overhead each adds on top of it.
+
+    How to run the benchmark: in backend/ run `uv run ai-cli bench evaluation results --items 50000`
+    """
+    raw_results, dataset_items = build_response_batch(items)
+    typer.echo(f"Parsing {items} response batch items")
+
+    frame, frame_bytes = retained_bytes(
+        lambda: parse_evaluation_output(
+            raw_results=raw_results, dataset_items=dataset_items
+        )
+    )
+    records, records_bytes = retained_bytes(lambda: list(frame.iter_records()))
+    if len(records) != len(frame):
+        typer.echo(f"Row counts differ: frame={len(frame)} dicts={len(records)}")
+        raise typer.Exit(code=1)
+
+    # Containers the cyclic garbage collector walks on every full collection;
+    # strings and token arrays are not tracked
+    frame_objects = count_gc_tracked(frame)
+    records_objects = count_gc_tracked(records)
+
+    typer.echo(f"{'':>8} {'MB':>8} {'tracked objects':>16}")
+    typer.echo(f"{'dicts':>8} {records_bytes / 1024**2:>8.1f} {records_objects:>16}")
+    typer.echo(f"{'frame':>8} {frame_bytes / 1024**2:>8.1f} {frame_objects:>16}")
+
+
+def build_batch_output_lines(
+    lines: int, text_fraction: float, repr_fraction: float, seed: int = 0
+) -> list[str]:
+    """
+    Build synthetic Responses batch output JSONL lines.
+
+    Most lines carry the output as a list of items. A fraction carries it as
+    plain text, and another as the Python repr of the list, the two string
+    shapes that reach the string decoding path.
+    """
+    rng = np.random.default_rng(seed)
+    shapes = rng.random(lines)
+    output_lines = []
+    for i in range(lines):
+        output = [
+            {"type": "reasoning", "id": f"rs_{i}", "summary": []},
+            {
+                "type": "message",
+                "id": f"msg_{i}",
+                "role": "assistant",
+                "content": [
+                    {
+                        "type": "output_text",
+                        "text": f"Generated {i}: " + "word " * 60,
+                        "annotations": [],
+                    }
+                ],
+            },
+        ]
+        if shapes[i] < text_fraction:
+            output = f"Generated {i}: " + "word " * 60
+        elif shapes[i] < text_fraction + repr_fraction:
+            output = repr(output)
+        line = {
+            "id": f"batch_req_{i}",
+            "custom_id": f"item_{i}",
+            "response": {
+                "status_code": 200,
+                "body": {
+                    "id": f"resp_{i:032x}",
+                    "output": output,
+                    "usage": {
+                        "input_tokens": 69,
+                        "output_tokens": 258,
+                        "total_tokens": 327,
+                    },
+                },
+            },
+            "error": None,
+        }
+        output_lines.append(json.dumps(line))
+    return output_lines
+
+
+def legacy_output_text(output: Any) -> str:
+    """Output extraction as done before the fast path: JSON, then literal_eval."""
+    if isinstance(output, str):
+        try:
+            output = json.loads(output)
+        except (json.JSONDecodeError, ValueError):
+            try:
+                output = ast.literal_eval(output)
+            except (ValueError, SyntaxError):
+                return output
+    if isinstance(output, list):
+        return extract_output_text(output)
+    return ""
+
+
+@cli.command()
+def parser(
+    lines: int = typer.Option(100000, help="Number of synthetic batch output lines."),
+    text_fraction: float = typer.Option(
+        0.05, help="Fraction of outputs that are plain text strings."
+    ),
+    repr_fraction: float = typer.Option(
+        0.01, help="Fraction of outputs that are Python reprs of the output list."
+    ),
+    repeat: int = typer.Option(3, help="Runs per implementation; best is reported."),
+):
+    """
+    Measure batch output parsing throughput: line decoding and text extraction.
+
+    "legacy" tries json.loads and then ast.literal_eval on every string output;
+    "fast" is extract_generated_output(), which reads output[].content[].text
+    and only falls back to ast.literal_eval for reprs of the output list.
+    "parse" is the whole parse_evaluation_output() step, including matching
+    dataset items and building the result frame.
+
+    How to run the benchmark: in backend/ run `uv run ai-cli bench evaluation parser --lines 100000`
+    """
+    output_lines = build_batch_output_lines(lines, text_fraction, repr_fraction)
+    size_mb = sum(len(line) for line in output_lines) / 1024**2
+    typer.echo(
+        f"Parsing {lines} batch output lines ({size_mb:.0f} MB), "
+        f"decoder={JSON_DECODER}"
+    )
+
+    decode_timings = {
+        "json.loads": time_best_of(
+            lambda: [json.loads(line) for line in output_lines], repeat
+        ),
+        "decode_json": time_best_of(
+            lambda: [decode_json(line) for line in output_lines], repeat
+        ),
+    }
+    raw_results = [decode_json(line) for line in output_lines]
+    dataset_items = [
+        {
+            "id": f"item_{i}",
+            "input": {"question": f"Question {i}"},
+            "expected_output": {"answer": f"Answer {i}"},
+        }
+        for i in range(lines)
+    ]
+
+    outputs = [result["response"]["body"]["output"] for result in raw_results]
+
+    def legacy_extract() -> list[str]:
+        return [legacy_output_text(output) for output in outputs]
+
+    def fast_extract() -> list[str]:
+        return [extract_generated_output(output)[0] for output in outputs]
+
+    def parse():
+        return parse_evaluation_output(
+            raw_results=raw_results, dataset_items=dataset_items
+        )
+
+    if not legacy_extract() == fast_extract() == parse().generated_outputs:
+        typer.echo("Extracted outputs differ between legacy and fast parsing")
+        raise typer.Exit(code=1)
+
+    extract_timings = {
+        "legacy": time_best_of(legacy_extract, repeat),
+        "fast": time_best_of(fast_extract, repeat),
+        "parse": time_best_of(parse, repeat),
+    }
+
+    for title, timings in (
+        ("Line decoding", decode_timings),
+        ("Output extraction", extract_timings),
+    ):
+        typer.echo(title)
+        print_timings(timings)
+    typer.echo(
+        f"Throughput: {lines / decode_timings['decode_json']:.0f} lines/s decoded, "
+        f"{lines / extract_timings['parse']:.0f} lines/s parsed"
+    )
@@ -0,0 +1,94 @@
+"""Object store transfer benchmarks."""
+
+import contextlib
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import BinaryIO
+from uuid import uuid4
+
+import typer
+
+from app.core.cloud.storage import AmazonCloudStorage, AmazonCloudStorageClient
+from app.core.config import settings
+
+MB = 1024 * 1024
+
+
+class _BenchmarkFile:
+    """Minimal UploadFile-like wrapper for CloudStorage.put."""
+
+    content_type = "application/octet-stream"
+
+    def __init__(self, file: BinaryIO):
+        self.file = file
+
+
+def write_random_file(path: Path, size_mb: int):
+    """Write size_mb megabytes of random bytes to path."""
+    with path.open("wb") as f:
+        for _ in range(size_mb):
+            f.write(os.urandom(MB))
+
+
+def transfer(
+    sizes: str = typer.Option("8,64,256", help="Comma-separated file sizes in MB."),
+    real: bool = typer.Option(
+        False,
+        help="Use the bucket and credentials from the environment instead of "
+        "an in-process moto S3. Test objects are deleted afterwards.",
+    ),
+):
+    """
+    Measure object store upload and download throughput.
+
+    Uploads a random file of each size through AmazonCloudStorage.put and
+    downloads it back with AmazonCloudStorage.download, reporting MB/s for
+    both. Tune the transfer with AWS_S3_MULTIPART_THRESHOLD,
+    AWS_S3_MULTIPART_CHUNK_SIZE and AWS_S3_MAX_TRANSFER_CONCURRENCY.
+    """
+    sizes_mb = [int(size) for size in sizes.split(",")]
+
+    context = contextlib.nullcontext()
+    if not real:
+        from moto import mock_aws
+
+        os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+        os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+        context = mock_aws()
+
+    with context, tempfile.TemporaryDirectory() as tmp_dir:
+        AmazonCloudStorageClient().create()
+        storage = AmazonCloudStorage(project_id=0, storage_path=uuid4())
+        typer.echo(
+            f"threshold={settings.AWS_S3_MULTIPART_THRESHOLD // MB}MB "
+            f"chunk={settings.AWS_S3_MULTIPART_CHUNK_SIZE // MB}MB "
+            f"concurrency={settings.AWS_S3_MAX_TRANSFER_CONCURRENCY} "
+            f"backend={'s3' if real else 'moto'}"
+        )
+
+        for size_mb in sizes_mb:
+            source_path = Path(tmp_dir) / f"source-{size_mb}"
+            write_random_file(source_path, size_mb)
+
+            with source_path.open("rb") as f:
+                started = time.perf_counter()
+                url = str(
+                    storage.put(
+                        source=_BenchmarkFile(f),
+                        file_path=Path(f"benchmark-{size_mb}"),
+                    )
+                )
+                upload_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            storage.download(url, Path(tmp_dir) / f"download-{size_mb}")
+            download_seconds = time.perf_counter() - started
+
+            typer.echo(
+                f"{size_mb:>6} MB | upload {size_mb / upload_seconds:8.1f} MB/s | "
+                f"download {size_mb / download_seconds:8.1f} MB/s"
+            )
+            if real:
+                storage.delete(url)
@@ -3,6 +3,8 @@ import logging
 import typer
 
 from app.cli.bench.commands import cli as bench_cli
+from app.cli.bench.evaluation import cli as evaluation_bench_cli
+from app.cli.bench.storage import transfer as storage_transfer_bench
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s - %(message)s"
@@ -10,6 +12,13 @@ logging.basicConfig(
 
 cli = typer.Typer(help=__doc__)
 
+bench_cli.add_typer(
+    evaluation_bench_cli, name="evaluation", help="Run evaluation micro-benchmarks"
+)
+bench_cli.command(name="storage", help="Measure object store transfer throughput")(
+    storage_transfer_bench
+)
+
 cli.add_typer(bench_cli, name="bench", help="Run benchmarks")
 
 if __name__ == "__main__":
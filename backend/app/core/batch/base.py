@@ -1,21 +1,31 @@
 """Abstract interface for LLM batch providers."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Iterable
+from typing import IO, Any
+
+from .jsonl import JSONLRequestFile
 
 
 class BatchProvider(ABC):
     """Abstract base class for LLM batch providers (OpenAI, Anthropic, etc.)."""
 
+    # Per-batch limits of the provider. Logical batches that exceed them are
+    # split into shards by start_batch_job(); None means no limit.
+    max_batch_requests: int | None = None
+    max_batch_file_bytes: int | None = None
+
     @abstractmethod
     def create_batch(
-        self, jsonl_data: list[dict[str, Any]], config: dict[str, Any]
+        self, jsonl_data: Iterable[dict[str, Any]], config: dict[str, Any]
     ) -> dict[str, Any]:
         """
         Upload JSONL data and create a batch job with the provider.
 
         Args:
-            jsonl_data: List of dictionaries representing JSONL lines
+            jsonl_data: Iterable of dictionaries representing JSONL lines.
+                Implementations should consume it in a single pass so that
+                generators can be streamed without materializing a list.
             config: Provider-specific configuration (model, temperature, etc.)
 
         Returns:
@@ -23,7 +33,7 @@ class BatchProvider(ABC):
                 - provider_batch_id: Provider's batch job ID
                 - provider_file_id: Provider's input file ID
                 - provider_status: Initial status from provider
-                - total_items: Number of items in the batch
+                - total_items: Number of items in the batch (required)
                 - Any other provider-specific metadata
 
         Raises:
@@ -31,6 +41,25 @@ class BatchProvider(ABC):
         """
         pass
 
+    @abstractmethod
+    def create_batch_from_file(
+        self, request_file: JSONLRequestFile, config: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Upload an already serialized request file and create a batch job.
+
+        Args:
+            request_file: JSONLRequestFile holding the batch requests
+            config: Provider-specific configuration (model, temperature, etc.)
+
+        Returns:
+            Same dictionary as create_batch()
+
+        Raises:
+            Exception: If batch creation fails
+        """
+        pass
+
     @abstractmethod
     def get_batch_status(self, batch_id: str) -> dict[str, Any]:
         """
@@ -51,6 +80,24 @@ class BatchProvider(ABC):
         """
         pass
 
+    @abstractmethod
+    def cancel_batch(self, batch_id: str) -> dict[str, Any]:
+        """
+        Cancel a batch job that has not finished yet.
+
+        Args:
+            batch_id: Provider's batch job ID
+
+        Returns:
+            Dictionary containing:
+                - provider_status: Status reported by the provider after the
+                  cancellation request (e.g. "cancelling" or "cancelled")
+
+        Raises:
+            Exception: If the cancellation request fails
+        """
+        pass
+
     @abstractmethod
     def download_batch_results(self, output_file_id: str) -> list[dict[str, Any]]:
         """
@@ -72,12 +119,13 @@ class BatchProvider(ABC):
         pass
 
     @abstractmethod
-    def upload_file(self, content: str, purpose: str = "batch") -> str:
+    def upload_file(self, content: str | IO[bytes], purpose: str = "batch") -> str:
         """
         Upload a file to the provider's file storage.
 
         Args:
-            content: File content (typically JSONL string)
+            content: File content (typically JSONL string) or a binary file
+                handle positioned at the start of the content
             purpose: Purpose of the file (e.g., "batch")
 
         Returns:
@@ -0,0 +1,212 @@
+"""Streaming JSONL request-file writer and line decoder for provider batches."""
+
+import io
+import json
+import logging
+import tempfile
+from collections.abc import Iterable, Iterator
+from typing import IO, Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the standard library decoder is used
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Name of the decoder used by decode_json(), for logs and benchmarks
+JSON_DECODER = "orjson" if orjson is not None else "json"
+
+# Request files up to this size stay in memory; larger ones roll over to disk
+DEFAULT_SPOOL_MAX_SIZE = 8 * 1024 * 1024  # 8 MB
+
+
+def decode_json(data: str | bytes) -> Any:
+    """
+    Decode one JSON document, such as a line of batch output.
+
+    Uses orjson when it is installed, which decodes several times faster than
+    the standard library on large batch output files.
+
+    Raises:
+        ValueError: If the data is not valid JSON (json.JSONDecodeError, which
+            orjson.JSONDecodeError also subclasses)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class JSONLRequestFile:
+    """
+    JSONL file that serializes batch requests one line at a time.
+
+    Requests are encoded and written as they are produced, so the full payload
+    never has to exist as a list of dicts, a list of strings and a joined string
+    at the same time. Content is kept in a BytesIO buffer and moved to a
+    temporary file once it exceeds `max_size` bytes.
+
+    A SpooledTemporaryFile is deliberately not used: the multipart encoder in
+    httpx calls `fileno()` on upload, which forces a spooled file to disk even
+    when it is small.
+
+    Usage:
+        with JSONLRequestFile() as request_file:
+            request_file.write_all(requests)
+            provider.upload_file(content=request_file.rewind())
+    """
+
+    def __init__(self, max_size: int = DEFAULT_SPOOL_MAX_SIZE):
+        self._file: IO[bytes] = io.BytesIO()
+        self.max_size = max_size
+        self.count = 0
+        self.size_bytes = 0
+
+    def __enter__(self) -> "JSONLRequestFile":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def rolled_to_disk(self) -> bool:
+        """Whether the content has been spilled from memory to a temp file."""
+        return self.size_bytes > self.max_size
+
+    @staticmethod
+    def encode(request: dict[str, Any]) -> bytes:
+        """Encode a single request as one JSONL line."""
+        return json.dumps(request).encode("utf-8") + b"\n"
+
+    def write(self, request: dict[str, Any]) -> None:
+        """Serialize a single request as one JSONL line."""
+        self.write_line(self.encode(request))
+
+    def write_line(self, line: bytes) -> None:
+        """Append an already encoded JSONL line."""
+        self._file.write(line)
+        self.count += 1
+        self.size_bytes += len(line)
+
+        if self.rolled_to_disk and isinstance(self._file, io.BytesIO):
+            self._roll_over()
+
+    def _roll_over(self) -> None:
+        """Move the in-memory buffer into a temporary file on disk."""
+        disk_file = tempfile.TemporaryFile(mode="w+b")
+        disk_file.write(self._file.getvalue())
+        self._file.close()
+        self._file = disk_file
+
+    def write_all(self, requests: Iterable[dict[str, Any]]) -> int:
+        """
+        Serialize every request from an iterable.
+
+        Returns:
+            Number of requests written by this call
+        """
+        written = 0
+        for request in requests:
+            self.write(request)
+            written += 1
+        return written
+
+    def rewind(self) -> IO[bytes]:
+        """Flush pending writes and return the file handle positioned at the start."""
+        self._file.flush()
+        self._file.seek(0)
+        return self._file
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def write_jsonl_request_file(
+    requests: Iterable[dict[str, Any]],
+    max_size: int = DEFAULT_SPOOL_MAX_SIZE,
+) -> JSONLRequestFile:
+    """
+    Serialize requests into a new JSONLRequestFile.
+
+    The caller owns the returned file and is responsible for closing it.
+
+    Args:
+        requests: Iterable of request dictionaries (lists and generators both work)
+        max_size: Bytes to keep in memory before spilling to disk
+
+    Returns:
+        JSONLRequestFile holding the serialized requests
+    """
+    request_file = JSONLRequestFile(max_size=max_size)
+    try:
+        request_file.write_all(requests)
+    except Exception:
+        request_file.close()
+        raise
+
+    logger.info(
+        f"[write_jsonl_request_file] Serialized batch requests | "
+        f"items={request_file.count} | bytes={request_file.size_bytes} | "
+        f"on_disk={request_file.rolled_to_disk}"
+    )
+    return request_file
+
+
+def iter_jsonl_request_files(
+    requests: Iterable[dict[str, Any]],
+    max_requests: int | None = None,
+    max_bytes: int | None = None,
+    max_size: int = DEFAULT_SPOOL_MAX_SIZE,
+) -> Iterator[JSONLRequestFile]:
+    """
+    Serialize requests into one or more JSONLRequestFiles within the given limits.
+
+    A new file is started whenever the next line would push the current one past
+    `max_requests` lines or `max_bytes` bytes, so every request is encoded exactly
+    once and no file exceeds a provider's per-batch limits. Limits left as None
+    are not enforced, in which case a single file is produced.
+
+    The caller owns each yielded file and is responsible for closing it. A file
+    is only yielded once it is complete.
+
+    Args:
+        requests: Iterable of request dictionaries (lists and generators both work)
+        max_requests: Maximum number of lines per file
+        max_bytes: Maximum size in bytes per file
+        max_size: Bytes to keep in memory before spilling each file to disk
+
+    Yields:
+        JSONLRequestFile per shard, in request order
+
+    Raises:
+        ValueError: If a single request is larger than max_bytes
+    """
+    request_file = JSONLRequestFile(max_size=max_size)
+    try:
+        for request in requests:
+            line = JSONLRequestFile.encode(request)
+            if max_bytes is not None and len(line) > max_bytes:
+                raise ValueError(
+                    f"Batch request of {len(line)} bytes exceeds the per-file "
+                    f"limit of {max_bytes} bytes"
+                )
+
+            is_full = (
+                max_requests is not None and request_file.count >= max_requests
+            ) or (
+                max_bytes is not None
+                and request_file.size_bytes + len(line) > max_bytes
+            )
+            if is_full:
+                yield request_file
+                request_file = JSONLRequestFile(max_size=max_size)
+
+            request_file.write_line(line)
+    except Exception:
+        request_file.close()
+        raise
+
+    if request_file.count:
+        yield request_file
+    else:
+        request_file.close()
@@ -1,12 +1,13 @@
 """OpenAI batch provider implementation."""
 
-import json
 import logging
-from typing import Any
+from collections.abc import Iterable
+from typing import IO, Any
 
 from openai import OpenAI
 
 from .base import BatchProvider
+from .jsonl import JSONLRequestFile, decode_json, write_jsonl_request_file
 
 logger = logging.getLogger(__name__)
 
@@ -23,18 +24,23 @@ class OpenAIBatchProvider(BatchProvider):
         """
         self.client = client
 
+    # OpenAI Batch API limits per batch input file
+    max_batch_requests = 50_000
+    max_batch_file_bytes = 200 * 1024 * 1024  # 200 MB
+
     def create_batch(
-        self, jsonl_data: list[dict[str, Any]], config: dict[str, Any]
+        self, jsonl_data: Iterable[dict[str, Any]], config: dict[str, Any]
     ) -> dict[str, Any]:
         """
         Upload JSONL data and create a batch job with OpenAI.
 
+        Requests are serialized one at a time into a JSONLRequestFile (in memory up to
+        8 MB, then on disk) and uploaded from its handle, so large batches are
+        never held in memory as one joined string.
+
         Args:
-            jsonl_data: List of dictionaries representing JSONL lines
-            config: Provider-specific configuration with:
-                - endpoint: OpenAI endpoint (e.g., "/v1/responses")
-                - description: Optional batch description
-                - completion_window: Optional completion window (default "24h")
+            jsonl_data: Iterable of dictionaries representing JSONL lines
+            config: Provider-specific configuration, see create_batch_from_file()
 
         Returns:
             Dictionary containing:
@@ -43,21 +49,45 @@ class OpenAIBatchProvider(BatchProvider):
                 - provider_status: Initial status from OpenAI
                 - total_items: Number of items in the batch
 
+        Raises:
+            Exception: If batch creation fails
+        """
+        with write_jsonl_request_file(jsonl_data) as request_file:
+            return self.create_batch_from_file(request_file=request_file, config=config)
+
+    def create_batch_from_file(
+        self, request_file: JSONLRequestFile, config: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Upload an already serialized request file and create a batch job with OpenAI.
+
+        Args:
+            request_file: JSONLRequestFile holding the batch requests
+            config: Provider-specific configuration with:
+                - endpoint: OpenAI endpoint (e.g., "/v1/responses")
+                - description: Optional batch description
+                - completion_window: Optional completion window (default "24h")
+
+        Returns:
+            Same dictionary as create_batch()
+
         Raises:
             Exception: If batch creation fails
         """
         endpoint = config.get("endpoint", "/v1/responses")
         description = config.get("description", "LLM batch job")
         completion_window = config.get("completion_window", "24h")
+        total_items = request_file.count
 
         logger.info(
-            f"[create_batch] Creating OpenAI batch | items={len(jsonl_data)} | endpoint={endpoint}"
+            f"[create_batch_from_file] Creating OpenAI batch | endpoint={endpoint} | "
+            f"items={total_items} | bytes={request_file.size_bytes}"
         )
 
         try:
-            # Step 1: Upload file
+            # Step 1: Upload the request file
             file_id = self.upload_file(
-                content="\n".join([json.dumps(line) for line in jsonl_data]),
+                content=request_file.rewind(),
                 purpose="batch",
             )
 
@@ -73,17 +103,19 @@ class OpenAIBatchProvider(BatchProvider):
                 "provider_batch_id": batch.id,
                 "provider_file_id": file_id,
                 "provider_status": batch.status,
-                "total_items": len(jsonl_data),
+                "total_items": total_items,
             }
 
             logger.info(
-                f"[create_batch] Created OpenAI batch | batch_id={batch.id} | status={batch.status} | items={len(jsonl_data)}"
+                f"[create_batch_from_file] Created OpenAI batch | batch_id={batch.id} | status={batch.status} | items={total_items}"
             )
 
             return result
 
         except Exception as e:
-            logger.error(f"[create_batch] Failed to create OpenAI batch | {e}")
+            logger.error(
+                f"[create_batch_from_file] Failed to create OpenAI batch | {e}"
+            )
             raise
 
     def get_batch_status(self, batch_id: str) -> dict[str, Any]:
@@ -140,6 +172,40 @@ class OpenAIBatchProvider(BatchProvider):
             )
             raise
 
+    def cancel_batch(self, batch_id: str) -> dict[str, Any]:
+        """
+        Cancel an OpenAI batch job.
+
+        OpenAI moves the batch to "cancelling" and then "cancelled"; requests
+        that already completed are still billed.
+
+        Args:
+            batch_id: OpenAI batch ID
+
+        Returns:
+            Dictionary containing:
+                - provider_status: OpenAI status after the cancellation request
+
+        Raises:
+            Exception: If the cancellation request fails
+        """
+        logger.info(f"[cancel_batch] Cancelling OpenAI batch | batch_id={batch_id}")
+
+        try:
+            batch = self.client.batches.cancel(batch_id)
+
+            logger.info(
+                f"[cancel_batch] Cancelled OpenAI batch | batch_id={batch_id} | status={batch.status}"
+            )
+
+            return {"provider_status": batch.status}
+
+        except Exception as e:
+            logger.error(
+                f"[cancel_batch] Failed to cancel OpenAI batch | batch_id={batch_id} | {e}"
+            )
+            raise
+
     def download_batch_results(self, output_file_id: str) -> list[dict[str, Any]]:
         """
         Download and parse batch results from OpenAI.
@@ -170,9 +236,9 @@ class OpenAIBatchProvider(BatchProvider):
 
             for line_num, line in enumerate(lines, 1):
                 try:
-                    result = json.loads(line)
+                    result = decode_json(line)
                     results.append(result)
-                except json.JSONDecodeError as e:
+                except ValueError as e:
                     logger.error(
                         f"[download_batch_results] Failed to parse JSON | line={line_num} | {e}"
                     )
@@ -190,12 +256,13 @@ class OpenAIBatchProvider(BatchProvider):
             )
             raise
 
-    def upload_file(self, content: str, purpose: str = "batch") -> str:
+    def upload_file(self, content: str | IO[bytes], purpose: str = "batch") -> str:
         """
         Upload a file to OpenAI file storage.
 
         Args:
-            content: File content (typically JSONL string)
+            content: File content (typically JSONL string) or a binary file
+                handle positioned at the start of the content
             purpose: Purpose of the file (e.g., "batch")
 
         Returns:
@@ -204,11 +271,18 @@ class OpenAIBatchProvider(BatchProvider):
         Raises:
             Exception: If upload fails
         """
-        logger.info(f"[upload_file] Uploading file to OpenAI | bytes={len(content)}")
+        if isinstance(content, str):
+            payload: bytes | IO[bytes] = content.encode("utf-8")
+            logger.info(
+                f"[upload_file] Uploading file to OpenAI | bytes={len(payload)}"
+            )
+        else:
+            payload = content
+            logger.info("[upload_file] Uploading file to OpenAI from file handle")
 
         try:
             file_response = self.client.files.create(
-                file=("batch_input.jsonl", content.encode("utf-8")),
+                file=("batch_input.jsonl", payload),
                 purpose=purpose,
             )
 
@@ -3,5 +3,7 @@ from .storage import (
     AmazonCloudStorageClient,
     CloudStorage,
     CloudStorageError,
+    LocalCloudStorage,
     get_cloud_storage,
+    run_storage_io,
 )
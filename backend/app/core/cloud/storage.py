@@ -1,15 +1,34 @@
+import asyncio
+import base64
+import contextlib
+import contextvars
+import functools
+import hashlib
+import hmac
+import io
+import json
+import mmap
 import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from sqlmodel import Session
 from uuid import UUID
 import logging
-import functools as ft
 from pathlib import Path
 from dataclasses import dataclass, asdict
-from urllib.parse import ParseResult, urlparse, urlunparse
+from typing import TypeVar
+from urllib.parse import ParseResult, quote, urlencode, urlparse, urlunparse
 
 from abc import ABC, abstractmethod
 import boto3
+from boto3.s3.transfer import TransferConfig
 from fastapi import UploadFile
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from botocore.response import StreamingBody
 
@@ -19,26 +38,184 @@ from app.utils import mask_string
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+# Connections kept open by the shared S3 client; sized for the threads of a
+# web worker plus the concurrent uploads and downloads of background jobs
+S3_MAX_POOL_CONNECTIONS = 50
+# Attempts per S3 request with adaptive (client side rate limited) retries
+S3_MAX_RETRY_ATTEMPTS = 5
+# Projects whose storage path is kept in memory; the path never changes
+STORAGE_PATH_CACHE_SIZE = 1024
+# Object metadata key holding the SHA-256 (hex) of the uploaded content,
+# checked when the object is downloaded
+CHECKSUM_METADATA_KEY = "sha256"
+# Block size for hashing files and writing downloaded ranges
+TRANSFER_BLOCK_SIZE = 1024 * 1024
+# Signed download URLs are reused within windows of this many seconds, and
+# each is signed to stay valid for its full lifetime after its window ends
+SIGNED_URL_CACHE_WINDOW = 300
+# Signed download URLs kept in memory
+SIGNED_URL_CACHE_SIZE = 10000
+
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+_storage_io_executor: ThreadPoolExecutor | None = None
+_storage_io_executor_lock = threading.Lock()
+
+_storage_paths: OrderedDict[int, UUID] = OrderedDict()
+_storage_paths_lock = threading.Lock()
+
+# (bucket, key, expires_in, window) -> signed URL
+_signed_urls: OrderedDict[tuple[str, str, int, int], str] = OrderedDict()
+_signed_urls_lock = threading.Lock()
+
 
 class CloudStorageError(Exception):
     pass
 
 
-class AmazonCloudStorageClient:
-    @ft.cached_property
-    def client(self):
-        kwargs = {}
-        cred_params = (
-            ("aws_access_key_id", "AWS_ACCESS_KEY_ID"),
-            ("aws_secret_access_key", "AWS_SECRET_ACCESS_KEY"),
-            ("region_name", "AWS_DEFAULT_REGION"),
-        )
+@dataclass(frozen=True)
+class StoredObject:
+    """Size and recorded SHA-256 (hex) of an object in storage."""
+
+    size_bytes: int
+    sha256: str | None
+
+
+def _create_s3_client():
+    kwargs = {}
+    cred_params = (
+        ("aws_access_key_id", "AWS_ACCESS_KEY_ID"),
+        ("aws_secret_access_key", "AWS_SECRET_ACCESS_KEY"),
+        ("region_name", "AWS_DEFAULT_REGION"),
+    )
+
+    for i, j in cred_params:
+        kwargs[i] = os.environ.get(j, getattr(settings, j))
+
+    config = Config(
+        max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+        retries={"max_attempts": S3_MAX_RETRY_ATTEMPTS, "mode": "adaptive"},
+        tcp_keepalive=True,
+    )
+    return boto3.client("s3", config=config, **kwargs)
+
 
-        for i, j in cred_params:
-            kwargs[i] = os.environ.get(j, getattr(settings, j))
+def get_s3_client():
+    """
+    Return the S3 client shared by the whole process.
+
+    boto3 clients are thread safe once created, so a single client (and its
+    connection pool) is reused by every request and job instead of resolving
+    credentials and opening new connections each time. Creation is guarded
+    by a lock because the default boto3 session is not thread safe.
+    """
+    global _s3_client
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                _s3_client = _create_s3_client()
+    return _s3_client
+
+
+def get_transfer_config() -> TransferConfig:
+    """Multipart transfer settings for uploads, from the AWS_S3_* settings."""
+    return TransferConfig(
+        multipart_threshold=settings.AWS_S3_MULTIPART_THRESHOLD,
+        multipart_chunksize=settings.AWS_S3_MULTIPART_CHUNK_SIZE,
+        max_concurrency=settings.AWS_S3_MAX_TRANSFER_CONCURRENCY,
+        use_threads=True,
+    )
+
+
+def get_storage_io_executor() -> ThreadPoolExecutor:
+    """
+    Return the threadpool that runs object store calls for async code.
+
+    It is separate from the threadpool that serves sync routes, so a burst
+    of slow uploads cannot use up the threads other requests need.
+    """
+    global _storage_io_executor
+    if _storage_io_executor is None:
+        with _storage_io_executor_lock:
+            if _storage_io_executor is None:
+                _storage_io_executor = ThreadPoolExecutor(
+                    max_workers=settings.STORAGE_IO_MAX_WORKERS,
+                    thread_name_prefix="storage-io",
+                )
+    return _storage_io_executor
+
+
+async def run_storage_io(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run a blocking storage call on the storage threadpool and await it.
+
+    Context variables (such as the request's correlation id) are carried
+    over, so log lines from the call stay attached to the request.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        get_storage_io_executor(),
+        functools.partial(context.run, func, *args, **kwargs),
+    )
 
-        client = boto3.client("s3", **kwargs)
-        return client
+
+def file_sha256(fileobj) -> str | None:
+    """
+    Return the SHA-256 (hex) of a binary file from its current position.
+
+    The position is restored afterwards. Returns None for files that cannot
+    seek, since they can only be read once.
+    """
+    stored = describe_file(fileobj)
+    return stored.sha256 if stored else None
+
+
+def describe_file(fileobj) -> StoredObject | None:
+    """
+    Return the size and SHA-256 (hex) of a binary file in a single pass.
+
+    Reads from the current position, which is restored afterwards. Returns
+    None for files that cannot seek.
+    """
+    seekable = getattr(fileobj, "seekable", None)
+    if not seekable or not seekable():
+        return None
+
+    start = fileobj.tell()
+    digest = hashlib.sha256()
+    size = 0
+    for block in iter(lambda: fileobj.read(TRANSFER_BLOCK_SIZE), b""):
+        digest.update(block)
+        size += len(block)
+    fileobj.seek(start)
+    return StoredObject(size_bytes=size, sha256=digest.hexdigest())
+
+
+def iter_byte_ranges(size: int, threshold: int, chunk_size: int):
+    """
+    Split an object of `size` bytes into inclusive (start, end) byte ranges.
+
+    Objects up to `threshold` bytes are a single range; larger ones are split
+    into ranges of `chunk_size` bytes. Empty objects have no ranges.
+    """
+    if size <= 0:
+        return
+    if size <= threshold:
+        yield 0, size - 1
+        return
+    for start in range(0, size, chunk_size):
+        yield start, min(start + chunk_size, size) - 1
+
+
+class AmazonCloudStorageClient:
+    @property
+    def client(self):
+        return get_s3_client()
 
     def create(self):
         try:
@@ -110,14 +287,27 @@ class SimpleStorageName:
         return cls(Bucket=url.netloc, Key=str(path))
 
 
+@dataclass(frozen=True)
+class SignedUpload:
+    """A signed URL for uploading one object directly to storage."""
+
+    destination: SimpleStorageName
+    url: str
+    # Headers the client must send with the upload; they are covered by the
+    # signature, so the upload is rejected if they are missing or changed
+    headers: dict[str, str]
+
+
 class CloudStorage(ABC):
     def __init__(self, project_id: int, storage_path: UUID):
         self.project_id = project_id
         self.storage_path = str(storage_path)
 
     @abstractmethod
-    def put(self, source: UploadFile, filepath: Path) -> SimpleStorageName:
-        """Upload a file to storage"""
+    def put(
+        self, source: UploadFile, filepath: Path, sha256: str | None = None
+    ) -> SimpleStorageName:
+        """Upload a file to storage, optionally with its precomputed SHA-256"""
         pass
 
     @abstractmethod
@@ -135,30 +325,95 @@ class CloudStorage(ABC):
         """Generate a signed URL with an optional expiry"""
         pass
 
+    def get_signed_urls(
+        self, urls: Iterable[str], expires_in: int = 3600
+    ) -> dict[str, str]:
+        """Generate signed URLs for many files, keyed by storage URL"""
+        return {url: self.get_signed_url(url, expires_in) for url in urls}
+
     @abstractmethod
     def delete(self, url: str) -> None:
         """Delete a file from storage"""
         pass
 
+    @abstractmethod
+    def get_signed_upload(
+        self,
+        file_path: Path,
+        sha256: str,
+        content_type: str | None = None,
+        expires_in: int = 3600,
+    ) -> SignedUpload:
+        """Generate a signed URL for uploading a file directly to storage"""
+        pass
+
+    @abstractmethod
+    def get_object_info(self, url: str) -> StoredObject:
+        """Return the size and recorded checksum of a file"""
+        pass
+
+    def download(self, url: str, destination: Path) -> Path:
+        """Download a file from storage to a local path"""
+        body = self.stream(url)
+        try:
+            with open(destination, "wb") as f:
+                shutil.copyfileobj(body, f)
+        finally:
+            body.close()
+        return destination
+
+    # Async variants for use from async routes; each runs the blocking call
+    # on the storage threadpool so the event loop keeps serving requests
+
+    async def aput(
+        self, source: UploadFile, file_path: Path, sha256: str | None = None
+    ) -> SimpleStorageName:
+        """Upload a file to storage without blocking the event loop"""
+        return await run_storage_io(self.put, source, file_path, sha256=sha256)
+
+    async def adownload(self, url: str, destination: Path) -> Path:
+        """Download a file to a local path without blocking the event loop"""
+        return await run_storage_io(self.download, url, destination)
+
+    async def aget_object_info(self, url: str) -> StoredObject:
+        """Return the size and recorded checksum without blocking the event loop"""
+        return await run_storage_io(self.get_object_info, url)
+
+    async def adelete(self, url: str) -> None:
+        """Delete a file from storage without blocking the event loop"""
+        return await run_storage_io(self.delete, url)
+
 
 class AmazonCloudStorage(CloudStorage):
     def __init__(self, project_id: int, storage_path: UUID):
         super().__init__(project_id, storage_path)
         self.aws = AmazonCloudStorageClient()
 
-    def put(self, source: UploadFile, file_path: Path) -> SimpleStorageName:
+    def put(
+        self, source: UploadFile, file_path: Path, sha256: str | None = None
+    ) -> SimpleStorageName:
         if file_path.is_absolute():
             raise ValueError("file_path must be relative to the project's storage root")
         key = Path(self.storage_path) / file_path
         destination = SimpleStorageName(key.as_posix())
         kwargs = asdict(destination)
 
+        # S3 verifies a SHA-256 checksum of every part it receives; the
+        # SHA-256 of the whole content is kept in the object metadata so
+        # downloads can be verified end to end
+        extra_args = {
+            "ContentType": source.content_type,
+            "ChecksumAlgorithm": "SHA256",
+        }
+        sha256 = sha256 or file_sha256(source.file)
+        if sha256:
+            extra_args["Metadata"] = {CHECKSUM_METADATA_KEY: sha256}
+
         try:
             self.aws.client.upload_fileobj(
                 source.file,
-                ExtraArgs={
-                    "ContentType": source.content_type,
-                },
+                ExtraArgs=extra_args,
+                Config=get_transfer_config(),
                 **kwargs,
             )
             logger.info(
@@ -193,6 +448,74 @@ class AmazonCloudStorage(CloudStorage):
             )
             raise CloudStorageError(f'AWS Error: "{err}" ({url})') from err
 
+    def download(self, url: str, destination: Path) -> Path:
+        """
+        Download an object to a local file with parallel ranged GETs.
+
+        Objects above AWS_S3_MULTIPART_THRESHOLD are fetched in ranges of
+        AWS_S3_MULTIPART_CHUNK_SIZE, AWS_S3_MAX_TRANSFER_CONCURRENCY at a
+        time, each written at its offset in the file. Every range is pinned
+        to the ETag read up front, so an object replaced mid-download fails
+        instead of mixing versions. If the object carries a SHA-256 in its
+        metadata, the downloaded file is checked against it.
+        """
+        name = SimpleStorageName.from_url(url)
+        kwargs = asdict(name)
+        try:
+            head = self.aws.client.head_object(**kwargs)
+            size = head["ContentLength"]
+            etag = head["ETag"]
+            expected_sha256 = head.get("Metadata", {}).get(CHECKSUM_METADATA_KEY)
+
+            ranges = list(
+                iter_byte_ranges(
+                    size,
+                    threshold=settings.AWS_S3_MULTIPART_THRESHOLD,
+                    chunk_size=settings.AWS_S3_MULTIPART_CHUNK_SIZE,
+                )
+            )
+            with open(destination, "wb") as f:
+                f.truncate(size)
+
+            def fetch_range(byte_range: tuple[int, int]) -> None:
+                start, end = byte_range
+                body = self.aws.client.get_object(
+                    Range=f"bytes={start}-{end}", IfMatch=etag, **kwargs
+                )["Body"]
+                with open(destination, "r+b") as f:
+                    f.seek(start)
+                    for block in body.iter_chunks(TRANSFER_BLOCK_SIZE):
+                        f.write(block)
+
+            workers = max(1, min(settings.AWS_S3_MAX_TRANSFER_CONCURRENCY, len(ranges)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(fetch_range, ranges))
+        except ClientError as err:
+            logger.error(
+                f"[AmazonCloudStorage.download] AWS download error | "
+                f"{{'project_id': '{self.project_id}', 'bucket': '{mask_string(name.Bucket)}', 'key': '{mask_string(name.Key)}', 'error': '{str(err)}'}}",
+                exc_info=True,
+            )
+            raise CloudStorageError(f'AWS Error: "{err}" ({url})') from err
+
+        if expected_sha256:
+            with open(destination, "rb") as f:
+                actual_sha256 = file_sha256(f)
+            if actual_sha256 != expected_sha256:
+                logger.error(
+                    f"[AmazonCloudStorage.download] Checksum mismatch | "
+                    f"{{'project_id': '{self.project_id}', 'bucket': '{mask_string(name.Bucket)}', 'key': '{mask_string(name.Key)}'}}"
+                )
+                raise CloudStorageError(
+                    f"Checksum mismatch for downloaded file ({url})"
+                )
+
+        logger.info(
+            f"[AmazonCloudStorage.download] File downloaded successfully | "
+            f"{{'project_id': '{self.project_id}', 'bucket': '{mask_string(name.Bucket)}', 'key': '{mask_string(name.Key)}', 'size': {size}, 'ranges': {len(ranges)}}}"
+        )
+        return destination
+
     def get_file_size_kb(self, url: str) -> float:
         name = SimpleStorageName.from_url(url)
         kwargs = asdict(name)
@@ -220,26 +543,160 @@ class AmazonCloudStorage(CloudStorage):
         :param expires_in: Expiry time in seconds (default: 1 hour)
         :return: Signed URL as string
         """
-        name = SimpleStorageName.from_url(url)
+        return self.get_signed_urls([url], expires_in)[url]
+
+    def get_signed_urls(
+        self, urls: Iterable[str], expires_in: int = 3600
+    ) -> dict[str, str]:
+        """
+        Generate signed S3 URLs for many files, reusing recently signed ones.
+
+        Signing is local (no request to S3), so the cost of signing a listing
+        is the signing itself plus logging. URLs are cached per object and
+        expiry for SIGNED_URL_CACHE_WINDOW seconds; each is signed to expire
+        `expires_in` seconds after the end of its window, so a cached URL
+        always has at least the requested lifetime left. One summary line is
+        logged per call.
+        :param urls: S3 urls (e.g., s3://bucket/key)
+        :param expires_in: Minimum remaining validity in seconds (default: 1 hour)
+        :return: Signed URL for each given url
+        """
+        now = time.time()
+        window = int(now // SIGNED_URL_CACHE_WINDOW)
+        lifetime = expires_in + int((window + 1) * SIGNED_URL_CACHE_WINDOW - now) + 1
+
+        signed_urls: dict[str, str] = {}
+        cached = 0
+        for url in urls:
+            if url in signed_urls:
+                continue
+            name = SimpleStorageName.from_url(url)
+            cache_key = (name.Bucket, name.Key, expires_in, window)
+
+            with _signed_urls_lock:
+                signed_url = _signed_urls.get(cache_key)
+                if signed_url is not None:
+                    _signed_urls.move_to_end(cache_key)
+            if signed_url is not None:
+                cached += 1
+                signed_urls[url] = signed_url
+                continue
+
+            try:
+                signed_url = self.aws.client.generate_presigned_url(
+                    "get_object",
+                    Params={"Bucket": name.Bucket, "Key": name.Key},
+                    ExpiresIn=lifetime,
+                )
+            except ClientError as err:
+                logger.error(
+                    f"[AmazonCloudStorage.get_signed_urls] AWS presign error | "
+                    f"{{'project_id': '{self.project_id}', 'bucket': '{mask_string(name.Bucket)}', 'key': '{mask_string(name.Key)}', 'error': '{str(err)}'}}",
+                    exc_info=True,
+                )
+                raise CloudStorageError(f'AWS Error: "{err}" ({url})') from err
+
+            with _signed_urls_lock:
+                _signed_urls[cache_key] = signed_url
+                if len(_signed_urls) > SIGNED_URL_CACHE_SIZE:
+                    _signed_urls.popitem(last=False)
+            signed_urls[url] = signed_url
+
+        logger.info(
+            f"[AmazonCloudStorage.get_signed_urls] Signed URLs generated | "
+            f"{{'project_id': '{self.project_id}', 'count': {len(signed_urls)}, 'cached': {cached}}}"
+        )
+        return signed_urls
+
+    def get_signed_upload(
+        self,
+        file_path: Path,
+        sha256: str,
+        content_type: str | None = None,
+        expires_in: int = 3600,
+    ) -> SignedUpload:
+        """
+        Generate a presigned PUT URL for uploading a file straight to S3.
+
+        The SHA-256 of the content is part of the signature: S3 rejects an
+        upload whose body does not match it, and stores it in the object
+        metadata as put() does, so the object can be verified on download.
+        :param file_path: Path relative to the project's storage root
+        :param sha256: SHA-256 (hex) of the content to be uploaded
+        :param content_type: Content type the client must upload with
+        :param expires_in: Expiry time in seconds (default: 1 hour)
+        :return: SignedUpload with the URL and the headers to send with it
+        """
+        if file_path.is_absolute():
+            raise ValueError("file_path must be relative to the project's storage root")
+        key = Path(self.storage_path) / file_path
+        destination = SimpleStorageName(key.as_posix())
+
+        checksum = base64.b64encode(bytes.fromhex(sha256)).decode()
+        params = {
+            "Bucket": destination.Bucket,
+            "Key": destination.Key,
+            "ChecksumSHA256": checksum,
+            "Metadata": {CHECKSUM_METADATA_KEY: sha256},
+        }
+        headers = {
+            "x-amz-checksum-sha256": checksum,
+            f"x-amz-meta-{CHECKSUM_METADATA_KEY}": sha256,
+        }
+        if content_type:
+            params["ContentType"] = content_type
+            headers["Content-Type"] = content_type
+
         try:
             signed_url = self.aws.client.generate_presigned_url(
-                "get_object",
-                Params={"Bucket": name.Bucket, "Key": name.Key},
-                ExpiresIn=expires_in,
+                "put_object", Params=params, ExpiresIn=expires_in
             )
             logger.info(
-                f"[AmazonCloudStorage.get_signed_url] Signed URL generated | "
-                f"{{'project_id': '{self.project_id}', 'bucket': '{mask_string(name.Bucket)}', 'key': '{mask_string(name.Key)}'}}"
+                f"[AmazonCloudStorage.get_signed_upload] Signed upload URL generated | "
+                f"{{'project_id': '{self.project_id}', 'bucket': '{mask_string(destination.Bucket)}', 'key': '{mask_string(destination.Key)}'}}"
             )
-            return signed_url
         except ClientError as err:
             logger.error(
-                f"[AmazonCloudStorage.get_signed_url] AWS presign error | "
+                f"[AmazonCloudStorage.get_signed_upload] AWS presign error | "
+                f"{{'project_id': '{self.project_id}', 'bucket': '{mask_string(destination.Bucket)}', 'key': '{mask_string(destination.Key)}', 'error': '{str(err)}'}}",
+                exc_info=True,
+            )
+            raise CloudStorageError(f'AWS Error: "{err}"') from err
+
+        return SignedUpload(destination=destination, url=signed_url, headers=headers)
+
+    def get_object_info(self, url: str) -> StoredObject:
+        """
+        Read the size and SHA-256 of an object with a single HEAD request.
+
+        The SHA-256 is taken from the object metadata; if S3 also holds a
+        SHA-256 checksum of the whole object, the two must agree.
+        """
+        name = SimpleStorageName.from_url(url)
+        kwargs = asdict(name)
+        try:
+            head = self.aws.client.head_object(ChecksumMode="ENABLED", **kwargs)
+        except ClientError as err:
+            logger.error(
+                f"[AmazonCloudStorage.get_object_info] AWS head object error | "
                 f"{{'project_id': '{self.project_id}', 'bucket': '{mask_string(name.Bucket)}', 'key': '{mask_string(name.Key)}', 'error': '{str(err)}'}}",
                 exc_info=True,
             )
             raise CloudStorageError(f'AWS Error: "{err}" ({url})') from err
 
+        sha256 = head.get("Metadata", {}).get(CHECKSUM_METADATA_KEY)
+        s3_checksum = head.get("ChecksumSHA256")
+        # Multipart objects carry a checksum of part checksums ("<b64>-<parts>")
+        if sha256 and s3_checksum and "-" not in s3_checksum:
+            if base64.b64decode(s3_checksum).hex() != sha256:
+                logger.error(
+                    f"[AmazonCloudStorage.get_object_info] Checksum mismatch | "
+                    f"{{'project_id': '{self.project_id}', 'bucket': '{mask_string(name.Bucket)}', 'key': '{mask_string(name.Key)}'}}"
+                )
+                raise CloudStorageError(f"Checksum mismatch for stored file ({url})")
+
+        return StoredObject(size_bytes=head["ContentLength"], sha256=sha256)
+
     def delete(self, url: str) -> None:
         name = SimpleStorageName.from_url(url)
         kwargs = asdict(name)
@@ -258,18 +715,378 @@ class AmazonCloudStorage(CloudStorage):
             raise CloudStorageError(f'AWS Error: "{err}" ({url})') from err
 
 
-def get_cloud_storage(session: Session, project_id: int) -> CloudStorage:
+# Header a client sends with a signed local upload, carrying the SHA-256 (hex)
+# the upload URL was signed for
+LOCAL_CHECKSUM_HEADER = "x-content-sha256"
+# Directory under LOCAL_STORAGE_ROOT holding each object's metadata
+LOCAL_METADATA_DIR = ".meta"
+
+
+def get_local_storage_root() -> Path:
+    return Path(settings.LOCAL_STORAGE_ROOT)
+
+
+def get_local_object_path(name: SimpleStorageName) -> Path:
     """
-    Method to create and configure a cloud storage instance.
+    Return the file holding an object of the local backend.
+
+    Objects are laid out as <root>/<bucket>/<key>, mirroring the bucket, so a
+    local store can be synced to S3 with every stored URL still valid.
+
+    Raises:
+        CloudStorageError: If the name would resolve outside the bucket
     """
+    bucket = (get_local_storage_root() / name.Bucket).resolve()
+    path = (bucket / name.Key).resolve()
+    if (
+        not name.Bucket
+        or name.Bucket.startswith(".")
+        or not path.is_relative_to(bucket)
+    ):
+        raise CloudStorageError(f"Invalid storage name ({name})")
+    return path
+
+
+def _local_metadata_path(name: SimpleStorageName) -> Path:
+    return (
+        get_local_storage_root() / LOCAL_METADATA_DIR / name.Bucket / f"{name.Key}.json"
+    )
+
+
+def _atomic_write(path: Path, write) -> None:
+    """
+    Write a file through a temporary file in the same directory.
+
+    The temporary file is flushed to disk and renamed over the target, so
+    readers see either the old or the new content, never a partial write.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+
+
+def mapped_sha256(path: Path) -> str:
+    """Return the SHA-256 (hex) of a file, hashed through a memory map."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest()
+
+
+def write_local_object(
+    name: SimpleStorageName,
+    fileobj,
+    sha256: str | None = None,
+    content_type: str | None = None,
+) -> StoredObject:
+    """
+    Store the rest of a binary file as an object of the local backend.
+
+    The content is hashed while it is written; if an expected SHA-256 is
+    given and does not match, nothing is stored.
+
+    Raises:
+        CloudStorageError: On a checksum mismatch or a filesystem error
+    """
+    path = get_local_object_path(name)
+    digest = hashlib.sha256()
+    size = 0
+
+    def write(f):
+        nonlocal size
+        for block in iter(lambda: fileobj.read(TRANSFER_BLOCK_SIZE), b""):
+            digest.update(block)
+            f.write(block)
+            size += len(block)
+        if sha256 and digest.hexdigest() != sha256:
+            raise CloudStorageError(f"Checksum mismatch for uploaded file ({name})")
+
+    metadata = None
+    try:
+        _atomic_write(path, write)
+        metadata = {
+            CHECKSUM_METADATA_KEY: digest.hexdigest(),
+            "content_type": content_type,
+        }
+        _atomic_write(
+            _local_metadata_path(name),
+            lambda f: f.write(json.dumps(metadata).encode()),
+        )
+    except OSError as err:
+        raise CloudStorageError(f'Local storage error: "{err}" ({name})') from err
+    return StoredObject(size_bytes=size, sha256=metadata[CHECKSUM_METADATA_KEY])
+
+
+def read_local_metadata(name: SimpleStorageName) -> dict:
+    """Return the metadata recorded for a local object, empty if there is none."""
+    try:
+        return json.loads(_local_metadata_path(name).read_bytes())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _local_signing_key() -> bytes:
+    return hmac.new(
+        settings.SECRET_KEY.encode(), b"local-storage", hashlib.sha256
+    ).digest()
+
+
+def sign_local_url(
+    method: str, name: SimpleStorageName, expires: int, sha256: str | None = None
+) -> str:
+    """Return the HMAC signature of a local storage request."""
+    message = "\n".join([method, name.Bucket, name.Key, str(expires), sha256 or ""])
+    return hmac.new(_local_signing_key(), message.encode(), hashlib.sha256).hexdigest()
+
+
+def verify_local_url(
+    method: str,
+    name: SimpleStorageName,
+    expires: int,
+    signature: str,
+    sha256: str | None = None,
+) -> bool:
+    """Check the signature and expiry of a local storage request."""
+    if expires < time.time():
+        return False
+    expected = sign_local_url(method, name, expires, sha256)
+    return hmac.compare_digest(expected, signature)
+
+
+def build_local_url(name: SimpleStorageName, expires: int, signature: str) -> str:
+    path = quote(f"{settings.API_V1_STR}/storage/{name.Bucket}/{name.Key}")
+    query = urlencode({"expires": expires, "signature": signature})
+    return f"{settings.API_BASE_URL.rstrip('/')}{path}?{query}"
+
+
+class MappedFileBody(io.BufferedIOBase):
+    """
+    Read-only body of a local object, read through a memory map.
+
+    Mirrors the parts of botocore's StreamingBody that callers use, so it
+    can be returned from stream().
+    """
+
+    def __init__(self, path: Path):
+        self.name = path.name
+        self._map = None
+        self._pos = 0
+        with open(path, "rb") as f:
+            self._size = os.fstat(f.fileno()).st_size
+            if self._size:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> bytes:
+        if self._map is None:
+            return b""
+        end = self._size if size is None or size < 0 else self._pos + size
+        data = self._map[self._pos : min(end, self._size)]
+        self._pos += len(data)
+        return data
+
+    def read1(self, size: int = -1) -> bytes:
+        return self.read(size)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: self._size}
+        self._pos = max(0, base[whence] + offset)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def iter_chunks(self, chunk_size: int = TRANSFER_BLOCK_SIZE):
+        for block in iter(lambda: self.read(chunk_size), b""):
+            yield block
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        super().close()
+
+
+class LocalCloudStorage(CloudStorage):
+    """
+    Object store on the local filesystem, for single node deployments.
+
+    Objects keep their s3://<bucket>/<key> names and live under
+    LOCAL_STORAGE_ROOT. Signed URLs are HMAC tokens served by the
+    /storage routes of this API.
+    """
+
+    def _name(self, file_path: Path) -> SimpleStorageName:
+        if file_path.is_absolute():
+            raise ValueError("file_path must be relative to the project's storage root")
+        return SimpleStorageName((Path(self.storage_path) / file_path).as_posix())
+
+    def _path(self, url: str) -> tuple[SimpleStorageName, Path]:
+        name = SimpleStorageName.from_url(url)
+        path = get_local_object_path(name)
+        if not path.is_file():
+            logger.error(
+                f"[LocalCloudStorage] File not found | "
+                f"{{'project_id': '{self.project_id}', 'key': '{mask_string(name.Key)}'}}"
+            )
+            raise CloudStorageError(f"File not found ({url})")
+        return name, path
+
+    def put(
+        self, source: UploadFile, file_path: Path, sha256: str | None = None
+    ) -> SimpleStorageName:
+        destination = self._name(file_path)
+        write_local_object(
+            destination, source.file, sha256=sha256, content_type=source.content_type
+        )
+        logger.info(
+            f"[LocalCloudStorage.put] File stored successfully | "
+            f"{{'project_id': '{self.project_id}', 'key': '{mask_string(destination.Key)}'}}"
+        )
+        return destination
+
+    def stream(self, url: str) -> MappedFileBody:
+        _, path = self._path(url)
+        return MappedFileBody(path)
+
+    def download(self, url: str, destination: Path) -> Path:
+        """
+        Copy an object to a local file, checking it against its checksum.
+
+        shutil.copyfile copies with sendfile(2) on Linux, so the content
+        never passes through Python.
+        """
+        name, path = self._path(url)
+        shutil.copyfile(path, destination)
+
+        expected_sha256 = read_local_metadata(name).get(CHECKSUM_METADATA_KEY)
+        if expected_sha256 and mapped_sha256(destination) != expected_sha256:
+            logger.error(
+                f"[LocalCloudStorage.download] Checksum mismatch | "
+                f"{{'project_id': '{self.project_id}', 'key': '{mask_string(name.Key)}'}}"
+            )
+            raise CloudStorageError(f"Checksum mismatch for downloaded file ({url})")
+        return destination
+
+    def get_file_size_kb(self, url: str) -> float:
+        _, path = self._path(url)
+        return round(path.stat().st_size / 1024, 2)
+
+    def get_signed_url(self, url: str, expires_in: int = 3600) -> str:
+        return self.get_signed_urls([url], expires_in)[url]
+
+    def get_signed_urls(
+        self, urls: Iterable[str], expires_in: int = 3600
+    ) -> dict[str, str]:
+        """
+        Generate signed download URLs served by GET /storage/{bucket}/{key}.
+
+        Expiry is rounded up to SIGNED_URL_CACHE_WINDOW, as for S3, so the
+        same object gets the same URL within a window and clients can cache it.
+        """
+        window = SIGNED_URL_CACHE_WINDOW
+        expires = (int(time.time() + expires_in) // window + 1) * window
+
+        signed_urls = {}
+        for url in urls:
+            name = SimpleStorageName.from_url(url)
+            signature = sign_local_url("GET", name, expires)
+            signed_urls[url] = build_local_url(name, expires, signature)
+        return signed_urls
+
+    def get_signed_upload(
+        self,
+        file_path: Path,
+        sha256: str,
+        content_type: str | None = None,
+        expires_in: int = 3600,
+    ) -> SignedUpload:
+        """
+        Generate a signed URL for PUT /storage/{bucket}/{key}.
+
+        The SHA-256 is part of the signature and must be sent in the
+        LOCAL_CHECKSUM_HEADER header; content that does not match is rejected.
+        """
+        destination = self._name(file_path)
+        expires = int(time.time()) + expires_in
+        signature = sign_local_url("PUT", destination, expires, sha256)
+        headers = {LOCAL_CHECKSUM_HEADER: sha256}
+        if content_type:
+            headers["Content-Type"] = content_type
+        return SignedUpload(
+            destination=destination,
+            url=build_local_url(destination, expires, signature),
+            headers=headers,
+        )
+
+    def get_object_info(self, url: str) -> StoredObject:
+        name, path = self._path(url)
+        return StoredObject(
+            size_bytes=path.stat().st_size,
+            sha256=read_local_metadata(name).get(CHECKSUM_METADATA_KEY),
+        )
+
+    def delete(self, url: str) -> None:
+        name = SimpleStorageName.from_url(url)
+        for path in (get_local_object_path(name), _local_metadata_path(name)):
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+        logger.info(
+            f"[LocalCloudStorage.delete] File deleted successfully | "
+            f"{{'project_id': '{self.project_id}', 'key': '{mask_string(name.Key)}'}}"
+        )
+
+
+def get_project_storage_path(session: Session, project_id: int) -> UUID:
+    """
+    Return the storage path of a project, cached per process.
+
+    A project's storage path is set when it is created and never changes, so
+    it is only read from the database the first time.
+    """
+    with _storage_paths_lock:
+        storage_path = _storage_paths.get(project_id)
+        if storage_path is not None:
+            _storage_paths.move_to_end(project_id)
+            return storage_path
+
     project = get_project_by_id(session=session, project_id=project_id)
     if not project:
         raise ValueError(f"Invalid project_id: {project_id}")
 
-    storage_path = project.storage_path
+    with _storage_paths_lock:
+        _storage_paths[project_id] = project.storage_path
+        if len(_storage_paths) > STORAGE_PATH_CACHE_SIZE:
+            _storage_paths.popitem(last=False)
+    return project.storage_path
+
+
+def get_cloud_storage(session: Session, project_id: int) -> CloudStorage:
+    """
+    Method to create and configure a cloud storage instance.
+    """
+    storage_path = get_project_storage_path(session=session, project_id=project_id)
 
+    storage_class = (
+        LocalCloudStorage if settings.STORAGE_BACKEND == "local" else AmazonCloudStorage
+    )
     try:
-        return AmazonCloudStorage(project_id=project_id, storage_path=storage_path)
+        return storage_class(project_id=project_id, storage_path=storage_path)
     except Exception as err:
         logger.error(
             f"[get_cloud_storage] Failed to initialize storage for project_id={project_id}: {err}",
@@ -72,6 +72,23 @@ class Settings(BaseSettings):
     AWS_SECRET_ACCESS_KEY: str = ""
     AWS_DEFAULT_REGION: str = ""
     AWS_S3_BUCKET_PREFIX: str = ""
+    # Object store transfers: files above the threshold are uploaded and
+    # downloaded in chunks of this size (bytes), with this many in parallel
+    AWS_S3_MULTIPART_THRESHOLD: int = 16 * 1024 * 1024
+    AWS_S3_MULTIPART_CHUNK_SIZE: int = 8 * 1024 * 1024
+    AWS_S3_MAX_TRANSFER_CONCURRENCY: int = 8
+    # Threads per worker process that run object store calls made from async
+    # routes, so uploads never block the event loop or the request threadpool
+    STORAGE_IO_MAX_WORKERS: int = 16
+    # Object store backend: "s3", or "local" to keep objects on this
+    # machine's filesystem under LOCAL_STORAGE_ROOT (single node installs and
+    # test rigs). Local signed URLs point at API_BASE_URL and are signed with
+    # SECRET_KEY, so every worker must share it
+    STORAGE_BACKEND: Literal["s3", "local"] = "s3"
+    LOCAL_STORAGE_ROOT: str = "/var/lib/kaapi/storage"
+    # Largest body accepted by signed uploads to the local backend (bytes)
+    LOCAL_STORAGE_MAX_UPLOAD_BYTES: int = 512 * 1024 * 1024
+    API_BASE_URL: str = "http://localhost:8000"
 
     # RabbitMQ configuration for Celery broker
     RABBITMQ_HOST: str = "localhost"
@@ -123,6 +140,10 @@ class Settings(BaseSettings):
     CALLBACK_CONNECT_TIMEOUT: int = 3
     CALLBACK_READ_TIMEOUT: int = 10
 
+    # Evaluations with at most this many items (including duplicates) run
+    # with concurrent realtime API calls instead of the Batch API; 0 disables
+    EVALUATION_REALTIME_MAX_ITEMS: int = 50
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def COMPUTED_CELERY_WORKER_CONCURRENCY(self) -> int:
@@ -11,6 +11,7 @@ import logging
 from datetime import datetime
 from io import BytesIO
 from pathlib import Path
+from typing import BinaryIO
 
 from starlette.datastructures import Headers, UploadFile
 
@@ -21,16 +22,19 @@ logger = logging.getLogger(__name__)
 
 def upload_csv_to_object_store(
     storage: CloudStorage,
-    csv_content: bytes,
+    csv_content: bytes | BinaryIO,
     filename: str,
     subdirectory: str = "datasets",
 ) -> str | None:
     """
     Upload CSV content to object store.
 
+    A binary file object is streamed from its current position, so large
+    uploads do not have to be read into memory first.
+
     Args:
         storage: CloudStorage instance
-        csv_content: Raw CSV content as bytes
+        csv_content: Raw CSV content as bytes, or a binary file object
         filename: Name of the file (can include timestamp)
         subdirectory: Subdirectory path in object store (default: "datasets")
 
@@ -41,9 +45,10 @@ def upload_csv_to_object_store(
         This function handles errors gracefully and returns None on failure.
         Callers should continue without object store URL when this returns None.
     """
+    size = f"{len(csv_content)} bytes" if isinstance(csv_content, bytes) else "streamed"
     logger.info(
         f"[upload_csv_to_object_store] Preparing to upload '{filename}' | "
-        f"size={len(csv_content)} bytes, subdirectory='{subdirectory}'"
+        f"size={size}, subdirectory='{subdirectory}'"
     )
 
     try:
@@ -52,8 +57,10 @@ def upload_csv_to_object_store(
 
         # Create a mock UploadFile-like object for the storage put method
         class CSVFile:
-            def __init__(self, content: bytes):
-                self.file = io.BytesIO(content)
+            def __init__(self, content: bytes | BinaryIO):
+                self.file = (
+                    io.BytesIO(content) if isinstance(content, bytes) else content
+                )
                 self.content_type = "text/csv"
 
         csv_file = CSVFile(csv_content)
@@ -4,6 +4,7 @@ from .user import (
     get_user_by_email,
     update_user,
 )
+from .pagination import CountMode, Page
 from .collection.collection import CollectionCrud
 from .collection.collection_job import CollectionJobCrud
 from .document.document import DocumentCrud
@@ -57,6 +58,7 @@ from .openai_conversation import (
     get_conversation_by_ancestor_id,
     get_conversations_by_project,
     get_conversations_count_by_project,
+    get_conversations_page_by_project,
     create_conversation,
     delete_conversation,
 )
@@ -1,11 +1,14 @@
 """Generic batch operations orchestrator."""
 
+import itertools
 import logging
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from sqlmodel import Session
 
 from app.core.batch.base import BatchProvider
+from app.core.batch.jsonl import JSONLRequestFile, iter_jsonl_request_files
 from app.core.cloud import get_cloud_storage
 from app.core.storage_utils import upload_jsonl_to_object_store as shared_upload_jsonl
 from app.crud.batch_job import (
@@ -16,6 +19,9 @@ from app.models.batch_job import BatchJob, BatchJobCreate, BatchJobUpdate
 
 logger = logging.getLogger(__name__)
 
+# Provider statuses after which a batch will never produce results
+TERMINAL_FAILURE_STATUSES = ("failed", "expired", "cancelled")
+
 
 def start_batch_job(
     session: Session,
@@ -24,8 +30,9 @@ def start_batch_job(
     job_type: str,
     organization_id: int,
     project_id: int,
-    jsonl_data: list[dict[str, Any]],
+    jsonl_data: Iterable[dict[str, Any]],
     config: dict[str, Any],
+    total_items: int,
 ) -> BatchJob:
     """
     Create and start a batch job with the specified provider.
@@ -33,12 +40,25 @@ def start_batch_job(
     Creates a batch_job record, calls the provider to create the batch,
     and updates the record with provider IDs.
 
+    jsonl_data may be a generator that is consumed once by the provider, so
+    its length cannot be read up front. The caller passes the expected number
+    of items in total_items, which is stored on the record before submission;
+    once the provider accepts the batch it is replaced with the provider's
+    count of serialized lines.
+
+    If the requests exceed the provider's per-batch limits
+    (max_batch_requests / max_batch_file_bytes), they are split into shards.
+    Each shard is submitted as its own provider batch with a BatchJob row
+    linked to the returned record through parent_id, so the shards run in
+    parallel on the provider side. The parent record carries no provider IDs;
+    poll_batch_status() and download_batch_results() handle it as a group.
+
     Returns:
-        BatchJob with provider IDs populated
+        BatchJob with provider IDs populated, or the parent BatchJob of the shards
     """
     logger.info(
         f"[start_batch_job] Starting | provider={provider_name} | type={job_type} | "
-        f"org={organization_id} | project={project_id} | items={len(jsonl_data)}"
+        f"org={organization_id} | project={project_id} | items={total_items}"
     )
 
     batch_job_create = BatchJobCreate(
@@ -47,19 +67,41 @@ def start_batch_job(
         organization_id=organization_id,
         project_id=project_id,
         config=config,
-        total_items=len(jsonl_data),
+        total_items=total_items,
     )
 
     batch_job = create_batch_job(session=session, batch_job_create=batch_job_create)
 
     try:
-        batch_result = provider.create_batch(jsonl_data=jsonl_data, config=config)
+        request_files = iter_jsonl_request_files(
+            jsonl_data,
+            max_requests=provider.max_batch_requests,
+            max_bytes=provider.max_batch_file_bytes,
+        )
+
+        first_file = next(request_files, None)
+        if first_file is None:
+            raise ValueError("No batch requests to submit")
+
+        second_file = next(request_files, None)
+        if second_file is not None:
+            return _start_sharded_batch_job(
+                session=session,
+                provider=provider,
+                parent=batch_job,
+                request_files=itertools.chain([first_file, second_file], request_files),
+            )
+
+        with first_file:
+            batch_result = provider.create_batch_from_file(
+                request_file=first_file, config=config
+            )
 
         batch_job_update = BatchJobUpdate(
             provider_batch_id=batch_result["provider_batch_id"],
             provider_file_id=batch_result["provider_file_id"],
             provider_status=batch_result["provider_status"],
-            total_items=batch_result.get("total_items", len(jsonl_data)),
+            total_items=batch_result["total_items"],
         )
 
         batch_job = update_batch_job(
@@ -86,10 +128,168 @@ def start_batch_job(
         raise
 
 
+def _start_sharded_batch_job(
+    session: Session,
+    provider: BatchProvider,
+    parent: BatchJob,
+    request_files: Iterator[JSONLRequestFile],
+) -> BatchJob:
+    """
+    Submit one provider batch per request file as shards of the parent job.
+
+    If a shard fails to submit, the shards already created at the provider are
+    cancelled before the error is re-raised, so they do not keep running
+    without a parent to collect their results.
+    """
+    description = parent.config.get("description", "LLM batch job")
+    submitted: list[BatchJob] = []
+    shard_statuses = []
+    total_items = 0
+
+    for shard_index, request_file in enumerate(request_files):
+        with request_file:
+            shard = create_batch_job(
+                session=session,
+                batch_job_create=BatchJobCreate(
+                    provider=parent.provider,
+                    job_type=parent.job_type,
+                    organization_id=parent.organization_id,
+                    project_id=parent.project_id,
+                    config={
+                        **parent.config,
+                        "description": f"{description} (shard {shard_index + 1})",
+                    },
+                    total_items=request_file.count,
+                    parent_id=parent.id,
+                    shard_index=shard_index,
+                ),
+            )
+
+            try:
+                batch_result = provider.create_batch_from_file(
+                    request_file=request_file, config=shard.config
+                )
+            except Exception as e:
+                update_batch_job(
+                    session=session,
+                    batch_job=shard,
+                    batch_job_update=BatchJobUpdate(
+                        error_message=f"Batch creation failed: {str(e)}"
+                    ),
+                )
+                _cancel_submitted_shards(
+                    session=session,
+                    provider=provider,
+                    shards=submitted,
+                    reason=f"Cancelled because shard {shard_index} failed to submit",
+                )
+                raise
+
+        shard = update_batch_job(
+            session=session,
+            batch_job=shard,
+            batch_job_update=BatchJobUpdate(
+                provider_batch_id=batch_result["provider_batch_id"],
+                provider_file_id=batch_result["provider_file_id"],
+                provider_status=batch_result["provider_status"],
+                total_items=batch_result["total_items"],
+            ),
+        )
+        submitted.append(shard)
+        shard_statuses.append(batch_result["provider_status"])
+        total_items += batch_result["total_items"]
+
+        logger.info(
+            f"[start_batch_job] Submitted shard | parent_id={parent.id} | "
+            f"shard={shard_index} | id={shard.id} | "
+            f"provider_batch_id={batch_result['provider_batch_id']} | "
+            f"items={batch_result['total_items']}"
+        )
+
+    parent.config = {**parent.config, "shard_count": len(shard_statuses)}
+    parent = update_batch_job(
+        session=session,
+        batch_job=parent,
+        batch_job_update=BatchJobUpdate(
+            provider_status=_aggregate_provider_status(shard_statuses),
+            total_items=total_items,
+        ),
+    )
+
+    logger.info(
+        f"[start_batch_job] Success | id={parent.id} | shards={len(shard_statuses)} | "
+        f"items={total_items}"
+    )
+
+    return parent
+
+
+def _cancel_submitted_shards(
+    session: Session, provider: BatchProvider, shards: list[BatchJob], reason: str
+) -> None:
+    """
+    Cancel shards already created at the provider and mark their rows cancelled.
+
+    Cancellation is best effort: a shard that cannot be cancelled is logged and
+    still marked cancelled, so the original submission error is what surfaces.
+    """
+    for shard in shards:
+        try:
+            provider.cancel_batch(shard.provider_batch_id)
+        except Exception as e:
+            logger.error(
+                f"[start_batch_job] Failed to cancel shard | id={shard.id} | "
+                f"provider_batch_id={shard.provider_batch_id} | {e}"
+            )
+
+        update_batch_job(
+            session=session,
+            batch_job=shard,
+            batch_job_update=BatchJobUpdate(
+                provider_status="cancelled", error_message=reason
+            ),
+        )
+        logger.info(
+            f"[start_batch_job] Cancelled shard | id={shard.id} | "
+            f"provider_batch_id={shard.provider_batch_id}"
+        )
+
+
+def _aggregate_provider_status(statuses: list[str | None]) -> str:
+    """
+    Combine shard provider statuses into one status for the parent job.
+
+    A failed, expired or cancelled shard fails the group, the group is completed
+    once every shard is, and it stays "validating" until every shard has left
+    that state. Anything else is reported as "in_progress".
+    """
+    for status in statuses:
+        if status in TERMINAL_FAILURE_STATUSES:
+            return status
+
+    if all(status == "completed" for status in statuses):
+        return "completed"
+
+    if all(status == "validating" for status in statuses):
+        return "validating"
+
+    return "in_progress"
+
+
 def poll_batch_status(
     session: Session, provider: BatchProvider, batch_job: BatchJob
 ) -> dict[str, Any]:
-    """Poll provider for batch status and update database."""
+    """
+    Poll provider for batch status and update database.
+
+    For a sharded parent job every shard that has not finished is polled and
+    the parent's provider_status is derived from the shard statuses.
+    """
+    if batch_job.shards:
+        return _poll_sharded_batch_status(
+            session=session, provider=provider, batch_job=batch_job
+        )
+
     logger.info(
         f"[poll_batch_status] Polling | id={batch_job.id} | "
         f"provider_batch_id={batch_job.provider_batch_id}"
@@ -127,10 +327,70 @@ def poll_batch_status(
         raise
 
 
+def _poll_sharded_batch_status(
+    session: Session, provider: BatchProvider, batch_job: BatchJob
+) -> dict[str, Any]:
+    """Poll the unfinished shards of a parent job and aggregate their status."""
+    for shard in batch_job.shards:
+        if shard.provider_status == "completed" or (
+            shard.provider_status in TERMINAL_FAILURE_STATUSES
+        ):
+            continue
+        poll_batch_status(session=session, provider=provider, batch_job=shard)
+
+    statuses = [shard.provider_status for shard in batch_job.shards]
+    provider_status = _aggregate_provider_status(statuses)
+
+    error_message = None
+    failed_shard = next(
+        (s for s in batch_job.shards if s.provider_status == provider_status), None
+    )
+    if provider_status in TERMINAL_FAILURE_STATUSES and failed_shard:
+        error_message = (
+            f"Shard {failed_shard.shard_index} {provider_status}: "
+            f"{failed_shard.error_message or 'no error message'}"
+        )
+
+    if provider_status != batch_job.provider_status:
+        logger.info(
+            f"[poll_batch_status] Updated shards | id={batch_job.id} | "
+            f"{batch_job.provider_status} -> {provider_status}"
+        )
+        update_batch_job(
+            session=session,
+            batch_job=batch_job,
+            batch_job_update=BatchJobUpdate(
+                provider_status=provider_status, error_message=error_message
+            ),
+        )
+
+    return {
+        "provider_status": provider_status,
+        "error_message": error_message,
+        "shard_statuses": statuses,
+    }
+
+
 def download_batch_results(
     provider: BatchProvider, batch_job: BatchJob
 ) -> list[dict[str, Any]]:
-    """Download raw batch results from provider."""
+    """
+    Download raw batch results from provider.
+
+    Results of a sharded parent job are the shard results concatenated in
+    shard order.
+    """
+    if batch_job.shards:
+        results = []
+        for shard in batch_job.shards:
+            results.extend(download_batch_results(provider=provider, batch_job=shard))
+
+        logger.info(
+            f"[download_batch_results] Merged shards | batch_job_id={batch_job.id} | "
+            f"shards={len(batch_job.shards)} | results={len(results)}"
+        )
+        return results
+
     if not batch_job.provider_output_file_id:
         raise ValueError(
             f"Batch job {batch_job.id} does not have provider_output_file_id"
@@ -11,6 +11,7 @@ from sqlalchemy.exc import IntegrityError
 from app.models import Document, Collection, DocumentCollection
 from app.core.util import now
 from app.crud.document_collection import DocumentCollectionCrud
+from app.crud.pagination import CountMode, Page, paginate
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +94,33 @@ class CollectionCrud:
         collections = self.session.exec(statement).all()
         return collections
 
+    def read_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        count: CountMode = CountMode.NONE,
+    ) -> Page[Collection]:
+        """
+        Read one page of active collections, newest first.
+
+        See app.crud.pagination.paginate for the cursor and count semantics.
+        """
+        statement = select(Collection).where(
+            and_(
+                Collection.project_id == self.project_id,
+                Collection.deleted_at.is_(None),
+            )
+        )
+        return paginate(
+            self.session,
+            statement,
+            sort_column=Collection.inserted_at,
+            id_column=Collection.id,
+            limit=limit,
+            cursor=cursor,
+            count=count,
+        )
+
     def delete_by_id(self, collection_id: UUID) -> Collection:
         coll = self.read_one(collection_id)
         coll.deleted_at = now()
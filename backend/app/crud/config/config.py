@@ -12,6 +12,7 @@ from app.models import (
     ConfigVersion,
 )
 from app.core.util import now
+from app.crud.pagination import CountMode, Page, paginate
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +101,35 @@ class ConfigCrud:
         )
         return self.session.exec(statement).all()
 
+    def read_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        skip: int | None = None,
+        count: CountMode = CountMode.NONE,
+    ) -> Page[Config]:
+        """
+        Read one page of configurations, most recently updated first.
+
+        See app.crud.pagination.paginate for the cursor and count semantics.
+        """
+        statement = select(Config).where(
+            and_(
+                Config.project_id == self.project_id,
+                Config.deleted_at.is_(None),
+            )
+        )
+        return paginate(
+            self.session,
+            statement,
+            sort_column=Config.updated_at,
+            id_column=Config.id,
+            limit=limit,
+            cursor=cursor,
+            skip=skip,
+            count=count,
+        )
+
     def update_or_raise(self, config_id: UUID, config_update: ConfigUpdate) -> Config:
         config = self.exists_or_raise(config_id)
 
@@ -2,6 +2,7 @@ import logging
 from uuid import UUID
 from typing import List, Optional
 
+from sqlalchemy.orm import aliased
 from sqlmodel import Session, select, and_
 
 from app.crud import DocumentCrud
@@ -70,6 +71,55 @@ class DocTransformationJobCrud:
         jobs = self.session.exec(statement).all()
         return jobs
 
+    def read_each_with_outputs(
+        self, job_ids: set[UUID]
+    ) -> list[tuple[DocTransformationJob, Document | None]]:
+        """
+        Read jobs together with their transformed documents in one query.
+
+        The transformed document is None until the job completes, or if it
+        has been deleted since.
+        """
+        transformed = aliased(Document)
+        statement = (
+            select(DocTransformationJob, transformed)
+            .join(Document, DocTransformationJob.source_document_id == Document.id)
+            .outerjoin(
+                transformed,
+                and_(
+                    DocTransformationJob.transformed_document_id == transformed.id,
+                    transformed.is_deleted.is_(False),
+                ),
+            )
+            .where(
+                and_(
+                    DocTransformationJob.id.in_(list(job_ids)),
+                    Document.project_id == self.project_id,
+                    Document.is_deleted.is_(False),
+                )
+            )
+        )
+        return list(self.session.exec(statement).all())
+
+    def read_completed_outputs(
+        self, source_document_id: UUID
+    ) -> list[tuple[DocTransformationJob, Document]]:
+        """Return completed jobs of a source document with their live outputs."""
+        statement = (
+            select(DocTransformationJob, Document)
+            .join(Document, DocTransformationJob.transformed_document_id == Document.id)
+            .where(
+                and_(
+                    DocTransformationJob.source_document_id == source_document_id,
+                    DocTransformationJob.status == TransformationStatus.COMPLETED,
+                    Document.project_id == self.project_id,
+                    Document.is_deleted.is_(False),
+                )
+            )
+            .order_by(DocTransformationJob.updated_at.desc())
+        )
+        return list(self.session.exec(statement).all())
+
     def update(
         self,
         job_id: UUID,
@@ -5,6 +5,7 @@ from sqlmodel import Session, select, and_
 
 from app.models import Document
 from app.core.util import now
+from app.crud.pagination import CountMode, Page, paginate
 from app.core.exception_handlers import HTTPException
 
 logger = logging.getLogger(__name__)
@@ -21,6 +22,7 @@ class DocumentCrud:
                 Document.id == doc_id,
                 Document.project_id == self.project_id,
                 Document.is_deleted.is_(False),
+                Document.is_pending.is_(False),
             )
         )
 
@@ -33,13 +35,60 @@ class DocumentCrud:
 
         return result
 
+    def read_pending(self, doc_id: UUID) -> Document:
+        """Read a document whose direct upload has not been finalized yet."""
+        statement = select(Document).where(
+            and_(
+                Document.id == doc_id,
+                Document.project_id == self.project_id,
+                Document.is_deleted.is_(False),
+                Document.is_pending.is_(True),
+            )
+        )
+
+        result = self.session.exec(statement).one_or_none()
+        if result is None:
+            logger.warning(
+                f"[DocumentCrud.read_pending] Pending document not found | {{'doc_id': '{doc_id}', 'project_id': {self.project_id}}}"
+            )
+            raise HTTPException(status_code=404, detail="Pending document not found")
+
+        return result
+
+    def read_by_sha256(self, sha256: str) -> Document | None:
+        """
+        Return the earliest live uploaded document with the given content.
+
+        Transformation outputs are not matched, so only documents a client
+        uploaded are returned.
+        """
+        statement = (
+            select(Document)
+            .where(
+                and_(
+                    Document.project_id == self.project_id,
+                    Document.sha256 == sha256,
+                    Document.source_document_id.is_(None),
+                    Document.is_deleted.is_(False),
+                    Document.is_pending.is_(False),
+                )
+            )
+            .order_by(Document.inserted_at)
+            .limit(1)
+        )
+        return self.session.exec(statement).first()
+
     def read_many(
         self,
         skip: int | None = None,
         limit: int | None = None,
     ) -> list[Document]:
         statement = select(Document).where(
-            and_(Document.project_id == self.project_id, Document.is_deleted.is_(False))
+            and_(
+                Document.project_id == self.project_id,
+                Document.is_deleted.is_(False),
+                Document.is_pending.is_(False),
+            )
         )
 
         if skip is not None:
@@ -69,12 +118,43 @@ class DocumentCrud:
         documents = self.session.exec(statement).all()
         return documents
 
+    def read_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        skip: int | None = None,
+        count: CountMode = CountMode.NONE,
+    ) -> Page[Document]:
+        """
+        Read one page of live documents, newest first.
+
+        See app.crud.pagination.paginate for the cursor and count semantics.
+        """
+        statement = select(Document).where(
+            and_(
+                Document.project_id == self.project_id,
+                Document.is_deleted.is_(False),
+                Document.is_pending.is_(False),
+            )
+        )
+        return paginate(
+            self.session,
+            statement,
+            sort_column=Document.inserted_at,
+            id_column=Document.id,
+            limit=limit,
+            cursor=cursor,
+            skip=skip,
+            count=count,
+        )
+
     def read_each(self, doc_ids: list[UUID]):
         statement = select(Document).where(
             and_(
                 Document.project_id == self.project_id,
                 Document.id.in_(doc_ids),
                 Document.is_deleted.is_(False),
+                Document.is_pending.is_(False),
             )
         )
         results = self.session.exec(statement).all()
@@ -14,7 +14,9 @@ from app.crud.evaluations.dataset import (
     create_evaluation_dataset,
     delete_dataset,
     get_dataset_by_id,
+    iter_csv_items,
     list_datasets,
+    update_evaluation_dataset,
     upload_csv_to_object_store,
 )
 from app.crud.evaluations.embeddings import (
@@ -22,9 +24,11 @@ from app.crud.evaluations.embeddings import (
     calculate_cosine_similarity,
     start_embedding_batch,
 )
+from app.crud.evaluations.frame import EvaluationResultFrame
 from app.crud.evaluations.langfuse import (
     create_langfuse_dataset_run,
     update_traces_with_cosine_scores,
+    upload_dataset_items_to_langfuse,
     upload_dataset_to_langfuse,
 )
 from app.crud.evaluations.processing import (
@@ -33,6 +37,13 @@ from app.crud.evaluations.processing import (
     process_completed_embedding_batch,
     process_completed_evaluation,
 )
+from app.crud.evaluations.realtime import run_realtime_evaluation
+from app.crud.evaluations.results import (
+    get_evaluation_result_summary,
+    list_evaluation_results,
+    store_cosine_scores,
+    store_evaluation_results,
+)
 
 __all__ = [
     # Core
@@ -46,10 +57,14 @@ __all__ = [
     "create_evaluation_dataset",
     "delete_dataset",
     "get_dataset_by_id",
+    "iter_csv_items",
     "list_datasets",
+    "update_evaluation_dataset",
     "upload_csv_to_object_store",
     # Batch
     "start_evaluation_batch",
+    # Realtime
+    "run_realtime_evaluation",
     # Processing
     "check_and_process_evaluation",
     "poll_all_pending_evaluations",
@@ -59,8 +74,15 @@ __all__ = [
     "calculate_average_similarity",
     "calculate_cosine_similarity",
     "start_embedding_batch",
+    # Results
+    "EvaluationResultFrame",
+    "get_evaluation_result_summary",
+    "list_evaluation_results",
+    "store_cosine_scores",
+    "store_evaluation_results",
     # Langfuse
     "create_langfuse_dataset_run",
     "update_traces_with_cosine_scores",
+    "upload_dataset_items_to_langfuse",
     "upload_dataset_to_langfuse",
 ]
@@ -7,7 +7,9 @@ This module handles:
 3. Starting evaluation batches using generic batch infrastructure
 """
 
+import itertools
 import logging
+from collections.abc import Iterator
 from typing import Any
 
 from langfuse import Langfuse
@@ -15,8 +17,22 @@ from openai import OpenAI
 from sqlmodel import Session
 
 from app.core.batch.openai import OpenAIBatchProvider
+from app.core.cloud import get_cloud_storage
 from app.crud.batch_operations import start_batch_job
-from app.models import EvaluationRun
+from app.crud.evaluations.core import update_evaluation_run
+from app.crud.evaluations.dataset import (
+    build_copy_id,
+    get_item_copies,
+    update_evaluation_dataset,
+)
+from app.crud.evaluations.embeddings import EMBEDDING_CONFIG_KEYS
+from app.crud.evaluations.snapshot import (
+    SNAPSHOT_METADATA_KEY,
+    get_dataset_fingerprint,
+    read_dataset_snapshot,
+    write_dataset_snapshot,
+)
+from app.models import EvaluationDataset, EvaluationRun
 
 logger = logging.getLogger(__name__)
 
@@ -59,17 +75,121 @@ def fetch_dataset_items(langfuse: Langfuse, dataset_name: str) -> list[dict[str,
     return items
 
 
-def build_evaluation_jsonl(
-    dataset_items: list[dict[str, Any]], config: dict[str, Any]
+def load_dataset_items(
+    session: Session,
+    langfuse: Langfuse,
+    eval_run: EvaluationRun,
+    verify: bool = True,
 ) -> list[dict[str, Any]]:
     """
-    Build JSONL data for evaluation batch using OpenAI Responses API.
+    Load the items of an evaluation run's dataset, preferring its snapshot.
+
+    With verify, the snapshot recorded on the dataset is used only if its
+    fingerprint still matches the Langfuse dataset; otherwise the items are
+    fetched from Langfuse and a new snapshot is written and recorded. Either
+    way the snapshot is also recorded on the run. Without verify (e.g. when a
+    submitted run completes) the run's own snapshot is read without any
+    Langfuse calls, so results are matched against the items the run was
+    submitted with even if another run has since refreshed the dataset's
+    snapshot. Snapshot errors are logged and fall back to fetching the items
+    from Langfuse.
+
+    Args:
+        session: Database session
+        langfuse: Configured Langfuse client
+        eval_run: EvaluationRun whose dataset items to load
+        verify: Check the snapshot against the current Langfuse dataset
+
+    Returns:
+        List of dataset items with id, input, expected_output and metadata
+
+    Raises:
+        ValueError: If the items have to be fetched and the dataset is
+            not found or empty
+    """
+    dataset = session.get(EvaluationDataset, eval_run.dataset_id)
+    if verify:
+        snapshot = (
+            (dataset.dataset_metadata or {}).get(SNAPSHOT_METADATA_KEY)
+            if dataset
+            else None
+        )
+    else:
+        snapshot = eval_run.dataset_snapshot
+
+    storage = None
+    langfuse_dataset_id = fingerprint = None
+    try:
+        storage = get_cloud_storage(session=session, project_id=eval_run.project_id)
+        if verify:
+            langfuse_dataset_id, fingerprint = get_dataset_fingerprint(
+                langfuse=langfuse, dataset_name=eval_run.dataset_name
+            )
+        if snapshot and (not verify or snapshot.get("fingerprint") == fingerprint):
+            items = read_dataset_snapshot(storage=storage, url=snapshot["url"])
+            if verify:
+                update_evaluation_run(
+                    session=session, eval_run=eval_run, dataset_snapshot=snapshot
+                )
+            logger.info(
+                f"[load_dataset_items] Loaded dataset items from snapshot | "
+                f"dataset={eval_run.dataset_name} | items={len(items)}"
+            )
+            return items
+    except Exception as e:
+        logger.warning(
+            f"[load_dataset_items] Dataset snapshot unavailable, fetching from Langfuse | "
+            f"dataset={eval_run.dataset_name} | {e}"
+        )
+
+    items = fetch_dataset_items(langfuse=langfuse, dataset_name=eval_run.dataset_name)
+
+    if dataset and storage and fingerprint:
+        try:
+            url = write_dataset_snapshot(
+                storage=storage,
+                langfuse_dataset_id=langfuse_dataset_id,
+                fingerprint=fingerprint,
+                items=items,
+            )
+            snapshot = {"url": url, "fingerprint": fingerprint}
+            update_evaluation_dataset(
+                session=session,
+                dataset=dataset,
+                dataset_metadata={
+                    **dataset.dataset_metadata,
+                    SNAPSHOT_METADATA_KEY: snapshot,
+                },
+            )
+            update_evaluation_run(
+                session=session, eval_run=eval_run, dataset_snapshot=snapshot
+            )
+        except Exception as e:
+            logger.warning(
+                f"[load_dataset_items] Failed to write dataset snapshot | "
+                f"dataset={eval_run.dataset_name} | {e}"
+            )
+
+    return items
+
 
-    Each line is a dict with:
-    - custom_id: Unique identifier for the request (dataset item ID)
+def iter_evaluation_jsonl(
+    dataset_items: list[dict[str, Any]], config: dict[str, Any]
+) -> Iterator[dict[str, Any]]:
+    """
+    Lazily yield JSONL lines for an evaluation batch using OpenAI Responses API.
+
+    Each dataset item is stored once and expanded here into one line per
+    copy (see get_item_copies). Each line is a dict with:
+    - custom_id: Unique identifier for the request (dataset item ID, with the
+      copy number appended for duplicated items, see build_copy_id)
     - method: POST
     - url: /v1/responses
     - body: Response request using config as-is with input from dataset
+      (similarity scoring settings such as embedding_model are left out)
+
+    Lines are produced one at a time so the batch provider can serialize them
+    straight into its request file without holding the whole batch in memory.
 
     Args:
         dataset_items: List of dataset items from Langfuse
@@ -85,10 +205,12 @@ def build_evaluation_jsonl(
             - include
             etc.
 
-    Returns:
-        List of dictionaries (JSONL data)
+    Yields:
+        One dictionary per JSONL line
     """
-    jsonl_data = []
+    request_config = {
+        key: value for key, value in config.items() if key not in EMBEDDING_CONFIG_KEYS
+    }
 
     for item in dataset_items:
         # Extract question from input
@@ -101,18 +223,35 @@ def build_evaluation_jsonl(
 
         # Build the batch request object for Responses API
         # Use config as-is and only add the input field
-        batch_request = {
-            "custom_id": item["id"],
-            "method": "POST",
-            "url": "/v1/responses",
-            "body": {
-                **config,  # Use config as-is
-                "input": question,  # Add input from dataset
-            },
-        }
+        copies = get_item_copies(item.get("metadata"))
+        for copy_num in range(1, copies + 1):
+            yield {
+                "custom_id": build_copy_id(item["id"], copy_num, copies),
+                "method": "POST",
+                "url": "/v1/responses",
+                "body": {
+                    **request_config,  # Use config as-is
+                    "input": question,  # Add input from dataset
+                },
+            }
 
-        jsonl_data.append(batch_request)
-    return jsonl_data
+
+def build_evaluation_jsonl(
+    dataset_items: list[dict[str, Any]], config: dict[str, Any]
+) -> list[dict[str, Any]]:
+    """
+    Build JSONL data for evaluation batch using OpenAI Responses API.
+
+    Materialized variant of iter_evaluation_jsonl(); see it for the line format.
+
+    Args:
+        dataset_items: List of dataset items from Langfuse
+        config: Evaluation configuration dict with OpenAI Responses API parameters
+
+    Returns:
+        List of dictionaries (JSONL data)
+    """
+    return list(iter_evaluation_jsonl(dataset_items=dataset_items, config=config))
 
 
 def start_evaluation_batch(
@@ -126,7 +265,10 @@ def start_evaluation_batch(
     Fetch data, build JSONL, and start evaluation batch.
 
     This function orchestrates the evaluation-specific logic and delegates
-    to the generic batch infrastructure for actual batch creation.
+    to the generic batch infrastructure for actual batch creation. The
+    progress stage of the run is updated as each step starts
+    (fetching_dataset, submitting_batch) and set to submitted or failed at
+    the end.
 
     Args:
         langfuse: Configured Langfuse client
@@ -142,21 +284,35 @@ def start_evaluation_batch(
         Exception: If any step fails
     """
     try:
-        # Step 1: Fetch dataset items from Langfuse
+        # Step 1: Load dataset items (from the snapshot when it is current)
         logger.info(
             f"[start_evaluation_batch] Starting evaluation batch | run={eval_run.run_name}"
         )
-        dataset_items = fetch_dataset_items(
-            langfuse=langfuse, dataset_name=eval_run.dataset_name
+        update_evaluation_run(
+            session=session, eval_run=eval_run, progress={"stage": "fetching_dataset"}
+        )
+        dataset_items = load_dataset_items(
+            session=session, langfuse=langfuse, eval_run=eval_run
         )
 
-        # Step 2: Build evaluation-specific JSONL
-        jsonl_data = build_evaluation_jsonl(dataset_items=dataset_items, config=config)
+        # Step 2: Build evaluation-specific JSONL lazily; the provider streams
+        # it into its request file
+        jsonl_lines = iter_evaluation_jsonl(dataset_items=dataset_items, config=config)
 
-        if not jsonl_data:
+        first_line = next(jsonl_lines, None)
+        if first_line is None:
             raise ValueError(
                 "Evaluation dataset did not produce any JSONL entries (missing questions?)."
             )
+        jsonl_data = itertools.chain([first_line], jsonl_lines)
+        total_items = sum(
+            get_item_copies(item.get("metadata")) for item in dataset_items
+        )
+        update_evaluation_run(
+            session=session,
+            eval_run=eval_run,
+            progress={"stage": "submitting_batch", "total_items": total_items},
+        )
 
         # Step 3: Create batch provider
         provider = OpenAIBatchProvider(client=openai_client)
@@ -180,16 +336,18 @@ def start_evaluation_batch(
             project_id=eval_run.project_id,
             jsonl_data=jsonl_data,
             config=batch_config,
+            total_items=total_items,
         )
 
         # Step 6: Link batch_job to evaluation_run
         eval_run.batch_job_id = batch_job.id
-        eval_run.status = "processing"
         eval_run.total_items = batch_job.total_items
-
-        session.add(eval_run)
-        session.commit()
-        session.refresh(eval_run)
+        eval_run = update_evaluation_run(
+            session=session,
+            eval_run=eval_run,
+            status="processing",
+            progress={"stage": "submitted", "total_items": batch_job.total_items},
+        )
 
         logger.info(
             f"[start_evaluation_batch] Successfully started evaluation batch | "
@@ -205,8 +363,11 @@ def start_evaluation_batch(
             f"[start_evaluation_batch] Failed to start evaluation batch | {e}",
             exc_info=True,
         )
-        eval_run.status = "failed"
-        eval_run.error_message = str(e)
-        session.add(eval_run)
-        session.commit()
+        update_evaluation_run(
+            session=session,
+            eval_run=eval_run,
+            status="failed",
+            error_message=str(e),
+            progress={"stage": "failed"},
+        )
         raise
@@ -19,6 +19,7 @@ def create_evaluation_run(
     config: dict,
     organization_id: int,
     project_id: int,
+    progress: dict[str, Any] | None = None,
 ) -> EvaluationRun:
     """
     Create a new evaluation run record in the database.
@@ -31,6 +32,7 @@ def create_evaluation_run(
         config: Configuration dict for the evaluation
         organization_id: Organization ID
         project_id: Project ID
+        progress: Initial progress of run creation (optional)
 
     Returns:
         The created EvaluationRun instance
@@ -41,6 +43,7 @@ def create_evaluation_run(
         dataset_id=dataset_id,
         config=config,
         status="pending",
+        progress=progress,
         organization_id=organization_id,
         project_id=project_id,
         inserted_at=now(),
@@ -149,6 +152,8 @@ def update_evaluation_run(
     object_store_url: str | None = None,
     score: dict | None = None,
     embedding_batch_job_id: int | None = None,
+    progress: dict[str, Any] | None = None,
+    dataset_snapshot: dict[str, Any] | None = None,
 ) -> EvaluationRun:
     """
     Update an evaluation run with new values and persist to database.
@@ -164,6 +169,9 @@ def update_evaluation_run(
         object_store_url: New object store URL (optional)
         score: New score dict (optional)
         embedding_batch_job_id: New embedding batch job ID (optional)
+        progress: Progress fields to merge into the current progress (optional)
+        dataset_snapshot: Snapshot record ({"url", "fingerprint"}) of the
+            dataset items the run was submitted with (optional)
 
     Returns:
         Updated and refreshed EvaluationRun instance
@@ -179,6 +187,11 @@ def update_evaluation_run(
         eval_run.score = score
     if embedding_batch_job_id is not None:
         eval_run.embedding_batch_job_id = embedding_batch_job_id
+    if progress is not None:
+        # Assign a new dict so the JSONB column is marked as changed
+        eval_run.progress = {**(eval_run.progress or {}), **progress}
+    if dataset_snapshot is not None:
+        eval_run.dataset_snapshot = dataset_snapshot
 
     # Always update timestamp
     eval_run.updated_at = now()
@@ -6,10 +6,15 @@ This module handles database operations for evaluation datasets including:
 2. Fetching datasets by ID or name
 3. Listing datasets with pagination
 4. Uploading CSV files to AWS S3
+5. Parsing uploaded CSV files incrementally
+6. Expanding duplicated dataset items into per-copy IDs
 """
 
+import codecs
+import csv
 import logging
-from typing import Any
+from collections.abc import Iterator
+from typing import Any, BinaryIO
 
 from fastapi import HTTPException
 from sqlalchemy.exc import IntegrityError
@@ -27,6 +32,11 @@ from app.models import EvaluationDataset, EvaluationRun
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from an uploaded CSV at a time while parsing it
+CSV_READ_CHUNK_SIZE = 1024 * 1024
+# Separates a dataset item ID from the copy number in batch custom_ids
+COPY_ID_SEPARATOR = "#"
+
 
 def create_evaluation_dataset(
     session: Session,
@@ -37,6 +47,7 @@ def create_evaluation_dataset(
     description: str | None = None,
     object_store_url: str | None = None,
     langfuse_dataset_id: str | None = None,
+    progress: dict[str, Any] | None = None,
 ) -> EvaluationDataset:
     """
     Create a new evaluation dataset record in the database.
@@ -51,6 +62,7 @@ def create_evaluation_dataset(
         description: Optional dataset description
         object_store_url: Optional object store URL where CSV is stored
         langfuse_dataset_id: Optional Langfuse dataset ID
+        progress: Optional ingestion progress (e.g. {"stage": "queued"})
 
     Returns:
         Created EvaluationDataset object
@@ -65,6 +77,7 @@ def create_evaluation_dataset(
             dataset_metadata=dataset_metadata,
             object_store_url=object_store_url,
             langfuse_dataset_id=langfuse_dataset_id,
+            progress=progress,
             organization_id=organization_id,
             project_id=project_id,
             inserted_at=now(),
@@ -212,7 +225,7 @@ def list_datasets(
 
 def upload_csv_to_object_store(
     storage: CloudStorage,
-    csv_content: bytes,
+    csv_content: bytes | BinaryIO,
     dataset_name: str,
 ) -> str | None:
     """
@@ -223,7 +236,7 @@ def upload_csv_to_object_store(
 
     Args:
         storage: CloudStorage instance
-        csv_content: Raw CSV content as bytes
+        csv_content: Raw CSV content as bytes, or a binary file object to stream
         dataset_name: Name of the dataset (used for file naming)
 
     Returns:
@@ -249,6 +262,180 @@ def upload_csv_to_object_store(
 upload_csv_to_s3 = upload_csv_to_object_store
 
 
+def iter_csv_lines(
+    stream: BinaryIO, chunk_size: int = CSV_READ_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Decode a UTF-8 byte stream into lines for the csv module.
+
+    The stream is read chunk_size bytes at a time, so only one chunk and the
+    current line are held in memory. Lines keep their line endings, which lets
+    csv rejoin quoted values that span several lines. A leading byte order mark
+    is dropped.
+
+    Args:
+        stream: Binary file object (e.g. an upload or an object store body)
+        chunk_size: Bytes to read per chunk
+
+    Yields:
+        Lines of text including their trailing newline
+
+    Raises:
+        UnicodeDecodeError: If the stream is not valid UTF-8
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    while chunk := stream.read(chunk_size):
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def resolve_csv_columns(fieldnames: list[str] | None) -> tuple[str, str]:
+    """
+    Find the question and answer columns of a CSV header.
+
+    Column names are matched case-insensitively and ignoring surrounding
+    whitespace.
+
+    Args:
+        fieldnames: Header of the CSV file
+
+    Returns:
+        Tuple of (question_column, answer_column) as named in the header
+
+    Raises:
+        ValueError: If the header is missing or lacks either column
+    """
+    if not fieldnames:
+        raise ValueError("CSV file has no headers")
+
+    clean_headers = {field.strip().lower(): field for field in fieldnames}
+    if "question" not in clean_headers or "answer" not in clean_headers:
+        raise ValueError(
+            f"CSV must contain 'question' and 'answer' columns. "
+            f"Found columns: {fieldnames}"
+        )
+
+    return clean_headers["question"], clean_headers["answer"]
+
+
+def read_csv_columns(stream: BinaryIO) -> tuple[str, str]:
+    """
+    Validate the header of a CSV file and rewind it.
+
+    Only the header line is read, so this is cheap for large uploads.
+
+    Args:
+        stream: Seekable binary file object positioned at the start
+
+    Returns:
+        Tuple of (question_column, answer_column) as named in the header
+
+    Raises:
+        ValueError: If the header is missing or lacks either column
+        UnicodeDecodeError: If the header is not valid UTF-8
+    """
+    try:
+        header = next(csv.reader(iter_csv_lines(stream, chunk_size=64 * 1024)), None)
+    finally:
+        stream.seek(0)
+    return resolve_csv_columns(header)
+
+
+def iter_csv_items(
+    stream: BinaryIO, chunk_size: int = CSV_READ_CHUNK_SIZE
+) -> Iterator[dict[str, str]]:
+    """
+    Parse question/answer items from a CSV stream one row at a time.
+
+    Rows with an empty question or answer are skipped.
+
+    Args:
+        stream: Binary file object positioned at the start of the CSV
+        chunk_size: Bytes to read per chunk
+
+    Yields:
+        Dicts with 'question' and 'answer' keys
+
+    Raises:
+        ValueError: If the header is missing or lacks either column
+        UnicodeDecodeError: If the stream is not valid UTF-8
+        csv.Error: If the CSV is malformed
+    """
+    reader = csv.DictReader(iter_csv_lines(stream, chunk_size=chunk_size))
+    question_col, answer_col = resolve_csv_columns(reader.fieldnames)
+
+    for row in reader:
+        question = (row.get(question_col) or "").strip()
+        answer = (row.get(answer_col) or "").strip()
+        if question and answer:
+            yield {"question": question, "answer": answer}
+
+
+def get_item_copies(metadata: dict[str, Any] | None) -> int:
+    """
+    Number of times a dataset item is evaluated.
+
+    Items are stored once with the duplication factor in their metadata.
+    Datasets uploaded before that stored every copy as its own item, marked
+    with a duplicate_number, and those items are evaluated once each.
+
+    Args:
+        metadata: Metadata of the Langfuse dataset item
+
+    Returns:
+        Number of copies to evaluate (at least 1)
+    """
+    metadata = metadata or {}
+    if "duplicate_number" in metadata:
+        return 1
+    try:
+        return max(int(metadata.get("duplication_factor", 1)), 1)
+    except (TypeError, ValueError):
+        return 1
+
+
+def build_copy_id(item_id: str, copy_num: int, copies: int) -> str:
+    """
+    Deterministic custom_id for one copy of a dataset item.
+
+    Items evaluated once keep their plain item ID; copies are numbered from 1,
+    e.g. "item_1#2".
+
+    Args:
+        item_id: Langfuse dataset item ID
+        copy_num: Copy number, starting at 1
+        copies: Number of copies of the item
+
+    Returns:
+        custom_id for the batch request
+    """
+    if copies == 1:
+        return item_id
+    return f"{item_id}{COPY_ID_SEPARATOR}{copy_num}"
+
+
+def split_copy_id(custom_id: str) -> tuple[str, int]:
+    """
+    Fold a custom_id built by build_copy_id() back into its dataset item.
+
+    Args:
+        custom_id: custom_id of a batch request
+
+    Returns:
+        Tuple of (dataset item ID, copy number)
+    """
+    item_id, separator, copy_num = custom_id.rpartition(COPY_ID_SEPARATOR)
+    if separator and item_id and copy_num.isdigit():
+        return item_id, int(copy_num)
+    return custom_id, 1
+
+
 def download_csv_from_object_store(
     storage: CloudStorage, object_store_url: str
 ) -> bytes:
@@ -291,6 +478,52 @@ def download_csv_from_object_store(
 download_csv_from_s3 = download_csv_from_object_store
 
 
+def update_evaluation_dataset(
+    session: Session,
+    dataset: EvaluationDataset,
+    dataset_metadata: dict[str, Any] | None = None,
+    langfuse_dataset_id: str | None = None,
+    progress: dict[str, Any] | None = None,
+) -> EvaluationDataset:
+    """
+    Update an evaluation dataset with new values and persist to database.
+
+    Args:
+        session: Database session
+        dataset: EvaluationDataset instance to update
+        dataset_metadata: New dataset metadata (optional)
+        langfuse_dataset_id: New Langfuse dataset ID (optional)
+        progress: Progress fields to merge into the current progress (optional)
+
+    Returns:
+        Updated and refreshed EvaluationDataset instance
+    """
+    if dataset_metadata is not None:
+        dataset.dataset_metadata = dataset_metadata
+    if langfuse_dataset_id is not None:
+        dataset.langfuse_dataset_id = langfuse_dataset_id
+    if progress is not None:
+        # Assign a new dict so the JSONB column is marked as changed
+        dataset.progress = {**(dataset.progress or {}), **progress}
+
+    dataset.updated_at = now()
+
+    session.add(dataset)
+    try:
+        session.commit()
+        session.refresh(dataset)
+    except Exception as e:
+        session.rollback()
+        logger.error(
+            f"[update_evaluation_dataset] Failed to update dataset | "
+            f"dataset_id={dataset.id} | {e}",
+            exc_info=True,
+        )
+        raise
+
+    return dataset
+
+
 def update_dataset_langfuse_id(
     session: Session, dataset_id: int, langfuse_dataset_id: str
 ) -> None:
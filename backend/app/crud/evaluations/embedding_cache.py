@@ -0,0 +1,130 @@
+"""
+Content-addressed cache of text embeddings for evaluation scoring.
+
+Ground truth answers do not change between runs of the same dataset, so their
+embeddings are cached per project, keyed by (model, dimensions, sha256(text)),
+and left out of later embedding batches.
+"""
+
+import hashlib
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, select
+
+from app.core.util import now
+from app.models import EmbeddingCache
+
+logger = logging.getLogger(__name__)
+
+# Hashes per IN (...) lookup and rows per INSERT statement
+CACHE_QUERY_CHUNK_SIZE = 1000
+
+
+def hash_text(text: str) -> str:
+    """Return the hex sha256 of a text, used as its cache key."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def get_cached_embeddings(
+    session: Session,
+    project_id: int,
+    model: str,
+    dimensions: int,
+    text_hashes: Iterable[str],
+) -> dict[str, np.ndarray]:
+    """
+    Fetch cached embeddings for the given text hashes.
+
+    Args:
+        session: Database session
+        project_id: Project ID
+        model: Embedding model
+        dimensions: Embedding dimensions
+        text_hashes: Hex sha256 hashes of the texts to look up
+
+    Returns:
+        Mapping of text hash to float32 embedding for every cache hit
+    """
+    unique_hashes = list(dict.fromkeys(text_hashes))
+    cached: dict[str, np.ndarray] = {}
+
+    for start in range(0, len(unique_hashes), CACHE_QUERY_CHUNK_SIZE):
+        chunk = unique_hashes[start : start + CACHE_QUERY_CHUNK_SIZE]
+        statement = select(EmbeddingCache.text_hash, EmbeddingCache.embedding).where(
+            EmbeddingCache.project_id == project_id,
+            EmbeddingCache.model == model,
+            EmbeddingCache.dimensions == dimensions,
+            EmbeddingCache.text_hash.in_(chunk),
+        )
+        for text_hash, embedding in session.exec(statement):
+            cached[text_hash] = np.frombuffer(embedding, dtype="<f4")
+
+    logger.info(
+        f"[get_cached_embeddings] Looked up embeddings | project_id={project_id} | "
+        f"model={model} | dimensions={dimensions} | "
+        f"requested={len(unique_hashes)} | hits={len(cached)}"
+    )
+    return cached
+
+
+def store_embeddings(
+    session: Session,
+    project_id: int,
+    model: str,
+    dimensions: int,
+    embeddings: dict[str, Any],
+) -> int:
+    """
+    Store embeddings in the cache, ignoring hashes that are already cached.
+
+    Args:
+        session: Database session
+        project_id: Project ID
+        model: Embedding model
+        dimensions: Embedding dimensions
+        embeddings: Mapping of text hash to embedding (float list or array)
+
+    Returns:
+        Number of embeddings submitted for insertion
+    """
+    rows = []
+    for text_hash, embedding in embeddings.items():
+        vector = np.asarray(embedding, dtype="<f4")
+        if vector.shape != (dimensions,):
+            logger.warning(
+                f"[store_embeddings] Skipping embedding with unexpected shape | "
+                f"text_hash={text_hash} | shape={vector.shape} | dimensions={dimensions}"
+            )
+            continue
+
+        rows.append(
+            {
+                "project_id": project_id,
+                "model": model,
+                "dimensions": dimensions,
+                "text_hash": text_hash,
+                "embedding": vector.tobytes(),
+                "inserted_at": now(),
+            }
+        )
+
+    for start in range(0, len(rows), CACHE_QUERY_CHUNK_SIZE):
+        statement = (
+            insert(EmbeddingCache)
+            .values(rows[start : start + CACHE_QUERY_CHUNK_SIZE])
+            .on_conflict_do_nothing(
+                constraint="uq_embedding_cache_project_model_dimensions_hash"
+            )
+        )
+        session.exec(statement)
+    session.commit()
+
+    logger.info(
+        f"[store_embeddings] Stored embeddings | project_id={project_id} | "
+        f"model={model} | dimensions={dimensions} | count={len(rows)}"
+    )
+    return len(rows)
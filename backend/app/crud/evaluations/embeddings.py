@@ -8,7 +8,10 @@ This module handles:
 4. Orchestrating embedding batch creation and processing
 """
 
+import base64
+import itertools
 import logging
+from collections.abc import Iterator, Set
 from typing import Any
 
 import numpy as np
@@ -18,6 +21,8 @@ from sqlmodel import Session
 from app.core.batch.openai import OpenAIBatchProvider
 from app.core.util import now
 from app.crud.batch_operations import start_batch_job
+from app.crud.evaluations.embedding_cache import get_cached_embeddings, hash_text
+from app.crud.evaluations.frame import EvaluationResultFrame
 from app.models import EvaluationRun
 
 logger = logging.getLogger(__name__)
@@ -29,6 +34,24 @@ VALID_EMBEDDING_MODELS = {
     "text-embedding-ada-002": 1536,
 }
 
+# Range of reduced `dimensions` each model accepts. text-embedding-3 models can
+# shorten their embeddings; ada-002 only returns its native size.
+EMBEDDING_DIMENSION_RANGES = {
+    "text-embedding-3-small": (1, 1536),
+    "text-embedding-3-large": (1, 3072),
+    "text-embedding-ada-002": (1536, 1536),
+}
+
+DEFAULT_EMBEDDING_MODEL = "text-embedding-3-large"
+
+# Run config keys that configure similarity scoring; they are not part of the
+# Responses API request built from the same config
+EMBEDDING_CONFIG_KEYS = ("embedding_model", "embedding_dimensions")
+
+# Embedding pairs packed into one float32 matrix when calculating similarities;
+# 1024 pairs of 3072-dim vectors is 24 MB across both matrices
+SIMILARITY_CHUNK_SIZE = 1024
+
 
 def validate_embedding_model(model: str) -> None:
     """
@@ -47,55 +70,159 @@ def validate_embedding_model(model: str) -> None:
         )
 
 
-def build_embedding_jsonl(
-    results: list[dict[str, Any]],
+def validate_embedding_dimensions(model: str, dimensions: int | None) -> int:
+    """
+    Validate a requested embedding size against the model's allowed range.
+
+    Args:
+        model: The embedding model name (must already be valid)
+        dimensions: Requested number of dimensions, or None for the native size
+
+    Returns:
+        The number of dimensions embeddings will have
+
+    Raises:
+        ValueError: If dimensions is not an integer within the model's range
+    """
+    if dimensions is None:
+        return VALID_EMBEDDING_MODELS[model]
+
+    min_dimensions, max_dimensions = EMBEDDING_DIMENSION_RANGES[model]
+    if (
+        isinstance(dimensions, bool)
+        or not isinstance(dimensions, int)
+        or not min_dimensions <= dimensions <= max_dimensions
+    ):
+        raise ValueError(
+            f"Invalid embedding dimensions {dimensions!r} for model '{model}'. "
+            f"Supported range: {min_dimensions}-{max_dimensions}"
+        )
+    return dimensions
+
+
+def resolve_embedding_config(config: dict[str, Any]) -> dict[str, Any]:
+    """
+    Validate the similarity scoring settings of an evaluation run config.
+
+    Args:
+        config: Evaluation run config with optional "embedding_model" and
+            "embedding_dimensions" keys
+
+    Returns:
+        Dict with the resolved "embedding_model" and "embedding_dimensions",
+        suitable for recording in the run config
+
+    Raises:
+        ValueError: If the model or dimensions are not supported
+    """
+    embedding_model = config.get("embedding_model") or DEFAULT_EMBEDDING_MODEL
+    validate_embedding_model(embedding_model)
+    dimensions = validate_embedding_dimensions(
+        embedding_model, config.get("embedding_dimensions")
+    )
+    return {"embedding_model": embedding_model, "embedding_dimensions": dimensions}
+
+
+def truncate_embedding(
+    embedding: list[float] | np.ndarray, dimensions: int
+) -> np.ndarray:
+    """
+    Shorten an embedding to its first `dimensions` values and renormalize it.
+
+    text-embedding-3 embeddings keep most of their information in the leading
+    dimensions, so a truncated and L2-renormalized vector approximates the
+    embedding the API returns for the same `dimensions`.
+
+    Args:
+        embedding: Full size embedding
+        dimensions: Number of leading dimensions to keep
+
+    Returns:
+        float32 array of shape (dimensions,) with unit norm (zeros stay zeros)
+    """
+    vector = np.asarray(embedding, dtype=np.float32)[:dimensions]
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector = vector / norm
+    return vector
+
+
+def iter_embedding_jsonl(
+    results: EvaluationResultFrame,
     trace_id_mapping: dict[str, str],
     embedding_model: str = "text-embedding-3-large",
-) -> list[dict[str, Any]]:
+    cached_ground_truth_hashes: Set[str] = frozenset(),
+    dimensions: int | None = None,
+) -> Iterator[dict[str, Any]]:
     """
-    Build JSONL data for embedding batch using OpenAI Embeddings API.
+    Return a lazy iterator of JSONL lines for an embedding batch (Embeddings API).
 
     Each line is a dict with:
-    - custom_id: Langfuse trace_id (for direct score updates)
+    - custom_id: "<trace_id>:<sha256 of ground_truth>" (see make_embedding_custom_id)
     - method: POST
     - url: /v1/embeddings
-    - body: Embedding request with input array [output, ground_truth]
+    - body: Embedding request with input array [output, ground_truth], or just
+      [output] when the ground truth embedding will be available anyway
+
+    A ground truth is left out when its hash is in cached_ground_truth_hashes or
+    an earlier line of the same batch already embeds it (duplicated items).
+    parse_embedding_results() merges those vectors back by hash.
 
     Args:
-        results: List of evaluation results from parse_evaluation_output()
-                 Format: [
-                     {
-                         "item_id": "item_123",
-                         "question": "What is 2+2?",
-                         "generated_output": "The answer is 4",
-                         "ground_truth": "4"
-                     },
-                     ...
-                 ]
+        results: Evaluation results from parse_evaluation_output()
         trace_id_mapping: Mapping of item_id to Langfuse trace_id
         embedding_model: OpenAI embedding model to use (default: text-embedding-3-large)
+        cached_ground_truth_hashes: Hashes of ground truths already in the
+            embedding cache
+        dimensions: Reduced embedding size to request (default: the model's
+            native size)
 
     Returns:
-        List of dictionaries (JSONL data)
+        Iterator producing one dictionary per JSONL line
+
+    Raises:
+        ValueError: If the embedding model or dimensions are not supported.
+            This is checked when the function is called, not on the first next().
     """
-    # Validate embedding model
+    # Validate embedding model and size
     validate_embedding_model(embedding_model)
+    dimensions = validate_embedding_dimensions(embedding_model, dimensions)
 
     logger.info(
         f"Building embedding JSONL for {len(results)} items with model {embedding_model}"
     )
 
-    jsonl_data = []
+    return _generate_embedding_lines(
+        results=results,
+        trace_id_mapping=trace_id_mapping,
+        embedding_model=embedding_model,
+        cached_ground_truth_hashes=cached_ground_truth_hashes,
+        dimensions=dimensions,
+    )
 
-    for result in results:
-        item_id = result.get("item_id")
-        generated_output = result.get("generated_output", "")
-        ground_truth = result.get("ground_truth", "")
 
-        if not item_id:
-            logger.warning("Skipping result with no item_id")
-            continue
+def _generate_embedding_lines(
+    results: EvaluationResultFrame,
+    trace_id_mapping: dict[str, str],
+    embedding_model: str,
+    cached_ground_truth_hashes: Set[str],
+    dimensions: int,
+) -> Iterator[dict[str, Any]]:
+    """Yield embedding JSONL lines; see iter_embedding_jsonl() for the format."""
+    body_options: dict[str, Any] = {
+        # float32 bytes instead of a JSON float list; decoded by
+        # decode_embedding() when parsing results
+        "encoding_format": "base64",
+    }
+    if dimensions != VALID_EMBEDDING_MODELS[embedding_model]:
+        body_options["dimensions"] = dimensions
+
+    embedded_in_batch: set[str] = set()
+    skipped_ground_truths = 0
 
+    for item_id, generated_output, ground_truth in zip(
+        results.item_ids, results.generated_outputs, results.ground_truths
+    ):
         # Get trace_id from mapping
         trace_id = trace_id_mapping.get(item_id)
         if not trace_id:
@@ -107,34 +234,129 @@ def build_embedding_jsonl(
             logger.warning(f"Skipping item {item_id} - empty output or ground_truth")
             continue
 
+        ground_truth_hash = hash_text(ground_truth)
+        inputs = [generated_output]  # Index 0
+        if (
+            ground_truth_hash in cached_ground_truth_hashes
+            or ground_truth_hash in embedded_in_batch
+        ):
+            skipped_ground_truths += 1
+        else:
+            inputs.append(ground_truth)  # Index 1
+            embedded_in_batch.add(ground_truth_hash)
+
         # Build the batch request object for Embeddings API
-        # Use trace_id as custom_id for direct score updates
-        batch_request = {
-            "custom_id": trace_id,
+        # The custom_id carries the trace_id for direct score updates
+        yield {
+            "custom_id": make_embedding_custom_id(trace_id, ground_truth_hash),
             "method": "POST",
             "url": "/v1/embeddings",
             "body": {
                 "model": embedding_model,
-                "input": [
-                    generated_output,  # Index 0
-                    ground_truth,  # Index 1
-                ],
-                "encoding_format": "float",
+                "input": inputs,
+                **body_options,
             },
         }
 
-        jsonl_data.append(batch_request)
+    logger.info(
+        f"Embedding JSONL reuses {skipped_ground_truths} ground truth embeddings "
+        f"({len(embedded_in_batch)} embedded in this batch)"
+    )
+
+
+def make_embedding_custom_id(trace_id: str, ground_truth_hash: str) -> str:
+    """Build the custom_id of an embedding request from its trace and ground truth."""
+    return f"{trace_id}:{ground_truth_hash}"
+
+
+def split_embedding_custom_id(custom_id: str) -> tuple[str, str | None]:
+    """
+    Split an embedding request custom_id into (trace_id, ground_truth_hash).
+
+    custom_ids from batches created before the embedding cache are plain
+    trace_ids and return None as the hash.
+    """
+    trace_id, separator, ground_truth_hash = custom_id.rpartition(":")
+    if separator and len(ground_truth_hash) == 64:
+        return trace_id, ground_truth_hash
+    return custom_id, None
+
+
+def get_ground_truth_hashes(raw_results: list[dict[str, Any]]) -> set[str]:
+    """Collect the ground truth hashes referenced by embedding batch output."""
+    hashes = set()
+    for response in raw_results:
+        _, ground_truth_hash = split_embedding_custom_id(response.get("custom_id", ""))
+        if ground_truth_hash:
+            hashes.add(ground_truth_hash)
+    return hashes
+
+
+def build_embedding_jsonl(
+    results: EvaluationResultFrame,
+    trace_id_mapping: dict[str, str],
+    embedding_model: str = "text-embedding-3-large",
+    dimensions: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Build JSONL data for embedding batch using OpenAI Embeddings API.
+
+    Materialized variant of iter_embedding_jsonl(); see it for the line format.
+
+    Args:
+        results: Evaluation results from parse_evaluation_output()
+        trace_id_mapping: Mapping of item_id to Langfuse trace_id
+        embedding_model: OpenAI embedding model to use (default: text-embedding-3-large)
+        dimensions: Reduced embedding size to request (default: native size)
+
+    Returns:
+        List of dictionaries (JSONL data)
+    """
+    jsonl_data = list(
+        iter_embedding_jsonl(
+            results=results,
+            trace_id_mapping=trace_id_mapping,
+            embedding_model=embedding_model,
+            dimensions=dimensions,
+        )
+    )
 
     logger.info(f"Built {len(jsonl_data)} embedding JSONL lines")
     return jsonl_data
 
 
-def parse_embedding_results(raw_results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def decode_embedding(embedding: list[float] | str) -> list[float] | np.ndarray:
+    """
+    Decode an embedding returned by the Embeddings API.
+
+    Embeddings requested with encoding_format="base64" arrive as base64 encoded
+    little-endian float32 bytes and are decoded straight into a float32 array,
+    which avoids building thousands of Python floats per vector. Float lists
+    are returned unchanged.
+    """
+    if isinstance(embedding, str):
+        return np.frombuffer(base64.b64decode(embedding), dtype="<f4")
+    return embedding
+
+
+def parse_embedding_results(
+    raw_results: list[dict[str, Any]],
+    ground_truth_embeddings: dict[str, Any] | None = None,
+    dimensions: int | None = None,
+) -> list[dict[str, Any]]:
     """
     Parse embedding batch output into structured embedding pairs.
 
+    Lines whose ground truth was left out of the request (see
+    iter_embedding_jsonl) get it by hash from another line of the same batch
+    or from ground_truth_embeddings, typically the embedding cache.
+
     Args:
         raw_results: Raw results from batch provider (list of JSONL lines)
+        ground_truth_embeddings: Mapping of ground truth hash to embedding
+        dimensions: Embedding size of the run; longer vectors (e.g. from a
+            provider that ignored the `dimensions` parameter) are truncated
+            and renormalized locally
 
     Returns:
         List of embedding pairs in format:
@@ -142,23 +364,27 @@ def parse_embedding_results(raw_results: list[dict[str, Any]]) -> list[dict[str,
             {
                 "trace_id": "trace-uuid-123",
                 "output_embedding": [0.1, 0.2, ...],
-                "ground_truth_embedding": [0.15, 0.22, ...]
+                "ground_truth_embedding": [0.15, 0.22, ...],
+                "ground_truth_hash": "9f86d08..."  # None for legacy custom_ids
             },
             ...
         ]
     """
     logger.info(f"Parsing embedding results from {len(raw_results)} lines")
 
-    embedding_pairs = []
+    known_ground_truths = dict(ground_truth_embeddings or {})
+    parsed_lines = []
 
     for line_num, response in enumerate(raw_results, 1):
         try:
-            # Extract custom_id (which is now the Langfuse trace_id)
-            trace_id = response.get("custom_id")
-            if not trace_id:
+            custom_id = response.get("custom_id")
+            if not custom_id:
                 logger.warning(f"Line {line_num}: No custom_id found, skipping")
                 continue
 
+            # custom_id carries the Langfuse trace_id and the ground truth hash
+            trace_id, ground_truth_hash = split_embedding_custom_id(custom_id)
+
             # Handle errors in batch processing
             if response.get("error"):
                 error_msg = response["error"].get("message", "Unknown error")
@@ -169,15 +395,16 @@ def parse_embedding_results(raw_results: list[dict[str, Any]]) -> list[dict[str,
             response_body = response.get("response", {}).get("body", {})
             embedding_data = response_body.get("data", [])
 
-            if len(embedding_data) < 2:
+            expected = 2 if ground_truth_hash is None else 1
+            if len(embedding_data) < expected:
                 logger.warning(
-                    f"Trace {trace_id}: Expected 2 embeddings, got {len(embedding_data)}"
+                    f"Trace {trace_id}: Expected {expected} embeddings, got {len(embedding_data)}"
                 )
                 continue
 
             # Extract embeddings by index
             # Index 0 = generated_output embedding
-            # Index 1 = ground_truth embedding
+            # Index 1 = ground_truth embedding (absent when reused by hash)
             output_embedding = None
             ground_truth_embedding = None
 
@@ -188,30 +415,52 @@ def parse_embedding_results(raw_results: list[dict[str, Any]]) -> list[dict[str,
                 if embedding is None:
                     continue
 
+                embedding = decode_embedding(embedding)
+                if dimensions is not None and len(embedding) > dimensions:
+                    embedding = truncate_embedding(embedding, dimensions)
+
                 if index == 0:
                     output_embedding = embedding
                 elif index == 1:
                     ground_truth_embedding = embedding
 
-            if output_embedding is None or ground_truth_embedding is None:
-                logger.warning(
-                    f"Trace {trace_id}: Missing embeddings (output={output_embedding is not None}, "
-                    f"ground_truth={ground_truth_embedding is not None})"
-                )
-                continue
+            if ground_truth_hash and ground_truth_embedding is not None:
+                known_ground_truths[ground_truth_hash] = ground_truth_embedding
 
-            embedding_pairs.append(
-                {
-                    "trace_id": trace_id,
-                    "output_embedding": output_embedding,
-                    "ground_truth_embedding": ground_truth_embedding,
-                }
+            parsed_lines.append(
+                (trace_id, ground_truth_hash, output_embedding, ground_truth_embedding)
             )
 
         except Exception as e:
             logger.error(f"Line {line_num}: Unexpected error: {e}", exc_info=True)
             continue
 
+    embedding_pairs = []
+    for (
+        trace_id,
+        ground_truth_hash,
+        output_embedding,
+        ground_truth_embedding,
+    ) in parsed_lines:
+        if ground_truth_embedding is None and ground_truth_hash:
+            ground_truth_embedding = known_ground_truths.get(ground_truth_hash)
+
+        if output_embedding is None or ground_truth_embedding is None:
+            logger.warning(
+                f"Trace {trace_id}: Missing embeddings (output={output_embedding is not None}, "
+                f"ground_truth={ground_truth_embedding is not None})"
+            )
+            continue
+
+        embedding_pairs.append(
+            {
+                "trace_id": trace_id,
+                "output_embedding": output_embedding,
+                "ground_truth_embedding": ground_truth_embedding,
+                "ground_truth_hash": ground_truth_hash,
+            }
+        )
+
     logger.info(
         f"Parsed {len(embedding_pairs)} embedding pairs from {len(raw_results)} lines"
     )
@@ -252,14 +501,123 @@ def calculate_cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
     return float(similarity)
 
 
+def calculate_cosine_similarities(
+    output_matrix: np.ndarray, ground_truth_matrix: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate row-wise cosine similarity between two matrices of embeddings.
+
+    Both matrices have one embedding per row. Norms are computed once per row
+    and all similarities come from a single row-wise dot product. Rows where
+    either vector is all zeros get a similarity of 0.0, and results are clipped
+    to [-1, 1] to absorb float32 rounding.
+
+    Args:
+        output_matrix: Array of shape (n, dims) with generated output embeddings
+        ground_truth_matrix: Array of shape (n, dims) with ground truth embeddings
+
+    Returns:
+        Array of shape (n,) with one similarity per row
+    """
+    dots = np.einsum("ij,ij->i", output_matrix, ground_truth_matrix)
+    norms = np.linalg.norm(output_matrix, axis=1) * np.linalg.norm(
+        ground_truth_matrix, axis=1
+    )
+
+    similarities = np.zeros_like(dots)
+    np.divide(dots, norms, out=similarities, where=norms > 0)
+    return np.clip(similarities, -1.0, 1.0)
+
+
+def _pack_embeddings(
+    embeddings: list[list[float] | np.ndarray], dims: int
+) -> np.ndarray:
+    """Pack equal-length embeddings into one contiguous float32 matrix."""
+    matrix = np.empty((len(embeddings), dims), dtype=np.float32)
+    for row, embedding in enumerate(embeddings):
+        matrix[row] = embedding
+    return matrix
+
+
+def iter_similarity_chunks(
+    embedding_pairs: list[dict[str, Any]],
+    chunk_size: int = SIMILARITY_CHUNK_SIZE,
+) -> Iterator[tuple[list[str], np.ndarray]]:
+    """
+    Yield cosine similarities for embedding pairs one chunk at a time.
+
+    Each chunk of pairs is packed into two contiguous float32 matrices, so
+    memory stays bounded by chunk_size * dims regardless of the run size.
+    Pairs with a missing embedding, or whose embeddings do not match the
+    dimension of the first valid pair, are logged and skipped.
+
+    Args:
+        embedding_pairs: List of embedding pairs from parse_embedding_results()
+        chunk_size: Maximum number of pairs per chunk
+
+    Yields:
+        Tuple of (trace_ids, similarities) for each chunk
+    """
+    dims = None
+
+    for start in range(0, len(embedding_pairs), chunk_size):
+        trace_ids = []
+        outputs = []
+        ground_truths = []
+
+        for pair in embedding_pairs[start : start + chunk_size]:
+            output_emb = pair.get("output_embedding")
+            ground_truth_emb = pair.get("ground_truth_embedding")
+
+            if (
+                output_emb is None
+                or ground_truth_emb is None
+                or len(output_emb) == 0
+                or len(ground_truth_emb) == 0
+            ):
+                logger.error(
+                    f"Error calculating similarity for trace {pair.get('trace_id')}: "
+                    f"missing embedding"
+                )
+                continue
+
+            if dims is None:
+                dims = len(output_emb)
+
+            if len(output_emb) != dims or len(ground_truth_emb) != dims:
+                logger.error(
+                    f"Error calculating similarity for trace {pair.get('trace_id')}: "
+                    f"expected {dims} dimensions, got "
+                    f"{len(output_emb)} and {len(ground_truth_emb)}"
+                )
+                continue
+
+            trace_ids.append(pair["trace_id"])
+            outputs.append(output_emb)
+            ground_truths.append(ground_truth_emb)
+
+        if not trace_ids:
+            continue
+
+        similarities = calculate_cosine_similarities(
+            _pack_embeddings(outputs, dims), _pack_embeddings(ground_truths, dims)
+        )
+        yield trace_ids, similarities
+
+
 def calculate_average_similarity(
-    embedding_pairs: list[dict[str, Any]]
+    embedding_pairs: list[dict[str, Any]],
+    chunk_size: int = SIMILARITY_CHUNK_SIZE,
 ) -> dict[str, Any]:
     """
     Calculate cosine similarity statistics for all embedding pairs.
 
+    Similarities are computed in chunks by iter_similarity_chunks(); the mean
+    and standard deviation are accumulated across chunks in float64.
+
     Args:
         embedding_pairs: List of embedding pairs from parse_embedding_results()
+        chunk_size: Maximum number of pairs to pack into one matrix
 
     Returns:
         Dictionary with similarity statistics:
@@ -272,40 +630,25 @@ def calculate_average_similarity(
     """
     logger.info(f"Calculating similarity for {len(embedding_pairs)} pairs")
 
-    if not embedding_pairs:
-        return {
-            "cosine_similarity_avg": 0.0,
-            "cosine_similarity_std": 0.0,
-            "total_pairs": 0,
-            "per_item_scores": [],
-        }
-
-    similarities = []
     per_item_scores = []
+    total = 0.0
+    total_squares = 0.0
+
+    for trace_ids, similarities in iter_similarity_chunks(
+        embedding_pairs, chunk_size=chunk_size
+    ):
+        values = similarities.astype(np.float64)
+        total += float(values.sum())
+        total_squares += float(np.dot(values, values))
+
+        per_item_scores.extend(
+            {"trace_id": trace_id, "cosine_similarity": similarity}
+            for trace_id, similarity in zip(trace_ids, values.tolist())
+        )
 
-    for pair in embedding_pairs:
-        try:
-            output_emb = pair["output_embedding"]
-            ground_truth_emb = pair["ground_truth_embedding"]
-
-            similarity = calculate_cosine_similarity(output_emb, ground_truth_emb)
-            similarities.append(similarity)
-
-            per_item_scores.append(
-                {
-                    "trace_id": pair["trace_id"],
-                    "cosine_similarity": similarity,
-                }
-            )
-
-        except Exception as e:
-            logger.error(
-                f"Error calculating similarity for trace {pair.get('trace_id')}: {e}"
-            )
-            continue
-
-    if not similarities:
-        logger.warning("No valid similarities calculated")
+    if not per_item_scores:
+        if embedding_pairs:
+            logger.warning("No valid similarities calculated")
         return {
             "cosine_similarity_avg": 0.0,
             "cosine_similarity_std": 0.0,
@@ -313,13 +656,15 @@ def calculate_average_similarity(
             "per_item_scores": [],
         }
 
-    # Calculate statistics
-    similarities_array = np.array(similarities)
+    # Calculate statistics (population standard deviation, as np.std)
+    count = len(per_item_scores)
+    mean = total / count
+    variance = max(total_squares / count - mean * mean, 0.0)
 
     stats = {
-        "cosine_similarity_avg": float(np.mean(similarities_array)),
-        "cosine_similarity_std": float(np.std(similarities_array)),
-        "total_pairs": len(similarities),
+        "cosine_similarity_avg": mean,
+        "cosine_similarity_std": float(np.sqrt(variance)),
+        "total_pairs": count,
         "per_item_scores": per_item_scores,
     }
 
@@ -331,21 +676,90 @@ def calculate_average_similarity(
     return stats
 
 
+def prepare_embedding_jsonl(
+    session: Session,
+    eval_run: EvaluationRun,
+    results: EvaluationResultFrame,
+    trace_id_mapping: dict[str, str],
+) -> tuple[Iterator[dict[str, Any]], str, int]:
+    """
+    Resolve the embedding settings of a run and build its embedding JSONL.
+
+    The embedding model and size come from the run config, falling back to
+    the defaults when they are invalid. Ground truths that are already in the
+    project's embedding cache are left out of the requests.
+
+    Args:
+        session: Database session
+        eval_run: EvaluationRun database object
+        results: Parsed evaluation results (output + ground_truth pairs)
+        trace_id_mapping: Mapping of item_id to Langfuse trace_id
+
+    Returns:
+        Tuple of (lazy JSONL line iterator, embedding model, dimensions)
+    """
+    # Get embedding model and size from config (default:
+    # text-embedding-3-large at its native size)
+    embedding_model = eval_run.config.get("embedding_model", DEFAULT_EMBEDDING_MODEL)
+
+    # Validate and fallback to default if invalid
+    try:
+        validate_embedding_model(embedding_model)
+    except ValueError as e:
+        logger.warning(
+            f"Invalid embedding model '{embedding_model}' in config: {e}. "
+            f"Falling back to {DEFAULT_EMBEDDING_MODEL}"
+        )
+        embedding_model = DEFAULT_EMBEDDING_MODEL
+
+    try:
+        dimensions = validate_embedding_dimensions(
+            embedding_model, eval_run.config.get("embedding_dimensions")
+        )
+    except ValueError as e:
+        dimensions = VALID_EMBEDDING_MODELS[embedding_model]
+        logger.warning(f"{e}. Falling back to {dimensions} dimensions")
+
+    # Look up ground truths that are already in the embedding cache
+    cached_ground_truths = get_cached_embeddings(
+        session=session,
+        project_id=eval_run.project_id,
+        model=embedding_model,
+        dimensions=dimensions,
+        text_hashes=(
+            hash_text(ground_truth)
+            for ground_truth in results.ground_truths
+            if ground_truth
+        ),
+    )
+
+    jsonl_lines = iter_embedding_jsonl(
+        results=results,
+        trace_id_mapping=trace_id_mapping,
+        embedding_model=embedding_model,
+        cached_ground_truth_hashes=cached_ground_truths.keys(),
+        dimensions=dimensions,
+    )
+    return jsonl_lines, embedding_model, dimensions
+
+
 def start_embedding_batch(
     session: Session,
     openai_client: OpenAI,
     eval_run: EvaluationRun,
-    results: list[dict[str, Any]],
+    results: EvaluationResultFrame,
     trace_id_mapping: dict[str, str],
 ) -> EvaluationRun:
     """
     Start embedding batch for similarity scoring.
 
     This function orchestrates the embedding batch creation:
-    1. Builds embedding JSONL from evaluation results with trace_ids
-    2. Creates batch via generic infrastructure (job_type="embedding")
-    3. Links embedding_batch_job_id to eval_run
-    4. Keeps status as "processing"
+    1. Looks up cached ground truth embeddings for the project
+    2. Builds embedding JSONL from evaluation results with trace_ids, leaving
+       out ground truths that are cached or repeated within the batch
+    3. Creates batch via generic infrastructure (job_type="embedding")
+    4. Links embedding_batch_job_id to eval_run
+    5. Keeps status as "processing"
 
     Args:
         session: Database session
@@ -363,43 +777,34 @@ def start_embedding_batch(
     try:
         logger.info(f"Starting embedding batch for evaluation run {eval_run.id}")
 
-        # Get embedding model from config (default: text-embedding-3-large)
-        embedding_model = eval_run.config.get(
-            "embedding_model", "text-embedding-3-large"
-        )
-
-        # Validate and fallback to default if invalid
-        try:
-            validate_embedding_model(embedding_model)
-        except ValueError as e:
-            logger.warning(
-                f"Invalid embedding model '{embedding_model}' in config: {e}. "
-                f"Falling back to text-embedding-3-large"
-            )
-            embedding_model = "text-embedding-3-large"
-
-        # Step 1: Build embedding JSONL with trace_ids
-        jsonl_data = build_embedding_jsonl(
+        # Steps 1-2: Resolve the embedding settings and build the embedding
+        # JSONL with trace_ids lazily; the provider streams it into its
+        # request file
+        jsonl_lines, embedding_model, dimensions = prepare_embedding_jsonl(
+            session=session,
+            eval_run=eval_run,
             results=results,
             trace_id_mapping=trace_id_mapping,
-            embedding_model=embedding_model,
         )
 
-        if not jsonl_data:
+        first_line = next(jsonl_lines, None)
+        if first_line is None:
             raise ValueError("No valid items to create embeddings for")
+        jsonl_data = itertools.chain([first_line], jsonl_lines)
 
-        # Step 2: Create batch provider
+        # Step 3: Create batch provider
         provider = OpenAIBatchProvider(client=openai_client)
 
-        # Step 3: Prepare batch configuration
+        # Step 4: Prepare batch configuration
         batch_config = {
             "endpoint": "/v1/embeddings",
             "description": f"Embeddings for evaluation: {eval_run.run_name}",
             "completion_window": "24h",
             "embedding_model": embedding_model,
+            "dimensions": dimensions,
         }
 
-        # Step 4: Start batch job using generic infrastructure
+        # Step 5: Start batch job using generic infrastructure
         batch_job = start_batch_job(
             session=session,
             provider=provider,
@@ -409,9 +814,10 @@ def start_embedding_batch(
             project_id=eval_run.project_id,
             jsonl_data=jsonl_data,
             config=batch_config,
+            total_items=len(results),
         )
 
-        # Step 5: Link embedding_batch_job to evaluation_run
+        # Step 6: Link embedding_batch_job to evaluation_run
         eval_run.embedding_batch_job_id = batch_job.id
         # Keep status as "processing" - will change to "completed" after embeddings
         eval_run.updated_at = now()
@@ -0,0 +1,129 @@
+"""
+Columnar in-memory representation of parsed evaluation results.
+
+A completed batch is walked several times (Langfuse dataset run, result
+storage, embedding JSONL), so results are held as parallel columns instead
+of one dict per item: strings are shared with the parsed batch output, token
+counts live in compact int64 arrays, and an item_id -> row index map gives
+constant time lookups.
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+# Stored in token columns for items without usage information
+MISSING_TOKENS = -1
+
+
+@dataclass
+class EvaluationResultFrame:
+    """Parsed evaluation results stored column by column, one row per item."""
+
+    item_ids: list[str] = field(default_factory=list)
+    questions: list[str] = field(default_factory=list)
+    generated_outputs: list[str] = field(default_factory=list)
+    ground_truths: list[str] = field(default_factory=list)
+    response_ids: list[str | None] = field(default_factory=list)
+    input_tokens: array = field(default_factory=lambda: array("q"))
+    output_tokens: array = field(default_factory=lambda: array("q"))
+    total_tokens: array = field(default_factory=lambda: array("q"))
+    index: dict[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.item_ids)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self.index
+
+    def append(
+        self,
+        item_id: str,
+        question: str,
+        generated_output: str,
+        ground_truth: str,
+        response_id: str | None = None,
+        usage: dict[str, Any] | None = None,
+    ) -> int:
+        """
+        Append one item and return its row number.
+
+        Raises:
+            ValueError: If the item_id is already in the frame
+        """
+        if item_id in self.index:
+            raise ValueError(f"Duplicate item_id in result frame: {item_id}")
+
+        row = len(self.item_ids)
+        self.index[item_id] = row
+        self.item_ids.append(item_id)
+        self.questions.append(question)
+        self.generated_outputs.append(generated_output)
+        self.ground_truths.append(ground_truth)
+        self.response_ids.append(response_id)
+
+        usage = usage or {}
+        has_usage = bool(usage)
+        for column, key in (
+            (self.input_tokens, "input_tokens"),
+            (self.output_tokens, "output_tokens"),
+            (self.total_tokens, "total_tokens"),
+        ):
+            value = usage.get(key) if has_usage else None
+            column.append(MISSING_TOKENS if value is None else int(value))
+        return row
+
+    def usage(self, row: int) -> dict[str, int] | None:
+        """Return the token usage of a row, or None if the item had no usage."""
+        counts = (
+            self.input_tokens[row],
+            self.output_tokens[row],
+            self.total_tokens[row],
+        )
+        if all(count == MISSING_TOKENS for count in counts):
+            return None
+        return {
+            key: (0 if count == MISSING_TOKENS else count)
+            for key, count in zip(
+                ("input_tokens", "output_tokens", "total_tokens"), counts
+            )
+        }
+
+    def tokens(self, row: int) -> tuple[int | None, int | None, int | None]:
+        """Return (input, output, total) token counts of a row, None when missing."""
+        return tuple(
+            None if column[row] == MISSING_TOKENS else column[row]
+            for column in (self.input_tokens, self.output_tokens, self.total_tokens)
+        )
+
+    def record(self, row: int) -> dict[str, Any]:
+        """Return one row in the per-item dict format of parse_evaluation_output()."""
+        return {
+            "item_id": self.item_ids[row],
+            "question": self.questions[row],
+            "generated_output": self.generated_outputs[row],
+            "ground_truth": self.ground_truths[row],
+            "response_id": self.response_ids[row],
+            "usage": self.usage(row),
+        }
+
+    def iter_records(self) -> Iterator[dict[str, Any]]:
+        """Lazily yield every row as a per-item dict."""
+        for row in range(len(self)):
+            yield self.record(row)
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, Any]]) -> "EvaluationResultFrame":
+        """Build a frame from per-item result dicts."""
+        frame = cls()
+        for record in records:
+            frame.append(
+                item_id=record["item_id"],
+                question=record.get("question") or "",
+                generated_output=record.get("generated_output") or "",
+                ground_truth=record.get("ground_truth") or "",
+                response_id=record.get("response_id"),
+                usage=record.get("usage"),
+            )
+        return frame
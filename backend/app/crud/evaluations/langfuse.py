@@ -3,37 +3,172 @@ Langfuse integration for evaluation runs.
 
 This module handles:
 1. Creating dataset runs in Langfuse
-2. Creating traces for each evaluation item
+2. Creating traces for each evaluation item (bulk, via batch ingestion)
 3. Uploading results to Langfuse for visualization
 4. Fetching trace scores from Langfuse for results
 """
 
+import json
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from datetime import datetime, timezone
 from typing import Any
 
+import httpx
 import numpy as np
 from langfuse import Langfuse
+from langfuse.api import CreateDatasetRunItemRequest
+
+from app.crud.evaluations.dataset import split_copy_id
+from app.crud.evaluations.frame import EvaluationResultFrame
 
 logger = logging.getLogger(__name__)
 
+# Concurrent trace fetches when collecting the scores of a run, bounded to stay
+# within Langfuse API rate limits
+TRACE_FETCH_MAX_WORKERS = 8
+# Retries per trace on 408/409/429/5xx responses; the Langfuse API client backs
+# off exponentially with jitter and honors Retry-After
+TRACE_FETCH_MAX_RETRIES = 3
+TRACE_FETCH_TIMEOUT_SECONDS = 30
+# Log fetch progress every this many traces
+TRACE_FETCH_PROGRESS_INTERVAL = 100
+
+# Events per Langfuse batch ingestion request, and a serialized size cap below
+# the endpoint's 3.5 MB batch limit
+INGESTION_CHUNK_MAX_EVENTS = 500
+INGESTION_CHUNK_MAX_BYTES = 3_000_000
+# Attempts per chunk; HTTP 408/409/429/5xx are retried by the Langfuse API
+# client, connection errors and timeouts here
+INGESTION_MAX_RETRIES = 3
+INGESTION_RETRY_BACKOFF_SECONDS = 1.0
+# Concurrent dataset run item links; Langfuse has no bulk endpoint for them
+DATASET_RUN_LINK_MAX_WORKERS = 8
+# Concurrent dataset item uploads, and uploads queued per worker before
+# reading more items from the source
+DATASET_UPLOAD_MAX_WORKERS = 4
+DATASET_UPLOAD_QUEUE_FACTOR = 4
+# Report upload progress every this many items read
+DATASET_UPLOAD_PROGRESS_INTERVAL = 500
+
+
+def _ingestion_event(event_type: str, body: dict[str, Any]) -> dict[str, Any]:
+    """Wrap a Langfuse ingestion body (camelCase keys) in an event envelope."""
+    return {
+        "id": str(uuid.uuid4()),
+        "type": event_type,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "body": body,
+    }
+
+
+def _iter_event_chunks(
+    events: Iterable[dict[str, Any]],
+) -> Iterator[list[dict[str, Any]]]:
+    """Split ingestion events into chunks bounded by count and serialized size."""
+    chunk: list[dict[str, Any]] = []
+    chunk_bytes = 0
+    for event in events:
+        event_bytes = len(json.dumps(event, default=str))
+        if chunk and (
+            len(chunk) >= INGESTION_CHUNK_MAX_EVENTS
+            or chunk_bytes + event_bytes > INGESTION_CHUNK_MAX_BYTES
+        ):
+            yield chunk
+            chunk, chunk_bytes = [], 0
+        chunk.append(event)
+        chunk_bytes += event_bytes
+    if chunk:
+        yield chunk
+
+
+def ingest_events(langfuse: Langfuse, events: list[dict[str, Any]]) -> set[str]:
+    """
+    Submit trace, generation and score events through Langfuse batch ingestion.
+
+    Events are sent in chunks of at most INGESTION_CHUNK_MAX_EVENTS events and
+    INGESTION_CHUNK_MAX_BYTES bytes. Each chunk is retried on its own, so a
+    failing chunk does not affect the others.
+
+    Args:
+        langfuse: Configured Langfuse client
+        events: Ingestion events built with _ingestion_event()
+
+    Returns:
+        IDs of the events that were not ingested, either because their chunk
+        failed or because Langfuse rejected them individually
+    """
+    failed_event_ids: set[str] = set()
+    request_options = {"max_retries": INGESTION_MAX_RETRIES}
+
+    for chunk_num, chunk in enumerate(_iter_event_chunks(events), 1):
+        for attempt in range(1, INGESTION_MAX_RETRIES + 1):
+            try:
+                response = langfuse.api.ingestion.batch(
+                    batch=chunk, request_options=request_options
+                )
+            except httpx.TransportError as e:
+                if attempt < INGESTION_MAX_RETRIES:
+                    logger.warning(
+                        f"[ingest_events] Retrying chunk | chunk={chunk_num} | "
+                        f"attempt={attempt} | {e}"
+                    )
+                    time.sleep(INGESTION_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+                    continue
+                failed_event_ids.update(event["id"] for event in chunk)
+                logger.error(
+                    f"[ingest_events] Failed to ingest chunk | chunk={chunk_num} | "
+                    f"events={len(chunk)} | {e}"
+                )
+            except Exception as e:
+                failed_event_ids.update(event["id"] for event in chunk)
+                logger.error(
+                    f"[ingest_events] Failed to ingest chunk | chunk={chunk_num} | "
+                    f"events={len(chunk)} | {e}",
+                    exc_info=True,
+                )
+            else:
+                # Per-event input errors come back with a 207 status
+                for error in response.errors:
+                    failed_event_ids.add(error.id)
+                    logger.warning(
+                        f"[ingest_events] Event rejected | event_id={error.id} | "
+                        f"status={error.status} | {error.message}"
+                    )
+            break
+
+    logger.info(
+        f"[ingest_events] Ingested events | events={len(events)} | "
+        f"failed={len(failed_event_ids)}"
+    )
+    return failed_event_ids
+
 
 def create_langfuse_dataset_run(
     langfuse: Langfuse,
     dataset_name: str,
     run_name: str,
-    results: list[dict[str, Any]],
+    results: EvaluationResultFrame,
     model: str | None = None,
+    dataset_item_ids: set[str] | None = None,
 ) -> dict[str, str]:
     """
     Create a dataset run in Langfuse with traces for each evaluation item.
 
     This function:
-    1. Gets the dataset from Langfuse (which already exists)
-    2. For each result, creates a trace linked to the dataset item
-    3. Creates a generation within the trace with usage/model for cost tracking
-    4. Logs input (question), output (generated_output), and expected (ground_truth)
-    5. Returns a mapping of item_id -> trace_id for later score updates
+    1. Gets the dataset item IDs from Langfuse, unless they are passed in
+       (e.g. from the dataset snapshot the run was evaluated against)
+    2. Builds a trace per result, logging input (question), output
+       (generated_output) and expected (ground_truth)
+    3. Builds a generation within each trace with usage/model for cost tracking
+    4. Submits traces and generations through batch ingestion (see ingest_events)
+    5. Links each ingested trace to its dataset item within the run, concurrently.
+       Copies of a duplicated item are folded back into the item they came
+       from, so an item has one run item per copy
+    6. Returns a mapping of item_id -> trace_id for later score updates
 
     Note: Cost tracking in Langfuse happens at the generation level, not trace level.
     We create a generation within each trace to enable automatic cost calculation.
@@ -42,23 +177,10 @@ def create_langfuse_dataset_run(
         langfuse: Configured Langfuse client
         dataset_name: Name of the dataset in Langfuse
         run_name: Name for this evaluation run
-        results: List of evaluation results from parse_batch_output()
-                 Format: [
-                     {
-                         "item_id": "item_123",
-                         "question": "What is 2+2?",
-                         "generated_output": "4",
-                         "ground_truth": "4",
-                         "response_id": "resp_0b99aadf...",
-                         "usage": {
-                             "input_tokens": 69,
-                             "output_tokens": 258,
-                             "total_tokens": 327
-                         }
-                     },
-                     ...
-                 ]
+        results: Evaluation results from parse_evaluation_output()
         model: Model name used for evaluation (for cost calculation by Langfuse)
+        dataset_item_ids: IDs of the items of the dataset; fetched from
+            Langfuse when not given
 
     Returns:
         dict[str, str]: Mapping of item_id to Langfuse trace_id
@@ -72,82 +194,119 @@ def create_langfuse_dataset_run(
     )
 
     try:
-        # Get the dataset
-        dataset = langfuse.get_dataset(dataset_name)
-        dataset_items_map = {item.id: item for item in dataset.items}
-
-        trace_id_mapping = {}
-
-        # Create a trace for each result
-        for result in results:
-            item_id = result["item_id"]
-            question = result["question"]
-            generated_output = result["generated_output"]
-            ground_truth = result["ground_truth"]
-            response_id = result.get("response_id")
-            usage_raw = result.get("usage")
-
-            dataset_item = dataset_items_map.get(item_id)
-            if not dataset_item:
+        if dataset_item_ids is None:
+            dataset = langfuse.get_dataset(dataset_name)
+            dataset_item_ids = {item.id for item in dataset.items}
+
+        events = []
+        # (item_id, dataset_item_id, trace_id, trace event id) per trace to link
+        pending_links = []
+
+        # Build a trace for each result
+        for row, item_id in enumerate(results.item_ids):
+            question = results.questions[row]
+            generated_output = results.generated_outputs[row]
+            ground_truth = results.ground_truths[row]
+            response_id = results.response_ids[row]
+            usage_raw = results.usage(row)
+
+            dataset_item_id, copy_num = split_copy_id(item_id)
+            if item_id in dataset_item_ids:
+                dataset_item_id = item_id
+            elif dataset_item_id not in dataset_item_ids:
                 logger.warning(
                     f"[create_langfuse_dataset_run] Dataset item not found, skipping | "
                     f"item_id={item_id}"
                 )
                 continue
 
-            try:
-                with dataset_item.observe(run_name=run_name) as trace_id:
-                    metadata = {
-                        "ground_truth": ground_truth,
-                        "item_id": item_id,
-                    }
-                    if response_id:
-                        metadata["response_id"] = response_id
-
-                    # Create trace with basic info
-                    langfuse.trace(
-                        id=trace_id,
-                        input={"question": question},
-                        output={"answer": generated_output},
-                        metadata=metadata,
+            trace_id = str(uuid.uuid4())
+            metadata = {
+                "ground_truth": ground_truth,
+                "item_id": item_id,
+            }
+            if dataset_item_id != item_id:
+                metadata["dataset_item_id"] = dataset_item_id
+                metadata["copy_number"] = copy_num
+            if response_id:
+                metadata["response_id"] = response_id
+
+            # Create trace with basic info
+            trace_event = _ingestion_event(
+                "trace-create",
+                {
+                    "id": trace_id,
+                    "input": {"question": question},
+                    "output": {"answer": generated_output},
+                    "metadata": metadata,
+                },
+            )
+            events.append(trace_event)
+
+            # Create a generation within the trace for cost tracking
+            # Cost tracking happens at generation level, not trace level
+            if usage_raw and model:
+                events.append(
+                    _ingestion_event(
+                        "generation-create",
+                        {
+                            "id": str(uuid.uuid4()),
+                            "traceId": trace_id,
+                            "name": "evaluation-response",
+                            "input": {"question": question},
+                            "output": {"answer": generated_output},
+                            "metadata": metadata,
+                            "model": model,
+                            # Usage in Langfuse format
+                            "usage": {
+                                "input": usage_raw.get("input_tokens", 0),
+                                "output": usage_raw.get("output_tokens", 0),
+                                "total": usage_raw.get("total_tokens", 0),
+                                "unit": "TOKENS",
+                            },
+                            "endTime": trace_event["timestamp"],
+                        },
                     )
+                )
 
-                    # Convert usage to Langfuse format
-                    usage = None
-                    if usage_raw:
-                        usage = {
-                            "input": usage_raw.get("input_tokens", 0),
-                            "output": usage_raw.get("output_tokens", 0),
-                            "total": usage_raw.get("total_tokens", 0),
-                            "unit": "TOKENS",
-                        }
-
-                    # Create a generation within the trace for cost tracking
-                    # Cost tracking happens at generation level, not trace level
-                    if usage and model:
-                        generation = langfuse.generation(
-                            name="evaluation-response",
-                            trace_id=trace_id,
-                            input={"question": question},
-                            metadata=metadata,
-                        )
-                        generation.end(
-                            output={"answer": generated_output},
-                            model=model,
-                            usage=usage,
-                        )
+            pending_links.append(
+                (item_id, dataset_item_id, trace_id, trace_event["id"])
+            )
 
-                    trace_id_mapping[item_id] = trace_id
+        failed_event_ids = ingest_events(langfuse=langfuse, events=events)
 
-            except Exception as e:
-                logger.error(
-                    f"[create_langfuse_dataset_run] Failed to create trace | "
-                    f"item_id={item_id} | {e}",
-                    exc_info=True,
+        def link_trace(dataset_item_id: str, trace_id: str) -> None:
+            langfuse.api.dataset_run_items.create(
+                request=CreateDatasetRunItemRequest(
+                    runName=run_name, datasetItemId=dataset_item_id, traceId=trace_id
                 )
-                continue
+            )
+
+        trace_id_mapping = {}
+        with ThreadPoolExecutor(max_workers=DATASET_RUN_LINK_MAX_WORKERS) as executor:
+            futures = {}
+            for item_id, dataset_item_id, trace_id, event_id in pending_links:
+                if event_id in failed_event_ids:
+                    logger.error(
+                        f"[create_langfuse_dataset_run] Trace not ingested, skipping | "
+                        f"item_id={item_id}"
+                    )
+                    continue
+                future = executor.submit(link_trace, dataset_item_id, trace_id)
+                futures[future] = (item_id, trace_id)
+
+            for future in as_completed(futures):
+                item_id, trace_id = futures[future]
+                try:
+                    future.result()
+                    trace_id_mapping[item_id] = trace_id
+                except Exception as e:
+                    logger.error(
+                        f"[create_langfuse_dataset_run] Failed to link trace | "
+                        f"item_id={item_id} | {e}",
+                        exc_info=True,
+                    )
 
-        langfuse.flush()
         logger.info(
             f"[create_langfuse_dataset_run] Created Langfuse dataset run | "
             f"run_name={run_name} | traces={len(trace_id_mapping)}"
@@ -172,7 +331,8 @@ def update_traces_with_cosine_scores(
     Update Langfuse traces with cosine similarity scores.
 
     This function adds custom "cosine_similarity" scores to traces at the trace level,
-    allowing them to be visualized in the Langfuse UI.
+    allowing them to be visualized in the Langfuse UI. Scores are submitted in
+    bulk through batch ingestion (see ingest_events).
 
     Args:
         langfuse: Configured Langfuse client
@@ -190,6 +350,7 @@ def update_traces_with_cosine_scores(
         This function logs errors but does not raise exceptions to avoid blocking
         evaluation completion if Langfuse updates fail.
     """
+    events = []
     for score_item in per_item_scores:
         trace_id = score_item.get("trace_id")
         cosine_score = score_item.get("cosine_similarity")
@@ -201,24 +362,39 @@ def update_traces_with_cosine_scores(
             )
             continue
 
-        try:
-            langfuse.score(
-                trace_id=trace_id,
-                name="cosine_similarity",
-                value=cosine_score,
-                comment=(
-                    "Cosine similarity between generated output and "
-                    "ground truth embeddings"
-                ),
-            )
-        except Exception as e:
-            logger.error(
-                f"[update_traces_with_cosine_scores] Failed to add score | "
-                f"trace_id={trace_id} | {e}",
-                exc_info=True,
+        events.append(
+            _ingestion_event(
+                "score-create",
+                {
+                    "id": str(uuid.uuid4()),
+                    "traceId": trace_id,
+                    "name": "cosine_similarity",
+                    "value": cosine_score,
+                    "comment": (
+                        "Cosine similarity between generated output and "
+                        "ground truth embeddings"
+                    ),
+                },
             )
+        )
+
+    if not events:
+        return
 
-    langfuse.flush()
+    try:
+        failed_event_ids = ingest_events(langfuse=langfuse, events=events)
+    except Exception as e:
+        logger.error(
+            f"[update_traces_with_cosine_scores] Failed to add scores | {e}",
+            exc_info=True,
+        )
+        return
+
+    if failed_event_ids:
+        logger.error(
+            f"[update_traces_with_cosine_scores] Failed to add scores | "
+            f"failed={len(failed_event_ids)} | total={len(events)}"
+        )
 
 
 def upload_dataset_to_langfuse(
@@ -230,25 +406,71 @@ def upload_dataset_to_langfuse(
     """
     Upload a dataset to Langfuse from pre-parsed items.
 
+    Each item is stored once; see upload_dataset_items_to_langfuse.
+
     Args:
         langfuse: Configured Langfuse client
         items: List of dicts with 'question' and 'answer' keys (already validated)
         dataset_name: Name for the dataset in Langfuse
-        duplication_factor: Number of times to duplicate each item
+        duplication_factor: Number of times each item is evaluated
 
     Returns:
-        Tuple of (langfuse_dataset_id, total_items_uploaded)
+        Tuple of (langfuse_dataset_id, items_uploaded)
+
+    Raises:
+        Exception: If Langfuse operations fail
+    """
+    langfuse_dataset_id, _, total_uploaded = upload_dataset_items_to_langfuse(
+        langfuse=langfuse,
+        items=items,
+        dataset_name=dataset_name,
+        duplication_factor=duplication_factor,
+    )
+    return langfuse_dataset_id, total_uploaded
+
+
+def upload_dataset_items_to_langfuse(
+    langfuse: Langfuse,
+    items: Iterable[dict[str, str]],
+    dataset_name: str,
+    duplication_factor: int,
+    max_workers: int = DATASET_UPLOAD_MAX_WORKERS,
+    on_progress: Callable[[int], None] | None = None,
+) -> tuple[str, int, int]:
+    """
+    Upload dataset items to Langfuse as they are produced.
+
+    Each item is stored once. The duplication factor is recorded in the
+    dataset and item metadata, and the copies are only expanded when the
+    evaluation batch is built (see iter_evaluation_jsonl), so upload and fetch
+    costs scale with the number of unique items.
+
+    Items are consumed lazily and at most max_workers * DATASET_UPLOAD_QUEUE_FACTOR
+    uploads are in flight at a time, so memory stays bounded for datasets
+    parsed incrementally from large files. Failed items are logged and skipped.
+
+    Args:
+        langfuse: Configured Langfuse client
+        items: Iterable of dicts with 'question' and 'answer' keys
+        dataset_name: Name for the dataset in Langfuse
+        duplication_factor: Number of times each item is evaluated
+        max_workers: Maximum number of concurrent item uploads
+        on_progress: Called with the number of items read so far, every
+            DATASET_UPLOAD_PROGRESS_INTERVAL items
+
+    Returns:
+        Tuple of (langfuse_dataset_id, original_items, items_uploaded)
 
     Raises:
         Exception: If Langfuse operations fail
     """
     logger.info(
-        f"[upload_dataset_to_langfuse] Uploading dataset to Langfuse | "
-        f"dataset={dataset_name} | items={len(items)} | "
-        f"duplication_factor={duplication_factor}"
+        f"[upload_dataset_items_to_langfuse] Uploading dataset to Langfuse | "
+        f"dataset={dataset_name} | duplication_factor={duplication_factor} | "
+        f"max_workers={max_workers}"
     )
 
-    def upload_item(item: dict[str, str], duplicate_num: int) -> bool:
+    def upload_item(item: dict[str, str]) -> bool:
         try:
             langfuse.create_dataset_item(
                 dataset_name=dataset_name,
@@ -256,41 +478,45 @@ def upload_dataset_to_langfuse(
                 expected_output={"answer": item["answer"]},
                 metadata={
                     "original_question": item["question"],
-                    "duplicate_number": duplicate_num + 1,
                     "duplication_factor": duplication_factor,
                 },
             )
             return True
         except Exception as e:
             logger.error(
-                f"[upload_dataset_to_langfuse] Failed to upload item | "
-                f"duplicate={duplicate_num + 1} | "
+                f"[upload_dataset_items_to_langfuse] Failed to upload item | "
                 f"question={item['question'][:50]}... | {e}"
             )
             return False
 
     try:
         # Create or get dataset in Langfuse
-        dataset = langfuse.create_dataset(name=dataset_name)
-
-        upload_tasks = [
-            (item, duplicate_num)
-            for item in items
-            for duplicate_num in range(duplication_factor)
-        ]
+        dataset = langfuse.create_dataset(
+            name=dataset_name, metadata={"duplication_factor": duplication_factor}
+        )
 
-        # Upload items concurrently using ThreadPoolExecutor
+        original_items = 0
         total_uploaded = 0
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            # Submit all upload tasks and collect the futures
-            futures = []
-            for item, dup_num in upload_tasks:
-                future = executor.submit(upload_item, item, dup_num)
-                futures.append(future)
-
-            for future in as_completed(futures):
-                upload_successful = future.result()
-                if upload_successful:
+        max_pending = max_workers * DATASET_UPLOAD_QUEUE_FACTOR
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = set()
+            for item in items:
+                original_items += 1
+                pending.add(executor.submit(upload_item, item))
+
+                # Wait for uploads to finish before reading more items
+                while len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    total_uploaded += sum(future.result() for future in done)
+
+                if (
+                    on_progress
+                    and original_items % DATASET_UPLOAD_PROGRESS_INTERVAL == 0
+                ):
+                    on_progress(original_items)
+
+            for future in as_completed(pending):
+                if future.result():
                     total_uploaded += 1
 
         # Final flush to ensure all items are uploaded
@@ -299,37 +525,151 @@ def upload_dataset_to_langfuse(
         langfuse_dataset_id = dataset.id
 
         logger.info(
-            f"[upload_dataset_to_langfuse] Successfully uploaded to Langfuse | "
-            f"items={total_uploaded} | dataset={dataset_name} | "
-            f"id={langfuse_dataset_id}"
+            f"[upload_dataset_items_to_langfuse] Successfully uploaded to Langfuse | "
+            f"original_items={original_items} | items={total_uploaded} | "
+            f"dataset={dataset_name} | id={langfuse_dataset_id}"
         )
 
-        return langfuse_dataset_id, total_uploaded
+        return langfuse_dataset_id, original_items, total_uploaded
 
     except Exception as e:
         logger.error(
-            f"[upload_dataset_to_langfuse] Failed to upload dataset to Langfuse | "
+            f"[upload_dataset_items_to_langfuse] Failed to upload dataset to Langfuse | "
             f"dataset={dataset_name} | {e}",
             exc_info=True,
         )
         raise
 
 
+def fetch_traces(
+    langfuse: Langfuse,
+    trace_ids: list[str],
+    max_workers: int = TRACE_FETCH_MAX_WORKERS,
+) -> tuple[dict[str, Any], list[str]]:
+    """
+    Fetch traces from Langfuse concurrently.
+
+    Langfuse cannot list traces or scores filtered by trace ids, so each trace
+    is fetched on its own, up to max_workers at a time. Rate limited and
+    failed requests are retried with backoff by the Langfuse API client.
+
+    Args:
+        langfuse: Configured Langfuse client
+        trace_ids: IDs of the traces to fetch
+        max_workers: Maximum number of concurrent requests
+
+    Returns:
+        Tuple of (traces by trace_id, trace_ids that could not be fetched)
+    """
+    request_options = {
+        "max_retries": TRACE_FETCH_MAX_RETRIES,
+        "timeout_in_seconds": TRACE_FETCH_TIMEOUT_SECONDS,
+    }
+    traces: dict[str, Any] = {}
+    if not trace_ids:
+        return traces, []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                langfuse.api.trace.get, trace_id, request_options=request_options
+            ): trace_id
+            for trace_id in trace_ids
+        }
+
+        for completed, future in enumerate(as_completed(futures), 1):
+            trace_id = futures[future]
+            try:
+                traces[trace_id] = future.result()
+            except Exception as e:
+                logger.warning(
+                    f"[fetch_traces] Failed to fetch trace | "
+                    f"trace_id={trace_id} | error={e}"
+                )
+
+            if completed % TRACE_FETCH_PROGRESS_INTERVAL == 0 or completed == len(
+                futures
+            ):
+                logger.info(
+                    f"[fetch_traces] Fetch progress | completed={completed} | "
+                    f"total={len(futures)} | failed={completed - len(traces)}"
+                )
+
+    failed_trace_ids = [trace_id for trace_id in trace_ids if trace_id not in traces]
+    return traces, failed_trace_ids
+
+
+def _build_trace_data(trace_id: str, trace: Any) -> dict[str, Any]:
+    """Extract the Q&A context and scores of a Langfuse trace."""
+    trace_data: dict[str, Any] = {
+        "trace_id": trace_id,
+        "question": "",
+        "llm_answer": "",
+        "ground_truth_answer": "",
+        "scores": [],
+    }
+
+    # Get question from input
+    if trace.input:
+        if isinstance(trace.input, dict):
+            trace_data["question"] = trace.input.get("question", "")
+        elif isinstance(trace.input, str):
+            trace_data["question"] = trace.input
+
+    # Get answer from output
+    if trace.output:
+        if isinstance(trace.output, dict):
+            trace_data["llm_answer"] = trace.output.get("answer", "")
+        elif isinstance(trace.output, str):
+            trace_data["llm_answer"] = trace.output
+
+    # Get ground truth from metadata
+    if trace.metadata and isinstance(trace.metadata, dict):
+        trace_data["ground_truth_answer"] = trace.metadata.get("ground_truth", "")
+
+    # Add scores from this trace
+    for score in trace.scores or []:
+        score_value = score.value
+        # Get data_type from Langfuse score, default to NUMERIC
+        data_type = getattr(score, "data_type", None) or "NUMERIC"
+
+        # Round numeric values to 2 decimal places
+        if data_type != "CATEGORICAL" and isinstance(score_value, (int, float)):
+            score_value = round(float(score_value), 2)
+
+        score_entry: dict[str, Any] = {
+            "name": score.name,
+            "value": score_value,
+            "data_type": data_type,
+        }
+        if score.comment:
+            score_entry["comment"] = score.comment
+
+        trace_data["scores"].append(score_entry)
+
+    return trace_data
+
+
 def fetch_trace_scores_from_langfuse(
     langfuse: Langfuse,
     dataset_name: str,
     run_name: str,
+    cached_traces: list[dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
     """
     Fetch trace scores from Langfuse for an evaluation run.
 
     This function retrieves all traces and their scores from a Langfuse dataset run,
-    including the original Q&A context for each trace.
+    including the original Q&A context for each trace. Traces are fetched
+    concurrently (see fetch_traces); traces that still fail are listed in
+    "failed_trace_ids" so a later call can pass the partial result back as
+    cached_traces and fetch only what is missing.
 
     Args:
         langfuse: Configured Langfuse client
         dataset_name: Name of the dataset in Langfuse
         run_name: Name of the evaluation run
+        cached_traces: Traces from an earlier partial result to reuse
 
     Returns:
         Score data with per-trace scores and summary statistics:
@@ -363,7 +703,8 @@ def fetch_trace_scores_from_langfuse(
                         }
                     ]
                 }
-            ]
+            ],
+            "failed_trace_ids": ["trace-uuid-456"]  # Only when fetches failed
         }
 
     Raises:
@@ -396,90 +737,49 @@ def fetch_trace_scores_from_langfuse(
 
         # 2. Extract trace IDs from dataset run items
         trace_ids = [item.trace_id for item in dataset_run.dataset_run_items]
+        run_trace_ids = set(trace_ids)
+        reused_traces = {
+            trace["trace_id"]: trace
+            for trace in cached_traces or []
+            if trace.get("trace_id") in run_trace_ids
+        }
 
         logger.info(
-            f"[fetch_trace_scores_from_langfuse] Found traces | count={len(trace_ids)}"
+            f"[fetch_trace_scores_from_langfuse] Found traces | count={len(trace_ids)} | "
+            f"cached={len(reused_traces)}"
+        )
+
+        # 3. Fetch trace details with scores for traces not already cached
+        fetched_traces, failed_trace_ids = fetch_traces(
+            langfuse=langfuse,
+            trace_ids=[
+                trace_id for trace_id in trace_ids if trace_id not in reused_traces
+            ],
         )
 
-        # 3. Fetch trace details with scores for each trace
         traces = []
         # Track score aggregations by name: {name: {"data_type": str, "values": list}}
         score_aggregations: dict[str, dict[str, Any]] = {}
 
         for trace_id in trace_ids:
-            try:
-                trace = langfuse.api.trace.get(trace_id)
-                trace_data: dict[str, Any] = {
-                    "trace_id": trace_id,
-                    "question": "",
-                    "llm_answer": "",
-                    "ground_truth_answer": "",
-                    "scores": [],
-                }
-
-                # Get question from input
-                if trace.input:
-                    if isinstance(trace.input, dict):
-                        trace_data["question"] = trace.input.get("question", "")
-                    elif isinstance(trace.input, str):
-                        trace_data["question"] = trace.input
-
-                # Get answer from output
-                if trace.output:
-                    if isinstance(trace.output, dict):
-                        trace_data["llm_answer"] = trace.output.get("answer", "")
-                    elif isinstance(trace.output, str):
-                        trace_data["llm_answer"] = trace.output
-
-                # Get ground truth from metadata
-                if trace.metadata and isinstance(trace.metadata, dict):
-                    trace_data["ground_truth_answer"] = trace.metadata.get(
-                        "ground_truth", ""
-                    )
-
-                # Add scores from this trace
-                if trace.scores:
-                    for score in trace.scores:
-                        score_name = score.name
-                        score_value = score.value
-                        score_comment = score.comment
-                        # Get data_type from Langfuse score, default to NUMERIC
-                        data_type = getattr(score, "data_type", None) or "NUMERIC"
-
-                        # Build score entry for trace
-                        # Round numeric values to 2 decimal places
-                        if data_type != "CATEGORICAL" and isinstance(
-                            score_value, (int, float)
-                        ):
-                            score_value = round(float(score_value), 2)
-
-                        score_entry: dict[str, Any] = {
-                            "name": score_name,
-                            "value": score_value,
-                            "data_type": data_type,
-                        }
-                        if score_comment:
-                            score_entry["comment"] = score_comment
-
-                        trace_data["scores"].append(score_entry)
-
-                        # Aggregate for summary calculation
-                        if score_value is not None:
-                            if score_name not in score_aggregations:
-                                score_aggregations[score_name] = {
-                                    "data_type": data_type,
-                                    "values": [],
-                                }
-                            score_aggregations[score_name]["values"].append(score_value)
-
-                traces.append(trace_data)
+            if trace_id in reused_traces:
+                trace_data = reused_traces[trace_id]
+            elif trace_id in fetched_traces:
+                trace_data = _build_trace_data(trace_id, fetched_traces[trace_id])
+            else:
+                continue
 
-            except Exception as e:
-                logger.warning(
-                    f"[fetch_trace_scores_from_langfuse] Failed to fetch trace | "
-                    f"trace_id={trace_id} | error={e}"
+            # Aggregate for summary calculation
+            for score_entry in trace_data["scores"]:
+                if score_entry["value"] is None:
+                    continue
+                aggregation = score_aggregations.setdefault(
+                    score_entry["name"],
+                    {"data_type": score_entry["data_type"], "values": []},
                 )
-                continue
+                aggregation["values"].append(score_entry["value"])
+
+            traces.append(trace_data)
 
         # 4. Identify complete scores (all traces must have the score)
         total_traces = len(traces)
@@ -538,10 +838,13 @@ def fetch_trace_scores_from_langfuse(
             "summary_scores": summary_scores,
             "traces": traces,
         }
+        if failed_trace_ids:
+            result["failed_trace_ids"] = failed_trace_ids
 
         logger.info(
             f"[fetch_trace_scores_from_langfuse] Successfully fetched scores | "
-            f"total_traces={len(traces)} | complete_scores={list(complete_score_names)}"
+            f"total_traces={len(traces)} | failed_traces={len(failed_trace_ids)} | "
+            f"complete_scores={list(complete_score_names)}"
         )
 
         return result
@@ -9,7 +9,6 @@ This module coordinates the evaluation-specific workflow:
 """
 
 import ast
-import json
 import logging
 from collections import defaultdict
 from typing import Any
@@ -19,64 +18,156 @@ from langfuse import Langfuse
 from openai import OpenAI
 from sqlmodel import Session, select
 
+from app.core.batch.jsonl import decode_json
 from app.core.batch.openai import OpenAIBatchProvider
 from app.crud.batch_job import get_batch_job
 from app.crud.batch_operations import (
     download_batch_results,
     upload_batch_results_to_object_store,
 )
-from app.crud.evaluations.batch import fetch_dataset_items
+from app.crud.evaluations.batch import load_dataset_items
 from app.crud.evaluations.core import update_evaluation_run
+from app.crud.evaluations.dataset import split_copy_id
+from app.crud.evaluations.embedding_cache import (
+    get_cached_embeddings,
+    store_embeddings,
+)
 from app.crud.evaluations.embeddings import (
+    VALID_EMBEDDING_MODELS,
     calculate_average_similarity,
+    get_ground_truth_hashes,
     parse_embedding_results,
     start_embedding_batch,
 )
+from app.crud.evaluations.frame import EvaluationResultFrame
 from app.crud.evaluations.langfuse import (
     create_langfuse_dataset_run,
     update_traces_with_cosine_scores,
 )
+from app.crud.evaluations.results import (
+    store_cosine_scores,
+    store_evaluation_results,
+)
 from app.models import EvaluationRun
 from app.utils import get_langfuse_client, get_openai_client
 
 logger = logging.getLogger(__name__)
 
 
+def extract_output_text(output: list[Any]) -> str:
+    """
+    Return the generated text of a Responses API output list.
+
+    Reads output[].content[].text directly: the first output_text content of
+    the first message item that has one.
+
+    Args:
+        output: The "output" list of a Responses API body
+
+    Returns:
+        The generated text, or "" if no message carries output_text
+    """
+    for item in output:
+        if not isinstance(item, dict) or item.get("type") != "message":
+            continue
+        for content in item.get("content") or ():
+            if isinstance(content, dict) and content.get("type") == "output_text":
+                text = content.get("text", "")
+                if text:
+                    return text
+                break
+    return ""
+
+
+def extract_generated_output(output: Any) -> tuple[str, bool]:
+    """
+    Return the generated text of a Responses API body "output" field.
+
+    The output is normally a list of output items, read by
+    extract_output_text(). Outputs that arrived as a string are decoded first
+    (see _decode_output_string()); strings that do not hold a list are plain
+    text and returned as they are.
+
+    Args:
+        output: The "output" field of a Responses API body
+
+    Returns:
+        Tuple of (generated text, whether ast.literal_eval was needed)
+    """
+    used_literal_eval = False
+    if isinstance(output, str):
+        output, used_literal_eval = _decode_output_string(output)
+
+    if isinstance(output, list):
+        return extract_output_text(output), used_literal_eval
+    if isinstance(output, str):
+        return output, used_literal_eval
+    raise TypeError(f"Unexpected output type: {type(output)}")
+
+
+def _decode_output_string(output: str) -> tuple[Any, bool]:
+    """
+    Decode an output that arrived as a string instead of a list.
+
+    Plain text is returned as is. Strings holding a list are decoded as JSON,
+    and only when that fails with ast.literal_eval (a Python repr of the list),
+    which is far slower.
+
+    Returns:
+        Tuple of (decoded output or the original string, whether
+        ast.literal_eval was needed)
+    """
+    if not output.lstrip().startswith("["):
+        return output, False
+    try:
+        return decode_json(output), False
+    except ValueError:
+        pass
+    try:
+        return ast.literal_eval(output), True
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
+        # Keep as string if parsing fails
+        return output, True
+
+
 def parse_evaluation_output(
     raw_results: list[dict[str, Any]], dataset_items: list[dict[str, Any]]
-) -> list[dict[str, Any]]:
+) -> EvaluationResultFrame:
     """
     Parse batch output into evaluation results.
 
     This function extracts the generated output from the batch results
-    and matches it with the ground truth from the dataset.
+    and matches it with the ground truth from the dataset. Copies of a
+    duplicated item are matched to their dataset item through their custom_id
+    (see split_copy_id) and kept as separate rows.
 
     Args:
         raw_results: Raw results from batch provider (list of JSONL lines)
         dataset_items: Original dataset items (for matching ground truth)
 
     Returns:
-        List of results in format:
-        [
-            {
-                "item_id": "item_123",
-                "question": "What is 2+2?",
-                "generated_output": "4",
-                "ground_truth": "4",
-                "response_id": "resp_0b99aadfead1fb62006908e7f540c48197bd110183a347c1d8",
-                "usage": {
-                    "input_tokens": 69,
-                    "output_tokens": 258,
-                    "total_tokens": 327
-                }
-            },
-            ...
-        ]
+        EvaluationResultFrame with one row per item copy, holding item_id (the
+        custom_id, e.g. "item_123#2" for the second copy), question,
+        generated_output, ground_truth, response_id and token usage columns.
+        EvaluationResultFrame.record() returns a row in dict form:
+        {
+            "item_id": "item_123",
+            "question": "What is 2+2?",
+            "generated_output": "4",
+            "ground_truth": "4",
+            "response_id": "resp_0b99aadfead1fb62006908e7f540c48197bd110183a347c1d8",
+            "usage": {
+                "input_tokens": 69,
+                "output_tokens": 258,
+                "total_tokens": 327
+            }
+        }
     """
     # Create lookup map for dataset items by ID
     dataset_map = {item["id"]: item for item in dataset_items}
 
-    results = []
+    results = EvaluationResultFrame()
+    literal_eval_fallbacks = 0
 
     for line_num, response in enumerate(raw_results, 1):
         try:
@@ -88,8 +179,16 @@ def parse_evaluation_output(
                 )
                 continue
 
-            # Get original dataset item
-            dataset_item = dataset_map.get(item_id)
+            if item_id in results:
+                logger.warning(
+                    f"[parse_evaluation_output] Duplicate custom_id, skipping | line={line_num} | item_id={item_id}"
+                )
+                continue
+
+            # Get original dataset item, folding copies back into their item
+            dataset_item = dataset_map.get(item_id) or dataset_map.get(
+                split_copy_id(item_id)[0]
+            )
             if not dataset_item:
                 logger.warning(
                     f"[parse_evaluation_output] No dataset item found | line={line_num} | item_id={item_id}"
@@ -113,40 +212,16 @@ def parse_evaluation_output(
                 )
                 generated_output = f"ERROR: {error_msg}"
             else:
-                # Extract text from output (can be string, list, or complex structure)
-                output = response_body.get("output", "")
-
-                # If string, try to parse it (may be JSON or Python repr of list)
-                if isinstance(output, str):
-                    try:
-                        output = json.loads(output)
-                    except (json.JSONDecodeError, ValueError):
-                        try:
-                            output = ast.literal_eval(output)
-                        except (ValueError, SyntaxError):
-                            # Keep as string if parsing fails
-                            generated_output = output
-                            output = None
-
-                # If we have a list structure, extract text from message items
-                if isinstance(output, list):
-                    generated_output = ""
-                    for item in output:
-                        if isinstance(item, dict) and item.get("type") == "message":
-                            for content in item.get("content", []):
-                                if (
-                                    isinstance(content, dict)
-                                    and content.get("type") == "output_text"
-                                ):
-                                    generated_output = content.get("text", "")
-                                    break
-                            if generated_output:
-                                break
-                elif output is not None:
-                    # output was not a string and not a list
+                # Extract text from output (normally a list of output items)
+                try:
+                    generated_output, used_literal_eval = extract_generated_output(
+                        response_body.get("output", "")
+                    )
+                    literal_eval_fallbacks += used_literal_eval
+                except TypeError as e:
                     generated_output = ""
                     logger.warning(
-                        f"[parse_evaluation_output] Unexpected output type | item_id={item_id} | type={type(output)}"
+                        f"[parse_evaluation_output] Unexpected output type | item_id={item_id} | {e}"
                     )
 
             # Extract question and ground truth from dataset item
@@ -154,14 +229,12 @@ def parse_evaluation_output(
             ground_truth = dataset_item["expected_output"].get("answer", "")
 
             results.append(
-                {
-                    "item_id": item_id,
-                    "question": question,
-                    "generated_output": generated_output,
-                    "ground_truth": ground_truth,
-                    "response_id": response_id,
-                    "usage": usage,
-                }
+                item_id=item_id,
+                question=question,
+                generated_output=generated_output,
+                ground_truth=ground_truth,
+                response_id=response_id,
+                usage=usage,
             )
 
         except Exception as e:
@@ -170,12 +243,210 @@ def parse_evaluation_output(
             )
             continue
 
+    if literal_eval_fallbacks:
+        logger.warning(
+            f"[parse_evaluation_output] Decoded outputs with ast.literal_eval | count={literal_eval_fallbacks}"
+        )
     logger.info(
-        f"[parse_evaluation_output] Parsed evaluation results | results={len(results)} | output_lines={len(raw_results)}"
+        f"[parse_evaluation_output] Parsed evaluation results | results={len(results)} | output_lines={len(raw_results)} | literal_eval_fallbacks={literal_eval_fallbacks}"
     )
     return results
 
 
+def record_evaluation_results(
+    session: Session,
+    langfuse: Langfuse,
+    eval_run: EvaluationRun,
+    results: EvaluationResultFrame,
+    dataset_item_ids: set[str] | None = None,
+) -> dict[str, str]:
+    """
+    Create the Langfuse dataset run of an evaluation and store its results.
+
+    Failing to store the per-item results is logged but does not fail the
+    evaluation; the Langfuse traces remain the source for scoring.
+
+    Args:
+        session: Database session
+        langfuse: Configured Langfuse client
+        eval_run: EvaluationRun database object
+        results: Evaluation results from parse_evaluation_output()
+        dataset_item_ids: IDs of the items of the dataset (optional)
+
+    Returns:
+        dict[str, str]: Mapping of item_id to Langfuse trace_id
+
+    Raises:
+        Exception: If the Langfuse dataset run cannot be created
+    """
+    # Extract model from config for cost tracking
+    model = eval_run.config.get("model") if eval_run.config else None
+
+    trace_id_mapping = create_langfuse_dataset_run(
+        langfuse=langfuse,
+        dataset_name=eval_run.dataset_name,
+        run_name=eval_run.run_name,
+        results=results,
+        model=model,
+        dataset_item_ids=dataset_item_ids,
+    )
+
+    try:
+        store_evaluation_results(
+            session=session,
+            eval_run_id=eval_run.id,
+            results=results,
+            trace_id_mapping=trace_id_mapping,
+        )
+    except Exception as e:
+        session.rollback()
+        logger.error(
+            f"[record_evaluation_results] Failed to store evaluation results | "
+            f"eval_id={eval_run.id} | {e}",
+            exc_info=True,
+        )
+
+    return trace_id_mapping
+
+
+def score_embedding_results(
+    session: Session,
+    langfuse: Langfuse,
+    eval_run: EvaluationRun,
+    raw_results: list[dict[str, Any]],
+    embedding_model: str,
+    dimensions: int | None,
+) -> EvaluationRun:
+    """
+    Score an evaluation run from the output of its embedding requests.
+
+    This function:
+    1. Parses embeddings (output + ground_truth pairs), merging ground truth
+       embeddings that were left out of the requests from the embedding cache
+    2. Caches the ground truth embeddings computed by the requests
+    3. Calculates cosine similarity for each pair and stores it per item
+    4. Updates eval_run.score with the average and statistics
+    5. Updates Langfuse traces with per-item cosine similarity scores
+    6. Marks evaluation as completed
+
+    Args:
+        session: Database session
+        langfuse: Configured Langfuse client
+        eval_run: EvaluationRun database object
+        raw_results: Embedding output lines in Batch API output format
+        embedding_model: Embedding model the requests were made with
+        dimensions: Embedding size of the run
+
+    Returns:
+        Completed EvaluationRun with similarity scores
+
+    Raises:
+        ValueError: If no valid embedding pairs are found
+    """
+    log_prefix = f"[org={eval_run.organization_id}][project={eval_run.project_id}][eval={eval_run.id}]"
+
+    # Step 1: Parse embedding results, merging ground truth embeddings
+    # that were left out of the requests from the embedding cache
+    cached_ground_truths = get_cached_embeddings(
+        session=session,
+        project_id=eval_run.project_id,
+        model=embedding_model,
+        dimensions=dimensions,
+        text_hashes=get_ground_truth_hashes(raw_results),
+    )
+    embedding_pairs = parse_embedding_results(
+        raw_results=raw_results,
+        ground_truth_embeddings=cached_ground_truths,
+        dimensions=dimensions,
+    )
+
+    if not embedding_pairs:
+        raise ValueError("No valid embedding pairs found in batch output")
+
+    # Step 2: Cache ground truth embeddings computed by these requests
+    new_ground_truths = {
+        pair["ground_truth_hash"]: pair["ground_truth_embedding"]
+        for pair in embedding_pairs
+        if pair["ground_truth_hash"]
+        and pair["ground_truth_hash"] not in cached_ground_truths
+    }
+    if new_ground_truths:
+        try:
+            store_embeddings(
+                session=session,
+                project_id=eval_run.project_id,
+                model=embedding_model,
+                dimensions=dimensions,
+                embeddings=new_ground_truths,
+            )
+        except Exception as e:
+            session.rollback()
+            logger.warning(
+                f"[score_embedding_results] {log_prefix} Failed to cache ground truth embeddings | {e}"
+            )
+
+    # Step 3: Calculate similarity scores
+    similarity_stats = calculate_average_similarity(embedding_pairs=embedding_pairs)
+
+    # Step 3a: Store per-item scores with the stored results
+    try:
+        store_cosine_scores(
+            session=session,
+            eval_run_id=eval_run.id,
+            per_item_scores=similarity_stats["per_item_scores"],
+        )
+    except Exception as e:
+        session.rollback()
+        logger.error(
+            f"[score_embedding_results] {log_prefix} Failed to store cosine scores | {e}",
+            exc_info=True,
+        )
+
+    # Step 4: Update evaluation_run with scores
+    if eval_run.score is None:
+        eval_run.score = {}
+
+    eval_run.score["cosine_similarity"] = {
+        "avg": similarity_stats["cosine_similarity_avg"],
+        "std": similarity_stats["cosine_similarity_std"],
+        "total_pairs": similarity_stats["total_pairs"],
+    }
+
+    # Optionally store per-item scores if not too large
+    if len(similarity_stats.get("per_item_scores", [])) <= 100:
+        eval_run.score["cosine_similarity"]["per_item_scores"] = similarity_stats[
+            "per_item_scores"
+        ]
+
+    # Step 5: Update Langfuse traces with cosine similarity scores
+    logger.info(
+        f"[score_embedding_results] {log_prefix} Updating Langfuse traces with cosine similarity scores"
+    )
+    per_item_scores = similarity_stats.get("per_item_scores", [])
+    if per_item_scores:
+        try:
+            update_traces_with_cosine_scores(
+                langfuse=langfuse,
+                per_item_scores=per_item_scores,
+            )
+        except Exception as e:
+            # Log error but don't fail the evaluation
+            logger.error(
+                f"[score_embedding_results] {log_prefix} Failed to update Langfuse traces with scores | {e}",
+                exc_info=True,
+            )
+
+    # Step 6: Mark evaluation as completed
+    eval_run = update_evaluation_run(
+        session=session, eval_run=eval_run, status="completed", score=eval_run.score
+    )
+
+    logger.info(
+        f"[score_embedding_results] {log_prefix} Completed evaluation | avg_similarity={similarity_stats['cosine_similarity_avg']:.3f}"
+    )
+    return eval_run
+
+
 async def process_completed_evaluation(
     eval_run: EvaluationRun,
     session: Session,
@@ -188,7 +459,7 @@ async def process_completed_evaluation(
     This function:
     1. Downloads batch output from provider
     2. Parses results into question/output/ground_truth format
-    3. Creates Langfuse dataset run with traces
+    3. Creates Langfuse dataset run with traces and stores per-item results
     4. Starts embedding batch for similarity scoring (keeps status as "processing")
 
     Args:
@@ -237,32 +508,35 @@ async def process_completed_evaluation(
                 f"[process_completed_evaluation] {log_prefix} Object store upload failed | {store_error}"
             )
 
-        # Step 3: Fetch dataset items (needed for matching ground truth)
+        # Step 3: Load dataset items (needed for matching ground truth) from
+        # the snapshot the batch was built from
         logger.info(
-            f"[process_completed_evaluation] {log_prefix} Fetching dataset items | dataset={eval_run.dataset_name}"
+            f"[process_completed_evaluation] {log_prefix} Loading dataset items | dataset={eval_run.dataset_name}"
         )
-        dataset_items = fetch_dataset_items(
-            langfuse=langfuse, dataset_name=eval_run.dataset_name
+        dataset_items = load_dataset_items(
+            session=session, langfuse=langfuse, eval_run=eval_run, verify=False
         )
+        dataset_item_ids = {item["id"] for item in dataset_items}
 
         # Step 4: Parse evaluation results
         results = parse_evaluation_output(
             raw_results=raw_results, dataset_items=dataset_items
         )
+        # The frame keeps only the extracted fields; drop the raw batch output
+        # and dataset items before the Langfuse and embedding steps
+        del raw_results, dataset_items
 
         if not results:
             raise ValueError("No valid results found in batch output")
 
-        # Extract model from config for cost tracking
-        model = eval_run.config.get("model") if eval_run.config else None
-
-        # Step 5: Create Langfuse dataset run with traces
-        trace_id_mapping = create_langfuse_dataset_run(
+        # Step 5: Create Langfuse dataset run with traces and store per-item
+        # results for SQL aggregation
+        trace_id_mapping = record_evaluation_results(
+            session=session,
             langfuse=langfuse,
-            dataset_name=eval_run.dataset_name,
-            run_name=eval_run.run_name,
+            eval_run=eval_run,
             results=results,
-            model=model,
+            dataset_item_ids=dataset_item_ids,
         )
 
         # Store object store URL in database
@@ -328,7 +602,7 @@ async def process_completed_embedding_batch(
     This function:
     1. Downloads embedding batch results
     2. Parses embeddings (output + ground_truth pairs)
-    3. Calculates cosine similarity for each pair
+    3. Calculates cosine similarity for each pair and stores it per item
     4. Calculates average and statistics
     5. Updates eval_run.score with results
     6. Updates Langfuse traces with per-item cosine similarity scores
@@ -372,56 +646,20 @@ async def process_completed_embedding_batch(
             provider=provider, batch_job=embedding_batch_job
         )
 
-        # Step 3: Parse embedding results
-        embedding_pairs = parse_embedding_results(raw_results=raw_results)
-
-        if not embedding_pairs:
-            raise ValueError("No valid embedding pairs found in batch output")
-
-        # Step 4: Calculate similarity scores
-        similarity_stats = calculate_average_similarity(embedding_pairs=embedding_pairs)
-
-        # Step 5: Update evaluation_run with scores
-        if eval_run.score is None:
-            eval_run.score = {}
-
-        eval_run.score["cosine_similarity"] = {
-            "avg": similarity_stats["cosine_similarity_avg"],
-            "std": similarity_stats["cosine_similarity_std"],
-            "total_pairs": similarity_stats["total_pairs"],
-        }
-
-        # Optionally store per-item scores if not too large
-        if len(similarity_stats.get("per_item_scores", [])) <= 100:
-            eval_run.score["cosine_similarity"]["per_item_scores"] = similarity_stats[
-                "per_item_scores"
-            ]
-
-        # Step 6: Update Langfuse traces with cosine similarity scores
-        logger.info(
-            f"[process_completed_embedding_batch] {log_prefix} Updating Langfuse traces with cosine similarity scores"
+        # Steps 3-7: Score the run from the embeddings and mark it completed
+        embedding_model = embedding_batch_job.config.get(
+            "embedding_model", "text-embedding-3-large"
         )
-        per_item_scores = similarity_stats.get("per_item_scores", [])
-        if per_item_scores:
-            try:
-                update_traces_with_cosine_scores(
-                    langfuse=langfuse,
-                    per_item_scores=per_item_scores,
-                )
-            except Exception as e:
-                # Log error but don't fail the evaluation
-                logger.error(
-                    f"[process_completed_embedding_batch] {log_prefix} Failed to update Langfuse traces with scores | {e}",
-                    exc_info=True,
-                )
-
-        # Step 7: Mark evaluation as completed
-        eval_run = update_evaluation_run(
-            session=session, eval_run=eval_run, status="completed", score=eval_run.score
+        dimensions = embedding_batch_job.config.get(
+            "dimensions", VALID_EMBEDDING_MODELS.get(embedding_model)
         )
-
-        logger.info(
-            f"[process_completed_embedding_batch] {log_prefix} Completed evaluation | avg_similarity={similarity_stats['cosine_similarity_avg']:.3f}"
+        eval_run = score_embedding_results(
+            session=session,
+            langfuse=langfuse,
+            eval_run=eval_run,
+            raw_results=raw_results,
+            embedding_model=embedding_model,
+            dimensions=dimensions,
         )
 
         return eval_run
@@ -666,9 +904,11 @@ async def poll_all_pending_evaluations(session: Session, org_id: int) -> dict[st
             "details": [...]
         }
     """
-    # Get pending evaluations (status = "processing")
+    # Get pending evaluations (status = "processing"). Realtime evaluations
+    # are processing without a batch job and finish within their own job.
     statement = select(EvaluationRun).where(
         EvaluationRun.status == "processing",
+        EvaluationRun.batch_job_id.is_not(None),
         EvaluationRun.organization_id == org_id,
     )
     pending_runs = session.exec(statement).all()
@@ -0,0 +1,280 @@
+"""
+Realtime ("fast") evaluation of small datasets.
+
+A Batch API evaluation takes two batch round trips (responses, then
+embeddings), each waiting for the provider and the cron poller, so even a
+smoke-test dataset can take minutes to hours. Below a configurable item count
+the same requests are sent as concurrent realtime API calls instead and the
+run is processed within the job that starts it.
+
+The realtime responses are shaped like Batch API output lines, so parsing,
+Langfuse traces, stored results, object store uploads and scoring are shared
+with the batch path.
+"""
+
+import logging
+import uuid
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from langfuse import Langfuse
+from openai import OpenAI
+from sqlmodel import Session
+
+from app.core.cloud import get_cloud_storage
+from app.core.config import settings
+from app.core.storage_utils import upload_jsonl_to_object_store
+from app.crud.evaluations.batch import iter_evaluation_jsonl, load_dataset_items
+from app.crud.evaluations.core import update_evaluation_run
+from app.crud.evaluations.embeddings import prepare_embedding_jsonl
+from app.crud.evaluations.processing import (
+    parse_evaluation_output,
+    record_evaluation_results,
+    score_embedding_results,
+)
+from app.models import EvaluationDataset, EvaluationRun
+
+logger = logging.getLogger(__name__)
+
+# Concurrent realtime API calls per evaluation phase
+REALTIME_EVALUATION_MAX_WORKERS = 8
+
+
+def use_realtime_evaluation(session: Session, eval_run: EvaluationRun) -> bool:
+    """
+    Check whether an evaluation run is small enough to run in realtime.
+
+    The item count recorded on the dataset at ingestion (including duplicates)
+    is compared with settings.EVALUATION_REALTIME_MAX_ITEMS; a threshold of 0
+    disables realtime evaluation.
+
+    Args:
+        session: Database session
+        eval_run: EvaluationRun to check
+
+    Returns:
+        True if the run should be evaluated with realtime API calls
+    """
+    max_items = settings.EVALUATION_REALTIME_MAX_ITEMS
+    if max_items <= 0:
+        return False
+
+    dataset = session.get(EvaluationDataset, eval_run.dataset_id)
+    total_items = (
+        (dataset.dataset_metadata or {}).get("total_items_count") if dataset else None
+    )
+    return bool(total_items) and total_items <= max_items
+
+
+def execute_realtime_requests(
+    jsonl_lines: Iterable[dict[str, Any]],
+    send: Callable[[dict[str, Any]], Any],
+    max_workers: int = REALTIME_EVALUATION_MAX_WORKERS,
+) -> list[dict[str, Any]]:
+    """
+    Send Batch API request lines as concurrent realtime API calls.
+
+    Args:
+        jsonl_lines: Batch request lines with custom_id and body
+        send: Makes the API call for a request body and returns the SDK
+            response (e.g. client.responses.create(**body))
+        max_workers: Maximum number of concurrent calls
+
+    Returns:
+        One line per request in Batch API output format: custom_id and
+        response.body (the response as a dict), or error.message when the
+        call failed
+    """
+
+    def execute(line: dict[str, Any]) -> dict[str, Any]:
+        output = {
+            "id": f"realtime_req_{uuid.uuid4().hex}",
+            "custom_id": line["custom_id"],
+        }
+        try:
+            response = send(line["body"])
+        except Exception as e:
+            logger.error(
+                f"[execute_realtime_requests] Request failed | "
+                f"custom_id={line['custom_id']} | {e}"
+            )
+            output["response"] = {
+                "status_code": getattr(e, "status_code", None) or 500,
+                "body": {},
+            }
+            output["error"] = {"code": type(e).__name__, "message": str(e)}
+            return output
+
+        output["response"] = {"status_code": 200, "body": response.model_dump()}
+        output["error"] = None
+        return output
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(execute, jsonl_lines))
+
+
+def run_realtime_evaluation(
+    langfuse: Langfuse,
+    openai_client: OpenAI,
+    session: Session,
+    eval_run: EvaluationRun,
+    config: dict[str, Any],
+) -> EvaluationRun:
+    """
+    Evaluate a run end to end with realtime API calls.
+
+    This function:
+    1. Loads the dataset items and builds the Responses API requests, as
+       start_evaluation_batch() does
+    2. Generates the responses with concurrent realtime calls and uploads
+       them to the object store
+    3. Parses the results, creates the Langfuse dataset run and stores the
+       per-item results
+    4. Embeds outputs and ground truths with concurrent realtime calls and
+       scores the run, marking it completed
+
+    The progress stage of the run is updated as each step starts
+    (fetching_dataset, generating, embedding). Embedding failures complete the
+    run without scores, as on the batch path.
+
+    Args:
+        langfuse: Configured Langfuse client
+        openai_client: Configured OpenAI client
+        session: Database session
+        eval_run: EvaluationRun database object (with run_name, dataset_name, config)
+        config: Evaluation configuration dict with llm, instructions, vector_store_ids
+
+    Returns:
+        Updated EvaluationRun with status completed
+
+    Raises:
+        Exception: If any step before scoring fails; the run is marked failed
+    """
+    log_prefix = f"[org={eval_run.organization_id}][project={eval_run.project_id}][eval={eval_run.id}]"
+
+    try:
+        # Step 1: Load dataset items and build the requests
+        logger.info(
+            f"[run_realtime_evaluation] {log_prefix} Starting realtime evaluation | run={eval_run.run_name}"
+        )
+        update_evaluation_run(
+            session=session,
+            eval_run=eval_run,
+            progress={"stage": "fetching_dataset", "mode": "realtime"},
+        )
+        dataset_items = load_dataset_items(
+            session=session, langfuse=langfuse, eval_run=eval_run
+        )
+        jsonl_lines = list(
+            iter_evaluation_jsonl(dataset_items=dataset_items, config=config)
+        )
+        if not jsonl_lines:
+            raise ValueError(
+                "Evaluation dataset did not produce any JSONL entries (missing questions?)."
+            )
+
+        # Step 2: Generate responses
+        eval_run.total_items = len(jsonl_lines)
+        eval_run = update_evaluation_run(
+            session=session,
+            eval_run=eval_run,
+            status="processing",
+            progress={"stage": "generating", "total_items": len(jsonl_lines)},
+        )
+        raw_results = execute_realtime_requests(
+            jsonl_lines=jsonl_lines,
+            send=lambda body: openai_client.responses.create(**body),
+        )
+
+        object_store_url = None
+        try:
+            storage = get_cloud_storage(session=session, project_id=eval_run.project_id)
+            object_store_url = upload_jsonl_to_object_store(
+                storage=storage,
+                results=raw_results,
+                filename="results.jsonl",
+                subdirectory=f"evaluation/realtime-{eval_run.id}",
+            )
+        except Exception as store_error:
+            logger.warning(
+                f"[run_realtime_evaluation] {log_prefix} Object store upload failed | {store_error}"
+            )
+
+        # Step 3: Parse results, create the Langfuse run and store results
+        results = parse_evaluation_output(
+            raw_results=raw_results, dataset_items=dataset_items
+        )
+        if not results:
+            raise ValueError("No valid results found in realtime output")
+
+        trace_id_mapping = record_evaluation_results(
+            session=session,
+            langfuse=langfuse,
+            eval_run=eval_run,
+            results=results,
+            dataset_item_ids={item["id"] for item in dataset_items},
+        )
+        del raw_results, dataset_items
+
+        eval_run = update_evaluation_run(
+            session=session,
+            eval_run=eval_run,
+            object_store_url=object_store_url,
+            progress={"stage": "embedding"},
+        )
+
+    except Exception as e:
+        logger.error(
+            f"[run_realtime_evaluation] {log_prefix} Failed to run realtime evaluation | {e}",
+            exc_info=True,
+        )
+        update_evaluation_run(
+            session=session,
+            eval_run=eval_run,
+            status="failed",
+            error_message=str(e),
+            progress={"stage": "failed"},
+        )
+        raise
+
+    # Step 4: Embed and score
+    try:
+        embedding_lines, embedding_model, dimensions = prepare_embedding_jsonl(
+            session=session,
+            eval_run=eval_run,
+            results=results,
+            trace_id_mapping=trace_id_mapping,
+        )
+        embedding_results = execute_realtime_requests(
+            jsonl_lines=embedding_lines,
+            send=lambda body: openai_client.embeddings.create(**body),
+        )
+        eval_run = score_embedding_results(
+            session=session,
+            langfuse=langfuse,
+            eval_run=eval_run,
+            raw_results=embedding_results,
+            embedding_model=embedding_model,
+            dimensions=dimensions,
+        )
+    except Exception as e:
+        logger.error(
+            f"[run_realtime_evaluation] {log_prefix} Failed to score evaluation | {e}",
+            exc_info=True,
+        )
+        eval_run = update_evaluation_run(
+            session=session,
+            eval_run=eval_run,
+            status="completed",
+            error_message=f"Embeddings failed: {str(e)}",
+        )
+
+    eval_run = update_evaluation_run(
+        session=session, eval_run=eval_run, progress={"stage": "completed"}
+    )
+    logger.info(
+        f"[run_realtime_evaluation] {log_prefix} Realtime evaluation finished | "
+        f"items={len(results)} | status={eval_run.status}"
+    )
+    return eval_run
@@ -0,0 +1,229 @@
+"""
+Per-item evaluation results stored in Postgres.
+
+Rows are bulk loaded with COPY when the response batch of a run has been
+processed, and their cosine scores filled in when the embedding batch
+completes. Run statistics and item listings are then plain SQL queries.
+"""
+
+import logging
+from typing import Any
+
+from sqlalchemy import func, text
+from sqlmodel import Session, delete, select
+
+from app.core.util import now
+from app.crud.evaluations.frame import EvaluationResultFrame
+from app.crud.pagination import Page, paginate_by_id
+from app.models import EvaluationResult, EvaluationResultSummary
+
+logger = logging.getLogger(__name__)
+
+RESULT_COPY_COLUMNS = (
+    "evaluation_run_id",
+    "item_id",
+    "trace_id",
+    "question",
+    "generated_output",
+    "ground_truth",
+    "input_tokens",
+    "output_tokens",
+    "total_tokens",
+    "inserted_at",
+)
+
+
+def store_evaluation_results(
+    session: Session,
+    eval_run_id: int,
+    results: EvaluationResultFrame,
+    trace_id_mapping: dict[str, str],
+) -> int:
+    """
+    Bulk load the per-item results of an evaluation run with COPY.
+
+    Existing rows of the run are replaced, so reprocessing a run is safe.
+
+    Args:
+        session: Database session
+        eval_run_id: ID of the evaluation run
+        results: Evaluation results from parse_evaluation_output()
+        trace_id_mapping: Mapping of item_id to Langfuse trace_id
+
+    Returns:
+        Number of rows stored
+    """
+    session.exec(
+        delete(EvaluationResult).where(
+            EvaluationResult.evaluation_run_id == eval_run_id
+        )
+    )
+
+    inserted_at = now()
+    copy_sql = (
+        f"COPY {EvaluationResult.__tablename__} "
+        f"({', '.join(RESULT_COPY_COLUMNS)}) FROM STDIN"
+    )
+    cursor = session.connection().connection.cursor()
+    try:
+        with cursor.copy(copy_sql) as copy:
+            for row, item_id in enumerate(results.item_ids):
+                copy.write_row(
+                    (
+                        eval_run_id,
+                        item_id,
+                        trace_id_mapping.get(item_id),
+                        results.questions[row] or "",
+                        results.generated_outputs[row] or "",
+                        results.ground_truths[row] or "",
+                        *results.tokens(row),
+                        inserted_at,
+                    )
+                )
+    finally:
+        cursor.close()
+    session.commit()
+
+    logger.info(
+        f"[store_evaluation_results] Stored evaluation results | "
+        f"evaluation_id={eval_run_id} | rows={len(results)}"
+    )
+    return len(results)
+
+
+def store_cosine_scores(
+    session: Session,
+    eval_run_id: int,
+    per_item_scores: list[dict[str, Any]],
+) -> int:
+    """
+    Set the cosine scores of stored results in one statement, matched by trace_id.
+
+    Args:
+        session: Database session
+        eval_run_id: ID of the evaluation run
+        per_item_scores: Per-item scores from calculate_average_similarity()
+
+    Returns:
+        Number of result rows updated
+    """
+    scores = [
+        (item["trace_id"], item["cosine_similarity"])
+        for item in per_item_scores
+        if item.get("trace_id")
+    ]
+    if not scores:
+        return 0
+
+    trace_ids, values = zip(*scores)
+    statement = text(
+        f"UPDATE {EvaluationResult.__tablename__} AS result "
+        "SET cosine_similarity = score.value "
+        "FROM unnest(CAST(:trace_ids AS text[]), "
+        "CAST(:values AS double precision[])) AS score(trace_id, value) "
+        "WHERE result.evaluation_run_id = :eval_run_id "
+        "AND result.trace_id = score.trace_id"
+    )
+    updated = session.exec(
+        statement,
+        params={
+            "trace_ids": list(trace_ids),
+            "values": [float(value) for value in values],
+            "eval_run_id": eval_run_id,
+        },
+    ).rowcount
+    session.commit()
+
+    logger.info(
+        f"[store_cosine_scores] Stored cosine scores | "
+        f"evaluation_id={eval_run_id} | scores={len(scores)} | updated={updated}"
+    )
+    return updated
+
+
+def get_evaluation_result_summary(
+    session: Session, eval_run_id: int
+) -> EvaluationResultSummary:
+    """
+    Aggregate the stored results of an evaluation run in SQL.
+
+    Args:
+        session: Database session
+        eval_run_id: ID of the evaluation run
+
+    Returns:
+        Item counts, cosine similarity statistics (population std, as in
+        calculate_average_similarity) and token totals
+    """
+    cosine = EvaluationResult.cosine_similarity
+    statement = select(
+        func.count(),
+        func.count(cosine),
+        func.avg(cosine),
+        func.stddev_pop(cosine),
+        func.min(cosine),
+        func.max(cosine),
+        func.coalesce(func.sum(EvaluationResult.input_tokens), 0),
+        func.coalesce(func.sum(EvaluationResult.output_tokens), 0),
+        func.coalesce(func.sum(EvaluationResult.total_tokens), 0),
+    ).where(EvaluationResult.evaluation_run_id == eval_run_id)
+
+    (
+        total_items,
+        scored_items,
+        cosine_avg,
+        cosine_std,
+        cosine_min,
+        cosine_max,
+        input_tokens,
+        output_tokens,
+        total_tokens,
+    ) = session.exec(statement).one()
+
+    return EvaluationResultSummary(
+        total_items=total_items,
+        scored_items=scored_items,
+        cosine_similarity_avg=cosine_avg,
+        cosine_similarity_std=cosine_std,
+        cosine_similarity_min=cosine_min,
+        cosine_similarity_max=cosine_max,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        total_tokens=total_tokens,
+    )
+
+
+def list_evaluation_results(
+    session: Session,
+    eval_run_id: int,
+    limit: int = 50,
+    offset: int = 0,
+    cursor: str | None = None,
+) -> Page[EvaluationResult]:
+    """
+    List the stored results of an evaluation run in item order.
+
+    Args:
+        session: Database session
+        eval_run_id: ID of the evaluation run
+        limit: Maximum number of results to return
+        offset: Number of results to skip, used only without a cursor
+        cursor: Cursor from the previous page's next_cursor
+
+    Returns:
+        Page of EvaluationResult objects with the next page's cursor
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    statement = select(EvaluationResult).where(
+        EvaluationResult.evaluation_run_id == eval_run_id
+    )
+    return paginate_by_id(
+        session,
+        statement,
+        id_column=EvaluationResult.id,
+        limit=limit,
+        cursor=cursor,
+        skip=offset,
+    )
@@ -0,0 +1,137 @@
+"""
+Object store snapshots of Langfuse dataset items.
+
+An evaluation run needs every item of its dataset twice: to build the batch
+JSONL when it starts and to match the batch results when it completes.
+Paginating the Langfuse dataset API for both is slow for large datasets, so
+the items are written once as gzip JSONL next to the dataset CSV, keyed by
+the Langfuse dataset ID and a fingerprint of the dataset, and read back from
+the object store by later phases and runs.
+"""
+
+import gzip
+import io
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from langfuse import Langfuse
+
+from app.core.cloud.storage import CloudStorage
+
+logger = logging.getLogger(__name__)
+
+# Bump when the snapshot layout changes so older snapshots are not reused
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_SUBDIRECTORY = "datasets/snapshots"
+# Key of the snapshot record ({"url", "fingerprint"}) in dataset_metadata
+SNAPSHOT_METADATA_KEY = "item_snapshot"
+
+
+class _SnapshotFile:
+    """Minimal UploadFile-like wrapper for CloudStorage.put."""
+
+    content_type = "application/gzip"
+
+    def __init__(self, content: bytes):
+        self.file = io.BytesIO(content)
+
+
+def get_dataset_fingerprint(langfuse: Langfuse, dataset_name: str) -> tuple[str, str]:
+    """
+    Fingerprint the current state of a Langfuse dataset.
+
+    Uses two single-page API calls (the dataset and a one-item page of its
+    items) instead of paginating through every item. The fingerprint changes
+    when items are added or removed, or when the dataset itself is updated.
+    Langfuse does not bump the dataset's updated_at when an existing item is
+    edited in place, and the item list cannot be ordered by update time, so
+    such an edit is only picked up once the item count changes. Items are
+    written once by dataset ingestion here, so this only matters for edits
+    made directly in Langfuse.
+
+    Args:
+        langfuse: Configured Langfuse client
+        dataset_name: Name of the dataset in Langfuse
+
+    Returns:
+        Tuple of (Langfuse dataset ID, fingerprint)
+    """
+    dataset = langfuse.api.datasets.get(dataset_name)
+    page = langfuse.api.dataset_items.list(dataset_name=dataset_name, limit=1)
+    fingerprint = (
+        f"v{SNAPSHOT_FORMAT_VERSION}-{page.meta.total_items}-"
+        f"{int(dataset.updated_at.timestamp())}"
+    )
+    return dataset.id, fingerprint
+
+
+def write_dataset_snapshot(
+    storage: CloudStorage,
+    langfuse_dataset_id: str,
+    fingerprint: str,
+    items: list[dict[str, Any]],
+) -> str:
+    """
+    Write dataset items to the object store as gzip JSONL.
+
+    Args:
+        storage: CloudStorage instance of the dataset's project
+        langfuse_dataset_id: Langfuse ID of the dataset
+        fingerprint: Fingerprint from get_dataset_fingerprint()
+        items: Dataset items as returned by fetch_dataset_items()
+
+    Returns:
+        Object store URL of the snapshot
+
+    Raises:
+        CloudStorageError: If the upload fails
+    """
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb") as gz:
+        for item in items:
+            gz.write(json.dumps(item, separators=(",", ":")).encode("utf-8"))
+            gz.write(b"\n")
+
+    file_path = (
+        Path(SNAPSHOT_SUBDIRECTORY) / langfuse_dataset_id / f"{fingerprint}.jsonl.gz"
+    )
+    destination = storage.put(
+        source=_SnapshotFile(buffer.getvalue()), file_path=file_path
+    )
+    url = str(destination)
+
+    logger.info(
+        f"[write_dataset_snapshot] Wrote dataset snapshot | "
+        f"langfuse_id={langfuse_dataset_id} | fingerprint={fingerprint} | "
+        f"items={len(items)} | size={buffer.tell()} bytes"
+    )
+    return url
+
+
+def read_dataset_snapshot(storage: CloudStorage, url: str) -> list[dict[str, Any]]:
+    """
+    Read dataset items from a snapshot written by write_dataset_snapshot().
+
+    Args:
+        storage: CloudStorage instance of the dataset's project
+        url: Object store URL of the snapshot
+
+    Returns:
+        List of dataset items with id, input, expected_output and metadata
+
+    Raises:
+        CloudStorageError: If the snapshot cannot be streamed
+        ValueError: If the snapshot is empty
+    """
+    body = storage.stream(url)
+    try:
+        with gzip.GzipFile(fileobj=body, mode="rb") as gz:
+            items = [json.loads(line) for line in gz if line.strip()]
+    finally:
+        body.close()
+
+    if not items:
+        raise ValueError(f"Dataset snapshot is empty: {url}")
+    return items
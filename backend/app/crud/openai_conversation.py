@@ -4,6 +4,7 @@ from sqlmodel import Session, select, func
 
 from app.models import OpenAIConversation, OpenAIConversationCreate
 from app.core.util import now
+from app.crud.pagination import CountMode, Page, paginate
 
 logger = logging.getLogger(__name__)
 
@@ -137,6 +138,35 @@ def get_conversations_by_project(
     return results
 
 
+def get_conversations_page_by_project(
+    session: Session,
+    project_id: int,
+    limit: int = 100,
+    cursor: str | None = None,
+    skip: int | None = None,
+    count: CountMode = CountMode.EXACT,
+) -> Page[OpenAIConversation]:
+    """
+    Return one page of conversations for a given project, newest first.
+
+    See app.crud.pagination.paginate for the cursor and count semantics.
+    """
+    statement = select(OpenAIConversation).where(
+        OpenAIConversation.project_id == project_id,
+        OpenAIConversation.is_deleted == False,
+    )
+    return paginate(
+        session,
+        statement,
+        sort_column=OpenAIConversation.inserted_at,
+        id_column=OpenAIConversation.id,
+        limit=limit,
+        cursor=cursor,
+        skip=skip,
+        count=count,
+    )
+
+
 def create_conversation(
     session: Session,
     conversation: OpenAIConversationCreate,
@@ -0,0 +1,229 @@
+"""
+Keyset pagination for project-scoped list endpoints.
+
+Rows are ordered newest first by a timestamp column with the primary key as
+a tie-breaker, and each page ends with an opaque cursor holding the last
+row's (timestamp, id). The next page seeks past that pair, so reading page N
+costs the same as reading page 1 instead of scanning every skipped row.
+"""
+
+import base64
+import binascii
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Generic, TypeVar
+
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlmodel import Session, func, select
+from sqlmodel.sql.expression import SelectOfScalar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CountMode(str, Enum):
+    """How the total row count of a listing is reported."""
+
+    NONE = "none"
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+
+
+@dataclass
+class Page(Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
+    total: int | None = None
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """Pagination metadata for the API response."""
+        metadata = {"next_cursor": self.next_cursor}
+        if self.total is not None:
+            metadata["total"] = self.total
+        return metadata
+
+
+def _encode_payload(payload: dict[str, str]) -> str:
+    encoded = json.dumps(payload).encode()
+    return base64.urlsafe_b64encode(encoded).decode().rstrip("=")
+
+
+def _decode_payload(cursor: str) -> dict[str, Any]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded))
+
+
+def _invalid_cursor(cursor: str, err: Exception) -> HTTPException:
+    logger.warning(
+        f"[decode_cursor] Invalid cursor | {{'cursor': '{cursor}', 'error': '{err}'}}"
+    )
+    return HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def encode_cursor(sort_value: datetime, row_id: Any) -> str:
+    return _encode_payload({"k": sort_value.isoformat(), "id": str(row_id)})
+
+
+def decode_cursor(
+    cursor: str, id_column: InstrumentedAttribute
+) -> tuple[datetime, Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        payload = _decode_payload(cursor)
+        sort_value = datetime.fromisoformat(payload["k"])
+        row_id = id_column.type.python_type(payload["id"])
+    except (binascii.Error, ValueError, TypeError, KeyError) as err:
+        raise _invalid_cursor(cursor, err)
+    return sort_value, row_id
+
+
+def encode_id_cursor(row_id: Any) -> str:
+    return _encode_payload({"id": str(row_id)})
+
+
+def decode_id_cursor(cursor: str, id_column: InstrumentedAttribute) -> Any:
+    """
+    Decode a cursor produced by encode_id_cursor.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        return id_column.type.python_type(_decode_payload(cursor)["id"])
+    except (binascii.Error, ValueError, TypeError, KeyError) as err:
+        raise _invalid_cursor(cursor, err)
+
+
+def estimate_count(session: Session, statement: SelectOfScalar) -> int:
+    """
+    Return the planner's row estimate for a statement without running it.
+
+    The estimate comes from table statistics (pg_class.reltuples and column
+    statistics) kept current by autovacuum, so it is cheap at any table size
+    but may be off by a few percent.
+    """
+    compiled = statement.compile(dialect=session.get_bind().dialect)
+    plan = (
+        session.connection()
+        .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params)
+        .scalar_one()
+    )
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def paginate(
+    session: Session,
+    statement: SelectOfScalar,
+    sort_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    limit: int,
+    cursor: str | None = None,
+    skip: int | None = None,
+    count: CountMode = CountMode.NONE,
+) -> Page:
+    """
+    Read one page of a filtered select, newest first.
+
+    Args:
+        session: Database session
+        statement: Select with the listing's filters applied, unordered
+        sort_column: Timestamp column to order by
+        id_column: Primary key, used as the tie-breaker
+        limit: Maximum rows in the page
+        cursor: Cursor from the previous page, if any
+        skip: Legacy offset, applied only when no cursor is given
+        count: Whether to report the total row count, and how
+
+    Returns:
+        Page with the rows, the cursor of the next page (None on the last
+        page) and the total if requested
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    total = None
+    if count == CountMode.EXACT:
+        total = session.exec(
+            select(func.count()).select_from(statement.subquery())
+        ).one()
+    elif count == CountMode.ESTIMATED:
+        total = estimate_count(session, statement)
+
+    page_statement = statement.order_by(sort_column.desc(), id_column.desc())
+    if cursor is not None:
+        page_statement = page_statement.where(
+            tuple_(sort_column, id_column) < tuple_(*decode_cursor(cursor, id_column))
+        )
+    elif skip:
+        page_statement = page_statement.offset(skip)
+
+    # One extra row tells whether another page follows
+    rows = session.exec(page_statement.limit(limit + 1)).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            getattr(last, sort_column.key), getattr(last, id_column.key)
+        )
+
+    return Page(items=list(rows), next_cursor=next_cursor, total=total)
+
+
+def paginate_by_id(
+    session: Session,
+    statement: SelectOfScalar,
+    id_column: InstrumentedAttribute,
+    limit: int,
+    cursor: str | None = None,
+    skip: int | None = None,
+) -> Page:
+    """
+    Read one page of a filtered select in ascending primary key order.
+
+    For listings whose natural order is insertion order (e.g. per-item
+    results of a run), the primary key alone is the keyset.
+
+    Args:
+        session: Database session
+        statement: Select with the listing's filters applied, unordered
+        id_column: Primary key to order and seek by
+        limit: Maximum rows in the page
+        cursor: Cursor from the previous page, if any
+        skip: Legacy offset, applied only when no cursor is given
+
+    Returns:
+        Page with the rows and the cursor of the next page (None on the last
+        page)
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    page_statement = statement.order_by(id_column)
+    if cursor is not None:
+        page_statement = page_statement.where(
+            id_column > decode_id_cursor(cursor, id_column)
+        )
+    elif skip:
+        page_statement = page_statement.offset(skip)
+
+    # One extra row tells whether another page follows
+    rows = session.exec(page_statement.limit(limit + 1)).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_id_cursor(getattr(rows[-1], id_column.key))
+
+    return Page(items=list(rows), next_cursor=next_cursor)
@@ -49,6 +49,9 @@ from .document import (
     DocTransformationJobsPublic,
     TransformedDocumentPublic,
     DocumentUploadResponse,
+    DocumentUploadURLRequest,
+    DocumentUploadURLResponse,
+    DocumentFinalizeRequest,
     TransformationJobInfo,
 )
 from .doc_transformation_job import (
@@ -67,9 +70,13 @@ from .batch_job import (
 )
 
 from .evaluation import (
+    EmbeddingCache,
     EvaluationDataset,
     EvaluationDatasetCreate,
     EvaluationDatasetPublic,
+    EvaluationResult,
+    EvaluationResultPublic,
+    EvaluationResultSummary,
     EvaluationRun,
     EvaluationRunCreate,
     EvaluationRunPublic,
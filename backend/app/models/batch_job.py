@@ -103,6 +103,27 @@ class BatchJob(SQLModel, table=True):
         description="Error message if batch failed",
     )
 
+    # Sharding - a logical batch too large for one provider batch is split
+    # into shard rows that point at a parent row without provider IDs
+    parent_id: int | None = Field(
+        default=None,
+        foreign_key="batch_job.id",
+        nullable=True,
+        ondelete="CASCADE",
+        index=True,
+        description="Reference to the logical batch job this shard belongs to",
+        sa_column_kwargs={
+            "comment": "Reference to the logical batch job this shard belongs to"
+        },
+    )
+    shard_index: int | None = Field(
+        default=None,
+        description="Position of this shard within its parent batch job",
+        sa_column_kwargs={
+            "comment": "Position of this shard within its parent batch job"
+        },
+    )
+
     # Foreign keys
     organization_id: int = Field(
         foreign_key="organization.id",
@@ -134,6 +155,12 @@ class BatchJob(SQLModel, table=True):
     # Relationships
     organization: Optional["Organization"] = Relationship()
     project: Optional["Project"] = Relationship()
+    shards: list["BatchJob"] = Relationship(
+        sa_relationship_kwargs={
+            "order_by": "BatchJob.shard_index",
+            "passive_deletes": True,
+        }
+    )
 
 
 class BatchJobCreate(SQLModel):
@@ -149,6 +176,8 @@ class BatchJobCreate(SQLModel):
     raw_output_url: str | None = None
     total_items: int = 0
     error_message: str | None = None
+    parent_id: int | None = None
+    shard_index: int | None = None
     organization_id: int
     project_id: int
 
@@ -179,6 +208,8 @@ class BatchJobPublic(SQLModel):
     raw_output_url: str | None
     total_items: int
     error_message: str | None
+    parent_id: int | None
+    shard_index: int | None
     organization_id: int
     project_id: int
     inserted_at: datetime
@@ -3,7 +3,7 @@ from typing import Any, Literal
 from uuid import UUID, uuid4
 
 from pydantic import HttpUrl, model_validator
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Index, Relationship, SQLModel
 
 from app.core.util import now
 from app.models.document import DocumentPublic
@@ -15,6 +15,15 @@ from .project import Project
 class Collection(SQLModel, table=True):
     """Database model for Collection operations."""
 
+    __table_args__ = (
+        Index(
+            "idx_collection_project_inserted_at_id",
+            "project_id",
+            "inserted_at",
+            "id",
+        ),
+    )
+
     id: UUID = Field(
         default_factory=uuid4,
         primary_key=True,
@@ -40,9 +40,10 @@ class Config(ConfigBase, table=True):
             postgresql_where=text("deleted_at IS NULL"),
         ),
         Index(
-            "idx_config_project_id_updated_at_active",
+            "idx_config_project_id_updated_at_id_active",
             "project_id",
             "updated_at",
+            "id",
             postgresql_where=text("deleted_at IS NULL"),
         ),
     )
@@ -1,6 +1,8 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
+from pydantic import field_validator
+from sqlalchemy import BigInteger, Index
 from sqlmodel import Field, SQLModel
 
 from app.core.util import now
@@ -28,6 +30,11 @@ class DocumentBase(SQLModel):
 class Document(DocumentBase, table=True):
     """Database model for documents."""
 
+    __table_args__ = (
+        Index("idx_document_project_sha256", "project_id", "sha256"),
+        Index("idx_document_project_inserted_at_id", "project_id", "inserted_at", "id"),
+    )
+
     id: UUID = Field(
         default_factory=uuid4,
         primary_key=True,
@@ -41,6 +48,23 @@ class Document(DocumentBase, table=True):
         default=False,
         sa_column_kwargs={"comment": "Soft delete flag"},
     )
+    is_pending: bool = Field(
+        default=False,
+        sa_column_kwargs={
+            "comment": "Whether a direct upload is still awaiting finalization",
+            "server_default": "false",
+        },
+    )
+    file_size_bytes: int | None = Field(
+        default=None,
+        sa_type=BigInteger,
+        sa_column_kwargs={"comment": "Size of the stored file in bytes"},
+    )
+    sha256: str | None = Field(
+        default=None,
+        max_length=64,
+        sa_column_kwargs={"comment": "SHA-256 (hex) of the stored file"},
+    )
 
     # Foreign keys
     source_document_id: UUID | None = Field(
@@ -80,6 +104,12 @@ class DocumentPublic(DocumentBase):
     updated_at: datetime = Field(
         description="The timestamp when the document was last updated"
     )
+    file_size_bytes: int | None = Field(
+        default=None, description="Size of the stored file in bytes"
+    )
+    sha256: str | None = Field(
+        default=None, description="SHA-256 (hex) of the stored file"
+    )
     signed_url: str | None = Field(
         default=None, description="A signed URL for accessing the document"
     )
@@ -104,9 +134,56 @@ class TransformationJobInfo(SQLModel):
 
 class DocumentUploadResponse(DocumentPublic):
     signed_url: str = Field(description="A signed URL for accessing the document")
+    is_duplicate: bool = Field(
+        default=False,
+        description="Whether the content matched an existing document, which is returned instead",
+    )
     transformation_job: TransformationJobInfo | None = None
 
 
+class DocumentUploadURLRequest(SQLModel):
+    fname: str = Field(description="The original filename of the document")
+    sha256: str = Field(
+        description="SHA-256 (hex) of the file content; the upload is rejected if it does not match",
+        min_length=64,
+        max_length=64,
+    )
+    content_type: str | None = Field(
+        default=None, description="Content type the file will be uploaded with"
+    )
+
+    @field_validator("sha256")
+    @classmethod
+    def validate_sha256(cls, value: str) -> str:
+        try:
+            bytes.fromhex(value)
+        except ValueError:
+            raise ValueError("sha256 must be a hexadecimal digest")
+        return value.lower()
+
+
+class DocumentUploadURLResponse(SQLModel):
+    id: UUID = Field(description="The unique identifier of the pending document")
+    upload_url: str = Field(description="Presigned URL to PUT the file content to")
+    upload_headers: dict[str, str] = Field(
+        description="Headers that must be sent with the PUT request"
+    )
+    expires_in: int = Field(description="Seconds until the upload URL expires")
+
+
+class DocumentFinalizeRequest(SQLModel):
+    target_format: str | None = Field(
+        default=None,
+        description="Desired output format for the uploaded document (e.g., pdf, docx, txt).",
+    )
+    transformer: str | None = Field(
+        default=None, description="Name of the transformer to apply when converting."
+    )
+    callback_url: str | None = Field(
+        default=None, description="URL to call to report doc transformation status"
+    )
+
+
 class DocTransformationJobPublic(SQLModel):
     job_id: UUID
     source_document_id: UUID
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
 from pydantic import BaseModel, Field
-from sqlalchemy import Column, Index, Text, UniqueConstraint
+from sqlalchemy import Column, Index, LargeBinary, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field as SQLField
 from sqlmodel import Relationship, SQLModel
@@ -42,6 +42,11 @@ class DatasetUploadResponse(BaseModel):
     object_store_url: str | None = Field(
         None, description="Object store URL if uploaded"
     )
+    progress: dict[str, Any] | None = Field(
+        None,
+        description="Ingestion progress (stage, items_processed, error) if the "
+        "dataset was ingested in the background",
+    )
 
 
 class EvaluationResult(BaseModel):
@@ -128,6 +133,19 @@ class EvaluationDataset(SQLModel, table=True):
             "comment": "Langfuse dataset ID for observability integration"
         },
     )
+    progress: dict[str, Any] | None = SQLField(
+        default=None,
+        sa_column=Column(
+            JSONB,
+            nullable=True,
+            comment="Progress of dataset ingestion (stage, task_id, items_processed)",
+        ),
+        description=(
+            "Progress of dataset ingestion in the background job: stage (queued, "
+            "ingesting, completed, failed), task_id, items_processed and error. "
+            "Datasets created before background ingestion have no progress."
+        ),
+    )
 
     # Foreign keys
     organization_id: int = SQLField(
@@ -252,6 +270,32 @@ class EvaluationRun(SQLModel, table=True):
         description="Total number of items evaluated (set during processing)",
         sa_column_kwargs={"comment": "Total number of items evaluated"},
     )
+    progress: dict[str, Any] | None = SQLField(
+        default=None,
+        sa_column=Column(
+            JSONB,
+            nullable=True,
+            comment="Progress of run creation (stage, task_id, total_items)",
+        ),
+        description=(
+            "Progress of run creation in the background job: stage (queued, "
+            "fetching_dataset, submitting_batch, submitted, failed), task_id "
+            "and total_items"
+        ),
+    )
+
+    dataset_snapshot: dict[str, Any] | None = SQLField(
+        default=None,
+        sa_column=Column(
+            JSONB,
+            nullable=True,
+            comment="Dataset item snapshot the run was submitted with (url, fingerprint)",
+        ),
+        description=(
+            "Object store snapshot of the dataset items the run was submitted "
+            "with (url, fingerprint), read back when its results are processed"
+        ),
+    )
 
     # Score field - dict requires sa_column
     score: dict[str, Any] | None = SQLField(
@@ -319,6 +363,173 @@ class EvaluationRun(SQLModel, table=True):
     )
 
 
+class EmbeddingCache(SQLModel, table=True):
+    """
+    Database table caching embeddings of evaluation texts.
+
+    Entries are content addressed by the sha256 of the embedded text, so a
+    ground truth answer is embedded once per project, model and dimension
+    setting and reused by every later evaluation run.
+    """
+
+    __tablename__ = "embedding_cache"
+    __table_args__ = (
+        UniqueConstraint(
+            "project_id",
+            "model",
+            "dimensions",
+            "text_hash",
+            name="uq_embedding_cache_project_model_dimensions_hash",
+        ),
+    )
+
+    id: int = SQLField(
+        default=None,
+        primary_key=True,
+        sa_column_kwargs={"comment": "Unique identifier for the cache entry"},
+    )
+    model: str = SQLField(
+        description="Embedding model used",
+        sa_column_kwargs={
+            "comment": "Embedding model used (e.g., text-embedding-3-large)"
+        },
+    )
+    dimensions: int = SQLField(
+        description="Number of dimensions of the embedding",
+        sa_column_kwargs={"comment": "Number of dimensions of the embedding"},
+    )
+    text_hash: str = SQLField(
+        max_length=64,
+        description="Hex sha256 of the embedded text",
+        sa_column_kwargs={"comment": "Hex sha256 of the embedded text"},
+    )
+    embedding: bytes = SQLField(
+        sa_column=Column(
+            LargeBinary,
+            nullable=False,
+            comment="Embedding vector as little-endian float32 bytes",
+        ),
+        description="Embedding vector as little-endian float32 bytes",
+    )
+
+    project_id: int = SQLField(
+        foreign_key="project.id",
+        nullable=False,
+        ondelete="CASCADE",
+        sa_column_kwargs={"comment": "Reference to the project"},
+    )
+    inserted_at: datetime = SQLField(
+        default_factory=now,
+        nullable=False,
+        sa_column_kwargs={"comment": "Timestamp when the embedding was cached"},
+    )
+
+
+class EvaluationResult(SQLModel, table=True):
+    """
+    Database table for per-item results of an evaluation run.
+
+    Rows are bulk loaded when the response batch completes and their cosine
+    scores filled in when the embedding batch completes, so run statistics and
+    item views are served by SQL instead of the object store or Langfuse.
+    """
+
+    __tablename__ = "evaluation_result"
+    __table_args__ = (
+        UniqueConstraint(
+            "evaluation_run_id",
+            "item_id",
+            name="uq_evaluation_result_run_item",
+        ),
+        Index("idx_evaluation_result_run_trace", "evaluation_run_id", "trace_id"),
+    )
+
+    id: int = SQLField(
+        default=None,
+        primary_key=True,
+        sa_column_kwargs={"comment": "Unique identifier for the evaluation result"},
+    )
+    evaluation_run_id: int = SQLField(
+        foreign_key="evaluation_run.id",
+        nullable=False,
+        ondelete="CASCADE",
+        sa_column_kwargs={"comment": "Reference to the evaluation run"},
+    )
+    item_id: str = SQLField(
+        description="Langfuse dataset item ID",
+        sa_column_kwargs={"comment": "Langfuse dataset item ID"},
+    )
+    trace_id: str | None = SQLField(
+        default=None,
+        description="Langfuse trace ID of the item in the dataset run",
+        sa_column_kwargs={"comment": "Langfuse trace ID of the item"},
+    )
+    question: str = SQLField(
+        sa_column=Column(Text, nullable=False, comment="Question sent to the model"),
+        description="Question sent to the model",
+    )
+    generated_output: str = SQLField(
+        sa_column=Column(Text, nullable=False, comment="Output generated by the model"),
+        description="Output generated by the model",
+    )
+    ground_truth: str = SQLField(
+        sa_column=Column(Text, nullable=False, comment="Expected answer"),
+        description="Expected answer",
+    )
+    cosine_similarity: float | None = SQLField(
+        default=None,
+        description="Cosine similarity between output and ground truth embeddings",
+        sa_column_kwargs={
+            "comment": "Cosine similarity between output and ground truth embeddings"
+        },
+    )
+    input_tokens: int | None = SQLField(
+        default=None,
+        sa_column_kwargs={"comment": "Input tokens used for the response"},
+    )
+    output_tokens: int | None = SQLField(
+        default=None,
+        sa_column_kwargs={"comment": "Output tokens used for the response"},
+    )
+    total_tokens: int | None = SQLField(
+        default=None,
+        sa_column_kwargs={"comment": "Total tokens used for the response"},
+    )
+    inserted_at: datetime = SQLField(
+        default_factory=now,
+        nullable=False,
+        sa_column_kwargs={"comment": "Timestamp when the result was stored"},
+    )
+
+
+class EvaluationResultPublic(SQLModel):
+    """Public model for a per-item evaluation result."""
+
+    item_id: str
+    trace_id: str | None
+    question: str
+    generated_output: str
+    ground_truth: str
+    cosine_similarity: float | None
+    input_tokens: int | None
+    output_tokens: int | None
+    total_tokens: int | None
+
+
+class EvaluationResultSummary(SQLModel):
+    """Summary statistics over the per-item results of an evaluation run."""
+
+    total_items: int
+    scored_items: int
+    cosine_similarity_avg: float | None
+    cosine_similarity_std: float | None
+    cosine_similarity_min: float | None
+    cosine_similarity_max: float | None
+    input_tokens: int
+    output_tokens: int
+    total_tokens: int
+
+
 class EvaluationRunCreate(SQLModel):
     """Model for creating an evaluation run."""
 
@@ -346,6 +557,7 @@ class EvaluationRunPublic(SQLModel):
     status: str
     object_store_url: str | None
     total_items: int
+    progress: dict[str, Any] | None = None
     score: dict[str, Any] | None
     error_message: str | None
     organization_id: int
@@ -2,7 +2,7 @@ import re
 from datetime import datetime
 
 from pydantic import field_validator
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Index, Relationship, SQLModel
 
 from app.core.util import now
 from app.models.organization import Organization
@@ -85,6 +85,14 @@ class OpenAIConversation(OpenAIConversationBase, table=True):
     """Stores OpenAI conversation history and responses."""
 
     __tablename__ = "openai_conversation"
+    __table_args__ = (
+        Index(
+            "idx_openai_conversation_project_inserted_at_id",
+            "project_id",
+            "inserted_at",
+            "id",
+        ),
+    )
 
     id: int = Field(
         default=None,
@@ -245,8 +245,13 @@ def execute_job(
             )
 
         file_exts = {doc.fname.split(".")[-1] for doc in flat_docs if "." in doc.fname}
+        # Sizes are recorded at upload; only documents uploaded before that
+        # (and not yet backfilled) need a HEAD request
         file_sizes_kb = [
-            storage.get_file_size_kb(doc.object_store_url) for doc in flat_docs
+            round(doc.file_size_bytes / 1024, 2)
+            if doc.file_size_bytes is not None
+            else storage.get_file_size_kb(doc.object_store_url)
+            for doc in flat_docs
         ]
 
         with Session(engine) as session:
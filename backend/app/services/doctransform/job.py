@@ -22,6 +22,7 @@ from app.models import (
     DocTransformationJob,
 )
 from app.core.cloud import get_cloud_storage
+from app.core.cloud.storage import describe_file
 from app.celery.utils import start_low_priority_job
 from app.utils import send_callback, APIResponse
 from app.services.doctransform.registry import convert_document, FORMAT_TO_EXTENSION
@@ -150,11 +151,9 @@ def execute_job(
             storage = get_cloud_storage(session=db, project_id=project_id)
 
         # --- download source ---
-        body = storage.stream(source_doc_object_store_url)
         tmp_dir = Path(tempfile.mkdtemp())
         tmp_in = tmp_dir / f"{source_doc_id}"
-        with open(tmp_in, "wb") as f:
-            shutil.copyfileobj(body, f)
+        storage.download(source_doc_object_store_url, tmp_in)
 
         # --- transform ---
         fname_no_ext = Path(source_doc_fname).stem
@@ -174,7 +173,10 @@ def execute_job(
                 file=fobj,
                 headers=Headers({"content-type": content_type}),
             )
-            dest = storage.put(file_upload, Path(str(transformed_doc_id)))
+            stored = describe_file(fobj)
+            dest = storage.put(
+                file_upload, Path(str(transformed_doc_id)), sha256=stored.sha256
+            )
 
         with Session(engine) as db:
             new_doc = Document(
@@ -183,6 +185,8 @@ def execute_job(
                 fname=tmp_out.name,
                 object_store_url=str(dest),
                 source_document_id=source_doc_id,
+                file_size_bytes=stored.size_bytes,
+                sha256=stored.sha256,
             )
             created = DocumentCrud(db, project_id).update(new_doc)
 
@@ -0,0 +1,142 @@
+"""
+Backfill file_size_bytes and sha256 for documents uploaded before they were
+recorded at upload time.
+
+Run once after deploying the columns (it is safe to re-run or interrupt):
+
+    python -m app.services.documents.backfill
+"""
+
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from uuid import UUID
+
+from sqlmodel import Session, and_, select
+
+from app.core.cloud import CloudStorage, CloudStorageError, get_cloud_storage
+from app.core.cloud.storage import TRANSFER_BLOCK_SIZE, StoredObject
+from app.models import Document
+
+logger = logging.getLogger(__name__)
+
+# Documents read from the database and committed together
+BACKFILL_BATCH_SIZE = 200
+# Concurrent object store requests while backfilling a batch
+BACKFILL_MAX_WORKERS = 8
+
+
+def read_stored_object(storage: CloudStorage, url: str) -> StoredObject:
+    """
+    Read the size and SHA-256 of a stored document.
+
+    Objects uploaded with their checksum in metadata need only a HEAD
+    request; older objects are streamed and hashed.
+    """
+    stored = storage.get_object_info(url)
+    if stored.sha256:
+        return stored
+
+    digest = hashlib.sha256()
+    body = storage.stream(url)
+    try:
+        for block in iter(lambda: body.read(TRANSFER_BLOCK_SIZE), b""):
+            digest.update(block)
+    finally:
+        body.close()
+    return StoredObject(size_bytes=stored.size_bytes, sha256=digest.hexdigest())
+
+
+def backfill_document_file_info(
+    session: Session,
+    batch_size: int = BACKFILL_BATCH_SIZE,
+    max_workers: int = BACKFILL_MAX_WORKERS,
+) -> int:
+    """
+    Record size and checksum for live documents that do not have them.
+
+    Documents are walked in id order, one batch per commit, so progress
+    survives interruption. Documents whose object cannot be read are logged
+    and skipped.
+
+    Args:
+        session: Database session
+        batch_size: Documents per batch
+        max_workers: Concurrent object store requests
+
+    Returns:
+        Number of documents updated
+    """
+    updated = 0
+    failed = 0
+    last_id: UUID | None = None
+    storages: dict[int, CloudStorage] = {}
+
+    while True:
+        conditions = [
+            Document.file_size_bytes.is_(None),
+            Document.is_deleted.is_(False),
+            Document.is_pending.is_(False),
+        ]
+        if last_id is not None:
+            conditions.append(Document.id > last_id)
+        documents = session.exec(
+            select(Document)
+            .where(and_(*conditions))
+            .order_by(Document.id)
+            .limit(batch_size)
+        ).all()
+        if not documents:
+            break
+        last_id = documents[-1].id
+
+        for document in documents:
+            if document.project_id not in storages:
+                storages[document.project_id] = get_cloud_storage(
+                    session=session, project_id=document.project_id
+                )
+
+        # Threads get plain values rather than session-bound objects
+        targets = [
+            (document.id, storages[document.project_id], document.object_store_url)
+            for document in documents
+        ]
+
+        def read(target: tuple[UUID, CloudStorage, str]) -> StoredObject | None:
+            doc_id, storage, url = target
+            try:
+                return read_stored_object(storage, url)
+            except CloudStorageError as err:
+                logger.warning(
+                    f"[backfill_document_file_info] Could not read document | "
+                    f"doc_id={doc_id} | {err}"
+                )
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(read, targets))
+
+        for document, stored in zip(documents, results):
+            if stored is None:
+                failed += 1
+                continue
+            document.file_size_bytes = stored.size_bytes
+            document.sha256 = stored.sha256
+            session.add(document)
+            updated += 1
+        session.commit()
+
+        logger.info(
+            f"[backfill_document_file_info] Batch done | "
+            f"updated={updated} | failed={failed} | last_id={last_id}"
+        )
+
+    return updated
+
+
+if __name__ == "__main__":
+    from app.core.db import engine
+
+    logging.basicConfig(level=logging.INFO)
+    with Session(engine) as session:
+        backfill_document_file_info(session)
@@ -0,0 +1,111 @@
+"""
+Remove direct uploads that were started but never finalized.
+
+/documents/upload-url creates a pending document row before the client has
+uploaded anything. If the client never finalizes, the row and any object it
+uploaded would stay forever, so pending documents older than the upload URL
+lifetime plus a grace period for finalizing are deleted together with their
+objects. It runs from the /cron/pending-uploads endpoint, or by hand:
+
+    python -m app.services.documents.cleanup
+"""
+
+import logging
+from datetime import timedelta
+from uuid import UUID
+
+from sqlmodel import Session, and_, select
+
+from app.core.cloud import CloudStorage, CloudStorageError, get_cloud_storage
+from app.core.util import now
+from app.models import Document
+
+logger = logging.getLogger(__name__)
+
+# Lifetime of presigned direct upload URLs, in seconds
+UPLOAD_URL_EXPIRES_IN = 3600
+# Time a client has to finalize after its upload URL expired, in seconds
+PENDING_UPLOAD_GRACE_PERIOD = 3600
+# Pending documents read from the database and deleted together
+CLEANUP_BATCH_SIZE = 200
+
+
+def delete_expired_pending_uploads(
+    session: Session,
+    max_age: timedelta = timedelta(
+        seconds=UPLOAD_URL_EXPIRES_IN + PENDING_UPLOAD_GRACE_PERIOD
+    ),
+    batch_size: int = CLEANUP_BATCH_SIZE,
+) -> int:
+    """
+    Delete pending documents older than max_age and their uploaded objects.
+
+    Documents are walked in id order, one batch per commit. A document whose
+    object cannot be deleted is logged and kept, so it is retried on the next
+    run instead of leaving an orphaned object behind.
+
+    Args:
+        session: Database session
+        max_age: Age after which a pending document is abandoned
+        batch_size: Documents per batch
+
+    Returns:
+        Number of documents deleted
+    """
+    cutoff = now() - max_age
+    deleted = 0
+    failed = 0
+    last_id: UUID | None = None
+    storages: dict[int, CloudStorage] = {}
+
+    while True:
+        conditions = [
+            Document.is_pending.is_(True),
+            Document.is_deleted.is_(False),
+            Document.inserted_at < cutoff,
+        ]
+        if last_id is not None:
+            conditions.append(Document.id > last_id)
+        documents = session.exec(
+            select(Document)
+            .where(and_(*conditions))
+            .order_by(Document.id)
+            .limit(batch_size)
+        ).all()
+        if not documents:
+            break
+        last_id = documents[-1].id
+
+        for document in documents:
+            if document.project_id not in storages:
+                storages[document.project_id] = get_cloud_storage(
+                    session=session, project_id=document.project_id
+                )
+            try:
+                # Deleting an object that was never uploaded is a no-op
+                storages[document.project_id].delete(document.object_store_url)
+            except CloudStorageError as err:
+                logger.warning(
+                    f"[delete_expired_pending_uploads] Could not delete object | "
+                    f"doc_id={document.id} | {err}"
+                )
+                failed += 1
+                continue
+            session.delete(document)
+            deleted += 1
+        session.commit()
+
+        logger.info(
+            f"[delete_expired_pending_uploads] Batch done | "
+            f"deleted={deleted} | failed={failed} | last_id={last_id}"
+        )
+
+    return deleted
+
+
+if __name__ == "__main__":
+    from app.core.db import engine
+
+    logging.basicConfig(level=logging.INFO)
+    with Session(engine) as session:
+        delete_expired_pending_uploads(session)
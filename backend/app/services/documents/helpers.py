@@ -4,6 +4,7 @@ from uuid import UUID
 from fastapi import HTTPException
 
 from app.services.doctransform.registry import (
+    FORMAT_TO_EXTENSION,
     get_available_transformers,
     get_file_format,
     is_transformation_supported,
@@ -106,6 +107,48 @@ def schedule_transformation(
     )
 
 
+def reuse_or_schedule_transformation(
+    *,
+    session,
+    project_id: int,
+    source_format: str,
+    target_format: str | None,
+    actual_transformer: str | None,
+    source_document_id: UUID,
+    callback_url: str | None,
+) -> TransformationJobInfo | None:
+    """
+    For a document that already existed (a duplicate upload), return its
+    completed transformation to the requested format instead of running
+    the transformer again; otherwise schedule one as usual.
+
+    Jobs do not record their transformer, so a completed job is matched on
+    the extension of its output document.
+    """
+    if target_format and actual_transformer:
+        extension = FORMAT_TO_EXTENSION.get(target_format, f".{target_format}")
+        job_crud = DocTransformationJobCrud(session, project_id)
+        for job, output in job_crud.read_completed_outputs(source_document_id):
+            if output.fname.endswith(extension):
+                return TransformationJobInfo(
+                    message=f"Document was already transformed from {source_format} to {target_format}.",
+                    job_id=job.id,
+                    status=TransformationStatus.COMPLETED,
+                    transformer=actual_transformer,
+                    status_check_url=f"/documents/transformation/{job.id}",
+                )
+
+    return schedule_transformation(
+        session=session,
+        project_id=project_id,
+        source_format=source_format,
+        target_format=target_format,
+        actual_transformer=actual_transformer,
+        source_document_id=source_document_id,
+        callback_url=callback_url,
+    )
+
+
 PublicDoc = Union[DocumentPublic, TransformedDocumentPublic]
 
 
@@ -133,11 +176,18 @@ def build_document_schemas(
     include_url: bool,
     storage: object | None,
 ) -> list[PublicDoc]:
+    documents = list(documents)
+    signed_urls = (
+        storage.get_signed_urls([doc.object_store_url for doc in documents])
+        if include_url and storage
+        else {}
+    )
+
     out: list[PublicDoc] = []
     for doc in documents:
         schema = _to_public_schema(doc)
-        if include_url and storage:
-            schema.signed_url = storage.get_signed_url(doc.object_store_url)
+        if doc.object_store_url in signed_urls:
+            schema.signed_url = signed_urls[doc.object_store_url]
         out.append(schema)
     return out
 
@@ -171,20 +221,37 @@ def build_job_schema(
 
 def build_job_schemas(
     *,
-    jobs: Iterable[DocTransformationJob],
-    doc_crud: DocumentCrud,
+    jobs: Iterable[tuple[DocTransformationJob, Document | None]],
     include_url: bool,
     storage: object | None,
 ) -> list[DocTransformationJobPublic]:
-    """Build many job schemas efficiently."""
+    """
+    Build many job schemas from jobs loaded with their transformed
+    documents (see DocTransformationJobCrud.read_each_with_outputs), signing
+    all document URLs in one call.
+    """
+    jobs = list(jobs)
+    signed_urls = (
+        storage.get_signed_urls([doc.object_store_url for _, doc in jobs if doc])
+        if include_url and storage
+        else {}
+    )
+
     out: list[DocTransformationJobPublic] = []
-    for job in jobs:
+    for job, doc in jobs:
+        transformed_doc_schema: TransformedDocumentPublic | None = None
+        if doc is not None:
+            transformed_doc_schema = TransformedDocumentPublic.model_validate(
+                doc, from_attributes=True
+            )
+            transformed_doc_schema.signed_url = signed_urls.get(doc.object_store_url)
+
+        job_schema = DocTransformationJobPublic.model_validate(
+            job, from_attributes=True
+        )
         out.append(
-            build_job_schema(
-                job=job,
-                doc_crud=doc_crud,
-                include_url=include_url,
-                storage=storage,
+            job_schema.model_copy(
+                update={"transformed_document": transformed_doc_schema}
             )
         )
     return out
@@ -0,0 +1,174 @@
+import logging
+from typing import Any
+
+from asgi_correlation_id import correlation_id
+from sqlmodel import Session
+
+from app.celery.utils import start_low_priority_job
+from app.core.cloud import get_cloud_storage
+from app.core.db import engine
+from app.crud.evaluations.dataset import iter_csv_items, update_evaluation_dataset
+from app.crud.evaluations.langfuse import upload_dataset_items_to_langfuse
+from app.models import EvaluationDataset
+from app.utils import get_langfuse_client
+
+logger = logging.getLogger(__name__)
+
+
+def start_job(db: Session, dataset: EvaluationDataset) -> EvaluationDataset:
+    """
+    Schedule the Celery task that ingests the uploaded CSV of a dataset.
+
+    The dataset is expected to be created with progress stage "queued" and an
+    object store URL, and is returned unchanged; the task records its ID on
+    the dataset once it starts. If the task cannot be scheduled, the dataset
+    is marked as failed instead.
+    """
+    trace_id = correlation_id.get() or "N/A"
+
+    try:
+        task_id = start_low_priority_job(
+            function_path="app.services.evaluations.ingestion.execute_job",
+            project_id=dataset.project_id,
+            job_id=str(dataset.id),
+            trace_id=trace_id,
+            organization_id=dataset.organization_id,
+        )
+    except Exception as e:
+        logger.error(
+            f"[start_job] Error starting Celery task | dataset_id={dataset.id} | {e}",
+            exc_info=True,
+        )
+        return update_evaluation_dataset(
+            session=db,
+            dataset=dataset,
+            progress={
+                "stage": "failed",
+                "error": f"Failed to schedule dataset ingestion: {e}",
+            },
+        )
+
+    logger.info(
+        f"[start_job] Job scheduled to ingest dataset | dataset_id={dataset.id} | "
+        f"project_id={dataset.project_id} | task_id={task_id}"
+    )
+    return dataset
+
+
+def execute_job(
+    project_id: int,
+    organization_id: int,
+    job_id: str,
+    task_id: str,
+    task_instance,
+) -> dict[str, Any]:
+    """
+    Celery task that streams a dataset CSV from the object store and uploads
+    its items to Langfuse.
+
+    The CSV is parsed one row at a time while items are uploaded, and
+    progress.items_processed is updated as rows are read. On success the
+    dataset gets its item counts and Langfuse dataset ID and progress stage
+    "completed". Failures are recorded on the dataset (progress stage
+    "failed" with the error) rather than raised, so the task is not retried.
+
+    Returns:
+        dict: dataset_id, stage and item counts of the dataset
+    """
+    dataset_id = int(job_id)
+
+    with Session(engine) as session:
+        dataset = session.get(EvaluationDataset, dataset_id)
+        if not dataset or dataset.project_id != project_id:
+            logger.error(
+                f"[execute_job] Dataset not found | dataset_id={dataset_id} | "
+                f"project_id={project_id}"
+            )
+            return {"dataset_id": dataset_id, "stage": "not_found"}
+
+        stage = (dataset.progress or {}).get("stage")
+        if stage != "queued":
+            logger.warning(
+                f"[execute_job] Dataset ingestion already started, skipping | "
+                f"dataset_id={dataset_id} | stage={stage}"
+            )
+            return {"dataset_id": dataset_id, "stage": stage}
+
+        dataset = update_evaluation_dataset(
+            session=session,
+            dataset=dataset,
+            progress={"stage": "ingesting", "task_id": task_id, "items_processed": 0},
+        )
+
+        def report_progress(items_processed: int) -> None:
+            update_evaluation_dataset(
+                session=session,
+                dataset=dataset,
+                progress={"items_processed": items_processed},
+            )
+
+        duplication_factor = dataset.dataset_metadata.get("duplication_factor", 1)
+        body = None
+        try:
+            langfuse = get_langfuse_client(
+                session=session, org_id=organization_id, project_id=project_id
+            )
+            storage = get_cloud_storage(session=session, project_id=project_id)
+            body = storage.stream(dataset.object_store_url)
+
+            (
+                langfuse_dataset_id,
+                original_items,
+                total_uploaded,
+            ) = upload_dataset_items_to_langfuse(
+                langfuse=langfuse,
+                items=iter_csv_items(body),
+                dataset_name=dataset.name,
+                duplication_factor=duplication_factor,
+                on_progress=report_progress,
+            )
+            if not original_items:
+                raise ValueError("No valid items found in CSV file")
+        except Exception as e:
+            error = getattr(e, "detail", None) or str(e)
+            logger.error(
+                f"[execute_job] Failed to ingest dataset | dataset_id={dataset_id} | {error}",
+                exc_info=True,
+            )
+            dataset = update_evaluation_dataset(
+                session=session,
+                dataset=dataset,
+                progress={"stage": "failed", "error": error},
+            )
+            return {"dataset_id": dataset_id, "stage": "failed"}
+        finally:
+            if body is not None:
+                body.close()
+
+        dataset = update_evaluation_dataset(
+            session=session,
+            dataset=dataset,
+            dataset_metadata={
+                **dataset.dataset_metadata,
+                "original_items_count": original_items,
+                "total_items_count": original_items * duplication_factor,
+            },
+            langfuse_dataset_id=langfuse_dataset_id,
+            progress={
+                "stage": "completed",
+                "items_processed": original_items,
+                "items_uploaded": total_uploaded,
+            },
+        )
+
+        logger.info(
+            f"[execute_job] Dataset ingested | dataset_id={dataset_id} | "
+            f"original_items={original_items} | uploaded={total_uploaded} | "
+            f"langfuse_id={langfuse_dataset_id} | task_id={task_id}"
+        )
+        return {
+            "dataset_id": dataset_id,
+            "stage": "completed",
+            "original_items": original_items,
+            "total_items": original_items * duplication_factor,
+        }
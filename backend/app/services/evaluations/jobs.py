@@ -0,0 +1,151 @@
+import logging
+
+from asgi_correlation_id import correlation_id
+from sqlmodel import Session
+
+from app.celery.utils import start_low_priority_job
+from app.core.db import engine
+from app.crud.evaluations.batch import start_evaluation_batch
+from app.crud.evaluations.core import update_evaluation_run
+from app.crud.evaluations.realtime import (
+    run_realtime_evaluation,
+    use_realtime_evaluation,
+)
+from app.models import EvaluationRun
+from app.utils import get_langfuse_client, get_openai_client
+
+logger = logging.getLogger(__name__)
+
+
+def start_job(db: Session, eval_run: EvaluationRun) -> EvaluationRun:
+    """
+    Schedule the Celery task that submits the batch of a pending evaluation run.
+
+    The run is expected to be created with progress stage "queued" and is
+    returned unchanged; the task records its ID on the run once it starts. If
+    the task cannot be scheduled, the run is marked as failed instead.
+    """
+    trace_id = correlation_id.get() or "N/A"
+
+    try:
+        task_id = start_low_priority_job(
+            function_path="app.services.evaluations.jobs.execute_job",
+            project_id=eval_run.project_id,
+            job_id=str(eval_run.id),
+            trace_id=trace_id,
+            organization_id=eval_run.organization_id,
+        )
+    except Exception as e:
+        logger.error(
+            f"[start_job] Error starting Celery task | evaluation_id={eval_run.id} | {e}",
+            exc_info=True,
+        )
+        return update_evaluation_run(
+            session=db,
+            eval_run=eval_run,
+            status="failed",
+            error_message=f"Failed to schedule evaluation: {e}",
+            progress={"stage": "failed"},
+        )
+
+    logger.info(
+        f"[start_job] Job scheduled to start evaluation | evaluation_id={eval_run.id} | "
+        f"project_id={eval_run.project_id} | task_id={task_id}"
+    )
+    return eval_run
+
+
+def execute_job(
+    project_id: int,
+    organization_id: int,
+    job_id: str,
+    task_id: str,
+    task_instance,
+) -> dict:
+    """
+    Celery task that fetches the dataset, builds the JSONL and submits the
+    evaluation batch of a pending run. Runs whose dataset has at most
+    settings.EVALUATION_REALTIME_MAX_ITEMS items are instead evaluated to
+    completion with realtime API calls (see run_realtime_evaluation).
+
+    Failures are recorded on the run (status "failed", progress stage
+    "failed") rather than raised, so the task is not retried against a run
+    whose state has already been updated.
+
+    Returns:
+        dict: evaluation_id, status and batch_job_id of the run
+    """
+    evaluation_id = int(job_id)
+
+    with Session(engine) as session:
+        eval_run = session.get(EvaluationRun, evaluation_id)
+        if not eval_run or eval_run.project_id != project_id:
+            logger.error(
+                f"[execute_job] Evaluation run not found | evaluation_id={evaluation_id} | "
+                f"project_id={project_id}"
+            )
+            return {"evaluation_id": evaluation_id, "status": "not_found"}
+
+        if eval_run.status != "pending":
+            logger.warning(
+                f"[execute_job] Evaluation run already started, skipping | "
+                f"evaluation_id={evaluation_id} | status={eval_run.status}"
+            )
+            return {"evaluation_id": evaluation_id, "status": eval_run.status}
+
+        eval_run = update_evaluation_run(
+            session=session, eval_run=eval_run, progress={"task_id": task_id}
+        )
+
+        try:
+            openai_client = get_openai_client(
+                session=session, org_id=organization_id, project_id=project_id
+            )
+            langfuse = get_langfuse_client(
+                session=session, org_id=organization_id, project_id=project_id
+            )
+        except Exception as e:
+            error = getattr(e, "detail", None) or str(e)
+            logger.error(
+                f"[execute_job] Failed to configure clients | evaluation_id={evaluation_id} | {error}"
+            )
+            eval_run = update_evaluation_run(
+                session=session,
+                eval_run=eval_run,
+                status="failed",
+                error_message=error,
+                progress={"stage": "failed"},
+            )
+            return {"evaluation_id": evaluation_id, "status": eval_run.status}
+
+        # Small datasets are evaluated right away with realtime API calls
+        if use_realtime_evaluation(session=session, eval_run=eval_run):
+            start_evaluation = run_realtime_evaluation
+        else:
+            start_evaluation = start_evaluation_batch
+
+        try:
+            eval_run = start_evaluation(
+                langfuse=langfuse,
+                openai_client=openai_client,
+                session=session,
+                eval_run=eval_run,
+                config=eval_run.config,
+            )
+        except Exception as e:
+            # The run has already been marked as failed
+            logger.error(
+                f"[execute_job] Failed to start evaluation | evaluation_id={evaluation_id} | {e}"
+            )
+            session.refresh(eval_run)
+
+        logger.info(
+            f"[execute_job] Evaluation start finished | evaluation_id={evaluation_id} | "
+            f"status={eval_run.status} | batch_job_id={eval_run.batch_job_id} | "
+            f"task_id={task_id}"
+        )
+        return {
+            "evaluation_id": evaluation_id,
+            "status": eval_run.status,
+            "batch_job_id": eval_run.batch_job_id,
+        }
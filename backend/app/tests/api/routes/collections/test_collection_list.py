@@ -125,3 +125,34 @@ def test_list_collections_does_not_error_with_no_collections(
     data = response.json()
     assert data["success"] is True
     assert isinstance(data["data"], list)
+
+
+def test_list_collections_paginates_with_cursor(
+    db: Session,
+    client: TestClient,
+    user_api_key_header,
+):
+    """
+    Following next_cursor visits each collection once, newest first.
+    """
+    project = get_project(db, "Dalgo")
+    for _ in range(3):
+        get_collection(db, project)
+
+    ids = []
+    params = {"limit": 2, "count": "exact"}
+    while True:
+        response = client.get(
+            f"{settings.API_V1_STR}/collections/",
+            headers=user_api_key_header,
+            params=params,
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert len(body["data"]) <= 2
+        ids.extend(row["id"] for row in body["data"])
+        if body["metadata"]["next_cursor"] is None:
+            break
+        params["cursor"] = body["metadata"]["next_cursor"]
+
+    assert len(ids) == len(set(ids)) == body["metadata"]["total"]
@@ -172,6 +172,36 @@ def test_list_configs_with_pagination(
     assert len(data["data"]) >= 2
 
 
+def test_list_configs_with_cursor(
+    db: Session,
+    client: TestClient,
+    user_api_key: TestAuthContext,
+) -> None:
+    """Test that following next_cursor visits each config once."""
+    for i in range(5):
+        create_test_config(
+            db=db, project_id=user_api_key.project_id, name=f"cursor-test-{i}"
+        )
+
+    names = []
+    params = {"limit": 2}
+    while True:
+        response = client.get(
+            f"{settings.API_V1_STR}/configs/",
+            headers={"X-API-KEY": user_api_key.key},
+            params=params,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        names.extend(c["name"] for c in data["data"])
+        if data["metadata"]["next_cursor"] is None:
+            break
+        params["cursor"] = data["metadata"]["next_cursor"]
+
+    assert len(names) == len(set(names))
+    assert {f"cursor-test-{i}" for i in range(5)} <= set(names)
+
+
 def test_get_config_by_id(
     db: Session,
     client: TestClient,
@@ -0,0 +1,212 @@
+import hashlib
+import os
+from unittest.mock import patch
+
+import pytest
+import requests
+from moto import mock_aws
+from sqlmodel import Session, select
+from fastapi.testclient import TestClient
+
+from app.core.cloud import AmazonCloudStorageClient
+from app.core.config import settings
+from app.models import Document
+from app.tests.utils.auth import TestAuthContext
+from app.tests.utils.document import Route, httpx_to_standard
+
+CONTENT = b"%PDF-1.4\n%%EOF"
+
+
+@pytest.fixture(scope="class")
+def aws_credentials():
+    os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+    os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+    os.environ["AWS_SECURITY_TOKEN"] = "testing"
+    os.environ["AWS_SESSION_TOKEN"] = "testing"
+    os.environ["AWS_DEFAULT_REGION"] = settings.AWS_DEFAULT_REGION
+
+
+@pytest.fixture
+def headers(user_api_key: TestAuthContext):
+    return {"X-API-KEY": user_api_key.key}
+
+
+def request_upload(client: TestClient, headers: dict, content: bytes = CONTENT):
+    return client.post(
+        str(Route("upload-url")),
+        headers=headers,
+        json={
+            "fname": "report.pdf",
+            "sha256": hashlib.sha256(content).hexdigest(),
+            "content_type": "application/pdf",
+        },
+    )
+
+
+def finalize(client: TestClient, headers: dict, doc_id: str, **body):
+    return client.post(
+        str(Route(f"{doc_id}/finalize")),
+        headers=headers,
+        json=body,
+    )
+
+
+@mock_aws
+@pytest.mark.usefixtures("aws_credentials")
+class TestDocumentRouteDirectUpload:
+    def test_upload_url_creates_pending_document(
+        self, db: Session, client: TestClient, headers: dict
+    ):
+        """Test that phase one returns a presigned PUT for a pending document."""
+        AmazonCloudStorageClient().create()
+
+        response = httpx_to_standard(request_upload(client, headers))
+
+        data = response.data
+        assert data["upload_url"].startswith("https://")
+        assert data["upload_headers"]["Content-Type"] == "application/pdf"
+        assert data["upload_headers"]["x-amz-meta-sha256"] == (
+            hashlib.sha256(CONTENT).hexdigest()
+        )
+
+        document = db.exec(select(Document).where(Document.id == data["id"])).one()
+        assert document.is_pending is True
+        assert document.fname == "report.pdf"
+        assert document.file_size_bytes is None
+
+    def test_pending_document_is_hidden(
+        self, db: Session, client: TestClient, headers: dict
+    ):
+        """Test that a document is not readable until it is finalized."""
+        AmazonCloudStorageClient().create()
+
+        data = httpx_to_standard(request_upload(client, headers)).data
+        response = client.get(str(Route(data["id"])), headers=headers)
+
+        assert response.status_code == 404
+
+    def test_finalize_records_size_and_checksum(
+        self, db: Session, client: TestClient, headers: dict
+    ):
+        """Test that phase two verifies the uploaded object and records it."""
+        AmazonCloudStorageClient().create()
+
+        data = httpx_to_standard(request_upload(client, headers)).data
+        upload = requests.put(
+            data["upload_url"], data=CONTENT, headers=data["upload_headers"]
+        )
+        assert upload.status_code == 200
+
+        response = httpx_to_standard(finalize(client, headers, data["id"]))
+
+        assert response.success is True
+        assert response.data["id"] == data["id"]
+        assert response.data["signed_url"]
+        assert response.data["file_size_bytes"] == len(CONTENT)
+        assert response.data["transformation_job"] is None
+
+        document = db.exec(select(Document).where(Document.id == data["id"])).one()
+        assert document.is_pending is False
+        assert document.file_size_bytes == len(CONTENT)
+        assert document.sha256 == hashlib.sha256(CONTENT).hexdigest()
+
+    def test_finalize_before_upload(
+        self, db: Session, client: TestClient, headers: dict
+    ):
+        """Test that finalizing without an uploaded object fails."""
+        AmazonCloudStorageClient().create()
+
+        data = httpx_to_standard(request_upload(client, headers)).data
+        response = finalize(client, headers, data["id"])
+
+        assert response.status_code == 400
+        assert "not found" in response.json()["error"]
+
+    def test_finalize_checksum_mismatch(
+        self, db: Session, client: TestClient, headers: dict
+    ):
+        """Test that an object uploaded without the signed checksum is rejected."""
+        AmazonCloudStorageClient().create()
+
+        data = httpx_to_standard(request_upload(client, headers)).data
+        requests.put(
+            data["upload_url"],
+            data=b"other content",
+            headers={"Content-Type": "application/pdf"},
+        )
+
+        response = finalize(client, headers, data["id"])
+
+        assert response.status_code == 400
+        assert "checksum" in response.json()["error"]
+
+        document = db.exec(select(Document).where(Document.id == data["id"])).one()
+        assert document.is_pending is True
+
+    def test_finalize_twice(self, db: Session, client: TestClient, headers: dict):
+        """Test that a finalized document cannot be finalized again."""
+        AmazonCloudStorageClient().create()
+
+        data = httpx_to_standard(request_upload(client, headers)).data
+        requests.put(data["upload_url"], data=CONTENT, headers=data["upload_headers"])
+        finalize(client, headers, data["id"])
+
+        response = finalize(client, headers, data["id"])
+
+        assert response.status_code == 404
+
+    @patch("app.services.doctransform.job.start_job")
+    def test_finalize_with_transformation(
+        self, mock_start_job, db: Session, client: TestClient, headers: dict
+    ):
+        """Test that finalizing schedules the requested transformation."""
+        AmazonCloudStorageClient().create()
+        mock_job_id = "12345678-1234-5678-9abc-123456789012"
+        mock_start_job.return_value = mock_job_id
+
+        data = httpx_to_standard(request_upload(client, headers)).data
+        requests.put(data["upload_url"], data=CONTENT, headers=data["upload_headers"])
+
+        response = httpx_to_standard(
+            finalize(client, headers, data["id"], target_format="markdown")
+        )
+
+        transformation_job = response.data["transformation_job"]
+        assert transformation_job["job_id"] == mock_job_id
+        assert transformation_job["transformer"] == "zerox"
+
+    def test_upload_url_invalid_sha256(self, client: TestClient, headers: dict):
+        """Test that a malformed checksum is rejected."""
+        response = client.post(
+            str(Route("upload-url")),
+            headers=headers,
+            json={"fname": "report.pdf", "sha256": "z" * 64},
+        )
+
+        assert response.status_code == 422
+
+    def test_finalize_duplicate_returns_existing_document(
+        self, db: Session, client: TestClient, headers: dict
+    ):
+        """Test that a second direct upload of the same content is dropped."""
+        AmazonCloudStorageClient().create()
+
+        first = httpx_to_standard(request_upload(client, headers)).data
+        requests.put(first["upload_url"], data=CONTENT, headers=first["upload_headers"])
+        finalize(client, headers, first["id"])
+
+        second = httpx_to_standard(request_upload(client, headers)).data
+        requests.put(
+            second["upload_url"], data=CONTENT, headers=second["upload_headers"]
+        )
+        response = httpx_to_standard(finalize(client, headers, second["id"]))
+
+        assert response.data["is_duplicate"] is True
+        assert response.data["id"] == first["id"]
+
+        duplicate = db.exec(select(Document).where(Document.id == second["id"])).one()
+        assert duplicate.is_deleted is True
+        objects = AmazonCloudStorageClient().client.list_objects_v2(
+            Bucket=settings.AWS_S3_BUCKET
+        )
+        assert objects["KeyCount"] == 1
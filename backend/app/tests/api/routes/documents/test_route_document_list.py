@@ -1,6 +1,10 @@
+from unittest.mock import patch
+
 import pytest
 from sqlmodel import Session
 
+from app.core.cloud import AmazonCloudStorage
+
 from app.tests.utils.document import (
     DocumentComparator,
     DocumentStore,
@@ -86,3 +90,67 @@ class TestDocumentRouteList:
         response = httpx_to_standard(crawler.get(route))
 
         assert len(response.data) == limit - skip
+
+    def test_include_url_signs_in_bulk(
+        self,
+        db: Session,
+        route: QueryRoute,
+        crawler: WebCrawler,
+    ):
+        store = DocumentStore(db=db, project_id=crawler.user_api_key.project_id)
+        store.fill(self._ndocs)
+
+        with patch.object(
+            AmazonCloudStorage, "get_signed_url", side_effect=AssertionError
+        ):
+            response = httpx_to_standard(
+                crawler.get(route.pushq("include_url", "true"))
+            )
+
+        signed_urls = {doc["signed_url"] for doc in response.data}
+        assert len(signed_urls) == self._ndocs
+        assert all(url.startswith("https://") for url in signed_urls)
+
+    def test_cursor_pages_through_all_documents(
+        self,
+        db: Session,
+        route: QueryRoute,
+        crawler: WebCrawler,
+    ):
+        store = DocumentStore(db=db, project_id=crawler.user_api_key.project_id)
+        docs = store.fill(self._ndocs)
+
+        seen = []
+        route = route.pushq("limit", 4)
+        while True:
+            response = httpx_to_standard(crawler.get(route))
+            seen.extend(doc["id"] for doc in response.data)
+            cursor = response.metadata["next_cursor"]
+            if cursor is None:
+                break
+            route = route.pushq("cursor", cursor)
+
+        assert seen == [str(doc.id) for doc in reversed(docs)]
+
+    def test_exact_count(
+        self,
+        db: Session,
+        route: QueryRoute,
+        crawler: WebCrawler,
+    ):
+        store = DocumentStore(db=db, project_id=crawler.user_api_key.project_id)
+        store.fill(self._ndocs)
+
+        route = route.pushq("limit", 2).pushq("count", "exact")
+        response = httpx_to_standard(crawler.get(route))
+
+        assert len(response.data) == 2
+        assert response.metadata["total"] == self._ndocs
+
+    def test_invalid_cursor_produces_error(
+        self,
+        route: QueryRoute,
+        crawler: WebCrawler,
+    ):
+        response = crawler.get(route.pushq("cursor", "not-a-cursor"))
+        assert response.status_code == 400
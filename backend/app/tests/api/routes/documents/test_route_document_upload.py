@@ -1,5 +1,9 @@
+import hashlib
 import os
 import mimetypes
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from urllib.parse import urlparse
@@ -10,9 +14,9 @@ from moto import mock_aws
 from sqlmodel import Session, select
 from fastapi.testclient import TestClient
 
-from app.core.cloud import AmazonCloudStorageClient
+from app.core.cloud import AmazonCloudStorage, AmazonCloudStorageClient
 from app.core.config import settings
-from app.models import Document
+from app.models import DocTransformationJob, Document, TransformationStatus
 from app.tests.utils.document import (
     Route,
     WebCrawler,
@@ -110,6 +114,27 @@ class TestDocumentRouteUpload:
 
         assert result.fname == str(scratch)
 
+    def test_records_size_and_checksum(
+        self,
+        db: Session,
+        route: Route,
+        scratch: Path,
+        uploader: WebUploader,
+    ):
+        """Test that the size and SHA-256 are recorded at upload time."""
+        aws = AmazonCloudStorageClient()
+        aws.create()
+
+        response = httpx_to_standard(uploader.put(route, scratch))
+        result = db.exec(
+            select(Document).where(Document.id == response.data["id"])
+        ).one()
+
+        content = scratch.read_bytes()
+        assert result.file_size_bytes == len(content)
+        assert result.sha256 == hashlib.sha256(content).hexdigest()
+        assert response.data["file_size_bytes"] == len(content)
+
     def test_adds_to_S3(
         self,
         db: Session,
@@ -324,3 +349,109 @@ class TestDocumentRouteUpload:
             assert field in response.data
 
         assert response.data["transformation_job"] is None
+
+    def test_duplicate_upload_returns_existing_document(
+        self,
+        db: Session,
+        route: Route,
+        scratch: Path,
+        uploader: WebUploader,
+    ):
+        """Test that re-uploading the same content stores it only once."""
+        aws = AmazonCloudStorageClient()
+        aws.create()
+
+        first = httpx_to_standard(uploader.put(route, scratch))
+        second = httpx_to_standard(uploader.put(route, scratch))
+
+        assert first.data["is_duplicate"] is False
+        assert second.data["is_duplicate"] is True
+        assert second.data["id"] == first.data["id"]
+        assert second.data["signed_url"]
+
+        sha256 = hashlib.sha256(scratch.read_bytes()).hexdigest()
+        documents = db.exec(select(Document).where(Document.sha256 == sha256)).all()
+        assert len(documents) == 1
+        objects = aws.client.list_objects_v2(Bucket=settings.AWS_S3_BUCKET)
+        assert objects["KeyCount"] == 1
+
+    @patch("app.services.doctransform.job.start_job")
+    def test_duplicate_upload_reuses_transformation(
+        self,
+        mock_start_job,
+        db: Session,
+        route: Route,
+        pdf_scratch: Path,
+        uploader: WebUploader,
+    ):
+        """Test that a completed transformation of the same content is reused."""
+        aws = AmazonCloudStorageClient()
+        aws.create()
+        mock_start_job.side_effect = lambda db, job_id, **kwargs: job_id
+
+        first = httpx_to_standard(
+            uploader.put(route, pdf_scratch, target_format="markdown")
+        )
+        job_id = first.data["transformation_job"]["job_id"]
+
+        # Complete the job as the transformation worker would
+        transformed = Document(
+            fname="<transformed>report.md",
+            object_store_url="s3://bucket/report.md",
+            project_id=first.data["project_id"],
+            source_document_id=first.data["id"],
+        )
+        db.add(transformed)
+        job = db.get(DocTransformationJob, job_id)
+        job.status = TransformationStatus.COMPLETED
+        job.transformed_document_id = transformed.id
+        db.add(job)
+        db.commit()
+
+        second = httpx_to_standard(
+            uploader.put(route, pdf_scratch, target_format="markdown")
+        )
+
+        assert second.data["is_duplicate"] is True
+        assert second.data["transformation_job"]["job_id"] == job_id
+        assert second.data["transformation_job"]["status"] == "COMPLETED"
+        mock_start_job.assert_called_once()
+
+
+@mock_aws
+@pytest.mark.usefixtures("aws_credentials")
+class TestDocumentRouteUploadConcurrency:
+    def test_slow_upload_does_not_block_other_requests(
+        self,
+        client: TestClient,
+        route: Route,
+        scratch: Path,
+        uploader: WebUploader,
+    ):
+        """Test that a request served during a slow S3 upload answers promptly."""
+        aws = AmazonCloudStorageClient()
+        aws.create()
+        uploading = threading.Event()
+        put = AmazonCloudStorage.put
+
+        def slow_put(self, *args, **kwargs):
+            uploading.set()
+            time.sleep(1)
+            return put(self, *args, **kwargs)
+
+        with patch.object(AmazonCloudStorage, "put", slow_put):
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                upload = executor.submit(uploader.put, route, scratch)
+                assert uploading.wait(timeout=5)
+
+                started = time.perf_counter()
+                health = client.get(f"{settings.API_V1_STR}/utils/health/")
+                latency = time.perf_counter() - started
+                upload_in_progress = not upload.done()
+
+                response = upload.result()
+
+        assert health.status_code == 200
+        assert upload_in_progress
+        assert latency < 0.5
+        assert response.is_success
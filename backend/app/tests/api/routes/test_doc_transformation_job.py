@@ -1,4 +1,5 @@
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlmodel import Session
 
 from app.core.config import settings
@@ -364,3 +365,60 @@ class TestGetMultipleTransformationJobs:
             TransformationStatus.FAILED,
         }
         assert statuses == expected_statuses
+
+
+class TestGetMultipleTransformationJobsQueries:
+    def count_queries(
+        self,
+        client: TestClient,
+        db: Session,
+        user_api_key: TestAuthContext,
+        store: DocumentStore,
+        n: int,
+    ) -> int:
+        crud = DocTransformationJobCrud(db, user_api_key.project_id)
+        jobs = []
+        for _ in range(n):
+            source, transformed = store.fill(2)
+            job = crud.create(DocTransformJobCreate(source_document_id=source.id))
+            crud.update(
+                job.id,
+                DocTransformJobUpdate(
+                    status=TransformationStatus.COMPLETED,
+                    transformed_document_id=transformed.id,
+                ),
+            )
+            jobs.append(job)
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        job_ids_params = "&".join(f"job_ids={job.id}" for job in jobs)
+        event.listen(db.get_bind(), "before_cursor_execute", record)
+        try:
+            response = client.get(
+                f"{settings.API_V1_STR}/documents/transformation/"
+                f"?{job_ids_params}&include_url=true",
+                headers={"X-API-KEY": user_api_key.key},
+            )
+        finally:
+            event.remove(db.get_bind(), "before_cursor_execute", record)
+
+        assert response.status_code == 200
+        data = response.json()["data"]["jobs"]
+        assert len(data) == n
+        assert all(job["transformed_document"]["signed_url"] for job in data)
+        return len(statements)
+
+    def test_query_count_is_constant(
+        self, client: TestClient, db: Session, user_api_key: TestAuthContext
+    ):
+        """Test that polling many jobs costs the same queries as polling one."""
+        store = DocumentStore(db, user_api_key.project_id)
+        one = self.count_queries(client, db, user_api_key, store, 1)
+        many = self.count_queries(client, db, user_api_key, store, 10)
+
+        assert one > 0
+        assert many == one
@@ -1,10 +1,15 @@
 import io
-from unittest.mock import Mock, patch
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
 import pytest
 from sqlmodel import select
 
 from app.crud.evaluations.batch import build_evaluation_jsonl
+from app.crud.evaluations.frame import EvaluationResultFrame
+from app.crud.evaluations.results import store_cosine_scores, store_evaluation_results
 from app.models import EvaluationDataset, EvaluationRun
 
 
@@ -44,65 +49,78 @@ def csv_with_empty_rows():
 """
 
 
-class TestDatasetUploadValidation:
-    """Test CSV validation and parsing."""
-
-    def test_upload_dataset_valid_csv(
-        self, client, user_api_key_header, valid_csv_content, db
+@pytest.fixture
+def upload_mocks():
+    """Mock the object store, Langfuse credentials and the ingestion job."""
+    with (
+        patch("app.api.routes.evaluation.get_cloud_storage") as mock_storage,
+        patch(
+            "app.api.routes.evaluation.upload_csv_to_object_store",
+            return_value="s3://bucket/datasets/test_dataset.csv",
+        ) as mock_store_upload,
+        patch("app.api.routes.evaluation.get_langfuse_client") as mock_langfuse,
+        patch(
+            "app.services.evaluations.ingestion.start_low_priority_job",
+            return_value="task_123",
+        ) as mock_start_job,
     ):
-        """Test uploading a valid CSV file."""
-        with (
-            patch("app.core.cloud.get_cloud_storage") as _mock_storage,
-            patch(
-                "app.api.routes.evaluation.upload_csv_to_object_store"
-            ) as mock_store_upload,
-            patch(
-                "app.api.routes.evaluation.get_langfuse_client"
-            ) as mock_get_langfuse_client,
-            patch(
-                "app.api.routes.evaluation.upload_dataset_to_langfuse"
-            ) as mock_langfuse_upload,
-        ):
-            # Mock object store upload
-            mock_store_upload.return_value = "s3://bucket/datasets/test_dataset.csv"
-
-            # Mock Langfuse client
-            mock_get_langfuse_client.return_value = Mock()
+        yield {
+            "storage": mock_storage,
+            "store_upload": mock_store_upload,
+            "langfuse": mock_langfuse,
+            "start_job": mock_start_job,
+        }
 
-            # Mock Langfuse upload
-            mock_langfuse_upload.return_value = ("test_dataset_id", 9)
 
-            filename, file_obj = create_csv_file(valid_csv_content)
+def post_dataset(client, headers, content: str, **data):
+    filename, file_obj = create_csv_file(content)
+    return client.post(
+        "/api/v1/evaluations/datasets",
+        files={"file": (filename, file_obj, "text/csv")},
+        data=data,
+        headers=headers,
+    )
 
-            response = client.post(
-                "/api/v1/evaluations/datasets",
-                files={"file": (filename, file_obj, "text/csv")},
-                data={
-                    "dataset_name": "test_dataset",
-                    "description": "Test dataset description",
-                    "duplication_factor": 3,
-                },
-                headers=user_api_key_header,
-            )
 
-            assert response.status_code == 200, response.text
-            response_data = response.json()
-            assert response_data["success"] is True
-            data = response_data["data"]
+class TestDatasetUploadValidation:
+    """Test CSV validation and parsing."""
 
-            assert data["dataset_name"] == "test_dataset"
-            assert data["original_items"] == 3
-            assert data["total_items"] == 9  # 3 items * 3 duplication
-            assert data["duplication_factor"] == 3
-            assert data["langfuse_dataset_id"] == "test_dataset_id"
-            assert data["object_store_url"] == "s3://bucket/datasets/test_dataset.csv"
-            assert "dataset_id" in data
+    def test_upload_dataset_valid_csv(
+        self, client, user_api_key_header, valid_csv_content, db, upload_mocks
+    ):
+        """Test that a valid CSV is stored and queued for ingestion."""
+        response = post_dataset(
+            client,
+            user_api_key_header,
+            valid_csv_content,
+            dataset_name="test_dataset",
+            description="Test dataset description",
+            duplication_factor=3,
+        )
 
-            # Verify object store upload was called
-            mock_store_upload.assert_called_once()
+        assert response.status_code == 200, response.text
+        response_data = response.json()
+        assert response_data["success"] is True
+        data = response_data["data"]
 
-            # Verify Langfuse upload was called
-            mock_langfuse_upload.assert_called_once()
+        assert data["dataset_name"] == "test_dataset"
+        assert data["duplication_factor"] == 3
+        assert data["object_store_url"] == "s3://bucket/datasets/test_dataset.csv"
+        assert data["progress"] == {"stage": "queued"}
+        # Counts and the Langfuse dataset ID are filled in by the ingestion job
+        assert data["original_items"] == 0
+        assert data["langfuse_dataset_id"] is None
+
+        # The upload is streamed from the request file, not read into memory
+        store_kwargs = upload_mocks["store_upload"].call_args.kwargs
+        assert not isinstance(store_kwargs["csv_content"], bytes)
+        assert store_kwargs["dataset_name"] == "test_dataset"
+
+        job_kwargs = upload_mocks["start_job"].call_args.kwargs
+        assert job_kwargs["function_path"] == (
+            "app.services.evaluations.ingestion.execute_job"
+        )
+        assert job_kwargs["job_id"] == str(data["dataset_id"])
 
     def test_upload_dataset_missing_columns(
         self,
@@ -111,18 +129,14 @@ class TestDatasetUploadValidation:
         invalid_csv_missing_columns,
     ):
         """Test uploading CSV with missing required columns."""
-        filename, file_obj = create_csv_file(invalid_csv_missing_columns)
-
-        # The CSV validation happens before any mocked functions are called
-        # so this test checks the actual validation logic
-        response = client.post(
-            "/api/v1/evaluations/datasets",
-            files={"file": (filename, file_obj, "text/csv")},
-            data={
-                "dataset_name": "test_dataset",
-                "duplication_factor": 5,
-            },
-            headers=user_api_key_header,
+        # The header is validated before anything is stored, so no mocks
+        # are needed
+        response = post_dataset(
+            client,
+            user_api_key_header,
+            invalid_csv_missing_columns,
+            dataset_name="test_dataset",
+            duplication_factor=5,
         )
 
         # Check that the response indicates unprocessable entity
@@ -133,196 +147,110 @@ class TestDatasetUploadValidation:
         )
         assert "question" in error_str.lower() or "answer" in error_str.lower()
 
-    def test_upload_dataset_empty_rows(
-        self, client, user_api_key_header, csv_with_empty_rows
+    def test_upload_dataset_header_only_checks_header(
+        self, client, user_api_key_header, csv_with_empty_rows, upload_mocks
     ):
-        """Test uploading CSV with empty rows (should skip them)."""
-        with (
-            patch("app.core.cloud.get_cloud_storage") as _mock_storage,
-            patch(
-                "app.api.routes.evaluation.upload_csv_to_object_store"
-            ) as mock_store_upload,
-            patch(
-                "app.api.routes.evaluation.get_langfuse_client"
-            ) as mock_get_langfuse_client,
-            patch(
-                "app.api.routes.evaluation.upload_dataset_to_langfuse"
-            ) as mock_langfuse_upload,
-        ):
-            # Mock object store and Langfuse uploads
-            mock_store_upload.return_value = "s3://bucket/datasets/test_dataset.csv"
-            mock_get_langfuse_client.return_value = Mock()
-            mock_langfuse_upload.return_value = ("test_dataset_id", 4)
+        """Test that rows are left to the ingestion job."""
+        response = post_dataset(
+            client,
+            user_api_key_header,
+            csv_with_empty_rows,
+            dataset_name="test_dataset",
+            duplication_factor=2,
+        )
 
-            filename, file_obj = create_csv_file(csv_with_empty_rows)
+        assert response.status_code == 200, response.text
+        assert response.json()["data"]["progress"]["stage"] == "queued"
 
-            response = client.post(
-                "/api/v1/evaluations/datasets",
-                files={"file": (filename, file_obj, "text/csv")},
-                data={
-                    "dataset_name": "test_dataset",
-                    "duplication_factor": 2,
-                },
-                headers=user_api_key_header,
-            )
-
-            assert response.status_code == 200, response.text
-            response_data = response.json()
-            assert response_data["success"] is True
-            data = response_data["data"]
+    def test_upload_dataset_with_bom_header(
+        self, client, user_api_key_header, valid_csv_content, upload_mocks
+    ):
+        """Test that a UTF-8 byte order mark does not hide the question column."""
+        response = post_dataset(
+            client,
+            user_api_key_header,
+            "\ufeff" + valid_csv_content,
+            dataset_name="test_dataset",
+        )
 
-            # Should only have 2 valid items (first and last rows)
-            assert data["original_items"] == 2
-            assert data["total_items"] == 4  # 2 items * 2 duplication
+        assert response.status_code == 200, response.text
 
 
 class TestDatasetUploadDuplication:
     """Test duplication logic."""
 
     def test_upload_with_default_duplication(
-        self, client, user_api_key_header, valid_csv_content
+        self, client, user_api_key_header, valid_csv_content, db, upload_mocks
     ):
         """Test uploading with default duplication factor (1)."""
-        with (
-            patch("app.core.cloud.get_cloud_storage") as _mock_storage,
-            patch(
-                "app.api.routes.evaluation.upload_csv_to_object_store"
-            ) as mock_store_upload,
-            patch(
-                "app.api.routes.evaluation.get_langfuse_client"
-            ) as mock_get_langfuse_client,
-            patch(
-                "app.api.routes.evaluation.upload_dataset_to_langfuse"
-            ) as mock_langfuse_upload,
-        ):
-            mock_store_upload.return_value = "s3://bucket/datasets/test_dataset.csv"
-            mock_get_langfuse_client.return_value = Mock()
-            mock_langfuse_upload.return_value = ("test_dataset_id", 3)
-
-            filename, file_obj = create_csv_file(valid_csv_content)
-
-            response = client.post(
-                "/api/v1/evaluations/datasets",
-                files={"file": (filename, file_obj, "text/csv")},
-                data={
-                    "dataset_name": "test_dataset",
-                    # duplication_factor not provided, should default to 1
-                },
-                headers=user_api_key_header,
-            )
+        response = post_dataset(
+            client,
+            user_api_key_header,
+            valid_csv_content,
+            dataset_name="test_dataset",
+            # duplication_factor not provided, should default to 1
+        )
 
-            assert response.status_code == 200, response.text
-            response_data = response.json()
-            assert response_data["success"] is True
-            data = response_data["data"]
+        assert response.status_code == 200, response.text
+        data = response.json()["data"]
+        assert data["duplication_factor"] == 1
 
-            assert data["duplication_factor"] == 1
-            assert data["original_items"] == 3
-            assert data["total_items"] == 3  # 3 items * 1 duplication
+        dataset = db.get(EvaluationDataset, data["dataset_id"])
+        assert dataset.dataset_metadata["duplication_factor"] == 1
 
     def test_upload_with_custom_duplication(
-        self, client, user_api_key_header, valid_csv_content
+        self, client, user_api_key_header, valid_csv_content, db, upload_mocks
     ):
-        """Test uploading with custom duplication factor."""
-        with (
-            patch("app.core.cloud.get_cloud_storage") as _mock_storage,
-            patch(
-                "app.api.routes.evaluation.upload_csv_to_object_store"
-            ) as mock_store_upload,
-            patch(
-                "app.api.routes.evaluation.get_langfuse_client"
-            ) as mock_get_langfuse_client,
-            patch(
-                "app.api.routes.evaluation.upload_dataset_to_langfuse"
-            ) as mock_langfuse_upload,
-        ):
-            mock_store_upload.return_value = "s3://bucket/datasets/test_dataset.csv"
-            mock_get_langfuse_client.return_value = Mock()
-            mock_langfuse_upload.return_value = ("test_dataset_id", 12)
-
-            filename, file_obj = create_csv_file(valid_csv_content)
-
-            response = client.post(
-                "/api/v1/evaluations/datasets",
-                files={"file": (filename, file_obj, "text/csv")},
-                data={
-                    "dataset_name": "test_dataset",
-                    "duplication_factor": 4,
-                },
-                headers=user_api_key_header,
-            )
+        """Test that the duplication factor is stored for the ingestion job."""
+        response = post_dataset(
+            client,
+            user_api_key_header,
+            valid_csv_content,
+            dataset_name="test_dataset",
+            duplication_factor=4,
+        )
 
-            assert response.status_code == 200, response.text
-            response_data = response.json()
-            assert response_data["success"] is True
-            data = response_data["data"]
+        assert response.status_code == 200, response.text
+        data = response.json()["data"]
+        assert data["duplication_factor"] == 4
 
-            assert data["duplication_factor"] == 4
-            assert data["original_items"] == 3
-            assert data["total_items"] == 12  # 3 items * 4 duplication
+        dataset = db.get(EvaluationDataset, data["dataset_id"])
+        assert dataset.dataset_metadata["duplication_factor"] == 4
 
     def test_upload_with_description(
-        self, client, user_api_key_header, valid_csv_content, db
+        self, client, user_api_key_header, valid_csv_content, db, upload_mocks
     ):
         """Test uploading with a description."""
-        with (
-            patch("app.core.cloud.get_cloud_storage") as _mock_storage,
-            patch(
-                "app.api.routes.evaluation.upload_csv_to_object_store"
-            ) as mock_store_upload,
-            patch(
-                "app.api.routes.evaluation.get_langfuse_client"
-            ) as mock_get_langfuse_client,
-            patch(
-                "app.api.routes.evaluation.upload_dataset_to_langfuse"
-            ) as mock_langfuse_upload,
-        ):
-            mock_store_upload.return_value = "s3://bucket/datasets/test_dataset.csv"
-            mock_get_langfuse_client.return_value = Mock()
-            mock_langfuse_upload.return_value = ("test_dataset_id", 9)
-
-            filename, file_obj = create_csv_file(valid_csv_content)
-
-            response = client.post(
-                "/api/v1/evaluations/datasets",
-                files={"file": (filename, file_obj, "text/csv")},
-                data={
-                    "dataset_name": "test_dataset_with_description",
-                    "description": "This is a test dataset for evaluation",
-                    "duplication_factor": 3,
-                },
-                headers=user_api_key_header,
-            )
+        response = post_dataset(
+            client,
+            user_api_key_header,
+            valid_csv_content,
+            dataset_name="test_dataset_with_description",
+            description="This is a test dataset for evaluation",
+            duplication_factor=3,
+        )
 
-            assert response.status_code == 200, response.text
-            response_data = response.json()
-            assert response_data["success"] is True
-            data = response_data["data"]
+        assert response.status_code == 200, response.text
+        data = response.json()["data"]
 
-            # Verify the description is stored
-            dataset = db.exec(
-                select(EvaluationDataset).where(
-                    EvaluationDataset.id == data["dataset_id"]
-                )
-            ).first()
+        # Verify the description is stored
+        dataset = db.exec(
+            select(EvaluationDataset).where(EvaluationDataset.id == data["dataset_id"])
+        ).first()
 
-            assert dataset is not None
-            assert dataset.description == "This is a test dataset for evaluation"
+        assert dataset is not None
+        assert dataset.description == "This is a test dataset for evaluation"
 
     def test_upload_with_duplication_factor_below_minimum(
         self, client, user_api_key_header, valid_csv_content
     ):
         """Test uploading with duplication factor below minimum (0)."""
-        filename, file_obj = create_csv_file(valid_csv_content)
-
-        response = client.post(
-            "/api/v1/evaluations/datasets",
-            files={"file": (filename, file_obj, "text/csv")},
-            data={
-                "dataset_name": "test_dataset",
-                "duplication_factor": 0,
-            },
-            headers=user_api_key_header,
+        response = post_dataset(
+            client,
+            user_api_key_header,
+            valid_csv_content,
+            dataset_name="test_dataset",
+            duplication_factor=0,
         )
 
         assert response.status_code == 422
@@ -335,16 +263,12 @@ class TestDatasetUploadDuplication:
         self, client, user_api_key_header, valid_csv_content
     ):
         """Test uploading with duplication factor above maximum (6)."""
-        filename, file_obj = create_csv_file(valid_csv_content)
-
-        response = client.post(
-            "/api/v1/evaluations/datasets",
-            files={"file": (filename, file_obj, "text/csv")},
-            data={
-                "dataset_name": "test_dataset",
-                "duplication_factor": 6,
-            },
-            headers=user_api_key_header,
+        response = post_dataset(
+            client,
+            user_api_key_header,
+            valid_csv_content,
+            dataset_name="test_dataset",
+            duplication_factor=6,
         )
 
         assert response.status_code == 422
@@ -353,46 +277,44 @@ class TestDatasetUploadDuplication:
         assert "error" in response_data
         assert "less than or equal to 5" in response_data["error"]
 
-    def test_upload_with_duplication_factor_boundary_minimum(
-        self, client, user_api_key_header, valid_csv_content
-    ):
-        """Test uploading with duplication factor at minimum boundary (1)."""
-        with (
-            patch("app.core.cloud.get_cloud_storage") as _mock_storage,
-            patch(
-                "app.api.routes.evaluation.upload_csv_to_object_store"
-            ) as mock_store_upload,
-            patch(
-                "app.api.routes.evaluation.get_langfuse_client"
-            ) as mock_get_langfuse_client,
-            patch(
-                "app.api.routes.evaluation.upload_dataset_to_langfuse"
-            ) as mock_langfuse_upload,
-        ):
-            mock_store_upload.return_value = "s3://bucket/datasets/test_dataset.csv"
-            mock_get_langfuse_client.return_value = Mock()
-            mock_langfuse_upload.return_value = ("test_dataset_id", 3)
 
-            filename, file_obj = create_csv_file(valid_csv_content)
+class TestDatasetUploadConcurrency:
+    """Test that dataset uploads do not hold up other requests."""
 
-            response = client.post(
-                "/api/v1/evaluations/datasets",
-                files={"file": (filename, file_obj, "text/csv")},
-                data={
-                    "dataset_name": "test_dataset",
-                    "duplication_factor": 1,
-                },
-                headers=user_api_key_header,
+    def test_slow_upload_does_not_block_other_requests(
+        self, client, user_api_key_header, valid_csv_content, upload_mocks
+    ):
+        """Test that other requests are answered promptly during a slow upload."""
+        uploading = threading.Event()
+
+        def slow_upload(**kwargs):
+            uploading.set()
+            time.sleep(1)
+            return "s3://bucket/datasets/slow_dataset.csv"
+
+        upload_mocks["store_upload"].side_effect = slow_upload
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            upload = executor.submit(
+                post_dataset,
+                client,
+                user_api_key_header,
+                valid_csv_content,
+                dataset_name="slow_dataset",
             )
+            assert uploading.wait(timeout=5)
 
-            assert response.status_code == 200, response.text
-            response_data = response.json()
-            assert response_data["success"] is True
-            data = response_data["data"]
+            started = time.perf_counter()
+            health = client.get("/api/v1/utils/health/")
+            latency = time.perf_counter() - started
+            upload_in_progress = not upload.done()
+
+            response = upload.result()
 
-            assert data["duplication_factor"] == 1
-            assert data["original_items"] == 3
-            assert data["total_items"] == 3  # 3 items * 1 duplication
+        assert health.status_code == 200
+        assert upload_in_progress
+        assert latency < 0.5
+        assert response.status_code == 200, response.text
 
 
 class TestDatasetUploadErrors:
@@ -403,27 +325,20 @@ class TestDatasetUploadErrors:
     ):
         """Test when Langfuse client configuration fails."""
         with (
-            patch("app.core.cloud.get_cloud_storage") as _mock_storage,
             patch(
                 "app.api.routes.evaluation.upload_csv_to_object_store"
             ) as mock_store_upload,
-            patch("app.crud.credentials.get_provider_credential") as mock_get_cred,
+            patch("app.utils.get_provider_credential") as mock_get_cred,
         ):
-            # Mock object store upload succeeds
-            mock_store_upload.return_value = "s3://bucket/datasets/test_dataset.csv"
             # Mock Langfuse credentials not found
             mock_get_cred.return_value = None
 
-            filename, file_obj = create_csv_file(valid_csv_content)
-
-            response = client.post(
-                "/api/v1/evaluations/datasets",
-                files={"file": (filename, file_obj, "text/csv")},
-                data={
-                    "dataset_name": "test_dataset",
-                    "duplication_factor": 5,
-                },
-                headers=user_api_key_header,
+            response = post_dataset(
+                client,
+                user_api_key_header,
+                valid_csv_content,
+                dataset_name="test_dataset",
+                duplication_factor=5,
             )
 
             # Accept either 400 (credentials not configured) or 500 (configuration/auth fails)
@@ -437,20 +352,71 @@ class TestDatasetUploadErrors:
                 or "credential" in error_str.lower()
                 or "unauthorized" in error_str.lower()
             )
+            # Nothing is stored when the dataset could not be ingested
+            mock_store_upload.assert_not_called()
+
+    def test_upload_object_store_failure(
+        self, client, user_api_key_header, valid_csv_content, db, upload_mocks
+    ):
+        """Test that the upload fails when the CSV cannot be stored."""
+        upload_mocks["store_upload"].return_value = None
+
+        response = post_dataset(
+            client,
+            user_api_key_header,
+            valid_csv_content,
+            dataset_name="test_dataset_no_store",
+        )
+
+        assert response.status_code == 503
+        assert "object store" in response.json()["error"].lower()
+        assert not db.exec(
+            select(EvaluationDataset).where(
+                EvaluationDataset.name == "test_dataset_no_store"
+            )
+        ).first()
+        upload_mocks["start_job"].assert_not_called()
+
+    def test_upload_duplicate_name(
+        self, client, user_api_key_header, valid_csv_content, upload_mocks
+    ):
+        """Test that a taken name is rejected before the file is stored."""
+        first = post_dataset(
+            client, user_api_key_header, valid_csv_content, dataset_name="dup_name"
+        )
+        assert first.status_code == 200, first.text
+        upload_mocks["store_upload"].reset_mock()
+
+        second = post_dataset(
+            client, user_api_key_header, valid_csv_content, dataset_name="dup_name"
+        )
+
+        assert second.status_code == 409
+        upload_mocks["store_upload"].assert_not_called()
+
+    def test_upload_schedule_failure(
+        self, client, user_api_key_header, valid_csv_content, upload_mocks
+    ):
+        """Test that the dataset is marked failed if ingestion cannot be queued."""
+        upload_mocks["start_job"].side_effect = Exception("broker down")
+
+        response = post_dataset(
+            client, user_api_key_header, valid_csv_content, dataset_name="test_dataset"
+        )
+
+        assert response.status_code == 200, response.text
+        progress = response.json()["data"]["progress"]
+        assert progress["stage"] == "failed"
+        assert "broker down" in progress["error"]
 
     def test_upload_invalid_csv_format(self, client, user_api_key_header):
         """Test uploading invalid CSV format."""
-        invalid_csv = "not,a,valid\ncsv format here!!!"
-        filename, file_obj = create_csv_file(invalid_csv)
-
-        response = client.post(
-            "/api/v1/evaluations/datasets",
-            files={"file": (filename, file_obj, "text/csv")},
-            data={
-                "dataset_name": "test_dataset",
-                "duplication_factor": 5,
-            },
-            headers=user_api_key_header,
+        response = post_dataset(
+            client,
+            user_api_key_header,
+            "not,a,valid\ncsv format here!!!",
+            dataset_name="test_dataset",
+            duplication_factor=5,
         )
 
         # Should fail validation - check error contains expected message
@@ -543,6 +509,144 @@ class TestBatchEvaluation:
         # Should fail with either "model" missing or "dataset not found" (both acceptable)
         assert "model" in error_str.lower() or "not found" in error_str.lower()
 
+    @pytest.mark.parametrize(
+        "embedding_config",
+        [
+            {"embedding_dimensions": 4096},
+            {"embedding_dimensions": 0},
+            {"embedding_dimensions": "512"},
+            {"embedding_model": "text-embedding-ada-002", "embedding_dimensions": 512},
+            {"embedding_model": "not-a-model"},
+        ],
+    )
+    def test_start_batch_evaluation_invalid_embedding_config(
+        self, client, user_api_key_header, sample_evaluation_config, embedding_config
+    ):
+        """Test that unsupported embedding settings are rejected up front."""
+        response = client.post(
+            "/api/v1/evaluations",
+            json={
+                "experiment_name": "test_embedding_dimensions",
+                "dataset_id": 99999,
+                "config": {**sample_evaluation_config, **embedding_config},
+            },
+            headers=user_api_key_header,
+        )
+
+        assert response.status_code == 400
+        response_data = response.json()
+        error_str = response_data.get(
+            "detail", response_data.get("message", str(response_data))
+        )
+        assert "embedding" in error_str.lower()
+
+    @pytest.fixture
+    def langfuse_dataset(self, db, user_api_key):
+        """Create a dataset that has been uploaded to Langfuse."""
+        dataset = EvaluationDataset(
+            name="test_dataset_for_start",
+            dataset_metadata={"original_items_count": 3},
+            langfuse_dataset_id="langfuse_start_id",
+            organization_id=user_api_key.organization_id,
+            project_id=user_api_key.project_id,
+        )
+        db.add(dataset)
+        db.commit()
+        db.refresh(dataset)
+        return dataset
+
+    def test_start_batch_evaluation_queues_job(
+        self,
+        client,
+        user_api_key_header,
+        sample_evaluation_config,
+        langfuse_dataset,
+    ):
+        """Test that the run is returned pending and its batch started by a job."""
+        with patch("app.api.routes.evaluation.get_openai_client"), patch(
+            "app.api.routes.evaluation.get_langfuse_client"
+        ), patch(
+            "app.services.evaluations.jobs.start_low_priority_job",
+            return_value="task_123",
+        ) as mock_start_job:
+            response = client.post(
+                "/api/v1/evaluations",
+                json={
+                    "experiment_name": "test_queued_run",
+                    "dataset_id": langfuse_dataset.id,
+                    "config": sample_evaluation_config,
+                },
+                headers=user_api_key_header,
+            )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["status"] == "pending"
+        assert data["progress"] == {"stage": "queued"}
+        assert data["batch_job_id"] is None
+
+        kwargs = mock_start_job.call_args.kwargs
+        assert kwargs["function_path"] == "app.services.evaluations.jobs.execute_job"
+        assert kwargs["job_id"] == str(data["id"])
+
+    def test_start_batch_evaluation_schedule_failure(
+        self,
+        client,
+        user_api_key_header,
+        sample_evaluation_config,
+        langfuse_dataset,
+    ):
+        """Test that a run whose job cannot be scheduled is marked as failed."""
+        with patch("app.api.routes.evaluation.get_openai_client"), patch(
+            "app.api.routes.evaluation.get_langfuse_client"
+        ), patch(
+            "app.services.evaluations.jobs.start_low_priority_job",
+            side_effect=ConnectionError("broker unavailable"),
+        ):
+            response = client.post(
+                "/api/v1/evaluations",
+                json={
+                    "experiment_name": "test_unscheduled_run",
+                    "dataset_id": langfuse_dataset.id,
+                    "config": sample_evaluation_config,
+                },
+                headers=user_api_key_header,
+            )
+
+        data = response.json()["data"]
+        assert data["status"] == "failed"
+        assert data["progress"] == {"stage": "failed"}
+        assert "broker unavailable" in data["error_message"]
+
+    def test_start_batch_evaluation_dataset_still_ingesting(
+        self,
+        client,
+        db,
+        user_api_key_header,
+        sample_evaluation_config,
+        langfuse_dataset,
+    ):
+        """Test that a dataset cannot be evaluated before ingestion completes."""
+        langfuse_dataset.progress = {"stage": "ingesting", "items_processed": 10}
+        db.add(langfuse_dataset)
+        db.commit()
+
+        with patch("app.api.routes.evaluation.get_openai_client"), patch(
+            "app.api.routes.evaluation.get_langfuse_client"
+        ):
+            response = client.post(
+                "/api/v1/evaluations",
+                json={
+                    "experiment_name": "test_ingesting_dataset",
+                    "dataset_id": langfuse_dataset.id,
+                    "config": sample_evaluation_config,
+                },
+                headers=user_api_key_header,
+            )
+
+        assert response.status_code == 409
+        assert "ingesting" in response.json()["error"]
+
     def test_start_batch_evaluation_without_authentication(
         self, client, sample_evaluation_config
     ):
@@ -593,6 +697,56 @@ class TestBatchEvaluationJSONLBuilding:
         assert request["body"]["instructions"] == "You are a helpful assistant"
         assert request["body"]["input"] == "What is 2+2?"
 
+    def test_build_batch_jsonl_expands_duplicates(self):
+        """Test that copies get deterministic custom_ids and legacy copies do not."""
+        dataset_items = [
+            {
+                "id": "item1",
+                "input": {"question": "What is 2+2?"},
+                "expected_output": {"answer": "4"},
+                "metadata": {"duplication_factor": 2},
+            },
+            {
+                # Uploaded before items were stored once: already a physical copy
+                "id": "item2",
+                "input": {"question": "What is 3+3?"},
+                "expected_output": {"answer": "6"},
+                "metadata": {"duplicate_number": 2, "duplication_factor": 2},
+            },
+        ]
+
+        jsonl_data = build_evaluation_jsonl(dataset_items, {"model": "gpt-4o"})
+
+        assert [line["custom_id"] for line in jsonl_data] == [
+            "item1#1",
+            "item1#2",
+            "item2",
+        ]
+        assert jsonl_data[1]["body"]["input"] == "What is 2+2?"
+        assert build_evaluation_jsonl(dataset_items, {"model": "gpt-4o"}) == (
+            jsonl_data
+        )
+
+    def test_build_batch_jsonl_leaves_out_embedding_config(self):
+        """Test that similarity scoring settings are not sent to the Responses API."""
+        dataset_items = [
+            {
+                "id": "item1",
+                "input": {"question": "What is 2+2?"},
+                "expected_output": {"answer": "4"},
+                "metadata": {},
+            }
+        ]
+        config = {
+            "model": "gpt-4o",
+            "embedding_model": "text-embedding-3-small",
+            "embedding_dimensions": 512,
+        }
+
+        jsonl_data = build_evaluation_jsonl(dataset_items, config)
+
+        assert jsonl_data[0]["body"] == {"model": "gpt-4o", "input": "What is 2+2?"}
+
     def test_build_batch_jsonl_with_tools(self):
         """Test JSONL building with tools configuration."""
         dataset_items = [
@@ -792,3 +946,171 @@ class TestGetEvaluationRunStatus:
         assert data["id"] == eval_run.id
         assert data["status"] == "completed"
         assert "traces" in data["score"]
+
+    def test_get_evaluation_run_trace_info_resumes_partial_score(
+        self, client, user_api_key_header, db, user_api_key, create_test_dataset
+    ):
+        """Test that a partial cached score is completed instead of returned."""
+        cached_traces = [{"trace_id": "trace1", "question": "Q1", "scores": []}]
+        eval_run = EvaluationRun(
+            run_name="test_partial_run",
+            dataset_name=create_test_dataset.name,
+            dataset_id=create_test_dataset.id,
+            config={"model": "gpt-4o"},
+            status="completed",
+            total_items=2,
+            score={
+                "traces": cached_traces,
+                "summary_scores": [],
+                "failed_trace_ids": ["trace2"],
+            },
+            organization_id=user_api_key.organization_id,
+            project_id=user_api_key.project_id,
+        )
+        db.add(eval_run)
+        db.commit()
+        db.refresh(eval_run)
+
+        with patch("app.api.routes.evaluation.get_langfuse_client"), patch(
+            "app.api.routes.evaluation.fetch_trace_scores_from_langfuse",
+            return_value={"traces": [], "summary_scores": []},
+        ) as fetch_scores, patch(
+            "app.api.routes.evaluation.save_score", return_value=eval_run
+        ):
+            response = client.get(
+                f"/api/v1/evaluations/{eval_run.id}",
+                params={"get_trace_info": True},
+                headers=user_api_key_header,
+            )
+
+        assert response.status_code == 200
+        assert fetch_scores.call_args.kwargs["cached_traces"] == cached_traces
+
+
+class TestEvaluationResults:
+    """Test the per-item results and summary endpoints."""
+
+    @pytest.fixture
+    def eval_run_with_results(self, db, user_api_key):
+        """Create an evaluation run with stored, partly scored results."""
+        dataset = EvaluationDataset(
+            name="test_dataset_for_results",
+            dataset_metadata={"original_items_count": 3},
+            organization_id=user_api_key.organization_id,
+            project_id=user_api_key.project_id,
+        )
+        db.add(dataset)
+        db.commit()
+        db.refresh(dataset)
+
+        eval_run = EvaluationRun(
+            run_name="test_results_run",
+            dataset_name=dataset.name,
+            dataset_id=dataset.id,
+            config={"model": "gpt-4o"},
+            status="completed",
+            total_items=3,
+            organization_id=user_api_key.organization_id,
+            project_id=user_api_key.project_id,
+        )
+        db.add(eval_run)
+        db.commit()
+        db.refresh(eval_run)
+
+        store_evaluation_results(
+            session=db,
+            eval_run_id=eval_run.id,
+            results=EvaluationResultFrame.from_records(
+                {
+                    "item_id": f"item_{i}",
+                    "question": f"Question {i}",
+                    "generated_output": f"Answer {i}",
+                    "ground_truth": f"Truth {i}",
+                    "usage": {"total_tokens": 10},
+                }
+                for i in range(3)
+            ),
+            trace_id_mapping={f"item_{i}": f"trace_{i}" for i in range(3)},
+        )
+        store_cosine_scores(
+            session=db,
+            eval_run_id=eval_run.id,
+            per_item_scores=[{"trace_id": "trace_0", "cosine_similarity": 0.8}],
+        )
+        return eval_run
+
+    def test_list_evaluation_results(
+        self, client, user_api_key_header, eval_run_with_results
+    ):
+        """Test that results are paged in item order."""
+        response = client.get(
+            f"/api/v1/evaluations/{eval_run_with_results.id}/results",
+            params={"limit": 2, "offset": 1},
+            headers=user_api_key_header,
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [item["item_id"] for item in data] == ["item_1", "item_2"]
+        assert data[0]["trace_id"] == "trace_1"
+        assert data[0]["cosine_similarity"] is None
+
+    def test_list_evaluation_results_cursor(
+        self, client, user_api_key_header, eval_run_with_results
+    ):
+        """Test that next_cursor continues after the last result of a page."""
+        url = f"/api/v1/evaluations/{eval_run_with_results.id}/results"
+        first = client.get(url, params={"limit": 2}, headers=user_api_key_header)
+        cursor = first.json()["metadata"]["next_cursor"]
+
+        second = client.get(
+            url, params={"limit": 2, "cursor": cursor}, headers=user_api_key_header
+        )
+
+        assert [item["item_id"] for item in second.json()["data"]] == ["item_2"]
+        assert second.json()["metadata"]["next_cursor"] is None
+
+    @pytest.mark.parametrize(
+        "params,status_code",
+        [
+            ({"offset": -1}, 422),
+            ({"limit": 0}, 422),
+            ({"limit": 101}, 422),
+            ({"cursor": "not-a-cursor"}, 400),
+        ],
+    )
+    def test_list_evaluation_results_invalid_paging(
+        self, client, user_api_key_header, eval_run_with_results, params, status_code
+    ):
+        """Test that out-of-range paging parameters are client errors."""
+        response = client.get(
+            f"/api/v1/evaluations/{eval_run_with_results.id}/results",
+            params=params,
+            headers=user_api_key_header,
+        )
+
+        assert response.status_code == status_code
+
+    def test_get_evaluation_summary(
+        self, client, user_api_key_header, eval_run_with_results
+    ):
+        """Test that the summary aggregates the stored results."""
+        response = client.get(
+            f"/api/v1/evaluations/{eval_run_with_results.id}/summary",
+            headers=user_api_key_header,
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["total_items"] == 3
+        assert data["scored_items"] == 1
+        assert data["cosine_similarity_avg"] == pytest.approx(0.8)
+        assert data["total_tokens"] == 30
+
+    def test_results_of_unknown_run(self, client, user_api_key_header):
+        """Test that results of a missing run return 404."""
+        for path in ("results", "summary"):
+            response = client.get(
+                f"/api/v1/evaluations/999999/{path}", headers=user_api_key_header
+            )
+            assert response.status_code == 404
@@ -259,6 +259,44 @@ def test_list_conversations_with_pagination(
     assert metadata["total"] >= 2
 
 
+def test_list_conversations_with_cursor(
+    client: TestClient,
+    db: Session,
+    user_api_key: TestAuthContext,
+):
+    """Test that following next_cursor visits each conversation once."""
+    for i in range(3):
+        conversation_data = OpenAIConversationCreate(
+            response_id=generate_openai_id("resp_", 40),
+            ancestor_response_id=generate_openai_id("resp_", 40),
+            previous_response_id=None,
+            user_question=f"Cursor question {i}",
+            response=f"Cursor response {i}",
+            model="gpt-4o",
+            assistant_id=generate_openai_id("asst_", 20),
+        )
+        create_conversation(
+            session=db,
+            conversation=conversation_data,
+            project_id=user_api_key.project_id,
+            organization_id=user_api_key.organization_id,
+        )
+
+    ids = []
+    url = "/api/v1/openai-conversation?limit=2"
+    while True:
+        response = client.get(url, headers={"X-API-KEY": user_api_key.key})
+        assert response.status_code == 200
+        metadata = response.json()["metadata"]
+        ids.extend(c["id"] for c in response.json()["data"])
+        if metadata["next_cursor"] is None:
+            break
+        url = f"/api/v1/openai-conversation?limit=2&cursor={metadata['next_cursor']}"
+
+    assert ids == sorted(ids, reverse=True)
+    assert len(ids) == metadata["total"]
+
+
 def test_list_conversations_pagination_metadata(
     client: TestClient,
     db: Session,
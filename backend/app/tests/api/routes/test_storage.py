@@ -0,0 +1,186 @@
+import hashlib
+import io
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.cloud import CloudStorageError, LocalCloudStorage
+from app.core.config import settings
+from app.tests.utils.auth import TestAuthContext
+from app.tests.utils.document import Route, httpx_to_standard
+
+CONTENT = b"%PDF-1.4\n%%EOF"
+
+
+@pytest.fixture
+def local_storage(tmp_path):
+    """Use the local storage backend, rooted in a temporary directory."""
+    with patch.object(settings, "STORAGE_BACKEND", "local"), patch.object(
+        settings, "LOCAL_STORAGE_ROOT", str(tmp_path)
+    ):
+        yield LocalCloudStorage(project_id=1, storage_path=uuid4())
+
+
+def put_bytes(storage: LocalCloudStorage, content: bytes = CONTENT) -> str:
+    source = MagicMock(file=io.BytesIO(content), content_type="application/pdf")
+    return str(storage.put(source=source, file_path=Path("doc.pdf")))
+
+
+class TestDownloadObject:
+    def test_signed_url_serves_object(
+        self, client: TestClient, local_storage: LocalCloudStorage
+    ):
+        signed_url = local_storage.get_signed_url(put_bytes(local_storage))
+
+        response = client.get(signed_url)
+
+        assert response.status_code == 200
+        assert response.content == CONTENT
+        assert response.headers["content-type"] == "application/pdf"
+
+    def test_tampered_signature_is_rejected(
+        self, client: TestClient, local_storage: LocalCloudStorage
+    ):
+        signed_url = local_storage.get_signed_url(put_bytes(local_storage))
+
+        response = client.get(signed_url[:-4] + "0000")
+
+        assert response.status_code == 403
+
+    def test_other_object_is_rejected(
+        self, client: TestClient, local_storage: LocalCloudStorage
+    ):
+        """Test that a signature only grants access to its own object."""
+        signed_url = local_storage.get_signed_url(put_bytes(local_storage))
+
+        response = client.get(signed_url.replace("doc.pdf", "other.pdf"))
+
+        assert response.status_code == 403
+
+    def test_not_served_for_s3_backend(
+        self, client: TestClient, local_storage: LocalCloudStorage
+    ):
+        signed_url = local_storage.get_signed_url(put_bytes(local_storage))
+
+        with patch.object(settings, "STORAGE_BACKEND", "s3"):
+            response = client.get(signed_url)
+
+        assert response.status_code == 404
+
+
+class TestUploadObject:
+    def test_signed_upload_stores_object(
+        self, client: TestClient, local_storage: LocalCloudStorage
+    ):
+        sha256 = hashlib.sha256(CONTENT).hexdigest()
+        signed = local_storage.get_signed_upload(
+            Path("upload.pdf"), sha256=sha256, content_type="application/pdf"
+        )
+
+        response = client.put(signed.url, content=CONTENT, headers=signed.headers)
+
+        assert response.status_code == 200
+        info = local_storage.get_object_info(str(signed.destination))
+        assert info.size_bytes == len(CONTENT)
+        assert info.sha256 == sha256
+
+    def test_content_must_match_signed_checksum(
+        self, client: TestClient, local_storage: LocalCloudStorage
+    ):
+        sha256 = hashlib.sha256(CONTENT).hexdigest()
+        signed = local_storage.get_signed_upload(Path("upload.pdf"), sha256=sha256)
+
+        response = client.put(signed.url, content=b"other", headers=signed.headers)
+
+        assert response.status_code == 400
+        with pytest.raises(CloudStorageError):
+            local_storage.get_object_info(str(signed.destination))
+
+    def test_checksum_header_is_signed(
+        self, client: TestClient, local_storage: LocalCloudStorage
+    ):
+        """Test that the upload cannot be replayed with different content."""
+        sha256 = hashlib.sha256(CONTENT).hexdigest()
+        signed = local_storage.get_signed_upload(Path("upload.pdf"), sha256=sha256)
+        other = b"other"
+
+        response = client.put(
+            signed.url,
+            content=other,
+            headers={"x-content-sha256": hashlib.sha256(other).hexdigest()},
+        )
+
+        assert response.status_code == 403
+
+    def test_streamed_upload_stores_object(
+        self, client: TestClient, local_storage: LocalCloudStorage
+    ):
+        """Test that a chunked body without a length is written in full."""
+        content = b"0123456789" * 10_000
+        signed = local_storage.get_signed_upload(
+            Path("upload.bin"), sha256=hashlib.sha256(content).hexdigest()
+        )
+        chunks = (content[i : i + 4096] for i in range(0, len(content), 4096))
+
+        response = client.put(signed.url, content=chunks, headers=signed.headers)
+
+        assert response.status_code == 200
+        info = local_storage.get_object_info(str(signed.destination))
+        assert info.size_bytes == len(content)
+
+    @pytest.mark.parametrize("chunked", [False, True])
+    def test_body_over_limit_is_rejected(
+        self, client: TestClient, local_storage: LocalCloudStorage, chunked: bool
+    ):
+        """Test that bodies over the limit get 413, with or without a length."""
+        content = b"x" * 1024
+        signed = local_storage.get_signed_upload(
+            Path("upload.bin"), sha256=hashlib.sha256(content).hexdigest()
+        )
+        body = iter([content[:512], content[512:]]) if chunked else content
+
+        with patch.object(settings, "LOCAL_STORAGE_MAX_UPLOAD_BYTES", 600):
+            response = client.put(signed.url, content=body, headers=signed.headers)
+
+        assert response.status_code == 413
+        with pytest.raises(CloudStorageError):
+            local_storage.get_object_info(str(signed.destination))
+
+
+@pytest.mark.usefixtures("local_storage")
+def test_document_direct_upload_with_local_backend(
+    client: TestClient, user_api_key: TestAuthContext
+):
+    """Test uploading, finalizing and downloading a document without S3."""
+    headers = {"X-API-KEY": user_api_key.key}
+    upload = httpx_to_standard(
+        client.post(
+            str(Route("upload-url")),
+            headers=headers,
+            json={
+                "fname": "report.pdf",
+                "sha256": hashlib.sha256(CONTENT).hexdigest(),
+                "content_type": "application/pdf",
+            },
+        )
+    ).data
+
+    stored = client.put(
+        upload["upload_url"], content=CONTENT, headers=upload["upload_headers"]
+    )
+    finalized = client.post(
+        str(Route(f"{upload['id']}/finalize")), headers=headers, json={}
+    )
+    document = httpx_to_standard(
+        client.get(
+            str(Route(upload["id"])), headers=headers, params={"include_url": True}
+        )
+    ).data
+
+    assert stored.status_code == 200
+    assert finalized.status_code == 200, finalized.text
+    assert document["file_size_bytes"] == len(CONTENT)
+    assert client.get(document["signed_url"]).content == CONTENT
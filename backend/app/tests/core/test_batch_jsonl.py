@@ -0,0 +1,158 @@
+"""Tests for the streaming JSONL request-file writer."""
+
+import io
+import json
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from openai import OpenAI
+
+from app.core.batch.jsonl import (
+    JSONLRequestFile,
+    decode_json,
+    iter_jsonl_request_files,
+    write_jsonl_request_file,
+)
+from app.core.batch.openai import OpenAIBatchProvider
+
+
+def _requests(count: int):
+    for i in range(count):
+        yield {"custom_id": f"item_{i}", "body": {"input": f"Question {i}"}}
+
+
+def test_write_jsonl_request_file_from_generator():
+    """Test that a generator is serialized line by line and counted."""
+    with write_jsonl_request_file(_requests(3)) as request_file:
+        assert request_file.count == 3
+        lines = request_file.rewind().read().decode("utf-8").splitlines()
+
+    assert [json.loads(line)["custom_id"] for line in lines] == [
+        "item_0",
+        "item_1",
+        "item_2",
+    ]
+    assert request_file.size_bytes == sum(len(line) + 1 for line in lines)
+
+
+def test_jsonl_request_file_rolls_over_to_disk():
+    """Test that content larger than max_size is spilled out of memory."""
+    with JSONLRequestFile(max_size=256) as request_file:
+        request_file.write_all(_requests(2))
+        assert not request_file.rolled_to_disk
+
+        request_file.write_all(_requests(10))
+        assert request_file.rolled_to_disk
+        assert not isinstance(request_file.rewind(), io.BytesIO)
+        assert request_file.count == 12
+        assert len(request_file.rewind().read()) == request_file.size_bytes
+
+
+def test_iter_jsonl_request_files_splits_within_limits():
+    """Test that requests are split by line count and byte size, in order."""
+    files = list(iter_jsonl_request_files(_requests(5), max_requests=2))
+    assert [f.count for f in files] == [2, 2, 1]
+    second_ids = [
+        json.loads(line)["custom_id"] for line in files[1].rewind().read().splitlines()
+    ]
+    assert second_ids == ["item_2", "item_3"]
+    for f in files:
+        f.close()
+
+    line_size = len(JSONLRequestFile.encode(next(_requests(1))))
+    files = list(iter_jsonl_request_files(_requests(3), max_bytes=line_size * 2))
+    assert [f.count for f in files] == [2, 1]
+    assert all(f.size_bytes <= line_size * 2 for f in files)
+    for f in files:
+        f.close()
+
+
+def test_iter_jsonl_request_files_rejects_oversized_request():
+    """Test that a single request larger than the byte limit is an error."""
+    with pytest.raises(ValueError, match="exceeds the per-file limit"):
+        list(iter_jsonl_request_files(_requests(1), max_bytes=10))
+
+
+def test_openai_create_batch_uploads_from_file_handle():
+    """Test that create_batch streams requests and uploads a file handle."""
+    client = MagicMock()
+    client.files.create.return_value = MagicMock(id="file_123")
+    client.batches.create.return_value = MagicMock(id="batch_123", status="validating")
+
+    uploaded = {}
+
+    def capture_upload(file, purpose):
+        filename, handle = file
+        uploaded["filename"] = filename
+        uploaded["content"] = handle.read()
+        return MagicMock(id="file_123")
+
+    client.files.create.side_effect = capture_upload
+
+    provider = OpenAIBatchProvider(client=client)
+    result = provider.create_batch(
+        jsonl_data=_requests(4), config={"endpoint": "/v1/responses"}
+    )
+
+    assert result["provider_batch_id"] == "batch_123"
+    assert result["provider_file_id"] == "file_123"
+    assert result["total_items"] == 4
+    assert uploaded["filename"] == "batch_input.jsonl"
+    assert len(uploaded["content"].splitlines()) == 4
+    client.batches.create.assert_called_once()
+
+
+def test_upload_keeps_small_request_file_in_memory():
+    """Test that an httpx-backed upload does not force a small file to disk."""
+    received = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        received["body"] = request.read()
+        return httpx.Response(
+            200,
+            json={
+                "id": "file_123",
+                "object": "file",
+                "bytes": len(received["body"]),
+                "created_at": 0,
+                "filename": "batch_input.jsonl",
+                "purpose": "batch",
+                "status": "processed",
+            },
+        )
+
+    client = OpenAI(
+        api_key="test-key",
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    provider = OpenAIBatchProvider(client=client)
+
+    with write_jsonl_request_file(_requests(3)) as request_file:
+        file_id = provider.upload_file(content=request_file.rewind())
+
+        assert file_id == "file_123"
+        assert isinstance(request_file.rewind(), io.BytesIO)
+        assert b'"custom_id": "item_2"' in received["body"]
+
+
+def test_decode_json_accepts_text_and_bytes():
+    """Test that lines decode the same from str and bytes, and errors are ValueError."""
+    line = '{"custom_id": "item_1", "response": {"body": {"output": []}}}'
+
+    assert decode_json(line) == json.loads(line)
+    assert decode_json(line.encode("utf-8")) == json.loads(line)
+    with pytest.raises(ValueError):
+        decode_json("{not json")
+
+
+def test_openai_download_batch_results_skips_invalid_lines():
+    """Test that batch output is decoded line by line, dropping broken lines."""
+    provider = OpenAIBatchProvider(client=MagicMock())
+    provider.download_file = MagicMock(
+        return_value='{"custom_id": "item_1"}\n{broken\n{"custom_id": "item_2"}\n'
+    )
+
+    results = provider.download_batch_results("file_123")
+
+    assert [result["custom_id"] for result in results] == ["item_1", "item_2"]
@@ -0,0 +1,415 @@
+"""Tests for the S3 storage client, transfers and direct uploads."""
+
+import asyncio
+import contextvars
+import hashlib
+import io
+import os
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+import requests
+from moto import mock_aws
+from sqlmodel import Session, select
+
+from app.core.cloud import storage as cloud_storage
+from app.core.cloud.storage import (
+    CHECKSUM_METADATA_KEY,
+    S3_MAX_POOL_CONNECTIONS,
+    SIGNED_URL_CACHE_WINDOW,
+    AmazonCloudStorage,
+    AmazonCloudStorageClient,
+    CloudStorageError,
+    SimpleStorageName,
+    StoredObject,
+    get_cloud_storage,
+    get_project_storage_path,
+    get_s3_client,
+    get_storage_io_executor,
+    iter_byte_ranges,
+    run_storage_io,
+)
+from app.core.config import settings
+from app.models import Project
+
+
+@pytest.fixture
+def fresh_caches():
+    """Start from an empty client, storage path and signed URL cache."""
+    with patch.object(cloud_storage, "_s3_client", None), patch.object(
+        cloud_storage, "_storage_paths", cloud_storage.OrderedDict()
+    ), patch.object(cloud_storage, "_signed_urls", cloud_storage.OrderedDict()):
+        yield
+
+
+@pytest.fixture
+def storage_io_executor():
+    """A fresh storage threadpool, shut down after the test."""
+    with patch.object(cloud_storage, "_storage_io_executor", None):
+        yield
+        get_storage_io_executor().shutdown(wait=True)
+
+
+@pytest.mark.usefixtures("fresh_caches")
+class TestGetS3Client:
+    """Test the process-wide S3 client."""
+
+    def test_client_is_shared(self):
+        """Test that every storage client uses the same boto3 client."""
+        client = get_s3_client()
+
+        assert AmazonCloudStorageClient().client is client
+        assert AmazonCloudStorageClient().client is client
+
+    def test_client_config(self):
+        """Test that the client keeps a larger pool and retries adaptively."""
+        config = get_s3_client().meta.config
+
+        assert config.max_pool_connections == S3_MAX_POOL_CONNECTIONS
+        assert config.retries["mode"] == "adaptive"
+        assert config.tcp_keepalive is True
+
+    def test_client_created_once_across_threads(self):
+        """Test that concurrent first calls create a single client."""
+        barrier = threading.Barrier(8)
+        clients = []
+
+        def get_client():
+            barrier.wait()
+            clients.append(get_s3_client())
+
+        with patch.object(
+            cloud_storage, "_create_s3_client", side_effect=lambda: MagicMock()
+        ) as mock_create:
+            threads = [threading.Thread(target=get_client) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        mock_create.assert_called_once()
+        assert len({id(client) for client in clients}) == 1
+
+
+@pytest.mark.usefixtures("fresh_caches")
+class TestGetProjectStoragePath:
+    """Test the per-process cache of project storage paths."""
+
+    def test_storage_path_is_cached(self, db: Session):
+        """Test that the project is read from the database only once."""
+        project = db.exec(select(Project)).first()
+
+        with patch(
+            "app.core.cloud.storage.get_project_by_id",
+            wraps=cloud_storage.get_project_by_id,
+        ) as mock_get:
+            first = get_project_storage_path(session=db, project_id=project.id)
+            storage = get_cloud_storage(session=db, project_id=project.id)
+
+        assert first == project.storage_path
+        assert storage.storage_path == str(project.storage_path)
+        mock_get.assert_called_once()
+
+    def test_invalid_project(self, db: Session):
+        """Test that an unknown project is rejected and not cached."""
+        with pytest.raises(ValueError, match="Invalid project_id"):
+            get_project_storage_path(session=db, project_id=-1)
+
+        assert -1 not in cloud_storage._storage_paths
+
+    def test_cache_is_bounded(self, db: Session):
+        """Test that the least recently used project is evicted."""
+        projects = {
+            project_id: MagicMock(storage_path=f"path_{project_id}")
+            for project_id in (1, 2, 3)
+        }
+
+        with patch.object(cloud_storage, "STORAGE_PATH_CACHE_SIZE", 2), patch(
+            "app.core.cloud.storage.get_project_by_id",
+            side_effect=lambda session, project_id: projects[project_id],
+        ):
+            get_project_storage_path(session=db, project_id=1)
+            get_project_storage_path(session=db, project_id=2)
+            get_project_storage_path(session=db, project_id=1)
+            get_project_storage_path(session=db, project_id=3)
+
+        assert list(cloud_storage._storage_paths) == [1, 3]
+
+
+class TestIterByteRanges:
+    """Test splitting objects into download ranges."""
+
+    def test_small_object_is_one_range(self):
+        assert list(iter_byte_ranges(10, threshold=100, chunk_size=4)) == [(0, 9)]
+
+    def test_large_object_is_split(self):
+        assert list(iter_byte_ranges(10, threshold=5, chunk_size=4)) == [
+            (0, 3),
+            (4, 7),
+            (8, 9),
+        ]
+
+    def test_empty_object_has_no_ranges(self):
+        assert list(iter_byte_ranges(0, threshold=5, chunk_size=4)) == []
+
+
+@pytest.fixture
+def s3_storage(fresh_caches):
+    """AmazonCloudStorage against a moto S3 bucket."""
+    with patch.dict(
+        os.environ,
+        {
+            "AWS_ACCESS_KEY_ID": "testing",
+            "AWS_SECRET_ACCESS_KEY": "testing",
+            "AWS_DEFAULT_REGION": settings.AWS_DEFAULT_REGION,
+        },
+    ), mock_aws():
+        AmazonCloudStorageClient().create()
+        yield AmazonCloudStorage(project_id=1, storage_path=uuid4())
+
+
+def put_bytes(storage: AmazonCloudStorage, content: bytes, name: str) -> str:
+    source = MagicMock(file=io.BytesIO(content), content_type="application/pdf")
+    return str(storage.put(source=source, file_path=Path(name)))
+
+
+class TestAmazonCloudStorageTransfers:
+    """Test multipart uploads and ranged downloads against moto."""
+
+    def test_put_records_checksum(self, s3_storage: AmazonCloudStorage):
+        """Test that uploads carry the SHA-256 of their content."""
+        content = b"%PDF-1.7 document"
+        url = put_bytes(s3_storage, content, "doc.pdf")
+
+        head = get_s3_client().head_object(**vars(SimpleStorageName.from_url(url)))
+        assert head["Metadata"][CHECKSUM_METADATA_KEY] == (
+            hashlib.sha256(content).hexdigest()
+        )
+
+    def test_multipart_round_trip(self, s3_storage: AmazonCloudStorage, tmp_path):
+        """Test that a multipart upload downloads intact in parallel ranges."""
+        part_size = 5 * 1024 * 1024  # S3 minimum part size
+        content = os.urandom(2 * part_size + 1024)
+
+        with patch.object(
+            settings, "AWS_S3_MULTIPART_THRESHOLD", part_size
+        ), patch.object(settings, "AWS_S3_MULTIPART_CHUNK_SIZE", part_size):
+            url = put_bytes(s3_storage, content, "large.pdf")
+            with patch.object(
+                get_s3_client(), "get_object", wraps=get_s3_client().get_object
+            ) as mock_get:
+                destination = s3_storage.download(url, tmp_path / "large.pdf")
+
+        # A multipart upload's ETag ends with its number of parts
+        head = get_s3_client().head_object(**vars(SimpleStorageName.from_url(url)))
+        assert head["ETag"].endswith('-3"')
+        assert destination.read_bytes() == content
+        assert mock_get.call_count == 3
+
+    def test_download_checksum_mismatch(self, s3_storage: AmazonCloudStorage, tmp_path):
+        """Test that content not matching its recorded checksum is rejected."""
+        name = SimpleStorageName(f"{s3_storage.storage_path}/tampered.pdf")
+        get_s3_client().put_object(
+            Body=b"tampered",
+            Metadata={CHECKSUM_METADATA_KEY: hashlib.sha256(b"orig").hexdigest()},
+            **vars(name),
+        )
+
+        with pytest.raises(CloudStorageError, match="Checksum mismatch"):
+            s3_storage.download(str(name), tmp_path / "tampered.pdf")
+
+    def test_download_missing_object(self, s3_storage: AmazonCloudStorage, tmp_path):
+        """Test that a missing object raises CloudStorageError."""
+        url = str(SimpleStorageName(f"{s3_storage.storage_path}/missing.pdf"))
+
+        with pytest.raises(CloudStorageError):
+            s3_storage.download(url, tmp_path / "missing.pdf")
+
+
+class TestAmazonCloudStorageDirectUploads:
+    """Test presigned uploads and object verification against moto."""
+
+    def test_signed_upload_round_trip(self, s3_storage: AmazonCloudStorage):
+        """Test that an upload with the signed headers is recorded with its checksum."""
+        content = b"%PDF-1.7 direct"
+        sha256 = hashlib.sha256(content).hexdigest()
+
+        signed = s3_storage.get_signed_upload(
+            Path("direct.pdf"), sha256=sha256, content_type="application/pdf"
+        )
+        response = requests.put(signed.url, data=content, headers=signed.headers)
+
+        assert response.status_code == 200
+        assert signed.destination.Key == f"{s3_storage.storage_path}/direct.pdf"
+        assert s3_storage.get_object_info(str(signed.destination)) == StoredObject(
+            size_bytes=len(content), sha256=sha256
+        )
+
+    def test_signed_upload_rejects_absolute_path(self, s3_storage: AmazonCloudStorage):
+        with pytest.raises(ValueError):
+            s3_storage.get_signed_upload(Path("/direct.pdf"), sha256="0" * 64)
+
+    def test_object_info_checksum_mismatch(self, s3_storage: AmazonCloudStorage):
+        """Test that metadata disagreeing with the S3 checksum is rejected."""
+        name = SimpleStorageName(f"{s3_storage.storage_path}/tampered.pdf")
+        get_s3_client().put_object(
+            Body=b"tampered",
+            ChecksumAlgorithm="SHA256",
+            Metadata={CHECKSUM_METADATA_KEY: hashlib.sha256(b"orig").hexdigest()},
+            **vars(name),
+        )
+
+        with pytest.raises(CloudStorageError, match="Checksum mismatch"):
+            s3_storage.get_object_info(str(name))
+
+    def test_object_info_missing_object(self, s3_storage: AmazonCloudStorage):
+        url = str(SimpleStorageName(f"{s3_storage.storage_path}/missing.pdf"))
+
+        with pytest.raises(CloudStorageError):
+            s3_storage.get_object_info(url)
+
+
+class TestAmazonCloudStorageSignedUrls:
+    """Test bulk signing and caching of download URLs."""
+
+    def test_signed_urls_are_cached(self, s3_storage: AmazonCloudStorage, caplog):
+        """Test that repeated signing reuses URLs and logs one line per call."""
+        urls = [
+            str(SimpleStorageName(f"{s3_storage.storage_path}/{i}.pdf"))
+            for i in range(5)
+        ]
+
+        with patch.object(
+            get_s3_client(),
+            "generate_presigned_url",
+            wraps=get_s3_client().generate_presigned_url,
+        ) as mock_sign:
+            with caplog.at_level("INFO", logger=cloud_storage.logger.name):
+                first = s3_storage.get_signed_urls(urls)
+                second = s3_storage.get_signed_urls(urls + urls[:1])
+
+        assert list(first) == urls
+        assert second == first
+        assert mock_sign.call_count == 5
+        messages = [r.message for r in caplog.records if "get_signed_urls" in r.message]
+        assert len(messages) == 2
+        assert "'cached': 5" in messages[1]
+
+    def test_signed_url_lifetime(self, s3_storage: AmazonCloudStorage):
+        """Test that a URL stays valid for the requested time after its window."""
+        url = str(SimpleStorageName(f"{s3_storage.storage_path}/doc.pdf"))
+        start = 1_000 * SIGNED_URL_CACHE_WINDOW
+
+        with patch.object(cloud_storage.time, "time", return_value=start + 10):
+            signed = s3_storage.get_signed_url(url, expires_in=600)
+        with patch.object(cloud_storage.time, "time", return_value=start + 20):
+            cached = s3_storage.get_signed_url(url, expires_in=600)
+        with patch.object(
+            cloud_storage.time, "time", return_value=start + SIGNED_URL_CACHE_WINDOW
+        ):
+            renewed = s3_storage.get_signed_url(url, expires_in=600)
+
+        expires = int(parse_qs(urlparse(signed).query)["X-Amz-Expires"][0])
+        assert expires >= 600 + SIGNED_URL_CACHE_WINDOW - 10
+        assert cached == signed
+        assert renewed != signed
+
+    def test_cache_is_keyed_by_expiry(self, s3_storage: AmazonCloudStorage):
+        url = str(SimpleStorageName(f"{s3_storage.storage_path}/doc.pdf"))
+
+        short = s3_storage.get_signed_url(url, expires_in=60)
+        long = s3_storage.get_signed_url(url, expires_in=3600)
+
+        assert short != long
+
+
+@pytest.mark.usefixtures("storage_io_executor")
+class TestRunStorageIO:
+    """Test offloading blocking storage calls from async code."""
+
+    def test_runs_on_storage_thread_with_context(self):
+        """Test that calls leave the event loop thread and keep context vars."""
+        request_id = contextvars.ContextVar("request_id")
+
+        def blocking_call(value):
+            return threading.current_thread().name, request_id.get(), value
+
+        async def main():
+            request_id.set("req-1")
+            return await run_storage_io(blocking_call, "done")
+
+        thread_name, seen_id, value = asyncio.run(main())
+
+        assert thread_name.startswith("storage-io")
+        assert seen_id == "req-1"
+        assert value == "done"
+
+    def test_event_loop_stays_responsive(self):
+        """Test that a slow call does not delay other coroutines."""
+
+        async def heartbeat(stop: asyncio.Event) -> float:
+            worst = 0.0
+            while not stop.is_set():
+                started = time.perf_counter()
+                await asyncio.sleep(0.01)
+                worst = max(worst, time.perf_counter() - started)
+            return worst
+
+        async def main():
+            stop = asyncio.Event()
+            beat = asyncio.create_task(heartbeat(stop))
+            await run_storage_io(time.sleep, 0.5)
+            stop.set()
+            return await beat
+
+        assert asyncio.run(main()) < 0.2
+
+    def test_pool_is_bounded(self):
+        """Test that no more than STORAGE_IO_MAX_WORKERS calls run at once."""
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def blocking_call():
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+
+        async def main():
+            await asyncio.gather(*(run_storage_io(blocking_call) for _ in range(12)))
+
+        with patch.object(settings, "STORAGE_IO_MAX_WORKERS", 3):
+            asyncio.run(main())
+
+        assert 1 < max_in_flight <= 3
+
+
+@pytest.mark.usefixtures("storage_io_executor")
+class TestAmazonCloudStorageAsync:
+    """Test the async storage methods against moto."""
+
+    def test_async_round_trip(self, s3_storage: AmazonCloudStorage, tmp_path):
+        content = b"%PDF-1.7 async"
+        source = MagicMock(file=io.BytesIO(content), content_type="application/pdf")
+
+        async def main():
+            url = str(await s3_storage.aput(source, Path("async.pdf")))
+            info = await s3_storage.aget_object_info(url)
+            destination = await s3_storage.adownload(url, tmp_path / "async.pdf")
+            await s3_storage.adelete(url)
+            return info, destination
+
+        info, destination = asyncio.run(main())
+
+        assert info.size_bytes == len(content)
+        assert info.sha256 == hashlib.sha256(content).hexdigest()
+        assert destination.read_bytes() == content
@@ -0,0 +1,229 @@
+"""Tests for the local filesystem storage backend."""
+
+import hashlib
+import io
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+from uuid import uuid4
+
+import pytest
+from sqlmodel import Session, select
+
+from app.core.cloud import storage as cloud_storage
+from app.core.cloud.storage import (
+    CloudStorageError,
+    LocalCloudStorage,
+    SimpleStorageName,
+    StoredObject,
+    get_cloud_storage,
+    get_local_object_path,
+    mapped_sha256,
+    verify_local_url,
+)
+from app.core.config import settings
+from app.models import Project
+
+
+@pytest.fixture
+def local_storage(tmp_path):
+    """LocalCloudStorage rooted in a temporary directory."""
+    with patch.object(settings, "STORAGE_BACKEND", "local"), patch.object(
+        settings, "LOCAL_STORAGE_ROOT", str(tmp_path)
+    ):
+        yield LocalCloudStorage(project_id=1, storage_path=uuid4())
+
+
+def put_bytes(storage: LocalCloudStorage, content: bytes, name: str, **kwargs) -> str:
+    source = MagicMock(file=io.BytesIO(content), content_type="application/pdf")
+    return str(storage.put(source=source, file_path=Path(name), **kwargs))
+
+
+def signed_query(signed_url: str) -> tuple[SimpleStorageName, int, str]:
+    parsed = urlparse(signed_url)
+    prefix = f"{settings.API_V1_STR}/storage/"
+    bucket, key = parsed.path.removeprefix(prefix).split("/", 1)
+    query = parse_qs(parsed.query)
+    return (
+        SimpleStorageName(Key=key, Bucket=bucket),
+        int(query["expires"][0]),
+        query["signature"][0],
+    )
+
+
+class TestLocalCloudStorage:
+    """Test storing and reading objects on the local filesystem."""
+
+    def test_put_round_trip(self, local_storage: LocalCloudStorage, tmp_path):
+        """Test that objects mirror the bucket layout and read back intact."""
+        content = b"%PDF-1.7 local"
+        url = put_bytes(local_storage, content, "doc.pdf")
+
+        name = SimpleStorageName.from_url(url)
+        assert url.startswith(f"s3://{settings.AWS_S3_BUCKET}/")
+        assert (tmp_path / name.Bucket / name.Key).read_bytes() == content
+        assert local_storage.get_object_info(url) == StoredObject(
+            size_bytes=len(content), sha256=hashlib.sha256(content).hexdigest()
+        )
+        assert local_storage.get_file_size_kb(url) == round(len(content) / 1024, 2)
+
+    def test_stream_reads_like_a_file(self, local_storage: LocalCloudStorage):
+        content = b"question,answer\n" * 100
+        url = put_bytes(local_storage, content, "data.csv")
+
+        body = local_storage.stream(url)
+        body.name = "data.csv"
+        try:
+            head = body.read(16)
+            rest = b"".join(body.iter_chunks(64))
+        finally:
+            body.close()
+
+        assert head == b"question,answer\n"
+        assert head + rest == content
+
+    def test_stream_empty_object(self, local_storage: LocalCloudStorage):
+        url = put_bytes(local_storage, b"", "empty.txt")
+
+        body = local_storage.stream(url)
+
+        assert body.read() == b""
+        body.close()
+
+    def test_failed_put_keeps_previous_content(
+        self, local_storage: LocalCloudStorage, tmp_path
+    ):
+        """Test that an interrupted write leaves the old object and no temp files."""
+        url = put_bytes(local_storage, b"original", "doc.pdf")
+        broken = MagicMock(content_type="application/pdf")
+        broken.file.read.side_effect = [b"partial", OSError("connection reset")]
+
+        with pytest.raises(CloudStorageError):
+            local_storage.put(source=broken, file_path=Path("doc.pdf"))
+
+        path = get_local_object_path(SimpleStorageName.from_url(url))
+        assert path.read_bytes() == b"original"
+        assert os.listdir(path.parent) == ["doc.pdf"]
+
+    def test_put_checksum_mismatch(self, local_storage: LocalCloudStorage):
+        """Test that content not matching the expected checksum is not stored."""
+        with pytest.raises(CloudStorageError, match="Checksum mismatch"):
+            put_bytes(local_storage, b"content", "doc.pdf", sha256="0" * 64)
+
+        url = str(SimpleStorageName(f"{local_storage.storage_path}/doc.pdf"))
+        with pytest.raises(CloudStorageError):
+            local_storage.get_object_info(url)
+
+    def test_download(self, local_storage: LocalCloudStorage, tmp_path):
+        content = os.urandom(3 * 1024 * 1024)
+        url = put_bytes(local_storage, content, "large.bin")
+
+        destination = local_storage.download(url, tmp_path / "copy.bin")
+
+        assert destination.read_bytes() == content
+        assert mapped_sha256(destination) == hashlib.sha256(content).hexdigest()
+
+    def test_download_checksum_mismatch(
+        self, local_storage: LocalCloudStorage, tmp_path
+    ):
+        url = put_bytes(local_storage, b"original", "doc.pdf")
+        get_local_object_path(SimpleStorageName.from_url(url)).write_bytes(b"tamper")
+
+        with pytest.raises(CloudStorageError, match="Checksum mismatch"):
+            local_storage.download(url, tmp_path / "copy.pdf")
+
+    def test_missing_object(self, local_storage: LocalCloudStorage, tmp_path):
+        url = str(SimpleStorageName(f"{local_storage.storage_path}/missing.pdf"))
+
+        with pytest.raises(CloudStorageError):
+            local_storage.stream(url)
+        with pytest.raises(CloudStorageError):
+            local_storage.download(url, tmp_path / "missing.pdf")
+
+    def test_delete(self, local_storage: LocalCloudStorage):
+        """Test that deleting removes the object and is safe to repeat."""
+        url = put_bytes(local_storage, b"content", "doc.pdf")
+
+        local_storage.delete(url)
+        local_storage.delete(url)
+
+        with pytest.raises(CloudStorageError):
+            local_storage.get_object_info(url)
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            f"s3://{settings.AWS_S3_BUCKET}/../outside.txt",
+            "s3://.meta/key.json",
+            "s3:///key.txt",
+        ],
+    )
+    def test_names_outside_the_root_are_rejected(
+        self, local_storage: LocalCloudStorage, url: str
+    ):
+        with pytest.raises(CloudStorageError):
+            get_local_object_path(SimpleStorageName.from_url(url))
+
+
+class TestLocalCloudStorageSignedUrls:
+    """Test HMAC signed URLs of the local backend."""
+
+    def test_signed_url_verifies(self, local_storage: LocalCloudStorage):
+        url = put_bytes(local_storage, b"content", "doc.pdf")
+
+        signed = local_storage.get_signed_url(url, expires_in=600)
+
+        assert signed.startswith(f"{settings.API_BASE_URL}{settings.API_V1_STR}/")
+        name, expires, signature = signed_query(signed)
+        assert name == SimpleStorageName.from_url(url)
+        assert verify_local_url("GET", name, expires, signature)
+        assert not verify_local_url("PUT", name, expires, signature)
+        assert not verify_local_url("GET", name, expires + 1, signature)
+
+    def test_signed_urls_are_stable_within_a_window(
+        self, local_storage: LocalCloudStorage
+    ):
+        """Test that URLs keep the requested lifetime and can be cached."""
+        urls = [put_bytes(local_storage, b"content", f"{i}.pdf") for i in range(3)]
+        start = 1_000 * cloud_storage.SIGNED_URL_CACHE_WINDOW
+
+        with patch.object(cloud_storage.time, "time", return_value=start + 10):
+            first = local_storage.get_signed_urls(urls, expires_in=600)
+        with patch.object(cloud_storage.time, "time", return_value=start + 20):
+            second = local_storage.get_signed_urls(urls, expires_in=600)
+
+        assert list(first) == urls
+        assert second == first
+        _, expires, _ = signed_query(first[urls[0]])
+        assert expires >= start + 20 + 600
+
+    def test_expired_url_is_rejected(self, local_storage: LocalCloudStorage):
+        url = put_bytes(local_storage, b"content", "doc.pdf")
+        name, expires, signature = signed_query(local_storage.get_signed_url(url))
+
+        with patch.object(cloud_storage.time, "time", return_value=expires + 1):
+            assert not verify_local_url("GET", name, expires, signature)
+
+    def test_signed_upload(self, local_storage: LocalCloudStorage):
+        """Test that the checksum is part of an upload signature."""
+        sha256 = hashlib.sha256(b"content").hexdigest()
+
+        signed = local_storage.get_signed_upload(
+            Path("doc.pdf"), sha256=sha256, content_type="application/pdf"
+        )
+
+        name, expires, signature = signed_query(signed.url)
+        assert name == signed.destination
+        assert signed.headers["Content-Type"] == "application/pdf"
+        assert verify_local_url("PUT", name, expires, signature, sha256)
+        assert not verify_local_url("PUT", name, expires, signature, "0" * 64)
+
+
+def test_get_cloud_storage_uses_local_backend(db: Session, local_storage):
+    project = db.exec(select(Project)).first()
+
+    storage = get_cloud_storage(session=db, project_id=project.id)
+
+    assert isinstance(storage, LocalCloudStorage)
+    assert storage.storage_path == str(project.storage_path)
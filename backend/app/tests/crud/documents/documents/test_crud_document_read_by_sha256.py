@@ -0,0 +1,57 @@
+import pytest
+from sqlmodel import Session
+
+from app.crud import DocumentCrud
+
+from app.tests.utils.document import DocumentStore
+from app.tests.utils.utils import get_project
+from app.tests.utils.test_data import create_test_project
+
+SHA256 = "a" * 64
+
+
+@pytest.fixture
+def store(db: Session):
+    project = get_project(db)
+    return DocumentStore(db, project.id)
+
+
+def put_with_sha256(store: DocumentStore, **fields):
+    document = next(store.documents)
+    document.sha256 = SHA256
+    for field, value in fields.items():
+        setattr(document, field, value)
+    store.db.add(document)
+    store.db.commit()
+    store.db.refresh(document)
+    return document
+
+
+class TestDatabaseReadBySha256:
+    def test_returns_earliest_match(self, db: Session, store: DocumentStore):
+        first = put_with_sha256(store)
+        put_with_sha256(store)
+
+        result = DocumentCrud(db, store.project.id).read_by_sha256(SHA256)
+
+        assert result.id == first.id
+
+    def test_ignores_deleted_pending_and_transformed(
+        self, db: Session, store: DocumentStore
+    ):
+        source = store.put()
+        put_with_sha256(store, is_deleted=True)
+        put_with_sha256(store, is_pending=True)
+        put_with_sha256(store, source_document_id=source.id)
+
+        result = DocumentCrud(db, store.project.id).read_by_sha256(SHA256)
+
+        assert result is None
+
+    def test_is_project_scoped(self, db: Session, store: DocumentStore):
+        put_with_sha256(store)
+        other_project = create_test_project(db)
+
+        result = DocumentCrud(db, other_project.id).read_by_sha256(SHA256)
+
+        assert result is None
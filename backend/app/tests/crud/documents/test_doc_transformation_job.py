@@ -183,6 +183,61 @@ class TestDocTransformationJobCrudReadEach:
         assert len(results) == 0
 
 
+class TestDocTransformationJobCrudReadEachWithOutputs:
+    def test_reads_jobs_with_transformed_documents(
+        self, db: Session, store: DocumentStore, crud: DocTransformationJobCrud
+    ):
+        source, transformed = store.fill(2)
+        completed = crud.create(DocTransformJobCreate(source_document_id=source.id))
+        pending = crud.create(DocTransformJobCreate(source_document_id=source.id))
+        crud.update(
+            completed.id,
+            DocTransformJobUpdate(
+                status=TransformationStatus.COMPLETED,
+                transformed_document_id=transformed.id,
+            ),
+        )
+
+        results = dict(
+            (job.id, doc)
+            for job, doc in crud.read_each_with_outputs({completed.id, pending.id})
+        )
+
+        assert results[completed.id].id == transformed.id
+        assert results[pending.id] is None
+
+    def test_deleted_transformed_document_is_none(
+        self, db: Session, store: DocumentStore, crud: DocTransformationJobCrud
+    ):
+        source, transformed = store.fill(2)
+        job = crud.create(DocTransformJobCreate(source_document_id=source.id))
+        crud.update(
+            job.id,
+            DocTransformJobUpdate(
+                status=TransformationStatus.COMPLETED,
+                transformed_document_id=transformed.id,
+            ),
+        )
+        transformed.is_deleted = True
+        db.add(transformed)
+        db.commit()
+
+        ((result_job, result_doc),) = crud.read_each_with_outputs({job.id})
+
+        assert result_job.id == job.id
+        assert result_doc is None
+
+    def test_excludes_other_projects(
+        self, db: Session, store: DocumentStore, crud: DocTransformationJobCrud
+    ):
+        job = crud.create(DocTransformJobCreate(source_document_id=store.put().id))
+        other_project = create_test_project(db)
+
+        other_crud = DocTransformationJobCrud(db, other_project.id)
+
+        assert other_crud.read_each_with_outputs({job.id}) == []
+
+
 class TestDocTransformationJobCrudUpdateStatus:
     def test_can_update_status_to_processing(
         self, db: Session, store: DocumentStore, crud: DocTransformationJobCrud
@@ -0,0 +1,313 @@
+"""Tests for starting evaluation batches."""
+
+import io
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlmodel import Session, select
+
+from app.core.cloud.storage import CloudStorageError
+from app.crud.evaluations.batch import load_dataset_items, start_evaluation_batch
+from app.crud.evaluations.snapshot import SNAPSHOT_METADATA_KEY
+from app.models import EvaluationDataset, EvaluationRun, Organization, Project
+from app.models.batch_job import BatchJob
+from app.tests.utils.openai import get_mock_openai_batch_client
+
+
+def create_langfuse(questions: list[str], metadata: dict | None = None) -> MagicMock:
+    """Mock Langfuse client whose dataset has one item per question."""
+    items = []
+    for i, question in enumerate(questions):
+        item = MagicMock(
+            id=f"item_{i}",
+            input={"question": question},
+            expected_output={"answer": f"Answer {i}"},
+            metadata=metadata or {},
+        )
+        items.append(item)
+
+    langfuse = MagicMock()
+    langfuse.get_dataset.return_value = MagicMock(items=items)
+    langfuse.api.datasets.get.return_value = MagicMock(
+        id="langfuse_dataset_123",
+        updated_at=datetime(2025, 12, 1, tzinfo=timezone.utc),
+    )
+    langfuse.api.dataset_items.list.return_value.meta.total_items = len(items)
+    return langfuse
+
+
+def create_storage() -> MagicMock:
+    """Mock CloudStorage that keeps put files in memory."""
+    storage = MagicMock()
+    storage.files = {}
+
+    def put(source, file_path: Path) -> str:
+        url = f"s3://bucket/{file_path.as_posix()}"
+        storage.files[url] = source.file.read()
+        return url
+
+    def stream(url: str) -> io.BytesIO:
+        if url not in storage.files:
+            raise CloudStorageError(f"AWS Error: NoSuchKey ({url})")
+        return io.BytesIO(storage.files[url])
+
+    storage.put.side_effect = put
+    storage.stream.side_effect = stream
+    return storage
+
+
+@pytest.fixture
+def storage():
+    storage = create_storage()
+    with patch("app.crud.evaluations.batch.get_cloud_storage", return_value=storage):
+        yield storage
+
+
+@pytest.fixture
+def eval_run(db: Session) -> EvaluationRun:
+    org = db.exec(select(Organization)).first()
+    project = db.exec(select(Project).where(Project.organization_id == org.id)).first()
+
+    dataset = EvaluationDataset(
+        name="start_batch_dataset",
+        dataset_metadata={"original_items_count": 3},
+        organization_id=org.id,
+        project_id=project.id,
+    )
+    db.add(dataset)
+    db.commit()
+    db.refresh(dataset)
+
+    eval_run = EvaluationRun(
+        run_name="start_batch_run",
+        dataset_name=dataset.name,
+        dataset_id=dataset.id,
+        config={"model": "gpt-4o"},
+        status="pending",
+        organization_id=org.id,
+        project_id=project.id,
+    )
+    db.add(eval_run)
+    db.commit()
+    db.refresh(eval_run)
+    return eval_run
+
+
+class TestLoadDatasetItems:
+    """Test loading dataset items through the object store snapshot."""
+
+    def test_load_dataset_items_writes_snapshot(
+        self, db: Session, eval_run: EvaluationRun, storage: MagicMock
+    ):
+        """Test that fetched items are written to a snapshot and recorded."""
+        items = load_dataset_items(
+            session=db, langfuse=create_langfuse(["Q0", "Q1"]), eval_run=eval_run
+        )
+
+        assert [item["id"] for item in items] == ["item_0", "item_1"]
+        dataset = db.get(EvaluationDataset, eval_run.dataset_id)
+        snapshot = dataset.dataset_metadata[SNAPSHOT_METADATA_KEY]
+        assert snapshot["url"] in storage.files
+        assert snapshot["url"].endswith(
+            f"datasets/snapshots/langfuse_dataset_123/{snapshot['fingerprint']}.jsonl.gz"
+        )
+        assert dataset.dataset_metadata["original_items_count"] == 3
+        assert eval_run.dataset_snapshot == snapshot
+
+    def test_load_dataset_items_reuses_current_snapshot(
+        self, db: Session, eval_run: EvaluationRun, storage: MagicMock
+    ):
+        """Test that a later run reads the snapshot instead of paginating."""
+        load_dataset_items(
+            session=db, langfuse=create_langfuse(["Q0", "Q1"]), eval_run=eval_run
+        )
+        langfuse = create_langfuse(["Q0", "Q1"])
+
+        items = load_dataset_items(session=db, langfuse=langfuse, eval_run=eval_run)
+
+        assert [item["input"] for item in items] == [
+            {"question": "Q0"},
+            {"question": "Q1"},
+        ]
+        langfuse.get_dataset.assert_not_called()
+        assert len(storage.files) == 1
+
+    def test_load_dataset_items_refreshes_stale_snapshot(
+        self, db: Session, eval_run: EvaluationRun, storage: MagicMock
+    ):
+        """Test that a changed dataset is fetched again and re-snapshotted."""
+        load_dataset_items(
+            session=db, langfuse=create_langfuse(["Q0", "Q1"]), eval_run=eval_run
+        )
+        langfuse = create_langfuse(["Q0", "Q1", "Q2"])
+
+        items = load_dataset_items(session=db, langfuse=langfuse, eval_run=eval_run)
+
+        assert len(items) == 3
+        langfuse.get_dataset.assert_called_once()
+        assert len(storage.files) == 2
+
+    def test_load_dataset_items_without_verify(
+        self, db: Session, eval_run: EvaluationRun, storage: MagicMock
+    ):
+        """Test that completion reads the recorded snapshot without Langfuse."""
+        load_dataset_items(
+            session=db, langfuse=create_langfuse(["Q0"]), eval_run=eval_run
+        )
+        langfuse = MagicMock()
+
+        items = load_dataset_items(
+            session=db, langfuse=langfuse, eval_run=eval_run, verify=False
+        )
+
+        assert [item["id"] for item in items] == ["item_0"]
+        assert langfuse.mock_calls == []
+
+    def test_completion_reads_the_runs_own_snapshot(
+        self, db: Session, eval_run: EvaluationRun, storage: MagicMock
+    ):
+        """Test that a snapshot refreshed by a later run does not affect completion."""
+        load_dataset_items(
+            session=db, langfuse=create_langfuse(["Q0", "Q1"]), eval_run=eval_run
+        )
+        submitted_snapshot = eval_run.dataset_snapshot
+        later_run = EvaluationRun(
+            run_name="later_run",
+            dataset_name=eval_run.dataset_name,
+            dataset_id=eval_run.dataset_id,
+            config=eval_run.config,
+            status="pending",
+            organization_id=eval_run.organization_id,
+            project_id=eval_run.project_id,
+        )
+        db.add(later_run)
+        db.commit()
+        load_dataset_items(
+            session=db, langfuse=create_langfuse(["Q0", "Q1", "Q2"]), eval_run=later_run
+        )
+
+        items = load_dataset_items(
+            session=db, langfuse=MagicMock(), eval_run=eval_run, verify=False
+        )
+
+        assert submitted_snapshot["url"] in storage.files
+        assert later_run.dataset_snapshot["url"] != submitted_snapshot["url"]
+        assert eval_run.dataset_snapshot == submitted_snapshot
+        assert [item["id"] for item in items] == ["item_0", "item_1"]
+
+    def test_load_dataset_items_falls_back_on_missing_snapshot(
+        self, db: Session, eval_run: EvaluationRun, storage: MagicMock
+    ):
+        """Test that an unreadable snapshot falls back to Langfuse."""
+        load_dataset_items(
+            session=db, langfuse=create_langfuse(["Q0"]), eval_run=eval_run
+        )
+        storage.files.clear()
+        langfuse = create_langfuse(["Q0"])
+
+        items = load_dataset_items(
+            session=db, langfuse=langfuse, eval_run=eval_run, verify=False
+        )
+
+        assert [item["id"] for item in items] == ["item_0"]
+        langfuse.get_dataset.assert_called_once()
+
+
+@pytest.mark.usefixtures("storage")
+class TestStartEvaluationBatch:
+    """Test start_evaluation_batch with a lazily built JSONL payload."""
+
+    def test_start_evaluation_batch_uploads_every_line(
+        self, db: Session, eval_run: EvaluationRun
+    ):
+        """Test that the peeked first line is re-joined with the rest."""
+        uploaded: list[dict] = []
+        client = get_mock_openai_batch_client(uploaded)
+
+        result = start_evaluation_batch(
+            langfuse=create_langfuse(["Q0", "Q1", "Q2"]),
+            openai_client=client,
+            session=db,
+            eval_run=eval_run,
+            config={"model": "gpt-4o"},
+        )
+
+        assert [line["custom_id"] for line in uploaded] == [
+            "item_0",
+            "item_1",
+            "item_2",
+        ]
+        assert result.status == "processing"
+        assert result.total_items == 3
+        assert result.progress == {"stage": "submitted", "total_items": 3}
+
+        batch_job = db.get(BatchJob, result.batch_job_id)
+        assert batch_job.total_items == 3
+        assert batch_job.provider_batch_id == "batch_123"
+
+    def test_start_evaluation_batch_skips_leading_empty_question(
+        self, db: Session, eval_run: EvaluationRun
+    ):
+        """Test that items skipped before the first line are not uploaded."""
+        uploaded: list[dict] = []
+        client = get_mock_openai_batch_client(uploaded)
+
+        result = start_evaluation_batch(
+            langfuse=create_langfuse(["", "Q1", "Q2"]),
+            openai_client=client,
+            session=db,
+            eval_run=eval_run,
+            config={"model": "gpt-4o"},
+        )
+
+        assert [line["custom_id"] for line in uploaded] == ["item_1", "item_2"]
+        assert result.total_items == 2
+
+    def test_start_evaluation_batch_expands_duplicates(
+        self, db: Session, eval_run: EvaluationRun
+    ):
+        """Test that items stored once are submitted once per copy."""
+        uploaded: list[dict] = []
+        client = get_mock_openai_batch_client(uploaded)
+
+        result = start_evaluation_batch(
+            langfuse=create_langfuse(["Q0", "Q1"], metadata={"duplication_factor": 3}),
+            openai_client=client,
+            session=db,
+            eval_run=eval_run,
+            config={"model": "gpt-4o"},
+        )
+
+        assert [line["custom_id"] for line in uploaded] == [
+            "item_0#1",
+            "item_0#2",
+            "item_0#3",
+            "item_1#1",
+            "item_1#2",
+            "item_1#3",
+        ]
+        assert result.total_items == 6
+        assert result.progress["total_items"] == 6
+
+    def test_start_evaluation_batch_no_valid_items(
+        self, db: Session, eval_run: EvaluationRun
+    ):
+        """Test that an empty payload fails the run before anything is uploaded."""
+        uploaded: list[dict] = []
+        client = get_mock_openai_batch_client(uploaded)
+
+        with pytest.raises(ValueError, match="did not produce any JSONL entries"):
+            start_evaluation_batch(
+                langfuse=create_langfuse(["", ""]),
+                openai_client=client,
+                session=db,
+                eval_run=eval_run,
+                config={"model": "gpt-4o"},
+            )
+
+        client.files.create.assert_not_called()
+        assert eval_run.status == "failed"
+        assert eval_run.progress == {"stage": "failed"}
+        assert eval_run.batch_job_id is None
@@ -2,6 +2,7 @@
 Tests for evaluation_dataset CRUD operations.
 """
 
+import io
 from unittest.mock import MagicMock
 
 import pytest
@@ -9,12 +10,19 @@ from sqlmodel import Session, select
 
 from app.core.cloud.storage import CloudStorageError
 from app.crud.evaluations.dataset import (
+    build_copy_id,
     create_evaluation_dataset,
     download_csv_from_object_store,
     get_dataset_by_id,
     get_dataset_by_name,
+    get_item_copies,
+    iter_csv_items,
+    iter_csv_lines,
     list_datasets,
+    read_csv_columns,
+    split_copy_id,
     update_dataset_langfuse_id,
+    update_evaluation_dataset,
     upload_csv_to_object_store,
 )
 from app.models import Organization, Project
@@ -335,6 +343,104 @@ class TestUploadCsvToObjectStore:
 
         assert object_store_url is None
 
+    def test_upload_csv_to_object_store_streams_file(self):
+        """Test that a file object is handed to storage without reading it."""
+        mock_storage = MagicMock()
+        mock_storage.put.return_value = "s3://bucket/datasets/test_dataset.csv"
+        file_obj = io.BytesIO(b"question,answer\nWhat is 2+2?,4\n")
+
+        upload_csv_to_object_store(
+            storage=mock_storage, csv_content=file_obj, dataset_name="test_dataset"
+        )
+
+        source = mock_storage.put.call_args.kwargs["source"]
+        assert source.file is file_obj
+        assert file_obj.tell() == 0
+
+
+class TestParseCsvStream:
+    """Test parsing CSV files incrementally."""
+
+    def test_iter_csv_lines_across_chunks(self):
+        """Test that lines and multi-byte characters split across chunks survive."""
+        content = "question,answer\nWho wrote “Hamlet”?,Shakespeare\nlast,row"
+
+        lines = list(iter_csv_lines(io.BytesIO(content.encode()), chunk_size=3))
+
+        assert lines == [
+            "question,answer\n",
+            "Who wrote “Hamlet”?,Shakespeare\n",
+            "last,row",
+        ]
+
+    def test_iter_csv_items(self):
+        """Test that items are read with quoted newlines and empty rows skipped."""
+        content = (
+            b"\xef\xbb\xbf Question ,ANSWER,notes\n"
+            b'"Line one\nline two","Answer 1",x\n'
+            b'"",missing question,\n'
+            b"only question,,\n"
+            b"  Q3  ,  A3  \n"
+        )
+
+        items = list(iter_csv_items(io.BytesIO(content), chunk_size=4))
+
+        assert items == [
+            {"question": "Line one\nline two", "answer": "Answer 1"},
+            {"question": "Q3", "answer": "A3"},
+        ]
+
+    def test_iter_csv_items_missing_columns(self):
+        """Test that a header without question/answer is rejected."""
+        with pytest.raises(ValueError, match="'question' and 'answer'"):
+            list(iter_csv_items(io.BytesIO(b"query,response\nq,a\n")))
+
+    def test_iter_csv_items_invalid_utf8(self):
+        """Test that non UTF-8 content raises a decode error."""
+        with pytest.raises(UnicodeDecodeError):
+            list(iter_csv_items(io.BytesIO(b"question,answer\n\xff,a\n")))
+
+    def test_read_csv_columns_rewinds(self):
+        """Test that the header check leaves the file at the start."""
+        file_obj = io.BytesIO(b"Question,Answer\nq,a\n")
+
+        assert read_csv_columns(file_obj) == ("Question", "Answer")
+        assert file_obj.tell() == 0
+
+    def test_read_csv_columns_empty(self):
+        """Test that a file without a header is rejected."""
+        with pytest.raises(ValueError, match="no headers"):
+            read_csv_columns(io.BytesIO(b""))
+
+
+class TestItemCopies:
+    """Test expanding duplicated dataset items into per-copy IDs."""
+
+    @pytest.mark.parametrize(
+        "metadata, copies",
+        [
+            (None, 1),
+            ({}, 1),
+            ({"duplication_factor": 3}, 3),
+            ({"duplication_factor": "2"}, 2),
+            ({"duplication_factor": 0}, 1),
+            ({"duplication_factor": "many"}, 1),
+            ({"duplicate_number": 1, "duplication_factor": 3}, 1),
+        ],
+    )
+    def test_get_item_copies(self, metadata, copies):
+        """Test copies for new, legacy and malformed item metadata."""
+        assert get_item_copies(metadata) == copies
+
+    def test_copy_ids_round_trip(self):
+        """Test that copy IDs fold back into their item ID."""
+        assert build_copy_id("item_1", 1, 1) == "item_1"
+        assert build_copy_id("item_1", 2, 3) == "item_1#2"
+        assert split_copy_id("item_1#2") == ("item_1", 2)
+        assert split_copy_id("item_1") == ("item_1", 1)
+        assert split_copy_id("item#x") == ("item#x", 1)
+        assert split_copy_id("#3") == ("#3", 1)
+
 
 class TestDownloadCsvFromObjectStore:
     """Test CSV download from object store."""
@@ -411,3 +517,37 @@ class TestUpdateDatasetLangfuseId:
             session=db, dataset_id=99999, langfuse_dataset_id="langfuse_123"
         )
         # No assertion needed, just ensuring it doesn't crash
+
+
+class TestUpdateEvaluationDataset:
+    """Test updating datasets during ingestion."""
+
+    def test_update_merges_progress(self, db: Session):
+        """Test that progress updates are merged and other fields replaced."""
+        org = db.exec(select(Organization)).first()
+        project = db.exec(
+            select(Project).where(Project.organization_id == org.id)
+        ).first()
+        dataset = create_evaluation_dataset(
+            session=db,
+            name="test_dataset_progress",
+            dataset_metadata={"duplication_factor": 2},
+            organization_id=org.id,
+            project_id=project.id,
+            progress={"stage": "queued"},
+        )
+
+        update_evaluation_dataset(
+            session=db, dataset=dataset, progress={"stage": "ingesting", "task_id": "t"}
+        )
+        dataset = update_evaluation_dataset(
+            session=db,
+            dataset=dataset,
+            dataset_metadata={"duplication_factor": 2, "original_items_count": 5},
+            langfuse_dataset_id="langfuse_456",
+            progress={"stage": "completed"},
+        )
+
+        assert dataset.progress == {"stage": "completed", "task_id": "t"}
+        assert dataset.dataset_metadata["original_items_count"] == 5
+        assert dataset.langfuse_dataset_id == "langfuse_456"
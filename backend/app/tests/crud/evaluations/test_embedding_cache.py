@@ -0,0 +1,125 @@
+"""Tests for the ground truth embedding cache."""
+
+import numpy as np
+import pytest
+from sqlmodel import Session, select
+
+from app.crud.evaluations.embedding_cache import (
+    get_cached_embeddings,
+    hash_text,
+    store_embeddings,
+)
+from app.models import EmbeddingCache, Organization, Project
+
+
+@pytest.fixture
+def project(db: Session) -> Project:
+    org = db.exec(select(Organization)).first()
+    return db.exec(select(Project).where(Project.organization_id == org.id)).first()
+
+
+class TestHashText:
+    """Test the cache key of a text."""
+
+    def test_hash_text_is_sha256_hex(self):
+        """Test that the hash is a stable 64-character hex digest."""
+        assert hash_text("4") == hash_text("4")
+        assert hash_text("4") != hash_text("5")
+        assert len(hash_text("Paris")) == 64
+
+
+class TestEmbeddingCache:
+    """Test storing and looking up cached embeddings."""
+
+    def test_store_and_get_round_trip(self, db: Session, project: Project):
+        """Test that stored vectors come back as float32 arrays by hash."""
+        stored = {
+            hash_text("Truth 1"): [0.1, 0.2, 0.3],
+            hash_text("Truth 2"): np.array([0.4, 0.5, 0.6]),
+        }
+
+        count = store_embeddings(
+            session=db,
+            project_id=project.id,
+            model="text-embedding-3-small",
+            dimensions=3,
+            embeddings=stored,
+        )
+        cached = get_cached_embeddings(
+            session=db,
+            project_id=project.id,
+            model="text-embedding-3-small",
+            dimensions=3,
+            text_hashes=[hash_text("Truth 1"), hash_text("Truth 2"), hash_text("x")],
+        )
+
+        assert count == 2
+        assert set(cached) == {hash_text("Truth 1"), hash_text("Truth 2")}
+        assert cached[hash_text("Truth 1")].dtype == np.float32
+        np.testing.assert_allclose(
+            cached[hash_text("Truth 2")], [0.4, 0.5, 0.6], rtol=1e-6
+        )
+
+    def test_get_is_scoped_by_model_and_dimensions(self, db: Session, project: Project):
+        """Test that vectors of another model or size are not returned."""
+        text_hash = hash_text("Scoped")
+        store_embeddings(
+            session=db,
+            project_id=project.id,
+            model="text-embedding-3-small",
+            dimensions=2,
+            embeddings={text_hash: [1.0, 0.0]},
+        )
+
+        assert (
+            get_cached_embeddings(
+                session=db,
+                project_id=project.id,
+                model="text-embedding-3-large",
+                dimensions=2,
+                text_hashes=[text_hash],
+            )
+            == {}
+        )
+        assert (
+            get_cached_embeddings(
+                session=db,
+                project_id=project.id,
+                model="text-embedding-3-small",
+                dimensions=3,
+                text_hashes=[text_hash],
+            )
+            == {}
+        )
+
+    def test_store_ignores_existing_hashes(self, db: Session, project: Project):
+        """Test that storing a cached hash again keeps the first vector."""
+        text_hash = hash_text("Duplicate")
+        for vector in ([1.0, 0.0], [0.0, 1.0]):
+            store_embeddings(
+                session=db,
+                project_id=project.id,
+                model="text-embedding-3-small",
+                dimensions=2,
+                embeddings={text_hash: vector},
+            )
+
+        rows = db.exec(
+            select(EmbeddingCache).where(EmbeddingCache.text_hash == text_hash)
+        ).all()
+        assert len(rows) == 1
+        np.testing.assert_array_equal(
+            np.frombuffer(rows[0].embedding, dtype="<f4"), [1.0, 0.0]
+        )
+
+    def test_store_skips_wrong_dimensions(self, db: Session, project: Project):
+        """Test that vectors of the wrong size are not cached."""
+        count = store_embeddings(
+            session=db,
+            project_id=project.id,
+            model="text-embedding-3-small",
+            dimensions=3,
+            embeddings={hash_text("Short"): [1.0, 0.0]},
+        )
+
+        assert count == 0
@@ -1,14 +1,29 @@
 """Tests for evaluation embeddings functionality."""
 
+import base64
+
 import numpy as np
 import pytest
+from sqlmodel import Session, select
 
+from app.crud.evaluations.embedding_cache import hash_text, store_embeddings
 from app.crud.evaluations.embeddings import (
     build_embedding_jsonl,
     calculate_average_similarity,
+    calculate_cosine_similarities,
     calculate_cosine_similarity,
+    iter_embedding_jsonl,
     parse_embedding_results,
+    resolve_embedding_config,
+    split_embedding_custom_id,
+    start_embedding_batch,
+    truncate_embedding,
+    validate_embedding_dimensions,
 )
+from app.crud.evaluations.frame import EvaluationResultFrame
+from app.models import EvaluationDataset, EvaluationRun, Organization, Project
+from app.models.batch_job import BatchJob
+from app.tests.utils.openai import get_mock_openai_batch_client
 
 
 class TestBuildEmbeddingJsonl:
@@ -16,20 +31,22 @@ class TestBuildEmbeddingJsonl:
 
     def test_build_embedding_jsonl_basic(self):
         """Test building JSONL for basic evaluation results."""
-        results = [
-            {
-                "item_id": "item_1",
-                "question": "What is 2+2?",
-                "generated_output": "The answer is 4",
-                "ground_truth": "4",
-            },
-            {
-                "item_id": "item_2",
-                "question": "What is the capital of France?",
-                "generated_output": "Paris",
-                "ground_truth": "Paris",
-            },
-        ]
+        results = EvaluationResultFrame.from_records(
+            [
+                {
+                    "item_id": "item_1",
+                    "question": "What is 2+2?",
+                    "generated_output": "The answer is 4",
+                    "ground_truth": "4",
+                },
+                {
+                    "item_id": "item_2",
+                    "question": "What is the capital of France?",
+                    "generated_output": "Paris",
+                    "ground_truth": "Paris",
+                },
+            ]
+        )
 
         trace_id_mapping = {
             "item_1": "trace_1",
@@ -40,24 +57,26 @@ class TestBuildEmbeddingJsonl:
 
         assert len(jsonl_data) == 2
 
-        # Check first item - uses trace_id as custom_id
-        assert jsonl_data[0]["custom_id"] == "trace_1"
+        # Check first item - custom_id carries trace_id and ground truth hash
+        assert jsonl_data[0]["custom_id"] == f"trace_1:{hash_text('4')}"
         assert jsonl_data[0]["method"] == "POST"
         assert jsonl_data[0]["url"] == "/v1/embeddings"
         assert jsonl_data[0]["body"]["model"] == "text-embedding-3-large"
         assert jsonl_data[0]["body"]["input"] == ["The answer is 4", "4"]
-        assert jsonl_data[0]["body"]["encoding_format"] == "float"
+        assert jsonl_data[0]["body"]["encoding_format"] == "base64"
 
     def test_build_embedding_jsonl_custom_model(self):
         """Test building JSONL with custom embedding model."""
-        results = [
-            {
-                "item_id": "item_1",
-                "question": "Test?",
-                "generated_output": "Output",
-                "ground_truth": "Truth",
-            }
-        ]
+        results = EvaluationResultFrame.from_records(
+            [
+                {
+                    "item_id": "item_1",
+                    "question": "Test?",
+                    "generated_output": "Output",
+                    "ground_truth": "Truth",
+                }
+            ]
+        )
 
         trace_id_mapping = {"item_1": "trace_1"}
 
@@ -70,26 +89,28 @@ class TestBuildEmbeddingJsonl:
 
     def test_build_embedding_jsonl_skips_empty(self):
         """Test that items with empty output or ground_truth are skipped."""
-        results = [
-            {
-                "item_id": "item_1",
-                "question": "Test?",
-                "generated_output": "",  # Empty
-                "ground_truth": "Truth",
-            },
-            {
-                "item_id": "item_2",
-                "question": "Test?",
-                "generated_output": "Output",
-                "ground_truth": "",  # Empty
-            },
-            {
-                "item_id": "item_3",
-                "question": "Test?",
-                "generated_output": "Output",
-                "ground_truth": "Truth",
-            },
-        ]
+        results = EvaluationResultFrame.from_records(
+            [
+                {
+                    "item_id": "item_1",
+                    "question": "Test?",
+                    "generated_output": "",  # Empty
+                    "ground_truth": "Truth",
+                },
+                {
+                    "item_id": "item_2",
+                    "question": "Test?",
+                    "generated_output": "Output",
+                    "ground_truth": "",  # Empty
+                },
+                {
+                    "item_id": "item_3",
+                    "question": "Test?",
+                    "generated_output": "Output",
+                    "ground_truth": "Truth",
+                },
+            ]
+        )
 
         trace_id_mapping = {
             "item_1": "trace_1",
@@ -101,24 +122,26 @@ class TestBuildEmbeddingJsonl:
 
         # Only item_3 should be included
         assert len(jsonl_data) == 1
-        assert jsonl_data[0]["custom_id"] == "trace_3"
-
-    def test_build_embedding_jsonl_missing_item_id(self):
-        """Test that items without item_id or trace_id are skipped."""
-        results = [
-            {
-                # Missing item_id
-                "question": "Test?",
-                "generated_output": "Output",
-                "ground_truth": "Truth",
-            },
-            {
-                "item_id": "item_2",
-                "question": "Test?",
-                "generated_output": "Output",
-                "ground_truth": "Truth",
-            },
-        ]
+        assert split_embedding_custom_id(jsonl_data[0]["custom_id"])[0] == "trace_3"
+
+    def test_build_embedding_jsonl_missing_trace_id(self):
+        """Test that items without a trace_id are skipped."""
+        results = EvaluationResultFrame.from_records(
+            [
+                {
+                    "item_id": "item_1",
+                    "question": "Test?",
+                    "generated_output": "Output",
+                    "ground_truth": "Truth",
+                },
+                {
+                    "item_id": "item_2",
+                    "question": "Test?",
+                    "generated_output": "Output",
+                    "ground_truth": "Truth",
+                },
+            ]
+        )
 
         # Only item_2 has a mapping
         trace_id_mapping = {"item_2": "trace_2"}
@@ -127,7 +150,56 @@ class TestBuildEmbeddingJsonl:
 
         # Only item_2 should be included
         assert len(jsonl_data) == 1
-        assert jsonl_data[0]["custom_id"] == "trace_2"
+        assert split_embedding_custom_id(jsonl_data[0]["custom_id"])[0] == "trace_2"
+
+    def test_iter_embedding_jsonl_validates_model_eagerly(self):
+        """Test that an invalid model is rejected before any line is requested."""
+        results = EvaluationResultFrame.from_records(
+            [
+                {
+                    "item_id": "item_1",
+                    "generated_output": "Output",
+                    "ground_truth": "Truth",
+                }
+            ]
+        )
+
+        with pytest.raises(ValueError, match="Invalid embedding model"):
+            iter_embedding_jsonl(results, {"item_1": "trace_1"}, "not-a-model")
+
+    def test_iter_embedding_jsonl_reuses_ground_truths(self):
+        """Test that cached and repeated ground truths are not embedded again."""
+        results = EvaluationResultFrame.from_records(
+            [
+                {"item_id": "item_1", "generated_output": "Four", "ground_truth": "4"},
+                {"item_id": "item_2", "generated_output": "4!", "ground_truth": "4"},
+                {
+                    "item_id": "item_3",
+                    "generated_output": "Paris",
+                    "ground_truth": "Paris",
+                },
+            ]
+        )
+        trace_id_mapping = {f"item_{i}": f"trace_{i}" for i in range(1, 4)}
+
+        lines = list(
+            iter_embedding_jsonl(
+                results,
+                trace_id_mapping,
+                cached_ground_truth_hashes={hash_text("Paris")},
+            )
+        )
+
+        assert [line["body"]["input"] for line in lines] == [
+            ["Four", "4"],
+            ["4!"],
+            ["Paris"],
+        ]
+        assert [split_embedding_custom_id(line["custom_id"]) for line in lines] == [
+            ("trace_1", hash_text("4")),
+            ("trace_2", hash_text("4")),
+            ("trace_3", hash_text("Paris")),
+        ]
 
 
 class TestParseEmbeddingResults:
@@ -233,6 +305,77 @@ class TestParseEmbeddingResults:
         assert len(embedding_pairs) == 1
         assert embedding_pairs[0]["trace_id"] == "trace_2"
 
+    def test_parse_embedding_results_base64(self):
+        """Test that base64 embeddings are decoded into float32 arrays."""
+
+        def encode(values: list[float]) -> str:
+            return base64.b64encode(np.asarray(values, dtype="<f4").tobytes()).decode()
+
+        raw_results = [
+            {
+                "custom_id": "trace_1",
+                "response": {
+                    "body": {
+                        "data": [
+                            {"index": 0, "embedding": encode([0.5, -1.0, 2.0])},
+                            {"index": 1, "embedding": encode([0.25, 0.0, 1.0])},
+                        ]
+                    }
+                },
+            }
+        ]
+
+        embedding_pairs = parse_embedding_results(raw_results)
+
+        output_embedding = embedding_pairs[0]["output_embedding"]
+        assert output_embedding.dtype == np.float32
+        assert output_embedding.tolist() == [0.5, -1.0, 2.0]
+        assert embedding_pairs[0]["ground_truth_embedding"].tolist() == [
+            0.25,
+            0.0,
+            1.0,
+        ]
+
+        stats = calculate_average_similarity(embedding_pairs)
+        assert stats["total_pairs"] == 1
+
+    def test_parse_embedding_results_merges_reused_ground_truths(self):
+        """Test that omitted ground truths come from the batch or the cache."""
+        truth_hash = hash_text("4")
+        cached_hash = hash_text("Paris")
+
+        def line(trace_id: str, text_hash: str, *embeddings: list[float]) -> dict:
+            data = [
+                {"index": index, "embedding": embedding}
+                for index, embedding in enumerate(embeddings)
+            ]
+            return {
+                "custom_id": f"{trace_id}:{text_hash}",
+                "response": {"body": {"data": data}},
+            }
+
+        raw_results = [
+            # Reuses the ground truth embedded by the next line
+            line("trace_1", truth_hash, [1.0, 0.0]),
+            line("trace_2", truth_hash, [0.0, 1.0], [0.6, 0.8]),
+            line("trace_3", cached_hash, [0.5, 0.5]),
+            # Not in the batch nor the cache: dropped
+            line("trace_4", hash_text("Rome"), [0.5, 0.5]),
+        ]
+
+        embedding_pairs = parse_embedding_results(
+            raw_results, ground_truth_embeddings={cached_hash: [0.3, 0.4]}
+        )
+
+        assert [pair["trace_id"] for pair in embedding_pairs] == [
+            "trace_1",
+            "trace_2",
+            "trace_3",
+        ]
+        assert embedding_pairs[0]["ground_truth_embedding"] == [0.6, 0.8]
+        assert embedding_pairs[0]["ground_truth_hash"] == truth_hash
+        assert embedding_pairs[2]["ground_truth_embedding"] == [0.3, 0.4]
+
 
 class TestCalculateCosineSimilarity:
     """Tests for calculate_cosine_similarity function."""
@@ -382,3 +525,345 @@ class TestCalculateAverageSimilarity:
         # Standard deviation of [1, 0, 1, 0] = 0.5
         assert stats["cosine_similarity_std"] == pytest.approx(0.5)
         assert stats["total_pairs"] == 4
+
+
+class TestCalculateCosineSimilarities:
+    """Tests for the vectorized similarity engine."""
+
+    def test_calculate_cosine_similarities_matches_single_pair(self):
+        """Test that row-wise results match calculate_cosine_similarity."""
+        rng = np.random.default_rng(0)
+        outputs = rng.normal(size=(5, 16)).astype(np.float32)
+        ground_truths = rng.normal(size=(5, 16)).astype(np.float32)
+
+        similarities = calculate_cosine_similarities(outputs, ground_truths)
+
+        expected = [
+            calculate_cosine_similarity(o.tolist(), g.tolist())
+            for o, g in zip(outputs, ground_truths)
+        ]
+        assert similarities.dtype == np.float32
+        assert similarities.tolist() == pytest.approx(expected, abs=1e-6)
+
+    def test_calculate_cosine_similarities_zero_vectors(self):
+        """Test that zero vectors give 0.0 without warnings or NaN."""
+        outputs = np.array([[0.0, 0.0], [1.0, 0.0]], dtype=np.float32)
+        ground_truths = np.array([[1.0, 0.0], [0.0, 0.0]], dtype=np.float32)
+
+        with np.errstate(all="raise"):
+            similarities = calculate_cosine_similarities(outputs, ground_truths)
+
+        assert similarities.tolist() == [0.0, 0.0]
+
+    def test_calculate_average_similarity_chunked(self):
+        """Test that chunking does not change scores, order or statistics."""
+        rng = np.random.default_rng(1)
+        embedding_pairs = [
+            {
+                "trace_id": f"trace_{i}",
+                "output_embedding": rng.normal(size=8).tolist(),
+                "ground_truth_embedding": rng.normal(size=8).tolist(),
+            }
+            for i in range(7)
+        ]
+
+        whole = calculate_average_similarity(embedding_pairs)
+        chunked = calculate_average_similarity(embedding_pairs, chunk_size=3)
+
+        assert [s["trace_id"] for s in chunked["per_item_scores"]] == [
+            f"trace_{i}" for i in range(7)
+        ]
+        assert chunked["cosine_similarity_avg"] == pytest.approx(
+            whole["cosine_similarity_avg"]
+        )
+        assert chunked["cosine_similarity_std"] == pytest.approx(
+            whole["cosine_similarity_std"]
+        )
+        scores = [s["cosine_similarity"] for s in whole["per_item_scores"]]
+        assert whole["cosine_similarity_std"] == pytest.approx(np.std(scores))
+
+    def test_calculate_average_similarity_skips_invalid_pairs(self):
+        """Test that pairs with missing or mismatched embeddings are skipped."""
+        embedding_pairs = [
+            {
+                "trace_id": "trace_1",
+                "output_embedding": [1.0, 0.0],
+                "ground_truth_embedding": [1.0, 0.0],
+            },
+            {
+                "trace_id": "trace_2",
+                "output_embedding": [1.0, 0.0, 0.0],
+                "ground_truth_embedding": [1.0, 0.0, 0.0],
+            },
+            {
+                "trace_id": "trace_3",
+                "output_embedding": None,
+                "ground_truth_embedding": [1.0, 0.0],
+            },
+        ]
+
+        stats = calculate_average_similarity(embedding_pairs)
+
+        assert stats["total_pairs"] == 1
+        assert stats["per_item_scores"][0]["trace_id"] == "trace_1"
+
+
+class TestEmbeddingDimensions:
+    """Tests for reduced-dimension embeddings."""
+
+    def test_validate_embedding_dimensions_ranges(self):
+        """Test per-model dimension ranges and the native-size default."""
+        assert validate_embedding_dimensions("text-embedding-3-large", None) == 3072
+        assert validate_embedding_dimensions("text-embedding-3-large", 256) == 256
+        assert validate_embedding_dimensions("text-embedding-3-small", 1536) == 1536
+        assert validate_embedding_dimensions("text-embedding-ada-002", 1536) == 1536
+
+        for model, dimensions in [
+            ("text-embedding-3-small", 3072),
+            ("text-embedding-3-large", 0),
+            ("text-embedding-ada-002", 512),
+            ("text-embedding-3-large", 256.0),
+            ("text-embedding-3-large", True),
+        ]:
+            with pytest.raises(ValueError, match="Invalid embedding dimensions"):
+                validate_embedding_dimensions(model, dimensions)
+
+    def test_resolve_embedding_config_defaults(self):
+        """Test that the resolved settings are filled in for the run config."""
+        assert resolve_embedding_config({"model": "gpt-4o"}) == {
+            "embedding_model": "text-embedding-3-large",
+            "embedding_dimensions": 3072,
+        }
+        assert resolve_embedding_config(
+            {"embedding_model": "text-embedding-3-small", "embedding_dimensions": 512}
+        ) == {"embedding_model": "text-embedding-3-small", "embedding_dimensions": 512}
+
+    def test_iter_embedding_jsonl_requests_reduced_dimensions(self):
+        """Test that only reduced sizes add the dimensions request parameter."""
+        results = EvaluationResultFrame.from_records(
+            [
+                {
+                    "item_id": "item_1",
+                    "generated_output": "Output",
+                    "ground_truth": "Truth",
+                }
+            ]
+        )
+        trace_id_mapping = {"item_1": "trace_1"}
+
+        reduced = build_embedding_jsonl(results, trace_id_mapping, dimensions=1024)
+        native = build_embedding_jsonl(results, trace_id_mapping, dimensions=3072)
+
+        assert reduced[0]["body"]["dimensions"] == 1024
+        assert "dimensions" not in native[0]["body"]
+        with pytest.raises(ValueError, match="Invalid embedding dimensions"):
+            iter_embedding_jsonl(results, trace_id_mapping, dimensions=4096)
+
+    def test_truncate_embedding_renormalizes(self):
+        """Test that truncated embeddings keep the leading values at unit norm."""
+        truncated = truncate_embedding([3.0, 4.0, 12.0], 2)
+
+        assert truncated.dtype == np.float32
+        np.testing.assert_allclose(truncated, [0.6, 0.8])
+        assert truncate_embedding([0.0, 0.0, 1.0], 2).tolist() == [0.0, 0.0]
+
+    def test_parse_embedding_results_truncates_longer_embeddings(self):
+        """Test that vectors longer than the run's size are reduced locally."""
+        raw_results = [
+            {
+                "custom_id": "trace_1",
+                "response": {
+                    "body": {
+                        "data": [
+                            {"index": 0, "embedding": [3.0, 4.0, 1.0]},
+                            {"index": 1, "embedding": [1.0, 0.0]},
+                        ]
+                    }
+                },
+            }
+        ]
+
+        embedding_pairs = parse_embedding_results(raw_results, dimensions=2)
+
+        np.testing.assert_allclose(embedding_pairs[0]["output_embedding"], [0.6, 0.8])
+        assert embedding_pairs[0]["ground_truth_embedding"] == [1.0, 0.0]
+
+
+class TestStartEmbeddingBatch:
+    """Test start_embedding_batch with a lazily built JSONL payload."""
+
+    @pytest.fixture
+    def eval_run(self, db: Session) -> EvaluationRun:
+        org = db.exec(select(Organization)).first()
+        project = db.exec(
+            select(Project).where(Project.organization_id == org.id)
+        ).first()
+
+        dataset = EvaluationDataset(
+            name="embedding_batch_dataset",
+            dataset_metadata={"original_items_count": 3},
+            organization_id=org.id,
+            project_id=project.id,
+        )
+        db.add(dataset)
+        db.commit()
+        db.refresh(dataset)
+
+        eval_run = EvaluationRun(
+            run_name="embedding_batch_run",
+            dataset_name=dataset.name,
+            dataset_id=dataset.id,
+            config={"model": "gpt-4o", "embedding_model": "text-embedding-3-small"},
+            status="processing",
+            organization_id=org.id,
+            project_id=project.id,
+        )
+        db.add(eval_run)
+        db.commit()
+        db.refresh(eval_run)
+        return eval_run
+
+    @staticmethod
+    def _results(count: int) -> EvaluationResultFrame:
+        return EvaluationResultFrame.from_records(
+            {
+                "item_id": f"item_{i}",
+                "generated_output": f"Output {i}",
+                "ground_truth": f"Truth {i}",
+            }
+            for i in range(count)
+        )
+
+    def test_start_embedding_batch_uploads_every_line(
+        self, db: Session, eval_run: EvaluationRun
+    ):
+        """Test that the peeked first line is re-joined with the rest."""
+        uploaded: list[dict] = []
+        client = get_mock_openai_batch_client(uploaded)
+        trace_id_mapping = {f"item_{i}": f"trace_{i}" for i in range(3)}
+
+        result = start_embedding_batch(
+            session=db,
+            openai_client=client,
+            eval_run=eval_run,
+            results=self._results(3),
+            trace_id_mapping=trace_id_mapping,
+        )
+
+        assert [
+            split_embedding_custom_id(line["custom_id"])[0] for line in uploaded
+        ] == ["trace_0", "trace_1", "trace_2"]
+        assert uploaded[0]["body"]["model"] == "text-embedding-3-small"
+
+        batch_job = db.get(BatchJob, result.embedding_batch_job_id)
+        assert batch_job.job_type == "embedding"
+        assert batch_job.total_items == 3
+
+    def test_start_embedding_batch_total_items_counts_uploaded_lines(
+        self, db: Session, eval_run: EvaluationRun
+    ):
+        """Test that results without a trace_id are not counted."""
+        uploaded: list[dict] = []
+        client = get_mock_openai_batch_client(uploaded)
+
+        result = start_embedding_batch(
+            session=db,
+            openai_client=client,
+            eval_run=eval_run,
+            results=self._results(3),
+            trace_id_mapping={"item_1": "trace_1", "item_2": "trace_2"},
+        )
+
+        assert [
+            split_embedding_custom_id(line["custom_id"])[0] for line in uploaded
+        ] == ["trace_1", "trace_2"]
+        batch_job = db.get(BatchJob, result.embedding_batch_job_id)
+        assert batch_job.total_items == 2
+
+    def test_start_embedding_batch_uses_cached_ground_truths(
+        self, db: Session, eval_run: EvaluationRun
+    ):
+        """Test that cached ground truths are left out of the upload."""
+        store_embeddings(
+            session=db,
+            project_id=eval_run.project_id,
+            model="text-embedding-3-small",
+            dimensions=1536,
+            embeddings={hash_text("Truth 1"): np.zeros(1536)},
+        )
+        uploaded: list[dict] = []
+        client = get_mock_openai_batch_client(uploaded)
+
+        result = start_embedding_batch(
+            session=db,
+            openai_client=client,
+            eval_run=eval_run,
+            results=self._results(2),
+            trace_id_mapping={"item_0": "trace_0", "item_1": "trace_1"},
+        )
+
+        assert [line["body"]["input"] for line in uploaded] == [
+            ["Output 0", "Truth 0"],
+            ["Output 1"],
+        ]
+        batch_job = db.get(BatchJob, result.embedding_batch_job_id)
+        assert batch_job.config["dimensions"] == 1536
+
+    def test_start_embedding_batch_uses_run_dimensions(
+        self, db: Session, eval_run: EvaluationRun
+    ):
+        """Test that the run's embedding size is requested and recorded."""
+        eval_run.config = {**eval_run.config, "embedding_dimensions": 256}
+        uploaded: list[dict] = []
+        client = get_mock_openai_batch_client(uploaded)
+
+        result = start_embedding_batch(
+            session=db,
+            openai_client=client,
+            eval_run=eval_run,
+            results=self._results(1),
+            trace_id_mapping={"item_0": "trace_0"},
+        )
+
+        assert uploaded[0]["body"]["dimensions"] == 256
+        batch_job = db.get(BatchJob, result.embedding_batch_job_id)
+        assert batch_job.config["dimensions"] == 256
+
+    def test_start_embedding_batch_invalid_dimensions_fall_back(
+        self, db: Session, eval_run: EvaluationRun
+    ):
+        """Test that an out-of-range size falls back to the native size."""
+        eval_run.config = {**eval_run.config, "embedding_dimensions": 4096}
+        uploaded: list[dict] = []
+        client = get_mock_openai_batch_client(uploaded)
+
+        result = start_embedding_batch(
+            session=db,
+            openai_client=client,
+            eval_run=eval_run,
+            results=self._results(1),
+            trace_id_mapping={"item_0": "trace_0"},
+        )
+
+        assert "dimensions" not in uploaded[0]["body"]
+        batch_job = db.get(BatchJob, result.embedding_batch_job_id)
+        assert batch_job.config["dimensions"] == 1536
+
+    def test_start_embedding_batch_no_valid_items(
+        self, db: Session, eval_run: EvaluationRun
+    ):
+        """Test that an empty payload raises before anything is uploaded."""
+        uploaded: list[dict] = []
+        client = get_mock_openai_batch_client(uploaded)
+
+        with pytest.raises(ValueError, match="No valid items"):
+            start_embedding_batch(
+                session=db,
+                openai_client=client,
+                eval_run=eval_run,
+                results=self._results(2),
+                trace_id_mapping={},
+            )
+
+        client.files.create.assert_not_called()
+        assert eval_run.embedding_batch_job_id is None
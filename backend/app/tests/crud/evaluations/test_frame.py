@@ -0,0 +1,85 @@
+"""Tests for the columnar evaluation result frame."""
+
+import pytest
+
+from app.crud.evaluations.frame import EvaluationResultFrame
+
+
+def make_record(item_id: str, usage: dict | None = None) -> dict:
+    return {
+        "item_id": item_id,
+        "question": f"Question {item_id}",
+        "generated_output": f"Answer {item_id}",
+        "ground_truth": f"Truth {item_id}",
+        "response_id": f"resp_{item_id}",
+        "usage": usage,
+    }
+
+
+class TestEvaluationResultFrame:
+    """Test building and reading result frames."""
+
+    def test_append_fills_columns_and_index(self):
+        """Test that each append adds one row to every column."""
+        frame = EvaluationResultFrame()
+
+        assert frame.append(**make_record("item_1")) == 0
+        assert frame.append(**make_record("item_2")) == 1
+
+        assert len(frame) == 2
+        assert frame.item_ids == ["item_1", "item_2"]
+        assert frame.ground_truths == ["Truth item_1", "Truth item_2"]
+        assert frame.index == {"item_1": 0, "item_2": 1}
+        assert "item_2" in frame
+        assert "item_3" not in frame
+
+    def test_append_rejects_duplicate_item_id(self):
+        """Test that an item can only be stored once."""
+        frame = EvaluationResultFrame()
+        frame.append(**make_record("item_1"))
+
+        with pytest.raises(ValueError, match="Duplicate item_id"):
+            frame.append(**make_record("item_1"))
+
+    def test_token_columns(self):
+        """Test that token counts are stored compactly with missing values."""
+        frame = EvaluationResultFrame()
+        frame.append(
+            **make_record(
+                "item_1",
+                usage={"input_tokens": 69, "output_tokens": 258, "total_tokens": 327},
+            )
+        )
+        frame.append(**make_record("item_2"))
+        frame.append(**make_record("item_3", usage={"total_tokens": 5}))
+
+        assert frame.total_tokens.typecode == "q"
+        assert frame.usage(0) == {
+            "input_tokens": 69,
+            "output_tokens": 258,
+            "total_tokens": 327,
+        }
+        assert frame.usage(1) is None
+        assert frame.tokens(1) == (None, None, None)
+        assert frame.usage(2) == {
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "total_tokens": 5,
+        }
+        assert frame.tokens(2) == (None, None, 5)
+
+    def test_records_round_trip(self):
+        """Test that rows come back in the per-item dict format."""
+        records = [
+            make_record("item_1", usage={"total_tokens": 3}),
+            make_record("item_2"),
+        ]
+
+        frame = EvaluationResultFrame.from_records(records)
+
+        assert frame.record(1) == records[1]
+        assert list(frame.iter_records())[0]["usage"] == {
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "total_tokens": 3,
+        }
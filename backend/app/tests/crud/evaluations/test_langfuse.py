@@ -2,67 +2,148 @@
 Tests for evaluation_langfuse CRUD operations.
 """
 
-from unittest.mock import MagicMock
+import threading
+import time
+from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
+from app.crud.evaluations.frame import EvaluationResultFrame
 from app.crud.evaluations.langfuse import (
+    DATASET_UPLOAD_PROGRESS_INTERVAL,
+    DATASET_UPLOAD_QUEUE_FACTOR,
+    TRACE_FETCH_MAX_RETRIES,
     create_langfuse_dataset_run,
+    fetch_trace_scores_from_langfuse,
+    fetch_traces,
+    ingest_events,
     update_traces_with_cosine_scores,
+    upload_dataset_items_to_langfuse,
     upload_dataset_to_langfuse,
 )
 
 
+def create_ingesting_langfuse(dataset_item_ids: list[str]) -> MagicMock:
+    """Mock Langfuse client that records ingested events per batch request."""
+    mock_langfuse = MagicMock()
+    mock_langfuse.ingested_batches = []
+
+    def ingest(batch, request_options=None):
+        mock_langfuse.ingested_batches.append(list(batch))
+        return MagicMock(errors=[])
+
+    mock_langfuse.api.ingestion.batch.side_effect = ingest
+
+    items = []
+    for item_id in dataset_item_ids:
+        item = MagicMock()
+        item.id = item_id
+        items.append(item)
+    mock_langfuse.get_dataset.return_value = MagicMock(items=items)
+    return mock_langfuse
+
+
+def linked_items(mock_langfuse: MagicMock) -> dict[str, str]:
+    """Map trace_id -> dataset item ID of the run items created."""
+    return {
+        call.kwargs["request"].trace_id: call.kwargs["request"].dataset_item_id
+        for call in mock_langfuse.api.dataset_run_items.create.call_args_list
+    }
+
+
+def ingested_events(mock_langfuse: MagicMock, event_type: str) -> list[dict]:
+    return [
+        event
+        for batch in mock_langfuse.ingested_batches
+        for event in batch
+        if event["type"] == event_type
+    ]
+
+
+def create_result(item_id: str, question: str, answer: str) -> dict:
+    return {
+        "item_id": item_id,
+        "question": question,
+        "generated_output": answer,
+        "ground_truth": answer,
+        "response_id": f"resp_{item_id}",
+        "usage": {"input_tokens": 10, "output_tokens": 5, "total_tokens": 15},
+    }
+
+
 class TestCreateLangfuseDatasetRun:
     """Test creating Langfuse dataset runs."""
 
     def test_create_langfuse_dataset_run_success(self):
         """Test successfully creating a dataset run with traces."""
-        # Mock Langfuse client
-        mock_langfuse = MagicMock()
-        mock_dataset = MagicMock()
+        mock_langfuse = create_ingesting_langfuse(["item_1", "item_2"])
+        results = EvaluationResultFrame.from_records(
+            [
+                create_result("item_1", "What is 2+2?", "4"),
+                create_result("item_2", "What is the capital of France?", "Paris"),
+            ]
+        )
 
-        # Mock dataset items
-        mock_item1 = MagicMock()
-        mock_item1.id = "item_1"
-        mock_item1.observe.return_value.__enter__.return_value = "trace_id_1"
+        trace_id_mapping = create_langfuse_dataset_run(
+            langfuse=mock_langfuse,
+            dataset_name="test_dataset",
+            run_name="test_run",
+            results=results,
+        )
 
-        mock_item2 = MagicMock()
-        mock_item2.id = "item_2"
-        mock_item2.observe.return_value.__enter__.return_value = "trace_id_2"
+        mock_langfuse.get_dataset.assert_called_once_with("test_dataset")
+        traces = ingested_events(mock_langfuse, "trace-create")
+        assert len(traces) == 2
+        assert traces[0]["body"]["input"] == {"question": "What is 2+2?"}
+        assert traces[0]["body"]["output"] == {"answer": "4"}
+        assert traces[0]["body"]["metadata"] == {
+            "ground_truth": "4",
+            "item_id": "item_1",
+            "response_id": "resp_item_1",
+        }
+        # No model: no generations for cost tracking
+        assert ingested_events(mock_langfuse, "generation-create") == []
 
-        mock_dataset.items = [mock_item1, mock_item2]
-        mock_langfuse.get_dataset.return_value = mock_dataset
+        assert trace_id_mapping == {
+            "item_1": traces[0]["body"]["id"],
+            "item_2": traces[1]["body"]["id"],
+        }
+        assert linked_items(mock_langfuse) == {
+            trace_id_mapping["item_1"]: "item_1",
+            trace_id_mapping["item_2"]: "item_2",
+        }
+        request = mock_langfuse.api.dataset_run_items.create.call_args.kwargs["request"]
+        assert request.run_name == "test_run"
+
+    def test_create_langfuse_dataset_run_with_item_ids(self):
+        """Test that passed dataset item IDs avoid fetching the dataset."""
+        mock_langfuse = create_ingesting_langfuse([])
+        results = EvaluationResultFrame.from_records(
+            [create_result("item_1", "What is 2+2?", "4")]
+        )
 
-        # Test data with usage and response_id
-        results = [
-            {
-                "item_id": "item_1",
-                "question": "What is 2+2?",
-                "generated_output": "4",
-                "ground_truth": "4",
-                "response_id": "resp_123",
-                "usage": {
-                    "input_tokens": 10,
-                    "output_tokens": 5,
-                    "total_tokens": 15,
-                },
-            },
-            {
-                "item_id": "item_2",
-                "question": "What is the capital of France?",
-                "generated_output": "Paris",
-                "ground_truth": "Paris",
-                "response_id": "resp_456",
-                "usage": {
-                    "input_tokens": 12,
-                    "output_tokens": 3,
-                    "total_tokens": 15,
-                },
-            },
-        ]
+        trace_id_mapping = create_langfuse_dataset_run(
+            langfuse=mock_langfuse,
+            dataset_name="test_dataset",
+            run_name="test_run",
+            results=results,
+            dataset_item_ids={"item_1"},
+        )
+
+        mock_langfuse.get_dataset.assert_not_called()
+        assert linked_items(mock_langfuse) == {trace_id_mapping["item_1"]: "item_1"}
+
+    def test_create_langfuse_dataset_run_folds_copies(self):
+        """Test that every copy of a duplicated item is linked to that item."""
+        mock_langfuse = create_ingesting_langfuse(["item_1"])
+        results = EvaluationResultFrame.from_records(
+            [
+                create_result("item_1#1", "What is 2+2?", "4"),
+                create_result("item_1#2", "What is 2+2?", "four"),
+            ]
+        )
 
-        # Call function
         trace_id_mapping = create_langfuse_dataset_run(
             langfuse=mock_langfuse,
             dataset_name="test_dataset",
@@ -70,56 +151,24 @@ class TestCreateLangfuseDatasetRun:
             results=results,
         )
 
-        # Verify results
-        assert len(trace_id_mapping) == 2
-        assert trace_id_mapping["item_1"] == "trace_id_1"
-        assert trace_id_mapping["item_2"] == "trace_id_2"
+        assert set(trace_id_mapping) == {"item_1#1", "item_1#2"}
+        traces = ingested_events(mock_langfuse, "trace-create")
+        assert traces[1]["body"]["metadata"]["dataset_item_id"] == "item_1"
+        assert traces[1]["body"]["metadata"]["copy_number"] == 2
 
-        # Verify Langfuse calls
-        mock_langfuse.get_dataset.assert_called_once_with("test_dataset")
-        mock_langfuse.flush.assert_called_once()
-        assert mock_langfuse.trace.call_count == 2
+        assert linked_items(mock_langfuse) == {
+            trace_id: "item_1" for trace_id in trace_id_mapping.values()
+        }
 
     def test_create_langfuse_dataset_run_skips_missing_items(self):
         """Test that missing dataset items are skipped."""
-        mock_langfuse = MagicMock()
-        mock_dataset = MagicMock()
-
-        # Only one item exists
-        mock_item1 = MagicMock()
-        mock_item1.id = "item_1"
-        mock_item1.observe.return_value.__enter__.return_value = "trace_id_1"
-
-        mock_dataset.items = [mock_item1]
-        mock_langfuse.get_dataset.return_value = mock_dataset
-
-        # Results include an item that doesn't exist in dataset
-        results = [
-            {
-                "item_id": "item_1",
-                "question": "What is 2+2?",
-                "generated_output": "4",
-                "ground_truth": "4",
-                "response_id": "resp_123",
-                "usage": {
-                    "input_tokens": 10,
-                    "output_tokens": 5,
-                    "total_tokens": 15,
-                },
-            },
-            {
-                "item_id": "item_nonexistent",
-                "question": "Invalid question",
-                "generated_output": "Invalid",
-                "ground_truth": "Invalid",
-                "response_id": "resp_456",
-                "usage": {
-                    "input_tokens": 8,
-                    "output_tokens": 2,
-                    "total_tokens": 10,
-                },
-            },
-        ]
+        mock_langfuse = create_ingesting_langfuse(["item_1"])
+        results = EvaluationResultFrame.from_records(
+            [
+                create_result("item_1", "What is 2+2?", "4"),
+                create_result("item_nonexistent", "Invalid question", "Invalid"),
+            ]
+        )
 
         trace_id_mapping = create_langfuse_dataset_run(
             langfuse=mock_langfuse,
@@ -129,54 +178,49 @@ class TestCreateLangfuseDatasetRun:
         )
 
         # Only the valid item should be in the mapping
-        assert len(trace_id_mapping) == 1
-        assert "item_1" in trace_id_mapping
-        assert "item_nonexistent" not in trace_id_mapping
+        assert list(trace_id_mapping) == ["item_1"]
+        assert len(ingested_events(mock_langfuse, "trace-create")) == 1
+
+    def test_create_langfuse_dataset_run_handles_link_error(self):
+        """Test that a failed dataset item link drops only that item."""
+        mock_langfuse = create_ingesting_langfuse(["item_1", "item_2"])
+
+        def create_run_item(request):
+            if request.dataset_item_id == "item_2":
+                raise Exception("Link failed")
+
+        mock_langfuse.api.dataset_run_items.create.side_effect = create_run_item
+        results = EvaluationResultFrame.from_records(
+            [
+                create_result("item_1", "What is 2+2?", "4"),
+                create_result("item_2", "What is the capital?", "Paris"),
+            ]
+        )
 
-    def test_create_langfuse_dataset_run_handles_trace_error(self):
-        """Test that trace creation errors are handled gracefully."""
-        mock_langfuse = MagicMock()
-        mock_dataset = MagicMock()
+        trace_id_mapping = create_langfuse_dataset_run(
+            langfuse=mock_langfuse,
+            dataset_name="test_dataset",
+            run_name="test_run",
+            results=results,
+        )
 
-        # First item succeeds
-        mock_item1 = MagicMock()
-        mock_item1.id = "item_1"
-        mock_item1.observe.return_value.__enter__.return_value = "trace_id_1"
+        assert list(trace_id_mapping) == ["item_1"]
 
-        # Second item fails
-        mock_item2 = MagicMock()
-        mock_item2.id = "item_2"
-        mock_item2.observe.side_effect = Exception("Trace creation failed")
+    def test_create_langfuse_dataset_run_skips_rejected_traces(self):
+        """Test that traces rejected by ingestion are not linked to the run."""
+        mock_langfuse = create_ingesting_langfuse(["item_1", "item_2"])
 
-        mock_dataset.items = [mock_item1, mock_item2]
-        mock_langfuse.get_dataset.return_value = mock_dataset
+        def ingest(batch, request_options=None):
+            error = MagicMock(id=batch[1]["id"], status=400, message="invalid")
+            return MagicMock(errors=[error])
 
-        results = [
-            {
-                "item_id": "item_1",
-                "question": "What is 2+2?",
-                "generated_output": "4",
-                "ground_truth": "4",
-                "response_id": "resp_123",
-                "usage": {
-                    "input_tokens": 10,
-                    "output_tokens": 5,
-                    "total_tokens": 15,
-                },
-            },
-            {
-                "item_id": "item_2",
-                "question": "What is the capital?",
-                "generated_output": "Paris",
-                "ground_truth": "Paris",
-                "response_id": "resp_456",
-                "usage": {
-                    "input_tokens": 8,
-                    "output_tokens": 2,
-                    "total_tokens": 10,
-                },
-            },
-        ]
+        mock_langfuse.api.ingestion.batch.side_effect = ingest
+        results = EvaluationResultFrame.from_records(
+            [
+                create_result("item_1", "What is 2+2?", "4"),
+                create_result("item_2", "What is the capital?", "Paris"),
+            ]
+        )
 
         trace_id_mapping = create_langfuse_dataset_run(
             langfuse=mock_langfuse,
@@ -185,77 +229,37 @@ class TestCreateLangfuseDatasetRun:
             results=results,
         )
 
-        # Only successful item should be in mapping
-        assert len(trace_id_mapping) == 1
-        assert "item_1" in trace_id_mapping
-        assert "item_2" not in trace_id_mapping
+        assert list(trace_id_mapping) == ["item_1"]
+        assert list(linked_items(mock_langfuse).values()) == ["item_1"]
 
     def test_create_langfuse_dataset_run_empty_results(self):
         """Test with empty results list."""
-        mock_langfuse = MagicMock()
-        mock_dataset = MagicMock()
-        mock_dataset.items = []
-        mock_langfuse.get_dataset.return_value = mock_dataset
+        mock_langfuse = create_ingesting_langfuse([])
 
         trace_id_mapping = create_langfuse_dataset_run(
             langfuse=mock_langfuse,
             dataset_name="test_dataset",
             run_name="test_run",
-            results=[],
+            results=EvaluationResultFrame(),
         )
 
         assert len(trace_id_mapping) == 0
-        mock_langfuse.flush.assert_called_once()
+        mock_langfuse.api.ingestion.batch.assert_not_called()
 
     def test_create_langfuse_dataset_run_with_cost_tracking(self):
-        """Test that generation() is called with usage when model and usage are provided."""
-        # Mock Langfuse client
-        mock_langfuse = MagicMock()
-        mock_dataset = MagicMock()
-        mock_generation = MagicMock()
-
-        # Mock dataset items
-        mock_item1 = MagicMock()
-        mock_item1.id = "item_1"
-        mock_item1.observe.return_value.__enter__.return_value = "trace_id_1"
-
-        mock_item2 = MagicMock()
-        mock_item2.id = "item_2"
-        mock_item2.observe.return_value.__enter__.return_value = "trace_id_2"
-
-        mock_dataset.items = [mock_item1, mock_item2]
-        mock_langfuse.get_dataset.return_value = mock_dataset
-        mock_langfuse.generation.return_value = mock_generation
-
-        # Test data with usage and model
-        results = [
-            {
-                "item_id": "item_1",
-                "question": "What is 2+2?",
-                "generated_output": "The answer is 4",
-                "ground_truth": "4",
-                "response_id": "resp_123",
-                "usage": {
-                    "input_tokens": 69,
-                    "output_tokens": 258,
-                    "total_tokens": 327,
-                },
-            },
-            {
-                "item_id": "item_2",
-                "question": "What is the capital of France?",
-                "generated_output": "Paris is the capital",
-                "ground_truth": "Paris",
-                "response_id": "resp_456",
-                "usage": {
-                    "input_tokens": 50,
-                    "output_tokens": 100,
-                    "total_tokens": 150,
-                },
-            },
+        """Test that a generation with usage is ingested when model is provided."""
+        mock_langfuse = create_ingesting_langfuse(["item_1", "item_2"])
+        records = [
+            create_result("item_1", "What is 2+2?", "The answer is 4"),
+            create_result("item_2", "What is the capital of France?", "Paris"),
         ]
+        records[0]["usage"] = {
+            "input_tokens": 69,
+            "output_tokens": 258,
+            "total_tokens": 327,
+        }
+        results = EvaluationResultFrame.from_records(records)
 
-        # Call function with model parameter
         trace_id_mapping = create_langfuse_dataset_run(
             langfuse=mock_langfuse,
             dataset_name="test_dataset",
@@ -264,39 +268,66 @@ class TestCreateLangfuseDatasetRun:
             model="gpt-4o",
         )
 
-        # Verify results
-        assert len(trace_id_mapping) == 2
-        assert trace_id_mapping["item_1"] == "trace_id_1"
-        assert trace_id_mapping["item_2"] == "trace_id_2"
-
-        # Verify generation() was called for cost tracking
-        assert mock_langfuse.generation.call_count == 2
-
-        # Verify the first generation call
-        first_call = mock_langfuse.generation.call_args_list[0]
-        assert first_call.kwargs["name"] == "evaluation-response"
-        assert first_call.kwargs["trace_id"] == "trace_id_1"
-        assert first_call.kwargs["input"] == {"question": "What is 2+2?"}
-        assert first_call.kwargs["metadata"]["ground_truth"] == "4"
-        assert first_call.kwargs["metadata"]["response_id"] == "resp_123"
-
-        # Verify generation.end() was called with usage
-        assert mock_generation.end.call_count == 2
-
-        first_end_call = mock_generation.end.call_args_list[0]
-        assert first_end_call.kwargs["output"] == {"answer": "The answer is 4"}
-        assert first_end_call.kwargs["model"] == "gpt-4o"
-        assert first_end_call.kwargs["usage"] == {
+        generations = ingested_events(mock_langfuse, "generation-create")
+        assert len(generations) == 2
+
+        first = generations[0]["body"]
+        assert first["name"] == "evaluation-response"
+        assert first["traceId"] == trace_id_mapping["item_1"]
+        assert first["input"] == {"question": "What is 2+2?"}
+        assert first["output"] == {"answer": "The answer is 4"}
+        assert first["metadata"]["response_id"] == "resp_item_1"
+        assert first["model"] == "gpt-4o"
+        assert first["usage"] == {
             "input": 69,
             "output": 258,
             "total": 327,
             "unit": "TOKENS",
         }
 
-        # Verify Langfuse calls
-        mock_langfuse.get_dataset.assert_called_once_with("test_dataset")
-        mock_langfuse.flush.assert_called_once()
-        assert mock_langfuse.trace.call_count == 2
+
+class TestIngestEvents:
+    """Test bulk submission of Langfuse ingestion events."""
+
+    def test_ingest_events_splits_into_chunks(self):
+        """Test that events are sent in chunks bounded by count."""
+        mock_langfuse = create_ingesting_langfuse([])
+        events = [{"id": f"event_{i}", "type": "score-create"} for i in range(5)]
+
+        with patch("app.crud.evaluations.langfuse.INGESTION_CHUNK_MAX_EVENTS", 2):
+            failed = ingest_events(langfuse=mock_langfuse, events=events)
+
+        assert failed == set()
+        assert [len(batch) for batch in mock_langfuse.ingested_batches] == [2, 2, 1]
+
+    def test_ingest_events_splits_on_size(self):
+        """Test that a chunk is closed before it exceeds the byte limit."""
+        mock_langfuse = create_ingesting_langfuse([])
+        events = [{"id": f"event_{i}", "body": {"value": "x" * 100}} for i in range(3)]
+
+        with patch("app.crud.evaluations.langfuse.INGESTION_CHUNK_MAX_BYTES", 300):
+            ingest_events(langfuse=mock_langfuse, events=events)
+
+        assert [len(batch) for batch in mock_langfuse.ingested_batches] == [2, 1]
+
+    def test_ingest_events_retries_chunk_on_connection_error(self):
+        """Test that a chunk is retried and other chunks are unaffected."""
+        mock_langfuse = MagicMock()
+        mock_langfuse.api.ingestion.batch.side_effect = [
+            httpx.ConnectError("connection reset"),
+            MagicMock(errors=[]),
+            Exception("status_code: 500"),
+        ]
+        events = [{"id": f"event_{i}"} for i in range(4)]
+
+        with patch(
+            "app.crud.evaluations.langfuse.INGESTION_CHUNK_MAX_EVENTS", 2
+        ), patch("app.crud.evaluations.langfuse.time.sleep") as sleep:
+            failed = ingest_events(langfuse=mock_langfuse, events=events)
+
+        assert mock_langfuse.api.ingestion.batch.call_count == 3
+        sleep.assert_called_once()
+        assert failed == {"event_2", "event_3"}
 
 
 class TestUpdateTracesWithCosineScores:
@@ -304,7 +335,7 @@ class TestUpdateTracesWithCosineScores:
 
     def test_update_traces_with_cosine_scores_success(self):
         """Test successfully updating traces with scores."""
-        mock_langfuse = MagicMock()
+        mock_langfuse = create_ingesting_langfuse([])
 
         per_item_scores = [
             {"trace_id": "trace_1", "cosine_similarity": 0.95},
@@ -316,24 +347,23 @@ class TestUpdateTracesWithCosineScores:
             langfuse=mock_langfuse, per_item_scores=per_item_scores
         )
 
-        # Verify score was called for each item
-        assert mock_langfuse.score.call_count == 3
-
-        # Verify the score calls
-        calls = mock_langfuse.score.call_args_list
-        assert calls[0].kwargs["trace_id"] == "trace_1"
-        assert calls[0].kwargs["name"] == "cosine_similarity"
-        assert calls[0].kwargs["value"] == 0.95
-        assert "cosine similarity" in calls[0].kwargs["comment"].lower()
-
-        assert calls[1].kwargs["trace_id"] == "trace_2"
-        assert calls[1].kwargs["value"] == 0.87
-
-        mock_langfuse.flush.assert_called_once()
+        # All scores go out in a single ingestion request
+        assert mock_langfuse.api.ingestion.batch.call_count == 1
+        scores = [
+            event["body"] for event in ingested_events(mock_langfuse, "score-create")
+        ]
+        assert [score["traceId"] for score in scores] == [
+            "trace_1",
+            "trace_2",
+            "trace_3",
+        ]
+        assert scores[0]["name"] == "cosine_similarity"
+        assert scores[0]["value"] == 0.95
+        assert "cosine similarity" in scores[0]["comment"].lower()
 
     def test_update_traces_with_cosine_scores_missing_trace_id(self):
         """Test that items without trace_id are skipped."""
-        mock_langfuse = MagicMock()
+        mock_langfuse = create_ingesting_langfuse([])
 
         per_item_scores = [
             {"trace_id": "trace_1", "cosine_similarity": 0.95},
@@ -345,20 +375,17 @@ class TestUpdateTracesWithCosineScores:
             langfuse=mock_langfuse, per_item_scores=per_item_scores
         )
 
-        # Should only call score for items with trace_id
-        assert mock_langfuse.score.call_count == 2
+        # Should only send scores for items with trace_id
+        assert len(ingested_events(mock_langfuse, "score-create")) == 2
 
     def test_update_traces_with_cosine_scores_error_handling(self):
-        """Test that score errors don't stop processing."""
+        """Test that ingestion errors don't raise."""
         mock_langfuse = MagicMock()
-
-        # First call succeeds, second fails, third succeeds
-        mock_langfuse.score.side_effect = [None, Exception("Score failed"), None]
+        mock_langfuse.api.ingestion.batch.side_effect = Exception("Score failed")
 
         per_item_scores = [
             {"trace_id": "trace_1", "cosine_similarity": 0.95},
             {"trace_id": "trace_2", "cosine_similarity": 0.87},
-            {"trace_id": "trace_3", "cosine_similarity": 0.92},
         ]
 
         # Should not raise exception
@@ -366,9 +393,7 @@ class TestUpdateTracesWithCosineScores:
             langfuse=mock_langfuse, per_item_scores=per_item_scores
         )
 
-        # All three should have been attempted
-        assert mock_langfuse.score.call_count == 3
-        mock_langfuse.flush.assert_called_once()
+        assert mock_langfuse.api.ingestion.batch.call_count == 1
 
     def test_update_traces_with_cosine_scores_empty_list(self):
         """Test with empty scores list."""
@@ -376,8 +401,7 @@ class TestUpdateTracesWithCosineScores:
 
         update_traces_with_cosine_scores(langfuse=mock_langfuse, per_item_scores=[])
 
-        mock_langfuse.score.assert_not_called()
-        mock_langfuse.flush.assert_called_once()
+        mock_langfuse.api.ingestion.batch.assert_not_called()
 
 
 class TestUploadDatasetToLangfuse:
@@ -393,7 +417,7 @@ class TestUploadDatasetToLangfuse:
         ]
 
     def test_upload_dataset_to_langfuse_success(self, valid_items):
-        """Test successful upload with duplication."""
+        """Test that duplicated items are stored once."""
         mock_langfuse = MagicMock()
         mock_dataset = MagicMock()
         mock_dataset.id = "dataset_123"
@@ -407,13 +431,15 @@ class TestUploadDatasetToLangfuse:
         )
 
         assert langfuse_id == "dataset_123"
-        assert total_items == 15  # 3 items * 5 duplication
+        assert total_items == 3  # copies are expanded at batch-build time
 
         # Verify dataset creation
-        mock_langfuse.create_dataset.assert_called_once_with(name="test_dataset")
+        mock_langfuse.create_dataset.assert_called_once_with(
+            name="test_dataset", metadata={"duplication_factor": 5}
+        )
 
-        # Verify dataset items were created (3 original * 5 duplicates = 15)
-        assert mock_langfuse.create_dataset_item.call_count == 15
+        # Verify one dataset item per unique item
+        assert mock_langfuse.create_dataset_item.call_count == 3
 
         # Verify flush was called once (final flush)
         assert mock_langfuse.flush.call_count == 1
@@ -435,17 +461,12 @@ class TestUploadDatasetToLangfuse:
         # Check metadata in create_dataset_item calls
         calls = mock_langfuse.create_dataset_item.call_args_list
 
-        # Each original item should have 3 duplicates
-        duplicate_numbers = []
+        # Each item carries the duplication factor instead of being copied
+        assert len(calls) == 3
         for call_args in calls:
             metadata = call_args.kwargs.get("metadata", {})
-            duplicate_numbers.append(metadata.get("duplicate_number"))
             assert metadata.get("duplication_factor") == 3
-
-        # Should have 3 sets of duplicates (1, 2, 3)
-        assert duplicate_numbers.count(1) == 3  # 3 original items, each with dup #1
-        assert duplicate_numbers.count(2) == 3  # 3 original items, each with dup #2
-        assert duplicate_numbers.count(3) == 3  # 3 original items, each with dup #3
+            assert "duplicate_number" not in metadata
 
     def test_upload_dataset_to_langfuse_empty_items(self):
         """Test with empty items list."""
@@ -510,3 +531,197 @@ class TestUploadDatasetToLangfuse:
         # 2 succeeded out of 3
         assert total_items == 2
         assert mock_langfuse.create_dataset_item.call_count == 3
+
+
+class TestUploadDatasetItemsToLangfuse:
+    """Test uploading items from a lazily parsed source."""
+
+    @staticmethod
+    def create_langfuse() -> MagicMock:
+        mock_langfuse = MagicMock()
+        mock_langfuse.create_dataset.return_value = MagicMock(id="dataset_123")
+        return mock_langfuse
+
+    def test_counts_and_progress(self):
+        """Test that counts are returned and progress reported per interval."""
+        mock_langfuse = self.create_langfuse()
+        count = DATASET_UPLOAD_PROGRESS_INTERVAL * 2 + 1
+        items = ({"question": f"Q{i}", "answer": f"A{i}"} for i in range(count))
+        progress = []
+
+        langfuse_id, original_items, total_uploaded = upload_dataset_items_to_langfuse(
+            langfuse=mock_langfuse,
+            items=items,
+            dataset_name="test_dataset",
+            duplication_factor=2,
+            on_progress=progress.append,
+        )
+
+        assert langfuse_id == "dataset_123"
+        assert original_items == count
+        assert total_uploaded == count
+        assert progress == [
+            DATASET_UPLOAD_PROGRESS_INTERVAL,
+            DATASET_UPLOAD_PROGRESS_INTERVAL * 2,
+        ]
+
+    def test_reads_items_only_as_uploads_finish(self):
+        """Test that the source is not drained ahead of the uploads."""
+        mock_langfuse = self.create_langfuse()
+        release = threading.Event()
+        mock_langfuse.create_dataset_item.side_effect = lambda **kwargs: release.wait(5)
+        consumed = []
+
+        def items():
+            for i in range(100):
+                consumed.append(i)
+                yield {"question": f"Q{i}", "answer": f"A{i}"}
+
+        max_workers = 2
+        max_pending = max_workers * DATASET_UPLOAD_QUEUE_FACTOR
+        uploader = threading.Thread(
+            target=upload_dataset_items_to_langfuse,
+            kwargs={
+                "langfuse": mock_langfuse,
+                "items": items(),
+                "dataset_name": "test_dataset",
+                "duplication_factor": 1,
+                "max_workers": max_workers,
+            },
+        )
+        uploader.start()
+        try:
+            deadline = time.monotonic() + 5
+            while len(consumed) < max_pending and time.monotonic() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.1)
+
+            # Every worker is blocked, so reading stops once the queue is full
+            assert len(consumed) == max_pending
+        finally:
+            release.set()
+            uploader.join(5)
+
+        assert len(consumed) == 100
+        assert mock_langfuse.create_dataset_item.call_count == 100
+
+
+def create_trace(trace_id: str, score: float) -> MagicMock:
+    """Mock Langfuse trace with one numeric cosine_similarity score."""
+    score_obj = MagicMock(value=score, comment=None, data_type="NUMERIC")
+    score_obj.name = "cosine_similarity"
+    return MagicMock(
+        id=trace_id,
+        input={"question": f"Question {trace_id}"},
+        output={"answer": f"Answer {trace_id}"},
+        metadata={"ground_truth": f"Truth {trace_id}"},
+        scores=[score_obj],
+    )
+
+
+class TestFetchTraceScoresFromLangfuse:
+    """Test fetching the traces and scores of a dataset run."""
+
+    @staticmethod
+    def create_langfuse(trace_ids: list[str], failing: set[str]) -> MagicMock:
+        def get_trace(trace_id, request_options=None):
+            if trace_id in failing:
+                raise Exception("status_code: 429")
+            return create_trace(trace_id, 0.5)
+
+        mock_langfuse = MagicMock()
+        mock_langfuse.api.datasets.get_run.return_value = MagicMock(
+            dataset_run_items=[MagicMock(trace_id=trace_id) for trace_id in trace_ids]
+        )
+        mock_langfuse.api.trace.get.side_effect = get_trace
+        return mock_langfuse
+
+    def test_fetch_trace_scores_keeps_run_order(self):
+        """Test that traces come back in run order with summary scores."""
+        trace_ids = [f"trace_{i}" for i in range(20)]
+        mock_langfuse = self.create_langfuse(trace_ids, failing=set())
+
+        result = fetch_trace_scores_from_langfuse(
+            langfuse=mock_langfuse, dataset_name="dataset", run_name="run"
+        )
+
+        assert [trace["trace_id"] for trace in result["traces"]] == trace_ids
+        assert result["traces"][0]["question"] == "Question trace_0"
+        assert result["summary_scores"][0]["total_pairs"] == 20
+        assert "failed_trace_ids" not in result
+        request_options = mock_langfuse.api.trace.get.call_args.kwargs[
+            "request_options"
+        ]
+        assert request_options["max_retries"] == TRACE_FETCH_MAX_RETRIES
+
+    def test_fetch_trace_scores_records_partial_result(self):
+        """Test that traces that cannot be fetched are listed, not fatal."""
+        mock_langfuse = self.create_langfuse(
+            ["trace_0", "trace_1", "trace_2"], failing={"trace_1"}
+        )
+
+        result = fetch_trace_scores_from_langfuse(
+            langfuse=mock_langfuse, dataset_name="dataset", run_name="run"
+        )
+
+        assert [trace["trace_id"] for trace in result["traces"]] == [
+            "trace_0",
+            "trace_2",
+        ]
+        assert result["failed_trace_ids"] == ["trace_1"]
+
+    def test_fetch_trace_scores_resumes_from_cached_traces(self):
+        """Test that cached traces are reused and only missing ones fetched."""
+        mock_langfuse = self.create_langfuse(["trace_0", "trace_1"], failing=set())
+        cached_traces = [
+            {
+                "trace_id": "trace_0",
+                "question": "Cached question",
+                "llm_answer": "",
+                "ground_truth_answer": "",
+                "scores": [
+                    {"name": "cosine_similarity", "value": 1.0, "data_type": "NUMERIC"}
+                ],
+            }
+        ]
+
+        result = fetch_trace_scores_from_langfuse(
+            langfuse=mock_langfuse,
+            dataset_name="dataset",
+            run_name="run",
+            cached_traces=cached_traces,
+        )
+
+        fetched = [c.args[0] for c in mock_langfuse.api.trace.get.call_args_list]
+        assert fetched == ["trace_1"]
+        assert result["traces"][0]["question"] == "Cached question"
+        assert result["summary_scores"][0]["avg"] == 0.75
+
+    def test_fetch_traces_bounds_concurrency(self):
+        """Test that no more than max_workers requests run at once."""
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def get_trace(trace_id, request_options=None):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return create_trace(trace_id, 0.5)
+
+        mock_langfuse = MagicMock()
+        mock_langfuse.api.trace.get.side_effect = get_trace
+
+        traces, failed = fetch_traces(
+            langfuse=mock_langfuse,
+            trace_ids=[f"trace_{i}" for i in range(12)],
+            max_workers=3,
+        )
+
+        assert len(traces) == 12
+        assert failed == []
+        assert 1 < peak <= 3
@@ -0,0 +1,257 @@
+"""Tests for evaluation batch processing."""
+
+import ast
+import asyncio
+import json
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlmodel import Session, select
+
+from app.crud.evaluations.embedding_cache import get_cached_embeddings, hash_text
+from app.crud.evaluations.frame import EvaluationResultFrame
+from app.crud.evaluations.processing import (
+    extract_output_text,
+    parse_evaluation_output,
+    process_completed_embedding_batch,
+)
+from app.models import EvaluationDataset, EvaluationRun, Organization, Project
+from app.models.batch_job import BatchJob
+
+
+@pytest.fixture
+def eval_run(db: Session) -> EvaluationRun:
+    org = db.exec(select(Organization)).first()
+    project = db.exec(select(Project).where(Project.organization_id == org.id)).first()
+
+    dataset = EvaluationDataset(
+        name="processing_dataset",
+        dataset_metadata={"original_items_count": 2},
+        organization_id=org.id,
+        project_id=project.id,
+    )
+    db.add(dataset)
+    db.commit()
+    db.refresh(dataset)
+
+    batch_job = BatchJob(
+        provider="openai",
+        job_type="embedding",
+        config={"embedding_model": "text-embedding-3-small", "dimensions": 2},
+        provider_output_file_id="output_1",
+        organization_id=org.id,
+        project_id=project.id,
+    )
+    db.add(batch_job)
+    db.commit()
+    db.refresh(batch_job)
+
+    eval_run = EvaluationRun(
+        run_name="processing_run",
+        dataset_name=dataset.name,
+        dataset_id=dataset.id,
+        config={"model": "gpt-4o"},
+        status="processing",
+        embedding_batch_job_id=batch_job.id,
+        organization_id=org.id,
+        project_id=project.id,
+    )
+    db.add(eval_run)
+    db.commit()
+    db.refresh(eval_run)
+    return eval_run
+
+
+class TestProcessCompletedEmbeddingBatch:
+    """Test scoring a completed embedding batch."""
+
+    def test_caches_ground_truth_embeddings(self, db: Session, eval_run: EvaluationRun):
+        """Test that ground truths embedded by the batch are cached for later runs."""
+        truth_hash = hash_text("4")
+        raw_results = [
+            {
+                "custom_id": f"trace_1:{truth_hash}",
+                "response": {
+                    "body": {
+                        "data": [
+                            {"index": 0, "embedding": [1.0, 0.0]},
+                            {"index": 1, "embedding": [1.0, 0.0]},
+                        ]
+                    }
+                },
+            },
+            {
+                "custom_id": f"trace_2:{truth_hash}",
+                "response": {"body": {"data": [{"index": 0, "embedding": [0.0, 1.0]}]}},
+            },
+        ]
+
+        with patch(
+            "app.crud.evaluations.processing.download_batch_results",
+            return_value=raw_results,
+        ), patch("app.crud.evaluations.processing.update_traces_with_cosine_scores"):
+            result = asyncio.run(
+                process_completed_embedding_batch(
+                    eval_run=eval_run,
+                    session=db,
+                    openai_client=MagicMock(),
+                    langfuse=MagicMock(),
+                )
+            )
+
+        assert result.status == "completed"
+        assert result.error_message is None
+        assert result.score["cosine_similarity"]["total_pairs"] == 2
+        assert result.score["cosine_similarity"]["avg"] == pytest.approx(0.5)
+
+        cached = get_cached_embeddings(
+            session=db,
+            project_id=eval_run.project_id,
+            model="text-embedding-3-small",
+            dimensions=2,
+            text_hashes=[truth_hash],
+        )
+        assert cached[truth_hash].tolist() == [1.0, 0.0]
+
+
+class TestParseEvaluationOutput:
+    """Test parsing response batch output into a result frame."""
+
+    @staticmethod
+    def _response_line(item_id: str, text: str) -> dict:
+        return {
+            "custom_id": item_id,
+            "response": {
+                "body": {
+                    "id": f"resp_{item_id}",
+                    "output": [
+                        {
+                            "type": "message",
+                            "content": [{"type": "output_text", "text": text}],
+                        }
+                    ],
+                    "usage": {
+                        "input_tokens": 3,
+                        "output_tokens": 1,
+                        "total_tokens": 4,
+                    },
+                }
+            },
+        }
+
+    def test_parses_into_columns(self):
+        """Test that outputs are matched with their dataset items."""
+        dataset_items = [
+            {
+                "id": f"item_{i}",
+                "input": {"question": f"Question {i}"},
+                "expected_output": {"answer": f"Truth {i}"},
+            }
+            for i in range(2)
+        ]
+        raw_results = [
+            self._response_line("item_1", "Answer 1"),
+            self._response_line("item_0", "Answer 0"),
+            self._response_line("item_0", "Retried"),
+            self._response_line("unknown", "Orphan"),
+        ]
+
+        results = parse_evaluation_output(
+            raw_results=raw_results, dataset_items=dataset_items
+        )
+
+        assert isinstance(results, EvaluationResultFrame)
+        assert results.item_ids == ["item_1", "item_0"]
+        assert results.generated_outputs == ["Answer 1", "Answer 0"]
+        assert results.ground_truths == ["Truth 1", "Truth 0"]
+        assert results.response_ids == ["resp_item_1", "resp_item_0"]
+        assert results.index["item_0"] == 1
+        assert results.tokens(0) == (3, 1, 4)
+
+    def test_copies_match_their_dataset_item(self):
+        """Test that each copy of a duplicated item gets its own row."""
+        dataset_items = [
+            {
+                "id": "item_0",
+                "input": {"question": "Question 0"},
+                "expected_output": {"answer": "Truth 0"},
+            }
+        ]
+        raw_results = [
+            self._response_line("item_0#1", "Answer A"),
+            self._response_line("item_0#2", "Answer B"),
+            self._response_line("other#1", "Orphan"),
+        ]
+
+        results = parse_evaluation_output(
+            raw_results=raw_results, dataset_items=dataset_items
+        )
+
+        assert results.item_ids == ["item_0#1", "item_0#2"]
+        assert results.questions == ["Question 0", "Question 0"]
+        assert results.ground_truths == ["Truth 0", "Truth 0"]
+        assert results.generated_outputs == ["Answer A", "Answer B"]
+
+    def test_string_outputs_use_literal_eval_only_as_fallback(self, caplog):
+        """Test that JSON and plain text outputs never reach ast.literal_eval."""
+        message = [
+            {
+                "type": "message",
+                "content": [{"type": "output_text", "text": "Four"}],
+            }
+        ]
+        outputs = {
+            "item_0": json.dumps(message),
+            "item_1": "The answer is 4",
+            "item_2": repr(message),
+        }
+        dataset_items = [
+            {
+                "id": item_id,
+                "input": {"question": "What is 2+2?"},
+                "expected_output": {"answer": "4"},
+            }
+            for item_id in outputs
+        ]
+        raw_results = [
+            {"custom_id": item_id, "response": {"body": {"output": output}}}
+            for item_id, output in outputs.items()
+        ]
+
+        with patch(
+            "app.crud.evaluations.processing.ast.literal_eval",
+            wraps=ast.literal_eval,
+        ) as literal_eval, caplog.at_level(logging.INFO):
+            results = parse_evaluation_output(
+                raw_results=raw_results, dataset_items=dataset_items
+            )
+
+        assert results.generated_outputs == ["Four", "The answer is 4", "Four"]
+        literal_eval.assert_called_once_with(repr(message))
+        assert "literal_eval_fallbacks=1" in caplog.text
+
+
+class TestExtractOutputText:
+    """Test reading generated text from a Responses API output list."""
+
+    def test_skips_non_message_items(self):
+        """Test that reasoning items and empty texts are passed over."""
+        output = [
+            {"type": "reasoning", "summary": []},
+            {"type": "message", "content": [{"type": "output_text", "text": ""}]},
+            {
+                "type": "message",
+                "content": [
+                    {"type": "refusal", "refusal": "No"},
+                    {"type": "output_text", "text": "Paris"},
+                ],
+            },
+        ]
+
+        assert extract_output_text(output) == "Paris"
+
+    def test_no_output_text(self):
+        """Test that outputs without text give an empty string."""
+        assert extract_output_text([{"type": "message", "content": None}]) == ""
+        assert extract_output_text([]) == ""
@@ -0,0 +1,265 @@
+"""Tests for realtime evaluation of small datasets."""
+
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlmodel import Session, select
+
+from app.crud.evaluations.realtime import (
+    execute_realtime_requests,
+    run_realtime_evaluation,
+    use_realtime_evaluation,
+)
+from app.models import EvaluationDataset, EvaluationRun, Organization, Project
+
+
+def create_langfuse(questions: list[str]) -> MagicMock:
+    """Mock Langfuse client whose dataset has one item per question."""
+    langfuse = MagicMock()
+    langfuse.get_dataset.return_value = MagicMock(
+        items=[
+            MagicMock(
+                id=f"item_{i}",
+                input={"question": question},
+                expected_output={"answer": f"Answer {i}"},
+                metadata={},
+            )
+            for i, question in enumerate(questions)
+        ]
+    )
+    langfuse.api.datasets.get.return_value = MagicMock(
+        id="langfuse_dataset_123",
+        updated_at=datetime(2025, 12, 1, tzinfo=timezone.utc),
+    )
+    langfuse.api.dataset_items.list.return_value.meta.total_items = len(questions)
+    langfuse.api.ingestion.batch.return_value = MagicMock(errors=[])
+    return langfuse
+
+
+def create_openai_client() -> MagicMock:
+    """Mock OpenAI client answering every question with its answer."""
+    client = MagicMock()
+
+    def create_response(**body):
+        answer = body["input"].replace("Q", "Answer ")
+        return MagicMock(
+            model_dump=lambda: {
+                "id": f"resp_{body['input']}",
+                "output": [
+                    {
+                        "type": "message",
+                        "content": [{"type": "output_text", "text": answer}],
+                    }
+                ],
+                "usage": {"input_tokens": 5, "output_tokens": 2, "total_tokens": 7},
+            }
+        )
+
+    def create_embedding(**body):
+        return MagicMock(
+            model_dump=lambda: {
+                "data": [
+                    {"index": index, "embedding": [1.0, 0.0, 0.0]}
+                    for index in range(len(body["input"]))
+                ]
+            }
+        )
+
+    client.responses.create.side_effect = create_response
+    client.embeddings.create.side_effect = create_embedding
+    return client
+
+
+@pytest.fixture
+def eval_run(db: Session) -> EvaluationRun:
+    org = db.exec(select(Organization)).first()
+    project = db.exec(select(Project).where(Project.organization_id == org.id)).first()
+
+    dataset = EvaluationDataset(
+        name="realtime_dataset",
+        dataset_metadata={"original_items_count": 2, "total_items_count": 2},
+        organization_id=org.id,
+        project_id=project.id,
+    )
+    db.add(dataset)
+    db.commit()
+    db.refresh(dataset)
+
+    eval_run = EvaluationRun(
+        run_name="realtime_run",
+        dataset_name=dataset.name,
+        dataset_id=dataset.id,
+        config={"model": "gpt-4o", "embedding_dimensions": 3},
+        status="pending",
+        organization_id=org.id,
+        project_id=project.id,
+    )
+    db.add(eval_run)
+    db.commit()
+    db.refresh(eval_run)
+    return eval_run
+
+
+@pytest.fixture
+def storage():
+    storage = MagicMock()
+    storage.put.return_value = "s3://bucket/evaluation/realtime/results.jsonl"
+    storage.stream.side_effect = Exception("no snapshot")
+    with patch(
+        "app.crud.evaluations.batch.get_cloud_storage", return_value=storage
+    ), patch("app.crud.evaluations.realtime.get_cloud_storage", return_value=storage):
+        yield storage
+
+
+class TestUseRealtimeEvaluation:
+    """Test choosing realtime evaluation from the dataset size."""
+
+    def test_small_dataset_uses_realtime(self, db: Session, eval_run: EvaluationRun):
+        """Test that a dataset at or below the threshold runs in realtime."""
+        with patch(
+            "app.crud.evaluations.realtime.settings.EVALUATION_REALTIME_MAX_ITEMS", 2
+        ):
+            assert use_realtime_evaluation(session=db, eval_run=eval_run)
+
+    def test_large_dataset_uses_batch(self, db: Session, eval_run: EvaluationRun):
+        """Test that a dataset above the threshold uses the Batch API."""
+        with patch(
+            "app.crud.evaluations.realtime.settings.EVALUATION_REALTIME_MAX_ITEMS", 1
+        ):
+            assert not use_realtime_evaluation(session=db, eval_run=eval_run)
+
+    def test_zero_threshold_disables_realtime(
+        self, db: Session, eval_run: EvaluationRun
+    ):
+        """Test that a threshold of 0 always uses the Batch API."""
+        with patch(
+            "app.crud.evaluations.realtime.settings.EVALUATION_REALTIME_MAX_ITEMS", 0
+        ):
+            assert not use_realtime_evaluation(session=db, eval_run=eval_run)
+
+
+class TestExecuteRealtimeRequests:
+    """Test sending batch request lines as realtime calls."""
+
+    def test_execute_realtime_requests_output_format(self):
+        """Test that responses and errors are shaped like batch output."""
+
+        def send(body):
+            if body["input"] == "bad":
+                raise ValueError("invalid input")
+            return MagicMock(model_dump=lambda: {"id": f"resp_{body['input']}"})
+
+        lines = [
+            {"custom_id": "item_0", "body": {"input": "good"}},
+            {"custom_id": "item_1", "body": {"input": "bad"}},
+        ]
+
+        output = execute_realtime_requests(jsonl_lines=lines, send=send)
+
+        assert [line["custom_id"] for line in output] == ["item_0", "item_1"]
+        assert output[0]["response"]["body"] == {"id": "resp_good"}
+        assert output[0]["error"] is None
+        assert output[1]["error"]["message"] == "invalid input"
+        assert output[1]["response"]["status_code"] == 500
+
+    def test_execute_realtime_requests_bounds_concurrency(self):
+        """Test that no more than max_workers calls are in flight."""
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def send(body):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return MagicMock(model_dump=lambda: {})
+
+        lines = [{"custom_id": f"item_{i}", "body": {}} for i in range(12)]
+
+        output = execute_realtime_requests(jsonl_lines=lines, send=send, max_workers=3)
+
+        assert len(output) == 12
+        assert 1 < max_in_flight <= 3
+
+
+@pytest.mark.usefixtures("storage")
+class TestRunRealtimeEvaluation:
+    """Test evaluating a run end to end with realtime calls."""
+
+    def test_run_realtime_evaluation_completes_run(
+        self, db: Session, eval_run: EvaluationRun
+    ):
+        """Test that the run is scored and completed without any batch."""
+        client = create_openai_client()
+        langfuse = create_langfuse(["Q0", "Q1"])
+
+        result = run_realtime_evaluation(
+            langfuse=langfuse,
+            openai_client=client,
+            session=db,
+            eval_run=eval_run,
+            config={"model": "gpt-4o"},
+        )
+
+        assert result.status == "completed"
+        assert result.error_message is None
+        assert result.total_items == 2
+        assert result.batch_job_id is None
+        assert result.embedding_batch_job_id is None
+        assert result.object_store_url == (
+            "s3://bucket/evaluation/realtime/results.jsonl"
+        )
+        assert result.progress["stage"] == "completed"
+        assert result.progress["mode"] == "realtime"
+        assert result.score["cosine_similarity"]["avg"] == pytest.approx(1.0)
+        assert result.score["cosine_similarity"]["total_pairs"] == 2
+
+        assert client.responses.create.call_count == 2
+        assert client.embeddings.create.call_count == 2
+        client.batches.create.assert_not_called()
+        assert langfuse.api.dataset_run_items.create.call_count == 2
+
+    def test_run_realtime_evaluation_no_valid_items(
+        self, db: Session, eval_run: EvaluationRun
+    ):
+        """Test that a dataset without questions fails the run."""
+        client = create_openai_client()
+
+        with pytest.raises(ValueError, match="did not produce any JSONL entries"):
+            run_realtime_evaluation(
+                langfuse=create_langfuse(["", ""]),
+                openai_client=client,
+                session=db,
+                eval_run=eval_run,
+                config={"model": "gpt-4o"},
+            )
+
+        assert eval_run.status == "failed"
+        assert eval_run.progress["stage"] == "failed"
+        client.responses.create.assert_not_called()
+
+    def test_run_realtime_evaluation_embedding_failure(
+        self, db: Session, eval_run: EvaluationRun
+    ):
+        """Test that failed embeddings complete the run without scores."""
+        client = create_openai_client()
+        client.embeddings.create.side_effect = Exception("rate limited")
+
+        result = run_realtime_evaluation(
+            langfuse=create_langfuse(["Q0", "Q1"]),
+            openai_client=client,
+            session=db,
+            eval_run=eval_run,
+            config={"model": "gpt-4o"},
+        )
+
+        assert result.status == "completed"
+        assert result.error_message.startswith("Embeddings failed")
+        assert result.score is None
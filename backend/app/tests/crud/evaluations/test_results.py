@@ -0,0 +1,255 @@
+"""Tests for per-item evaluation results stored in Postgres."""
+
+import pytest
+from sqlmodel import Session, select
+
+from app.crud.evaluations.frame import EvaluationResultFrame
+from app.crud.evaluations.results import (
+    get_evaluation_result_summary,
+    list_evaluation_results,
+    store_cosine_scores,
+    store_evaluation_results,
+)
+from app.models import (
+    EvaluationDataset,
+    EvaluationResult,
+    EvaluationRun,
+    Organization,
+    Project,
+)
+
+
+@pytest.fixture
+def eval_run(db: Session) -> EvaluationRun:
+    org = db.exec(select(Organization)).first()
+    project = db.exec(select(Project).where(Project.organization_id == org.id)).first()
+
+    dataset = EvaluationDataset(
+        name="results_dataset",
+        dataset_metadata={"original_items_count": 3},
+        organization_id=org.id,
+        project_id=project.id,
+    )
+    db.add(dataset)
+    db.commit()
+    db.refresh(dataset)
+
+    eval_run = EvaluationRun(
+        run_name="results_run",
+        dataset_name=dataset.name,
+        dataset_id=dataset.id,
+        config={"model": "gpt-4o"},
+        status="processing",
+        organization_id=org.id,
+        project_id=project.id,
+    )
+    db.add(eval_run)
+    db.commit()
+    db.refresh(eval_run)
+    return eval_run
+
+
+def make_results(count: int) -> EvaluationResultFrame:
+    return EvaluationResultFrame.from_records(
+        {
+            "item_id": f"item_{i}",
+            "question": f"Question {i}",
+            "generated_output": f"Answer {i}",
+            "ground_truth": f"Truth {i}",
+            "usage": {"input_tokens": 10, "output_tokens": 5, "total_tokens": 15},
+        }
+        for i in range(count)
+    )
+
+
+def make_trace_mapping(count: int) -> dict[str, str]:
+    return {f"item_{i}": f"trace_{i}" for i in range(count)}
+
+
+class TestStoreEvaluationResults:
+    """Test bulk loading per-item results."""
+
+    def test_stores_rows_with_trace_ids(self, db: Session, eval_run: EvaluationRun):
+        """Test that every result is stored with its trace ID and token usage."""
+        count = store_evaluation_results(
+            session=db,
+            eval_run_id=eval_run.id,
+            results=make_results(3),
+            trace_id_mapping=make_trace_mapping(3),
+        )
+
+        rows = list_evaluation_results(session=db, eval_run_id=eval_run.id).items
+
+        assert count == 3
+        assert [row.item_id for row in rows] == ["item_0", "item_1", "item_2"]
+        assert rows[1].trace_id == "trace_1"
+        assert rows[1].question == "Question 1"
+        assert rows[1].generated_output == "Answer 1"
+        assert rows[1].ground_truth == "Truth 1"
+        assert rows[1].total_tokens == 15
+        assert rows[1].cosine_similarity is None
+
+    def test_missing_usage_and_trace_are_null(
+        self, db: Session, eval_run: EvaluationRun
+    ):
+        """Test that items without usage or a trace are stored with nulls."""
+        results = EvaluationResultFrame.from_records(
+            [
+                {
+                    "item_id": "item_0",
+                    "question": "Question",
+                    "generated_output": "Answer",
+                    "ground_truth": "Truth",
+                    "usage": None,
+                }
+            ]
+        )
+
+        store_evaluation_results(
+            session=db, eval_run_id=eval_run.id, results=results, trace_id_mapping={}
+        )
+
+        row = list_evaluation_results(session=db, eval_run_id=eval_run.id).items[0]
+        assert row.trace_id is None
+        assert row.input_tokens is None
+
+    def test_restoring_replaces_existing_rows(
+        self, db: Session, eval_run: EvaluationRun
+    ):
+        """Test that reprocessing a run does not duplicate its results."""
+        for count in (3, 2):
+            store_evaluation_results(
+                session=db,
+                eval_run_id=eval_run.id,
+                results=make_results(count),
+                trace_id_mapping=make_trace_mapping(count),
+            )
+
+        rows = db.exec(
+            select(EvaluationResult).where(
+                EvaluationResult.evaluation_run_id == eval_run.id
+            )
+        ).all()
+        assert len(rows) == 2
+
+
+class TestStoreCosineScores:
+    """Test filling in cosine scores by trace ID."""
+
+    def test_updates_matching_traces(self, db: Session, eval_run: EvaluationRun):
+        """Test that scores land on the rows of their traces only."""
+        store_evaluation_results(
+            session=db,
+            eval_run_id=eval_run.id,
+            results=make_results(3),
+            trace_id_mapping=make_trace_mapping(3),
+        )
+
+        updated = store_cosine_scores(
+            session=db,
+            eval_run_id=eval_run.id,
+            per_item_scores=[
+                {"trace_id": "trace_0", "cosine_similarity": 0.9},
+                {"trace_id": "trace_2", "cosine_similarity": 0.5},
+                {"trace_id": "unknown", "cosine_similarity": 0.1},
+            ],
+        )
+
+        rows = list_evaluation_results(session=db, eval_run_id=eval_run.id).items
+        for row in rows:
+            db.refresh(row)
+
+        assert updated == 2
+        assert [row.cosine_similarity for row in rows] == [
+            pytest.approx(0.9),
+            None,
+            pytest.approx(0.5),
+        ]
+
+    def test_no_scores_is_noop(self, db: Session, eval_run: EvaluationRun):
+        """Test that an empty score list updates nothing."""
+        assert (
+            store_cosine_scores(session=db, eval_run_id=eval_run.id, per_item_scores=[])
+            == 0
+        )
+
+
+class TestEvaluationResultSummary:
+    """Test SQL aggregation over stored results."""
+
+    def test_summary_statistics(self, db: Session, eval_run: EvaluationRun):
+        """Test counts, cosine statistics and token totals."""
+        store_evaluation_results(
+            session=db,
+            eval_run_id=eval_run.id,
+            results=make_results(3),
+            trace_id_mapping=make_trace_mapping(3),
+        )
+        store_cosine_scores(
+            session=db,
+            eval_run_id=eval_run.id,
+            per_item_scores=[
+                {"trace_id": "trace_0", "cosine_similarity": 1.0},
+                {"trace_id": "trace_1", "cosine_similarity": 0.5},
+            ],
+        )
+
+        summary = get_evaluation_result_summary(session=db, eval_run_id=eval_run.id)
+
+        assert summary.total_items == 3
+        assert summary.scored_items == 2
+        assert summary.cosine_similarity_avg == pytest.approx(0.75)
+        assert summary.cosine_similarity_std == pytest.approx(0.25)
+        assert summary.cosine_similarity_min == pytest.approx(0.5)
+        assert summary.cosine_similarity_max == pytest.approx(1.0)
+        assert summary.input_tokens == 30
+        assert summary.total_tokens == 45
+
+    def test_summary_of_empty_run(self, db: Session, eval_run: EvaluationRun):
+        """Test that a run without results has zero counts and no statistics."""
+        summary = get_evaluation_result_summary(session=db, eval_run_id=eval_run.id)
+
+        assert summary.total_items == 0
+        assert summary.cosine_similarity_avg is None
+        assert summary.total_tokens == 0
+
+
+class TestListEvaluationResults:
+    """Test paging through stored results."""
+
+    def test_limit_and_offset(self, db: Session, eval_run: EvaluationRun):
+        """Test that pages follow item order."""
+        store_evaluation_results(
+            session=db,
+            eval_run_id=eval_run.id,
+            results=make_results(5),
+            trace_id_mapping=make_trace_mapping(5),
+        )
+
+        page = list_evaluation_results(
+            session=db, eval_run_id=eval_run.id, limit=2, offset=2
+        )
+
+        assert [row.item_id for row in page.items] == ["item_2", "item_3"]
+
+    def test_cursor(self, db: Session, eval_run: EvaluationRun):
+        """Test that following next_cursor visits every result once in order."""
+        store_evaluation_results(
+            session=db,
+            eval_run_id=eval_run.id,
+            results=make_results(5),
+            trace_id_mapping=make_trace_mapping(5),
+        )
+
+        item_ids = []
+        cursor = None
+        while True:
+            page = list_evaluation_results(
+                session=db, eval_run_id=eval_run.id, limit=2, cursor=cursor
+            )
+            item_ids.extend(row.item_id for row in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert item_ids == [f"item_{i}" for i in range(5)]
@@ -0,0 +1,89 @@
+"""Tests for object store snapshots of Langfuse dataset items."""
+
+import gzip
+import io
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.crud.evaluations.snapshot import (
+    SNAPSHOT_FORMAT_VERSION,
+    get_dataset_fingerprint,
+    read_dataset_snapshot,
+    write_dataset_snapshot,
+)
+
+ITEMS = [
+    {
+        "id": "item_1",
+        "input": {"question": "What is 2+2?"},
+        "expected_output": {"answer": "4"},
+        "metadata": {"duplication_factor": 2},
+    },
+    {
+        "id": "item_2",
+        "input": {"question": "Capital of France?"},
+        "expected_output": {"answer": "Paris"},
+        "metadata": {},
+    },
+]
+
+
+class TestGetDatasetFingerprint:
+    """Test fingerprinting a Langfuse dataset."""
+
+    def test_get_dataset_fingerprint(self):
+        """Test that the fingerprint combines item count and update time."""
+        langfuse = MagicMock()
+        updated_at = datetime(2025, 12, 1, tzinfo=timezone.utc)
+        langfuse.api.datasets.get.return_value = MagicMock(
+            id="langfuse_dataset_123", updated_at=updated_at
+        )
+        langfuse.api.dataset_items.list.return_value.meta.total_items = 42
+
+        dataset_id, fingerprint = get_dataset_fingerprint(
+            langfuse=langfuse, dataset_name="test_dataset"
+        )
+
+        assert dataset_id == "langfuse_dataset_123"
+        assert fingerprint == (
+            f"v{SNAPSHOT_FORMAT_VERSION}-42-{int(updated_at.timestamp())}"
+        )
+        langfuse.api.dataset_items.list.assert_called_once_with(
+            dataset_name="test_dataset", limit=1
+        )
+
+
+class TestDatasetSnapshot:
+    """Test writing and reading dataset snapshots."""
+
+    def test_snapshot_round_trip(self):
+        """Test that items read back equal the items written."""
+        storage = MagicMock()
+        storage.put.return_value = "s3://bucket/snapshot.jsonl.gz"
+
+        url = write_dataset_snapshot(
+            storage=storage,
+            langfuse_dataset_id="langfuse_dataset_123",
+            fingerprint="v1-2-0",
+            items=ITEMS,
+        )
+
+        kwargs = storage.put.call_args.kwargs
+        assert kwargs["file_path"].as_posix() == (
+            "datasets/snapshots/langfuse_dataset_123/v1-2-0.jsonl.gz"
+        )
+        content = kwargs["source"].file.getvalue()
+        assert gzip.decompress(content).count(b"\n") == 2
+
+        storage.stream.return_value = io.BytesIO(content)
+        assert read_dataset_snapshot(storage=storage, url=url) == ITEMS
+
+    def test_read_empty_snapshot(self):
+        """Test that an empty snapshot is rejected."""
+        storage = MagicMock()
+        storage.stream.return_value = io.BytesIO(gzip.compress(b""))
+
+        with pytest.raises(ValueError, match="empty"):
+            read_dataset_snapshot(storage=storage, url="s3://bucket/empty.jsonl.gz")
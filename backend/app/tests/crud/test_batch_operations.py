@@ -0,0 +1,247 @@
+"""Tests for the generic batch operations orchestrator."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlmodel import Session, select
+
+from app.core.batch.openai import OpenAIBatchProvider
+from app.crud.batch_operations import (
+    download_batch_results,
+    poll_batch_status,
+    start_batch_job,
+)
+from app.models import Organization, Project
+from app.models.batch_job import BatchJob
+from app.tests.utils.openai import get_mock_openai_batch_client
+
+
+def _requests(count: int):
+    for i in range(count):
+        yield {"custom_id": f"item_{i}", "body": {"input": f"Question {i}"}}
+
+
+@pytest.fixture
+def project(db: Session) -> Project:
+    org = db.exec(select(Organization)).first()
+    return db.exec(select(Project).where(Project.organization_id == org.id)).first()
+
+
+def _start(
+    db: Session, project: Project, provider: OpenAIBatchProvider, count: int
+) -> BatchJob:
+    return start_batch_job(
+        session=db,
+        provider=provider,
+        provider_name="openai",
+        job_type="evaluation",
+        organization_id=project.organization_id,
+        project_id=project.id,
+        jsonl_data=_requests(count),
+        config={"endpoint": "/v1/responses", "description": "Evaluation: run"},
+        total_items=count,
+    )
+
+
+def _sharded_provider(uploaded: list[dict], max_batch_requests: int | None):
+    client = get_mock_openai_batch_client(uploaded)
+    client.batches.create.side_effect = [
+        MagicMock(id=f"batch_{i}", status="validating") for i in range(5)
+    ]
+    provider = OpenAIBatchProvider(client=client)
+    provider.max_batch_requests = max_batch_requests
+    return provider
+
+
+class TestStartBatchJob:
+    """Test starting a batch job from streamed JSONL data."""
+
+    def test_start_batch_job_uses_provider_count(self, db: Session, project: Project):
+        """Test that total_items is replaced by the provider's serialized count."""
+        uploaded: list[dict] = []
+        provider = OpenAIBatchProvider(client=get_mock_openai_batch_client(uploaded))
+
+        batch_job = start_batch_job(
+            session=db,
+            provider=provider,
+            provider_name="openai",
+            job_type="evaluation",
+            organization_id=project.organization_id,
+            project_id=project.id,
+            jsonl_data=_requests(3),
+            config={"endpoint": "/v1/responses"},
+            total_items=5,
+        )
+
+        assert batch_job.provider_batch_id == "batch_123"
+        assert batch_job.total_items == 3
+        assert batch_job.shards == []
+        assert len(uploaded) == 3
+
+    def test_start_batch_job_keeps_count_when_provider_fails(
+        self, db: Session, project: Project
+    ):
+        """Test that the caller's count is stored even if the provider fails."""
+        client = MagicMock()
+        client.files.create.side_effect = Exception("upload failed")
+        provider = OpenAIBatchProvider(client=client)
+
+        with pytest.raises(Exception, match="upload failed"):
+            _start(db, project, provider, count=3)
+
+        batch_job = db.exec(select(BatchJob).order_by(BatchJob.id.desc())).first()
+        assert batch_job.total_items == 3
+        assert batch_job.provider_batch_id is None
+        assert "upload failed" in batch_job.error_message
+
+
+class TestShardedBatchJob:
+    """Test splitting a logical batch into provider batches."""
+
+    def test_start_batch_job_splits_into_shards(self, db: Session, project: Project):
+        """Test that oversized batches become ordered shard rows under a parent."""
+        uploaded: list[dict] = []
+        provider = _sharded_provider(uploaded, max_batch_requests=2)
+
+        parent = _start(db, project, provider, count=5)
+
+        assert parent.provider_batch_id is None
+        assert parent.provider_status == "validating"
+        assert parent.total_items == 5
+        assert parent.config["shard_count"] == 3
+
+        shards = parent.shards
+        assert [shard.shard_index for shard in shards] == [0, 1, 2]
+        assert [shard.total_items for shard in shards] == [2, 2, 1]
+        assert [shard.provider_batch_id for shard in shards] == [
+            "batch_0",
+            "batch_1",
+            "batch_2",
+        ]
+        assert all(shard.parent_id == parent.id for shard in shards)
+        assert shards[2].config["description"] == "Evaluation: run (shard 3)"
+        assert [line["custom_id"] for line in uploaded] == [
+            f"item_{i}" for i in range(5)
+        ]
+
+    def test_start_batch_job_splits_on_file_size(self, db: Session, project: Project):
+        """Test that the provider's per-file byte limit also starts new shards."""
+        uploaded: list[dict] = []
+        provider = _sharded_provider(uploaded, max_batch_requests=None)
+        provider.max_batch_file_bytes = 150
+
+        parent = _start(db, project, provider, count=4)
+
+        assert [shard.total_items for shard in parent.shards] == [2, 2]
+
+    def test_failed_shard_cancels_submitted_shards(self, db: Session, project: Project):
+        """Test that shards already at the provider are cancelled if a later one fails."""
+        provider = _sharded_provider([], max_batch_requests=2)
+        provider.client.batches.create.side_effect = [
+            MagicMock(id="batch_0", status="validating"),
+            MagicMock(id="batch_1", status="validating"),
+            Exception("rate limited"),
+        ]
+        provider.client.batches.cancel.return_value = MagicMock(status="cancelling")
+
+        with pytest.raises(Exception, match="rate limited"):
+            _start(db, project, provider, count=5)
+
+        assert [c.args for c in provider.client.batches.cancel.call_args_list] == [
+            ("batch_0",),
+            ("batch_1",),
+        ]
+        parent = db.exec(
+            select(BatchJob)
+            .where(BatchJob.parent_id.is_(None))
+            .order_by(BatchJob.id.desc())
+        ).first()
+        shards = parent.shards
+        assert [shard.provider_status for shard in shards[:2]] == [
+            "cancelled",
+            "cancelled",
+        ]
+        assert all("shard 2 failed" in shard.error_message for shard in shards[:2])
+        assert shards[2].provider_batch_id is None
+        assert "rate limited" in shards[2].error_message
+        assert "rate limited" in parent.error_message
+
+    def test_poll_batch_status_aggregates_shards(self, db: Session, project: Project):
+        """Test that the parent status follows its shards and skips finished ones."""
+        provider = _sharded_provider([], max_batch_requests=2)
+        parent = _start(db, project, provider, count=4)
+
+        statuses = {
+            "batch_0": {"provider_status": "completed"},
+            "batch_1": {"provider_status": "in_progress"},
+        }
+        with patch.object(
+            provider,
+            "get_batch_status",
+            side_effect=lambda batch_id: statuses[batch_id],
+        ) as get_status:
+            result = poll_batch_status(session=db, provider=provider, batch_job=parent)
+            assert result["provider_status"] == "in_progress"
+            assert parent.provider_status == "in_progress"
+
+            statuses["batch_1"] = {"provider_status": "completed"}
+            result = poll_batch_status(session=db, provider=provider, batch_job=parent)
+
+        assert result["provider_status"] == "completed"
+        assert parent.provider_status == "completed"
+        # batch_0 finished on the first poll and is not polled again
+        assert [c.args[0] for c in get_status.call_args_list] == [
+            "batch_0",
+            "batch_1",
+            "batch_1",
+        ]
+
+    def test_poll_batch_status_fails_group_on_failed_shard(
+        self, db: Session, project: Project
+    ):
+        """Test that one failed shard fails the whole group."""
+        provider = _sharded_provider([], max_batch_requests=2)
+        parent = _start(db, project, provider, count=4)
+
+        statuses = {
+            "batch_0": {"provider_status": "in_progress"},
+            "batch_1": {"provider_status": "failed", "error_message": "bad input"},
+        }
+        with patch.object(
+            provider,
+            "get_batch_status",
+            side_effect=lambda batch_id: statuses[batch_id],
+        ):
+            poll_batch_status(session=db, provider=provider, batch_job=parent)
+
+        assert parent.provider_status == "failed"
+        assert parent.error_message == "Shard 1 failed: bad input"
+
+    def test_download_batch_results_merges_in_shard_order(
+        self, db: Session, project: Project
+    ):
+        """Test that shard results are concatenated in shard order."""
+        provider = _sharded_provider([], max_batch_requests=2)
+        parent = _start(db, project, provider, count=4)
+        for i, shard in enumerate(parent.shards):
+            shard.provider_output_file_id = f"output_{i}"
+            db.add(shard)
+        db.commit()
+
+        outputs = {
+            "output_0": [{"custom_id": "item_1"}, {"custom_id": "item_0"}],
+            "output_1": [{"custom_id": "item_2"}, {"custom_id": "item_3"}],
+        }
+        with patch.object(
+            provider,
+            "download_batch_results",
+            side_effect=lambda output_file_id: outputs[output_file_id],
+        ):
+            results = download_batch_results(provider=provider, batch_job=parent)
+
+        assert [r["custom_id"] for r in results] == [
+            "item_1",
+            "item_0",
+            "item_2",
+            "item_3",
+        ]
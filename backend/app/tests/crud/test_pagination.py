@@ -0,0 +1,171 @@
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlmodel import Session, select
+
+from app.crud.pagination import CountMode, decode_cursor, encode_cursor, paginate
+from app.models import Document, OpenAIConversation
+from app.tests.utils.document import DocumentStore
+from app.tests.utils.utils import get_project
+
+
+@pytest.fixture
+def store(db: Session) -> DocumentStore:
+    return DocumentStore(db=db, project_id=get_project(db).id)
+
+
+def documents_statement(store: DocumentStore):
+    return select(Document).where(Document.project_id == store.project.id)
+
+
+def read_pages(db: Session, statement, limit: int) -> list[list[Document]]:
+    """Follow next_cursor from the first page to the last."""
+    pages = []
+    cursor = None
+    while True:
+        page = paginate(
+            db,
+            statement,
+            sort_column=Document.inserted_at,
+            id_column=Document.id,
+            limit=limit,
+            cursor=cursor,
+        )
+        pages.append(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            return pages
+
+
+class TestCursor:
+    """Test encoding and decoding of pagination cursors."""
+
+    def test_round_trip_uuid(self, store: DocumentStore):
+        doc = store.put()
+
+        cursor = encode_cursor(doc.inserted_at, doc.id)
+
+        assert decode_cursor(cursor, Document.id) == (doc.inserted_at, doc.id)
+
+    def test_round_trip_int(self):
+        inserted_at = datetime(2025, 12, 1, 10, 30, 15, 123456)
+
+        cursor = encode_cursor(inserted_at, 42)
+
+        assert decode_cursor(cursor, OpenAIConversation.id) == (inserted_at, 42)
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", "e30"])
+    def test_invalid_cursor(self, cursor: str):
+        """Test that a malformed cursor is a client error."""
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor(cursor, Document.id)
+
+        assert exc_info.value.status_code == 400
+
+
+class TestPaginate:
+    """Test keyset pagination over documents."""
+
+    def test_pages_cover_all_rows_newest_first(self, db: Session, store: DocumentStore):
+        """Test that following cursors visits every row once, newest first."""
+        docs = store.fill(7)
+
+        pages = read_pages(db, documents_statement(store), limit=3)
+
+        assert [len(page) for page in pages] == [3, 3, 1]
+        expected = sorted(docs, key=lambda d: (d.inserted_at, d.id), reverse=True)
+        assert [d.id for page in pages for d in page] == [d.id for d in expected]
+
+    def test_equal_timestamps_are_ordered_by_id(
+        self, db: Session, store: DocumentStore
+    ):
+        """Test that rows sharing a timestamp are neither skipped nor repeated."""
+        docs = store.fill(5)
+        inserted_at = docs[0].inserted_at
+        for doc in docs:
+            doc.inserted_at = inserted_at
+            db.add(doc)
+        db.commit()
+
+        pages = read_pages(db, documents_statement(store), limit=2)
+
+        ids = [d.id for page in pages for d in page]
+        assert ids == sorted((d.id for d in docs), reverse=True)
+
+    def test_exact_page_has_no_next_cursor(self, db: Session, store: DocumentStore):
+        store.fill(3)
+
+        page = paginate(
+            db,
+            documents_statement(store),
+            sort_column=Document.inserted_at,
+            id_column=Document.id,
+            limit=3,
+        )
+
+        assert len(page.items) == 3
+        assert page.next_cursor is None
+        assert page.metadata == {"next_cursor": None}
+
+    def test_skip_applies_without_cursor(self, db: Session, store: DocumentStore):
+        docs = store.fill(4)
+
+        page = paginate(
+            db,
+            documents_statement(store),
+            sort_column=Document.inserted_at,
+            id_column=Document.id,
+            limit=10,
+            skip=3,
+        )
+
+        assert [d.id for d in page.items] == [docs[0].id]
+
+    @pytest.mark.parametrize(
+        "count,expected",
+        [(CountMode.NONE, None), (CountMode.EXACT, 4)],
+    )
+    def test_count(self, db: Session, store: DocumentStore, count: CountMode, expected):
+        store.fill(4)
+
+        page = paginate(
+            db,
+            documents_statement(store),
+            sort_column=Document.inserted_at,
+            id_column=Document.id,
+            limit=2,
+            count=count,
+        )
+
+        assert page.total == expected
+        assert ("total" in page.metadata) is (expected is not None)
+
+    def test_estimated_count(self, db: Session, store: DocumentStore):
+        """Test that the estimate comes from the planner, not a count query."""
+        store.fill(4)
+        statement = documents_statement(store)
+        statements = []
+
+        def record(conn, cursor, sql, *args):
+            statements.append(sql)
+
+        event.listen(db.get_bind(), "before_cursor_execute", record)
+        try:
+            page = paginate(
+                db,
+                statement,
+                sort_column=Document.inserted_at,
+                id_column=Document.id,
+                limit=2,
+                count=CountMode.ESTIMATED,
+            )
+        finally:
+            event.remove(db.get_bind(), "before_cursor_execute", record)
+
+        assert isinstance(page.total, int)
+        assert page.total >= 0
+        assert len(statements) == 2
+        assert statements[0].startswith("EXPLAIN (FORMAT JSON)")
+        assert "count(" not in statements[1].lower()
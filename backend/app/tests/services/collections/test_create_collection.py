@@ -192,6 +192,70 @@ def test_execute_job_success_flow_updates_job_and_creates_collection(
     assert docs[0].fname == document.fname
 
 
+@pytest.mark.usefixtures("aws_credentials")
+@mock_aws
+@patch("app.services.collections.create_collection.get_openai_client")
+def test_execute_job_reads_recorded_file_sizes(mock_get_openai_client, db):
+    """
+    execute_job should take document sizes recorded at upload from the
+    database instead of requesting them from the object store.
+    """
+    project = get_project(db)
+
+    aws = AmazonCloudStorageClient()
+    aws.create()
+
+    store = DocumentStore(db=db, project_id=project.id)
+    document = store.put()
+    document.file_size_bytes = 2048
+    db.add(document)
+    db.commit()
+
+    sample_request = CreationRequest(
+        model="gpt-4o",
+        instructions="string",
+        temperature=0.000001,
+        documents=[document.id],
+        batch_size=1,
+        callback_url=None,
+    )
+    mock_get_openai_client.return_value = get_mock_openai_client_with_vector_store()
+
+    job_id = uuid4()
+    _ = get_collection_job(
+        db,
+        project,
+        job_id=job_id,
+        action_type=CollectionActionType.CREATE,
+        status=CollectionJobStatus.PENDING,
+        collection_id=None,
+    )
+
+    with patch(
+        "app.services.collections.create_collection.Session"
+    ) as SessionCtor, patch(
+        "app.core.cloud.storage.AmazonCloudStorage.get_file_size_kb"
+    ) as mock_get_size, patch(
+        "app.crud.rag.open_ai.OpenAIVectorStoreCrud.update", return_value=iter([])
+    ):
+        SessionCtor.return_value.__enter__.return_value = db
+        SessionCtor.return_value.__exit__.return_value = False
+
+        execute_job(
+            request=sample_request.model_dump(),
+            project_id=project.id,
+            organization_id=project.organization_id,
+            task_id=str(uuid4()),
+            with_assistant=True,
+            job_id=str(job_id),
+            task_instance=None,
+        )
+
+    mock_get_size.assert_not_called()
+    updated_job = CollectionJobCrud(db, project.id).read_one(job_id)
+    assert updated_job.status == CollectionJobStatus.SUCCESSFUL
+
+
 @pytest.mark.usefixtures("aws_credentials")
 @mock_aws
 @patch("app.services.collections.create_collection.get_openai_client")
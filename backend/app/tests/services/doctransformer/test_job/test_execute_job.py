@@ -83,6 +83,8 @@ class TestExecuteJob(DocTransformTestBase):
         assert "<transformed>" in transformed_doc.fname
         assert transformed_doc.source_document_id == document.id
         assert transformed_doc.object_store_url is not None
+        assert transformed_doc.file_size_bytes > 0
+        assert len(transformed_doc.sha256) == 64
 
         self.verify_s3_content(aws, transformed_doc)
 
@@ -1,7 +1,6 @@
 """
 Tests for retry mechanisms and error handling in document transformation service.
 """
-from io import BytesIO
 from uuid import uuid4
 from typing import Any, Callable, Tuple
 from unittest.mock import patch
@@ -56,7 +55,9 @@ class TestExecuteJobRetryAndErrors(DocTransformTestBase):
             mock_session_class.return_value.__exit__.return_value = None
 
             mock_storage = mock_storage_class.return_value
-            mock_storage.stream.return_value = BytesIO(b"test content")
+            mock_storage.download.side_effect = lambda url, destination: (
+                destination.write_bytes(b"test content")
+            )
             mock_storage.put.side_effect = Exception("S3 upload failed")
 
             with pytest.raises(Exception):
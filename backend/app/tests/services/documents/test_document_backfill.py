@@ -0,0 +1,77 @@
+import hashlib
+import os
+from pathlib import Path
+from urllib.parse import urlparse
+
+import pytest
+from moto import mock_aws
+from sqlmodel import Session
+
+from app.core.cloud import AmazonCloudStorageClient
+from app.core.cloud.storage import CHECKSUM_METADATA_KEY
+from app.core.config import settings
+from app.services.documents.backfill import backfill_document_file_info
+from app.tests.utils.document import DocumentStore
+from app.tests.utils.utils import get_project
+
+
+@pytest.fixture
+def aws_credentials():
+    os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+    os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+    os.environ["AWS_SECURITY_TOKEN"] = "testing"
+    os.environ["AWS_SESSION_TOKEN"] = "testing"
+    os.environ["AWS_DEFAULT_REGION"] = settings.AWS_DEFAULT_REGION
+
+
+def put_object(aws: AmazonCloudStorageClient, url: str, body: bytes, **kwargs):
+    key = Path(urlparse(url).path).relative_to("/")
+    aws.client.put_object(
+        Bucket=settings.AWS_S3_BUCKET, Key=str(key), Body=body, **kwargs
+    )
+
+
+@mock_aws
+@pytest.mark.usefixtures("aws_credentials")
+class TestBackfillDocumentFileInfo:
+    def test_backfills_size_and_checksum(self, db: Session):
+        """Test that documents with and without checksum metadata are filled in."""
+        aws = AmazonCloudStorageClient()
+        aws.create()
+        store = DocumentStore(db=db, project_id=get_project(db).id)
+        legacy, recent = store.fill(2)
+
+        put_object(aws, legacy.object_store_url, b"legacy content")
+        put_object(
+            aws,
+            recent.object_store_url,
+            b"recent",
+            Metadata={CHECKSUM_METADATA_KEY: hashlib.sha256(b"recent").hexdigest()},
+        )
+
+        updated = backfill_document_file_info(db, batch_size=1, max_workers=2)
+
+        assert updated == 2
+        db.refresh(legacy)
+        db.refresh(recent)
+        assert legacy.file_size_bytes == len(b"legacy content")
+        assert legacy.sha256 == hashlib.sha256(b"legacy content").hexdigest()
+        assert recent.file_size_bytes == len(b"recent")
+        assert recent.sha256 == hashlib.sha256(b"recent").hexdigest()
+
+    def test_skips_missing_objects(self, db: Session):
+        """Test that unreadable documents are skipped and left unset."""
+        aws = AmazonCloudStorageClient()
+        aws.create()
+        store = DocumentStore(db=db, project_id=get_project(db).id)
+        missing, present = store.fill(2)
+        put_object(aws, present.object_store_url, b"present")
+
+        updated = backfill_document_file_info(db, batch_size=1)
+
+        assert updated == 1
+        db.refresh(missing)
+        assert missing.file_size_bytes is None
+
+        # A second run only retries the unreadable document
+        assert backfill_document_file_info(db) == 0
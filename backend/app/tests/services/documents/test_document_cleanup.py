@@ -0,0 +1,68 @@
+import os
+from datetime import timedelta
+from pathlib import Path
+from urllib.parse import urlparse
+
+import pytest
+from moto import mock_aws
+from sqlmodel import Session
+
+from app.core.cloud import AmazonCloudStorageClient
+from app.core.config import settings
+from app.core.util import now
+from app.models import Document
+from app.services.documents.cleanup import delete_expired_pending_uploads
+from app.tests.utils.document import DocumentStore
+from app.tests.utils.utils import get_project
+
+
+@pytest.fixture
+def aws_credentials():
+    os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+    os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+    os.environ["AWS_SECURITY_TOKEN"] = "testing"
+    os.environ["AWS_SESSION_TOKEN"] = "testing"
+    os.environ["AWS_DEFAULT_REGION"] = settings.AWS_DEFAULT_REGION
+
+
+def object_key(url: str) -> str:
+    return str(Path(urlparse(url).path).relative_to("/"))
+
+
+def make_pending(db: Session, document: Document, age: timedelta) -> Document:
+    document.is_pending = True
+    document.inserted_at = now() - age
+    db.add(document)
+    db.commit()
+    db.refresh(document)
+    return document
+
+
+@mock_aws
+@pytest.mark.usefixtures("aws_credentials")
+class TestDeleteExpiredPendingUploads:
+    def test_deletes_abandoned_uploads_and_objects(self, db: Session):
+        """Test that old pending rows and their objects are removed."""
+        aws = AmazonCloudStorageClient()
+        aws.create()
+        store = DocumentStore(db=db, project_id=get_project(db).id)
+        uploaded, never_uploaded, recent, finalized = store.fill(4)
+        uploaded = make_pending(db, uploaded, timedelta(hours=3))
+        never_uploaded = make_pending(db, never_uploaded, timedelta(hours=3))
+        recent = make_pending(db, recent, timedelta(minutes=10))
+        aws.client.put_object(
+            Bucket=settings.AWS_S3_BUCKET,
+            Key=object_key(uploaded.object_store_url),
+            Body=b"content",
+        )
+        removed_ids = {uploaded.id, never_uploaded.id}
+
+        deleted = delete_expired_pending_uploads(db, batch_size=1)
+
+        assert deleted == 2
+        db.expire_all()
+        assert all(db.get(Document, doc_id) is None for doc_id in removed_ids)
+        assert db.get(Document, recent.id) is not None
+        assert db.get(Document, finalized.id) is not None
+        objects = aws.client.list_objects_v2(Bucket=settings.AWS_S3_BUCKET)
+        assert objects["KeyCount"] == 0
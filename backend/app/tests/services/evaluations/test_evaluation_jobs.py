@@ -0,0 +1,197 @@
+"""Tests for starting evaluation runs in a Celery job."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from sqlmodel import Session, select
+
+from app.models import EvaluationDataset, EvaluationRun, Organization, Project
+from app.services.evaluations.jobs import execute_job, start_job
+from app.tests.utils.openai import get_mock_openai_batch_client
+
+
+def create_langfuse(questions: list[str]) -> MagicMock:
+    """Mock Langfuse client whose dataset has one item per question."""
+    langfuse = MagicMock()
+    langfuse.get_dataset.return_value = MagicMock(
+        items=[
+            MagicMock(
+                id=f"item_{i}",
+                input={"question": question},
+                expected_output={"answer": f"Answer {i}"},
+                metadata={},
+            )
+            for i, question in enumerate(questions)
+        ]
+    )
+    return langfuse
+
+
+@pytest.fixture
+def eval_run(db: Session) -> EvaluationRun:
+    org = db.exec(select(Organization)).first()
+    project = db.exec(select(Project).where(Project.organization_id == org.id)).first()
+
+    dataset = EvaluationDataset(
+        name="job_dataset",
+        dataset_metadata={"original_items_count": 2},
+        organization_id=org.id,
+        project_id=project.id,
+    )
+    db.add(dataset)
+    db.commit()
+    db.refresh(dataset)
+
+    eval_run = EvaluationRun(
+        run_name="job_run",
+        dataset_name=dataset.name,
+        dataset_id=dataset.id,
+        config={"model": "gpt-4o"},
+        status="pending",
+        progress={"stage": "queued"},
+        organization_id=org.id,
+        project_id=project.id,
+    )
+    db.add(eval_run)
+    db.commit()
+    db.refresh(eval_run)
+    return eval_run
+
+
+def run_execute_job(db: Session, eval_run: EvaluationRun, **patches) -> dict:
+    """Run execute_job against the test session with the given client patches."""
+    with patch("app.services.evaluations.jobs.Session") as mock_session_class, patch(
+        "app.services.evaluations.jobs.get_openai_client",
+        **patches.get("openai", {}),
+    ), patch(
+        "app.services.evaluations.jobs.get_langfuse_client",
+        **patches.get("langfuse", {}),
+    ), patch(
+        "app.crud.evaluations.batch.get_cloud_storage",
+        side_effect=ValueError("object store not configured"),
+    ):
+        mock_session_class.return_value.__enter__.return_value = db
+        mock_session_class.return_value.__exit__.return_value = None
+
+        return execute_job(
+            project_id=eval_run.project_id,
+            organization_id=eval_run.organization_id,
+            job_id=str(eval_run.id),
+            task_id="task_123",
+            task_instance=None,
+        )
+
+
+class TestStartJob:
+    """Test scheduling the evaluation start task."""
+
+    def test_start_job_schedules_task(self, db: Session, eval_run: EvaluationRun):
+        """Test that the run stays pending and the task gets the run ID."""
+        with patch(
+            "app.services.evaluations.jobs.start_low_priority_job",
+            return_value="task_123",
+        ) as mock_start:
+            result = start_job(db=db, eval_run=eval_run)
+
+        assert result.status == "pending"
+        kwargs = mock_start.call_args.kwargs
+        assert kwargs["job_id"] == str(eval_run.id)
+        assert kwargs["project_id"] == eval_run.project_id
+        assert kwargs["organization_id"] == eval_run.organization_id
+
+
+class TestExecuteJob:
+    """Test the Celery task that submits the evaluation batch."""
+
+    def test_execute_job_submits_batch(self, db: Session, eval_run: EvaluationRun):
+        """Test that the batch is created and progress reaches submitted."""
+        uploaded: list[dict] = []
+
+        result = run_execute_job(
+            db,
+            eval_run,
+            openai={"return_value": get_mock_openai_batch_client(uploaded)},
+            langfuse={"return_value": create_langfuse(["Q0", "Q1"])},
+        )
+
+        db.refresh(eval_run)
+        assert result == {
+            "evaluation_id": eval_run.id,
+            "status": "processing",
+            "batch_job_id": eval_run.batch_job_id,
+        }
+        assert [line["custom_id"] for line in uploaded] == ["item_0", "item_1"]
+        assert eval_run.progress == {
+            "stage": "submitted",
+            "task_id": "task_123",
+            "total_items": 2,
+        }
+
+    def test_execute_job_missing_credentials(
+        self, db: Session, eval_run: EvaluationRun
+    ):
+        """Test that missing credentials fail the run without raising."""
+        result = run_execute_job(
+            db,
+            eval_run,
+            openai={
+                "side_effect": HTTPException(
+                    status_code=400, detail="OpenAI credentials not configured"
+                )
+            },
+        )
+
+        db.refresh(eval_run)
+        assert result["status"] == "failed"
+        assert eval_run.error_message == "OpenAI credentials not configured"
+        assert eval_run.progress["stage"] == "failed"
+
+    def test_execute_job_batch_failure(self, db: Session, eval_run: EvaluationRun):
+        """Test that a failed batch start is recorded on the run."""
+        result = run_execute_job(
+            db,
+            eval_run,
+            openai={"return_value": get_mock_openai_batch_client([])},
+            langfuse={"return_value": create_langfuse(["", ""])},
+        )
+
+        db.refresh(eval_run)
+        assert result["status"] == "failed"
+        assert "did not produce any JSONL entries" in eval_run.error_message
+        assert eval_run.progress["stage"] == "failed"
+
+    def test_execute_job_skips_started_run(self, db: Session, eval_run: EvaluationRun):
+        """Test that a redelivered task does not submit a second batch."""
+        eval_run.status = "processing"
+        db.add(eval_run)
+        db.commit()
+
+        result = run_execute_job(db, eval_run)
+
+        assert result == {"evaluation_id": eval_run.id, "status": "processing"}
+
+    def test_execute_job_small_dataset_runs_realtime(
+        self, db: Session, eval_run: EvaluationRun
+    ):
+        """Test that a dataset below the threshold is evaluated in realtime."""
+        dataset = db.get(EvaluationDataset, eval_run.dataset_id)
+        dataset.dataset_metadata = {**dataset.dataset_metadata, "total_items_count": 2}
+        db.add(dataset)
+        db.commit()
+
+        def complete_run(langfuse, openai_client, session, eval_run, config):
+            eval_run.status = "completed"
+            return eval_run
+
+        with patch(
+            "app.services.evaluations.jobs.run_realtime_evaluation",
+            side_effect=complete_run,
+        ) as mock_realtime, patch(
+            "app.services.evaluations.jobs.start_evaluation_batch"
+        ) as mock_batch:
+            result = run_execute_job(db, eval_run)
+
+        assert result["status"] == "completed"
+        mock_realtime.assert_called_once()
+        mock_batch.assert_not_called()
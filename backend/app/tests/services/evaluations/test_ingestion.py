@@ -0,0 +1,178 @@
+"""Tests for ingesting uploaded evaluation datasets in a Celery job."""
+
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlmodel import Session, select
+
+from app.core.cloud.storage import CloudStorageError
+from app.models import EvaluationDataset, Organization, Project
+from app.services.evaluations.ingestion import execute_job, start_job
+
+
+@pytest.fixture
+def dataset(db: Session) -> EvaluationDataset:
+    org = db.exec(select(Organization)).first()
+    project = db.exec(select(Project).where(Project.organization_id == org.id)).first()
+
+    dataset = EvaluationDataset(
+        name="ingestion_dataset",
+        dataset_metadata={
+            "original_items_count": 0,
+            "total_items_count": 0,
+            "duplication_factor": 2,
+        },
+        object_store_url="s3://bucket/datasets/ingestion_dataset.csv",
+        progress={"stage": "queued"},
+        organization_id=org.id,
+        project_id=project.id,
+    )
+    db.add(dataset)
+    db.commit()
+    db.refresh(dataset)
+    return dataset
+
+
+def create_langfuse() -> MagicMock:
+    langfuse = MagicMock()
+    langfuse.create_dataset.return_value = MagicMock(id="langfuse_dataset_123")
+    return langfuse
+
+
+def create_storage(content: bytes) -> MagicMock:
+    storage = MagicMock()
+    storage.stream.return_value = io.BytesIO(content)
+    return storage
+
+
+def run_execute_job(
+    db: Session,
+    dataset: EvaluationDataset,
+    langfuse: MagicMock | None = None,
+    storage: MagicMock | None = None,
+) -> dict:
+    """Run execute_job against the test session with mocked clients."""
+    with patch(
+        "app.services.evaluations.ingestion.Session"
+    ) as mock_session_class, patch(
+        "app.services.evaluations.ingestion.get_langfuse_client",
+        return_value=langfuse or create_langfuse(),
+    ), patch(
+        "app.services.evaluations.ingestion.get_cloud_storage",
+        return_value=storage or create_storage(b""),
+    ):
+        mock_session_class.return_value.__enter__.return_value = db
+        mock_session_class.return_value.__exit__.return_value = None
+
+        return execute_job(
+            project_id=dataset.project_id,
+            organization_id=dataset.organization_id,
+            job_id=str(dataset.id),
+            task_id="task_123",
+            task_instance=None,
+        )
+
+
+class TestStartJob:
+    """Test scheduling the dataset ingestion task."""
+
+    def test_start_job_schedules_task(self, db: Session, dataset: EvaluationDataset):
+        """Test that the dataset stays queued and the task gets its ID."""
+        with patch(
+            "app.services.evaluations.ingestion.start_low_priority_job",
+            return_value="task_123",
+        ) as mock_start:
+            result = start_job(db=db, dataset=dataset)
+
+        assert result.progress == {"stage": "queued"}
+        kwargs = mock_start.call_args.kwargs
+        assert kwargs["job_id"] == str(dataset.id)
+        assert kwargs["organization_id"] == dataset.organization_id
+
+    def test_start_job_schedule_failure(self, db: Session, dataset: EvaluationDataset):
+        """Test that a dataset whose task cannot be scheduled is marked failed."""
+        with patch(
+            "app.services.evaluations.ingestion.start_low_priority_job",
+            side_effect=ConnectionError("broker unavailable"),
+        ):
+            result = start_job(db=db, dataset=dataset)
+
+        assert result.progress["stage"] == "failed"
+        assert "broker unavailable" in result.progress["error"]
+
+
+class TestExecuteJob:
+    """Test the Celery task that uploads dataset items to Langfuse."""
+
+    def test_execute_job_ingests_csv(self, db: Session, dataset: EvaluationDataset):
+        """Test that valid rows are uploaded and counts recorded."""
+        langfuse = create_langfuse()
+        storage = create_storage(
+            b"question,answer\n"
+            b"What is 2+2?,4\n"
+            b",missing question\n"
+            b"Capital of France?,Paris\n"
+        )
+
+        result = run_execute_job(db, dataset, langfuse=langfuse, storage=storage)
+
+        db.refresh(dataset)
+        assert result == {
+            "dataset_id": dataset.id,
+            "stage": "completed",
+            "original_items": 2,
+            "total_items": 4,
+        }
+        storage.stream.assert_called_once_with(dataset.object_store_url)
+        # Items are stored once; the duplication factor is expanded later
+        assert langfuse.create_dataset_item.call_count == 2
+        assert dataset.langfuse_dataset_id == "langfuse_dataset_123"
+        assert dataset.dataset_metadata == {
+            "original_items_count": 2,
+            "total_items_count": 4,
+            "duplication_factor": 2,
+        }
+        assert dataset.progress == {
+            "stage": "completed",
+            "task_id": "task_123",
+            "items_processed": 2,
+            "items_uploaded": 2,
+        }
+
+    def test_execute_job_no_valid_items(self, db: Session, dataset: EvaluationDataset):
+        """Test that a CSV without valid rows fails the dataset."""
+        result = run_execute_job(
+            db, dataset, storage=create_storage(b"question,answer\n,\n")
+        )
+
+        db.refresh(dataset)
+        assert result["stage"] == "failed"
+        assert dataset.progress["stage"] == "failed"
+        assert dataset.progress["error"] == "No valid items found in CSV file"
+        assert dataset.langfuse_dataset_id is None
+
+    def test_execute_job_storage_failure(self, db: Session, dataset: EvaluationDataset):
+        """Test that an unreadable CSV is recorded on the dataset."""
+        storage = MagicMock()
+        storage.stream.side_effect = CloudStorageError("AWS Error: NoSuchKey")
+
+        result = run_execute_job(db, dataset, storage=storage)
+
+        db.refresh(dataset)
+        assert result["stage"] == "failed"
+        assert "NoSuchKey" in dataset.progress["error"]
+
+    def test_execute_job_skips_started_dataset(
+        self, db: Session, dataset: EvaluationDataset
+    ):
+        """Test that a redelivered task does not upload the items again."""
+        dataset.progress = {"stage": "completed"}
+        db.add(dataset)
+        db.commit()
+        langfuse = create_langfuse()
+
+        result = run_execute_job(db, dataset, langfuse=langfuse)
+
+        assert result == {"dataset_id": dataset.id, "stage": "completed"}
+        langfuse.create_dataset.assert_not_called()
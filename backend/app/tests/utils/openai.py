@@ -1,3 +1,4 @@
+import json
 import time
 import secrets
 import string
@@ -139,3 +140,17 @@ def get_mock_openai_client_with_vector_store():
     mock_client.beta.assistants.create.return_value = mock_assistant
 
     return mock_client
+
+
+def get_mock_openai_batch_client(uploaded: list[dict]) -> MagicMock:
+    """Mock OpenAI client for batch creation that records uploaded JSONL lines."""
+    client = MagicMock()
+
+    def capture_upload(file, purpose):
+        _, handle = file
+        uploaded.extend(json.loads(line) for line in handle.read().splitlines())
+        return MagicMock(id="file_123")
+
+    client.files.create.side_effect = capture_upload
+    client.batches.create.return_value = MagicMock(id="batch_123", status="validating")
+    return client